@@ -207,18 +207,11 @@ def extend_array_aep(common_aep, complete_aep, input_array, interpolate_missing=
     new_shape = (old_shape[0], len(complete_aep))  # shape of the new extended array
     
     # get common aep indexes
-    common_aep_indexes = []  # index of common aeps in complete aep list
-    for aep in common_aep:
-        index = complete_aep.index(aep)
-        common_aep_indexes.append(index)
-        
+    common_aep_indexes = [complete_aep.index(aep) for aep in common_aep]  # index of common aeps in complete aep list
+
     # Create new array and insert values from input array into correct positions based on common aep
-    extended_array = np.multiply(np.zeros(new_shape), np.nan)
-    for i in range(new_shape[1]):  # iterate through columns
-        if i in common_aep_indexes:
-            j = common_aep_indexes.index(i)  # index of column in original input array
-            values = input_array[:,j]
-            extended_array[:,i] = values
+    extended_array = np.full(new_shape, np.nan)
+    extended_array[:,common_aep_indexes] = input_array[:,:len(common_aep_indexes)]
 
     # interpolate 0.2EY and 0.5EY if needed and settings in turned on
     if interpolate_missing:
@@ -227,27 +220,20 @@ def extend_array_aep(common_aep, complete_aep, input_array, interpolate_missing=
             i = complete_aep.index('0.2EY')
             lower_i = complete_aep.index('20%')
             upper_i = complete_aep.index('10%')
-            lower_array = np.reshape(extended_array[:,lower_i], (1, extended_array.shape[0]))
-            upper_array = np.reshape(extended_array[:,upper_i], (1, extended_array.shape[0]))
-            inter_array = interpolate(5, 4.48, 10, lower_array, upper_array)
-            extended_array = np.delete(extended_array, i, axis=1)
-            extended_array = np.insert(extended_array, i, inter_array, axis=1)
+            extended_array[:,i] = interpolate(5, 4.48, 10, extended_array[:,lower_i], extended_array[:,upper_i])
         if '0.5EY' in complete_aep:
             print('Interrpolating initial loss values for 0.5EY...')
             i = complete_aep.index('0.5EY')
             lower_i = complete_aep.index('50%')
             upper_i = complete_aep.index('20%')
-            lower_array = np.reshape(extended_array[:,lower_i], (1, extended_array.shape[0]))
-            upper_array = np.reshape(extended_array[:,upper_i], (1, extended_array.shape[0]))
-            inter_array = interpolate(2, 1.44, 4.48, lower_array, upper_array)
-            extended_array = np.delete(extended_array, i, axis=1)
-            extended_array = np.insert(extended_array, i, inter_array, axis=1)
+            extended_array[:,i] = interpolate(2, 1.44, 4.48, extended_array[:,lower_i], extended_array[:,upper_i])
 
     return extended_array
             
 
 def interpolate(ref, lower_ref, upper_ref, lower_values, upper_values):
-    """Interpolates between single row numpy arrrays.
+    """Interpolates between single row numpy arrrays. Reference values can also be column arrays
+    to interpolate many rows at once.
 
     ref: float of reference number getting interpolated value for
     lower_ref: float of lower reference value
@@ -281,77 +267,47 @@ def interpolate_nan(input_array, dur, ils ,**kwargs):
 
     # setup interpolated array with values less than 60min based on user defined loss method
     int_array = np.insert(input_array, 0, np.nan, axis=1)  # add column at front for duration values
-    if lossMethod == 'interpolate':
-        int_array = np.insert(int_array, 0, 0, axis=0)  # add row at front with zero values
-    elif lossMethod == 'interpolate_log':
-        xp = [0, np.log10(60.)]
+    if lossMethod == 'interpolate_log':
         ind = dur.index(60)
-        for i, dur_ in enumerate(dur):
-            if dur_ >= 60.:
-                break
-            for j in range(input_array.shape[1]):
-                fp = [0, input_array[ind][j]]
-                int_array[i][j+1] = np.interp(np.log10(dur_), xp, fp)
-        int_array = np.insert(int_array, 0, 0, axis=0)
-    elif lossMethod == 'rahman':
-        il_array = rahman(dur, input_array[0], ils)
-        il_array_shape = np.shape(il_array)
-        for i in range(il_array_shape[0]):
-            for j in range(il_array_shape[1]):
-                int_array[i][j+1] = il_array[i][j]
-        int_array = np.insert(int_array, 0, 0, axis=0)
-    elif lossMethod == 'hill':
-        il_array = hill(dur, input_array[0], ils, mar)
-        il_array_shape = np.shape(il_array)
-        for i in range(il_array_shape[0]):
-            for j in range(il_array_shape[1]):
-                int_array[i][j + 1] = il_array[i][j]
-        int_array = np.insert(int_array, 0, 0, axis=0)
-    elif lossMethod == 'static':
-        il_array = static(dur, input_array[0], staticLoss)
-        il_array_shape = np.shape(il_array)
-        for i in range(il_array_shape[0]):
-            for j in range(il_array_shape[1]):
-                int_array[i][j + 1] = il_array[i][j]
-        int_array = np.insert(int_array, 0, 0, axis=0)
-    elif lossMethod == '60min':
-        for i, d in enumerate(dur):
-            if d == 60:
-                ind60m = i
-        il_array = use_60min(dur, input_array[ind60m])
-        il_array_shape = np.shape(il_array)
-        for i in range(il_array_shape[0]):
-            for j in range(il_array_shape[1]):
-                int_array[i][j + 1] = il_array[i][j]
-        int_array = np.insert(int_array, 0, 0, axis=0)
-    else:
-        int_array = np.insert(int_array, 0, 0, axis=0)
+        n = next((i for i, dur_ in enumerate(dur) if dur_ >= 60.), len(dur))  # durations less than 60min
+        if n:
+            # same as np.interp(np.log10(dur), [0, np.log10(60.)], [0, il60m]) - clamped to zero below 1min
+            x = np.log10(np.array(dur[:n], dtype=np.float64))[:,np.newaxis]
+            slope = input_array[ind] / np.log10(60.)
+            int_array[:n,1:] = np.where(x < 0., 0., slope * x)
+    elif lossMethod in ('rahman', 'hill', 'static', '60min'):
+        if lossMethod == 'rahman':
+            il_array = rahman(dur, input_array[0], ils)
+        elif lossMethod == 'hill':
+            il_array = hill(dur, input_array[0], ils, mar)
+        elif lossMethod == 'static':
+            il_array = static(dur, input_array[0], staticLoss)
+        else:
+            ind60m = len(dur) - 1 - dur[::-1].index(60)
+            il_array = use_60min(dur, input_array[ind60m])
+        if np.size(il_array):
+            int_array[:il_array.shape[0],1:il_array.shape[1]+1] = il_array
+    int_array = np.insert(int_array, 0, 0, axis=0)  # add row at front with zero values
 
     # Populate first column with duration values (skipping first row)
-    k = None
-    for i, duration in enumerate(dur):
-        int_array[i + 1][0] = dur[i]
-
-        # extend array for dur > 72hrs
-        if duration == 4320:
-            k = i + 1
-        if duration > 4320 and k is not None:
-            for j in range(int_array.shape[1] - 1):
-                int_array[i+1,j+1] = int_array[k,j+1]
-
-    # fill in nan values by interpolating
-    for i, row in enumerate(int_array):
-        if np.isnan(row[1]):
-            for j, sub_row in enumerate(int_array[i:]):
-                if not np.isnan(sub_row[1]):
-                    upper = sub_row
-                    break
-            try:
-                lower = int_array[i - 1]
-                int_array[i][1:] = interpolate(row[0], lower[0], upper[0], lower[1:], upper[1:])
-                upper = None
-            except:
-                break  # cannot find upper value for interpolation
+    int_array[1:len(dur)+1,0] = dur
+
+    # extend array for dur > 72hrs
+    if 4320 in dur:
+        k = dur.index(4320) + 1
+        longer = [i + 1 for i, duration in enumerate(dur) if duration > 4320 and i + 1 > k]
+        int_array[longer,1:] = int_array[k,1:]
+
+    # fill in nan values by interpolating between the surrounding rows. Will not extrapolate past the last value.
+    known = np.flatnonzero(~np.isnan(int_array[:,1]))
+    missing = np.flatnonzero(np.isnan(int_array[:,1]))
+    if known.size:
+        missing = missing[(missing > known[0]) & (missing < known[-1])]
+    if missing.size:
+        j = np.searchsorted(known, missing)
+        lower = int_array[known[j - 1]]
+        upper = int_array[known[j]]
+        int_array[missing,1:] = interpolate(int_array[missing,:1], lower[:,:1], upper[:,:1], lower[:,1:], upper[:,1:])
 
     # Tidy up array - delete first row and first column
     int_array = np.delete(int_array, 0, axis=0)
@@ -439,6 +395,80 @@ def arf_eqn244(area, arf10k):
     return arf
 
 
+def arf_eqn241_array(area, duration, aep):
+    """Array version of arf_eqn241. Inputs are broadcast against each other
+    e.g. duration column array and aep row array returns a (duration x aep) array.
+
+    area: km2
+    duration: mins
+    AEP: fraction (between 0.5 and 0.0005)"""
+
+    area = np.asarray(area, dtype=np.float64)
+    duration = np.asarray(duration, dtype=np.float64)
+    aep = np.asarray(aep, dtype=np.float64)
+
+    arf = 1.0 - 0.287 * (area ** 0.265 - 0.439 * np.log10(duration)) * duration ** (-0.36) + \
+          2.26 * 10.0 ** (-3.0) * area ** 0.226 * duration ** 0.125 * (0.3 + np.log10(aep)) + \
+          0.0141 * area ** 0.213 * 10.0 ** ((-0.021 * (duration - 180) ** 2.0) / 1440) * (0.3 + np.log10(aep))
+
+    return np.where(arf < 1.0, arf, 1.0)
+
+
+def arf_eqn242_array(area, duration, aep, a, b, c, d, e, f, g, h, i):
+    """Array version of arf_eqn242. Inputs are broadcast against each other.
+
+    area: km2
+    duration: mins
+    AEP: fraction (between 0.5 and 0.0005)"""
+
+    area = np.asarray(area, dtype=np.float64)
+    duration = np.asarray(duration, dtype=np.float64)
+    aep = np.asarray(aep, dtype=np.float64)
+    a, b, c, d, e, f, g, h, i = [float(x) for x in (a, b, c, d, e, f, g, h, i)]
+
+    arf = 1.0 - a * (area ** b - c * np.log10(duration)) * duration ** (-d) + \
+          e * area ** f * duration ** g * (0.3 + np.log10(aep)) + \
+          h * 10.0 ** (i * area * (duration / 1440.0)) * (0.3 + np.log10(aep))
+
+    return np.where(arf < 1.0, arf, 1.0)
+
+
+def arf_eqn243_array(duration, arf12h, arf24h):
+    """Array version of arf_eqn243. Inputs are broadcast against each other.
+
+    duration: min
+    arf12h (ARF 10km2 12h): fraction
+    arf24h (ARF 10km2 24h): fraction"""
+
+    duration = np.asarray(duration, dtype=np.float64)
+
+    return arf12h + (arf24h - arf12h) * ((duration - 720.0) / 720.0)
+
+
+def arf_eqn244_array(area, arf10k):
+    """Array version of arf_eqn244. Inputs are broadcast against each other.
+
+    area: km2
+    arf10k (ARF 10km2): fraction"""
+
+    area = np.asarray(area, dtype=np.float64)
+
+    return 1.0 - 0.6614 * (1.0 - arf10k) * (area ** 0.4 - 1.0)
+
+
+def arf_limits(arf, aep, ARF_frequent, min_ARF):
+    """Applies the minimum ARF and sets ARF to 1 for events outside the range
+    of the generalised equations (more frequent than 50% AEP unless ARF_frequent or rarer than 0.05% AEP).
+
+    arf: numpy array (duration x AEP)
+    aep: numpy array row of AEP(%)"""
+
+    AEP_max = 100 if ARF_frequent == True else 50
+
+    arf = np.where(arf >= min_ARF, arf, min_ARF)
+    return np.where((aep >= 0.05) & (aep <= AEP_max), arf, 1.)
+
+
 def short_arf(area, duration_list, aep_list, ARF_frequent, min_ARF):
     """Short duration ARF equation ARR2016
 
@@ -448,73 +478,28 @@ def short_arf(area, duration_list, aep_list, ARF_frequent, min_ARF):
 
     logger = logging.getLogger('ARR2019')
 
-    AEP_max = 100 if ARF_frequent == True else 50
+    shape = (len(duration_list), len(aep_list))
+    duration = np.reshape(np.array(duration_list, dtype=np.float64), (shape[0], 1))
+    aep = np.reshape(np.array(aep_list, dtype=np.float64), (1, shape[1]))
 
     if area <= 1:
-        arf_array = np.ones(len(duration_list), len(aep_list))
-
-    elif area <= 10:
-        arf_list = []  # ARF list that will be converted to numpy array
-        for duration in duration_list:
-            arf_row = []  # ARF row (create a list of lists so can be converted to numpy array)
-            for aep in aep_list:
-                if 0.05 <= aep <= AEP_max:
-                    # arf10km2 = arf_eqn242(duration, arf_eqn241(10, 720, (aep / 100)), arf_eqn241(10, 1440, (aep / 100)))
-                    # arf = arf_eqn243(area, arf10km2)
-                    # 3.1.4.33 - changed above 2 lines to the below
-                    arf10km2 = arf_eqn241(10, duration, (aep / 100))
-                    arf = arf_eqn244(area, arf10km2)
-                    if arf >= min_ARF:
-                        arf_row.append(arf)
-                    else:
-                        arf_row.append(min_ARF)
-                else:
-                    arf_row.append(1)
-            arf_list.append(arf_row)
-
-        arf_array = np.array(arf_list)
-
-    elif area <= 1000:
-        arf_list = []  # ARF list that will be converted to numpy array
-        for duration in duration_list:
-            arf_row = []  # ARF row (create a list of lists so can be converted to numpy array)
-            for aep in aep_list:
-                if 0.05 <= aep <= AEP_max:
-                    arf = arf_eqn241(area, duration, (aep / 100))
-                    if arf >= min_ARF:
-                        arf_row.append(arf)
-                    else:
-                        arf_row.append(min_ARF)
-                else:
-                    arf_row.append(1)
-            arf_list.append(arf_row)
-
-        arf_array = np.array(arf_list)
+        return np.ones(shape)
 
+    if area <= 10:
+        # 3.1.4.33 - ARF at 10km2 then eqn 2.4.3 (244 in plugin)
+        arf10km2 = arf_eqn241_array(10, duration, aep / 100)
+        arf = arf_eqn244_array(area, arf10km2)
     else:
-        # print('WARNING: {0:.0f}km2 out of range of generalised equations for short duration ARF factors. '
-        #       'Applying method for 1000km2, however this may not be applicable for catchment. '
-        #       'Please consult ARR2016'.format(area))
-        logger.warning('WARNING: {0:,.0f}km2 out of range of generalised equations for short duration ARF factors. '
-                       'Applying method for 1000km2, however this may not be applicable for catchment. '
-                       'Please consult ARR'.format(area))
-        arf_list = []  # ARF list that will be converted to numpy array
-        for duration in duration_list:
-            arf_row = []  # ARF row (create a list of lists so can be converted to numpy array)
-            for aep in aep_list:
-                if 0.05 <= aep <= AEP_max:
-                    arf = arf_eqn241(area, duration, (aep / 100))
-                    if arf >= min_ARF:
-                        arf_row.append(arf)
-                    else:
-                        arf_row.append(min_ARF)
-                else:
-                    arf_row.append(1)
-            arf_list.append(arf_row)
-
-        arf_array = np.array(arf_list)
+        if area > 1000:
+            # print('WARNING: {0:.0f}km2 out of range of generalised equations for short duration ARF factors. '
+            #       'Applying method for 1000km2, however this may not be applicable for catchment. '
+            #       'Please consult ARR2016'.format(area))
+            logger.warning('WARNING: {0:,.0f}km2 out of range of generalised equations for short duration ARF factors. '
+                           'Applying method for 1000km2, however this may not be applicable for catchment. '
+                           'Please consult ARR'.format(area))
+        arf = arf_eqn241_array(area, duration, aep / 100)
 
-    return arf_array
+    return np.broadcast_to(arf_limits(arf, aep, ARF_frequent, min_ARF), shape).copy()
 
 
 def medium_arf(area, duration_list, aep_list, a, b, c, d, e, f, g, h, i, ARF_frequent, min_ARF):
@@ -526,97 +511,34 @@ def medium_arf(area, duration_list, aep_list, a, b, c, d, e, f, g, h, i, ARF_fre
 
     logger = logging.getLogger('ARR2019')
 
-    AEP_max = 100 if ARF_frequent == True else 50
+    shape = (len(duration_list), len(aep_list))
+    duration = np.reshape(np.array(duration_list, dtype=np.float64), (shape[0], 1))
+    aep = np.reshape(np.array(aep_list, dtype=np.float64), (1, shape[1]))
 
     if area <= 1:
-        arf_array = np.ones(len(duration_list), len(aep_list))
-
-    elif area <= 10:
-        arf_list = []  # ARF list that will be converted to numpy array
-        for duration in duration_list:
-            arf_row = []  # ARF row (create a list of lists so can be converted to numpy array)
-            for aep in aep_list:
-                if 0.05 <= aep <= AEP_max:
-                    # arf10km2 = arf_eqn242(duration,
-                    #                       arf_eqn241(10, 720, (aep / 100)),
-                    #                       arf_eqn244(10, 1440, (aep / 100), a, b, c, d, e, f, g, h, i))
-                    # arf = arf_eqn243(area, arf10km2)
-
-                    # 3.1.4.33 - same process as above but with new eqn names.
-                    # ARR still seems to ref incorrect equations - no doubt will be fixing this again in the future
-                    arf10km24h = arf_eqn242(10, 1440, (aep / 100), a, b, c, d, e, f, g, h, i)
-                    arf10km12h = arf_eqn241(10, 720, (aep / 100))
-                    arf10km = arf_eqn243(duration, arf10km12h, arf10km24h)  # in ARR they say use eqn 2.4.4
-                    arf = arf_eqn244(area, arf10km)  # in ARR they say use eqn 2.4.3
-                    if arf >= min_ARF:
-                        arf_row.append(arf)
-                    else:
-                        arf_row.append(min_ARF)
-                else:
-                    arf_row.append(1)
-            arf_list.append(arf_row)
-
-        arf_array = np.array(arf_list)
-
-    elif area <= 30000:
-        arf_list = []  # ARF list that will be converted to numpy array
-        for duration in duration_list:
-            arf_row = []  # ARF row (create a list of lists so can be converted to numpy array)
-            for aep in aep_list:
-                if 0.05 <= aep <= AEP_max:
-                    # arf = arf_eqn242(duration,
-                    #                  arf_eqn241(area, 720, (aep / 100)),
-                    #                  arf_eqn244(area, 1440, (aep / 100), a, b, c, d, e, f, g, h, i))
-
-                    # 3.1.4.33 - same process as above but with new eqn names.
-                    arf24h = arf_eqn242(area, 1440, (aep / 100), a, b, c, d, e, f, g, h, i)
-                    arf12h = arf_eqn241(area, 720, (aep / 100))
-                    arf = arf_eqn243(duration, arf12h, arf24h)
-
-                    if arf >= min_ARF:
-                        arf_row.append(arf)
-                    else:
-                        arf_row.append(min_ARF)
-                else:
-                    arf_row.append(1)
-            arf_list.append(arf_row)
-
-        arf_array = np.array(arf_list)
-
+        return np.ones(shape)
+
+    if area <= 10:
+        # 3.1.4.33 - same process as before but with new eqn names.
+        # ARR still seems to ref incorrect equations - no doubt will be fixing this again in the future
+        arf10km24h = arf_eqn242_array(10, 1440, aep / 100, a, b, c, d, e, f, g, h, i)
+        arf10km12h = arf_eqn241_array(10, 720, aep / 100)
+        arf10km = arf_eqn243_array(duration, arf10km12h, arf10km24h)  # in ARR they say use eqn 2.4.4
+        arf = arf_eqn244_array(area, arf10km)  # in ARR they say use eqn 2.4.3
     else:
-        # print('WARNING: {0:.0f}km2 out of range of generalised equations for medium duration ARF factors. ' \
-        #       'Applying method for 30,000km2, however this may not be applicable for cathcment. ' \
-        #       'Please consult ARR2016.'.format(area))
-        logger.warning('WARNING: {0:,.0f}km2 out of range of generalised equations for medium duration ARF factors. ' \
-                       'Applying method for 30,000km2, however this may not be applicable for catchment. ' \
-                       'Please consult ARR.'.format(area))
-        arf_list = []  # ARF list that will be converted to numpy array
-        for duration in duration_list:
-            arf_row = []  # ARF row (create a list of lists so can be converted to numpy array)
-            for aep in aep_list:
-                if 0.05 <= aep <= AEP_max:
-                    # arf = arf_eqn242(duration,
-                    #                  arf_eqn241(area, 720, (aep / 100)),
-                    #                  arf_eqn244(area, 1440, (aep / 100), a, b, c, d, e, f, g, h, i))
-
-                    # 3.1.4.33 - same process as above but with new eqn names.
-                    arf24h = arf_eqn242(area, 1440, (aep / 100), a, b, c, d, e, f, g, h, i)
-                    arf12h = arf_eqn241(area, 720, (aep / 100))
-                    arf = arf_eqn243(duration, arf12h, arf24h)
-
-                    if arf >= min_ARF:
-                        arf_row.append(arf)
-                    else:
-                        arf_row.append(min_ARF)
-                else:
-                    arf_row.append(1)
-            arf_list.append(arf_row)
+        if area > 30000:
+            # print('WARNING: {0:.0f}km2 out of range of generalised equations for medium duration ARF factors. ' \
+            #       'Applying method for 30,000km2, however this may not be applicable for cathcment. ' \
+            #       'Please consult ARR2016.'.format(area))
+            logger.warning('WARNING: {0:,.0f}km2 out of range of generalised equations for medium duration ARF factors. ' \
+                           'Applying method for 30,000km2, however this may not be applicable for catchment. ' \
+                           'Please consult ARR.'.format(area))
+        # 3.1.4.33 - same process as before but with new eqn names.
+        arf24h = arf_eqn242_array(area, 1440, aep / 100, a, b, c, d, e, f, g, h, i)
+        arf12h = arf_eqn241_array(area, 720, aep / 100)
+        arf = arf_eqn243_array(duration, arf12h, arf24h)
 
-        arf_array = np.array(arf_list)
-        # if arf_array.shape != [len(duration_list), len(aep_list)]:
-        #    arf_array = np.zeros(len(duration_list), len(aep_list)) + 1
-
-    return arf_array
+    return np.broadcast_to(arf_limits(arf, aep, ARF_frequent, min_ARF), shape).copy()
 
 
 def long_arf(area, duration_list, aep_list, a, b, c, d, e, f, g, h, i, ARF_frequent, min_ARF):
@@ -628,83 +550,29 @@ def long_arf(area, duration_list, aep_list, a, b, c, d, e, f, g, h, i, ARF_frequ
 
     logger = logging.getLogger('ARR2019')
 
-    AEP_max = 100 if ARF_frequent == True else 50
+    shape = (len(duration_list), len(aep_list))
+    duration = np.reshape(np.array(duration_list, dtype=np.float64), (shape[0], 1))
+    aep = np.reshape(np.array(aep_list, dtype=np.float64), (1, shape[1]))
 
     if area <= 1:
-        arf_array = np.ones(len(duration_list), len(aep_list))
-
-    elif area <= 10:
-        arf_list = []  # ARF list that will be converted to numpy array
-        for duration in duration_list:
-            arf_row = []  # ARF row (create a list of lists so can be converted to numpy array)
-            for aep in aep_list:
-                if 0.05 <= aep <= AEP_max:
-                    # arf10km2 = arf_eqn244(10, duration, (aep / 100), a, b, c, d, e, f, g, h, i)
-                    # arf = arf_eqn243(area, arf10km2)
-
-                    # 3.1.4.33 - same process as above but with new eqn names.
-                    arf10km2 = arf_eqn242(10, duration, (aep / 100), a, b, c, d, e, f, g, h, i)
-                    arf = arf_eqn244(area, arf10km2)
-
-                    if arf >= min_ARF:
-                        arf_row.append(arf)
-                    else:
-                        arf_row.append(min_ARF)
-                else:
-                    arf_row.append(1)
-            arf_list.append(arf_row)
-
-        arf_array = np.array(arf_list)
-
-    elif area <= 30000:
-        arf_list = []  # ARF list that will be converted to numpy array
-        for duration in duration_list:
-            arf_row = []  # ARF row (create a list of lists so can be converted to numpy array)
-            for aep in aep_list:
-                if 0.05 <= aep <= AEP_max:
-                    # arf = arf_eqn244(area, duration, (aep / 100), a, b, c, d, e, f, g, h, i)
-
-                    # 3.1.4.33 - same process as above but with new eqn names.
-                    arf = arf_eqn242(area, duration, (aep / 100), a, b, c, d, e, f, g, h, i)
-
-                    if arf >= min_ARF:
-                        arf_row.append(arf)
-                    else:
-                        arf_row.append(min_ARF)
-                else:
-                    arf_row.append(1)
-            arf_list.append(arf_row)
-
-        arf_array = np.array(arf_list)
+        return np.ones(shape)
 
+    if area <= 10:
+        # 3.1.4.33 - same process as before but with new eqn names.
+        arf10km2 = arf_eqn242_array(10, duration, aep / 100, a, b, c, d, e, f, g, h, i)
+        arf = arf_eqn244_array(area, arf10km2)
     else:
-        # print('WARNING: {0:.0f}km2 out of range of generalised equations for long duration ARF factors. '
-        #       'Applying method for 30,000km2, however this may not be applicable for cathcment. '
-        #       'Please consult ARR2016.'.format(area))
-        logger.warning('WARNING: {0:,.0f}km2 out of range of generalised equations for long duration ARF factors. '
-                       'Applying method for 30,000km2, however this may not be applicable for catchment. '
-                       'Please consult ARR.'.format(area))
-        arf_list = []  # ARF list that will be converted to numpy array
-        for duration in duration_list:
-            arf_row = []  # ARF row (create a list of lists so can be converted to numpy array)
-            for aep in aep_list:
-                if aep <= AEP_max and aep >= 0.05:
-                    # arf = arf_eqn244(area, duration, (aep / 100), a, b, c, d, e, f, g, h, i)
-
-                    # 3.1.4.33 - same process as above but with new eqn names.
-                    arf = arf_eqn242(area, duration, (aep / 100), a, b, c, d, e, f, g, h, i)
-
-                    if arf >= min_ARF:
-                        arf_row.append(arf)
-                    else:
-                        arf_row.append(min_ARF)
-                else:
-                    arf_row.append(1)
-            arf_list.append(arf_row)
+        if area > 30000:
+            # print('WARNING: {0:.0f}km2 out of range of generalised equations for long duration ARF factors. '
+            #       'Applying method for 30,000km2, however this may not be applicable for cathcment. '
+            #       'Please consult ARR2016.'.format(area))
+            logger.warning('WARNING: {0:,.0f}km2 out of range of generalised equations for long duration ARF factors. '
+                           'Applying method for 30,000km2, however this may not be applicable for catchment. '
+                           'Please consult ARR.'.format(area))
+        # 3.1.4.33 - same process as before but with new eqn names.
+        arf = arf_eqn242_array(area, duration, aep / 100, a, b, c, d, e, f, g, h, i)
 
-        arf_array = np.array(arf_list)
-
-    return arf_array
+    return np.broadcast_to(arf_limits(arf, aep, ARF_frequent, min_ARF), shape).copy()
 
 
 def arf_factors(area, duration_list, aep_name_list, a, b, c, d, e, f, g, h, i, ARF_frequent, min_ARF):
@@ -732,34 +600,17 @@ def arf_factors(area, duration_list, aep_name_list, a, b, c, d, e, f, g, h, i, A
             print('Unrecognised storm event magnitude')
             return
 
-    short_dur_list = []
-    medium_dur_list = []
-    long_dur_list = []
-
-    for duration in duration_list:
-        if duration <= 720:
-            short_dur_list.append(duration)
-        elif duration < 1440:
-            medium_dur_list.append(duration)
-        else:
-            long_dur_list.append(duration)
+    duration_list = list(duration_list)
+    short_dur_list = [x for x in duration_list if x <= 720]
+    medium_dur_list = [x for x in duration_list if 720 < x < 1440]
+    long_dur_list = [x for x in duration_list if x >= 1440]
 
     short_dur_arf = short_arf(area, short_dur_list, aep_list, ARF_frequent, min_ARF)
     medium_dur_arf = medium_arf(area, medium_dur_list, aep_list, a, b, c, d, e, f, g, h, i, ARF_frequent, min_ARF)
     long_dur_arf = long_arf(area, long_dur_list, aep_list, a, b, c, d, e, f, g, h, i, ARF_frequent, min_ARF)
 
-    if len(short_dur_list) < 1 and len(medium_dur_list) < 1:
-        all_arf = long_dur_arf
-    elif len(short_dur_list) < 1:
-        all_arf = np.append(medium_dur_arf, long_dur_arf, axis=0)
-    elif len(medium_dur_list) < 1 and len(long_dur_list) < 1:
-        all_arf = short_dur_arf
-    elif len(long_dur_list) < 1:
-        all_arf = np.append(short_dur_arf, medium_dur_arf, axis=0)
-    elif len(medium_dur_list) < 1:
-        all_arf = np.append(short_dur_arf, long_dur_arf, axis=0)
-    else:
-        all_arf = np.append(np.append(short_dur_arf, medium_dur_arf, axis=0), long_dur_arf, axis=0)
+    # each array is (duration x AEP) so empty duration groups drop out
+    all_arf = np.concatenate((short_dur_arf, medium_dur_arf, long_dur_arf), axis=0)
 
     return all_arf
 
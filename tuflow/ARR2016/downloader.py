@@ -20,7 +20,15 @@ from ..compatibility_routines import QT_EVENT_LOOP_EXCLUDE_USER_INPUT_EVENTS, QT
 
 
 class Downloader:
-    """Downloader class that uses QgsNetworkAccessManager which inherits proxy settings from QGIS."""
+    """Downloader class that uses QgsNetworkAccessManager which inherits proxy settings from QGIS.
+
+    Successful downloads can be kept in a response cache keyed by URL. The URLs encode the coordinates
+    (BOM IFD, ARR datahub) or region code (temporal pattern zips), so catchments in a batch run that share
+    a location or region only download the data once. The cache is only used while enabled (see enable_cache).
+    """
+
+    _cache = {}  # key url: value downloaded data (str or bytearray)
+    _cache_enabled = False
 
     def __new__(cls, url, headers=None):
         if Downloader.has_qgis_libs():
@@ -42,6 +50,26 @@ class Downloader:
             return False
         return True
 
+    @staticmethod
+    def enable_cache(enable=True):
+        """Turn the response cache on / off. The cache is cleared either way."""
+        Downloader._cache_enabled = enable
+        Downloader._cache.clear()
+
+    def from_cache(self):
+        """Populates data from the response cache. Returns True if the url was found in the cache."""
+        if not Downloader._cache_enabled or self.url not in Downloader._cache:
+            return False
+        logger.info('Using previously downloaded data: {0}'.format(self.url))
+        self.data = Downloader._cache[self.url]
+        self.ret_code = 200
+        self.error_string = ''
+        return True
+
+    def to_cache(self):
+        if Downloader._cache_enabled and self.ok() and self.data is not None:
+            Downloader._cache[self.url] = self.data
+
     def type(self):
         pass
 
@@ -64,6 +92,8 @@ class DownloaderQGIS(Downloader):
         return self.reply.errorString()
 
     def download(self, retry_count = 5, retry_interval = range(5, 30, 5), validator = None):
+        if self.from_cache():
+            return
         old_user_agent = None
         netman = QgsNetworkAccessManager.instance()
         # QgsNetworkAccessManager.instance().cache().remove(QUrl(self.url))  # tmp
@@ -117,6 +147,7 @@ class DownloaderQGIS(Downloader):
             self.data = data.decode('utf-8')
         else:
             self.data = data
+        self.to_cache()
 
 
 
@@ -125,13 +156,20 @@ class DownloaderRequests(Downloader):
     def type(self):
         return 'Requests'
 
-    def download(self):
+    def download(self, validator = None):
+        if self.from_cache():
+            return
         r = requests.get(self.url, headers=self.headers, timeout=20)
         self.ret_code = r.status_code
         if not r.ok:
             self.error_string = r.text
             return
+        if validator is not None and not validator(r.content):
+            self.ret_code = None
+            self.error_string = 'Downloaded data is invalid or incomplete.'
+            return
         if 'zip' not in r.headers.get('content-type') and isinstance(r.content, bytes):
             self.data = r.content.decode('utf-8')
         else:
             self.data = r.content
+        self.to_cache()
@@ -376,243 +376,158 @@ class SCS(QObject):
 
     def calculateInflowGis(self, event):
         """ Calculate inflows for GIS approach.
+            All catchments are calculated together - arrays are (time x catchment).
         :return: inflowGis
         """
 
         # inputs
         depthCalcs = self.inputs[event]
-        #intensity = self.getIntensityGis(event)
         timeOut = self.getTimeOut()
-        # inflowGis = np.array([0])
-        inflowGisCum = np.zeros((1441,1))
+        nCatch = len(self.inputs['catchIdGis'])
+        imp2 = bool(self.inputs['areaImp2GisChecked'])
+        if not nCatch:
+            return np.zeros((timeOut.size, 0))
 
         # GIS inputs
-        #catchIdGisList = self.getCatchIdGis()
-        cnPerGis = self.inputs['cnPerGis']
-        cnImpGis = self.inputs['cnImpGis']
-        areaPerGis = self.inputs['areaPerGis']
-        areaPerCCGis = self.inputs['areaPerCCGis']
-        areaImp1Gis = self.inputs['areaImp1Gis']
-        areaImp1CCGis = self.inputs['areaImp1CCGis']
-        areaImp2Gis = self.inputs['areaImp2Gis']
-        areaImp2CCGis = self.inputs['areaImp2CCGis']
-        tpTcGis = self.inputs['tpTcGis']
-        cGis = self.inputs['cGis']
-        lengthGis = self.inputs['lengthGis']
-        slopeGis = self.inputs['slopeGis']
-
-        for j in range(len(self.inputs['catchIdGis'])):
-            # soil storage
-            soilStoragePerGis = ((1000 / float(cnPerGis[j])) - 10) * 25.4
-            soilStorageImpGis = ((1000 / float(cnImpGis[j])) - 10) * 25.4
-
-            # runoff depth for 24h in mm
-            runoffDepth24hPerGis = ((depthCalcs - self.inputs['iniLossPer']) ** 2) / \
-                                ((depthCalcs - self.inputs['iniLossPer']) + soilStoragePerGis)
-            runoffDepth24hImpGis = ((depthCalcs - self.inputs['iniLossImp']) ** 2) / \
-                                ((depthCalcs - self.inputs['iniLossImp']) + soilStorageImpGis)
-
-            # time of peak and time of concentration
-            tpPerGis = 0
-            tpImpGis = 0
-            if self.inputs['tpTcGisChecked']:
-                if self.inputs['tpGisChecked']:
-                    tpPerGis = float(tpTcGis[j])
-                    tpImpGis = float(tpTcGis[j])
-                else:
-                    tpPerGis = float(tpTcGis[j]) / 3 * 2
-                    tpImpGis = float(tpTcGis[j]) / 3 * 2
-            elif self.inputs['tpTcCalcsGisChecked']:
-                tpPerGis = (0.14 * cGis[j] * (lengthGis[j] ** 0.66) * ((cnPerGis[j] / (200 - cnPerGis[j])) ** -0.55) * (slopeGis[j] ** - 0.3)) / 3 * 2
-                if tpPerGis < 0.11:
-                    tpPerGis = 0.11
-                tpImpGis = (0.14 * cGis[j] * (lengthGis[j] ** 0.66) * ((cnImpGis[j] / (200 - cnImpGis[j])) ** -0.55) * (slopeGis[j] ** - 0.3)) / 3 * 2
-                if tpImpGis < 0.11:
-                    tpImpGis = 0.11
-            else:
-                pass
+        cnPerGis = np.array(self.inputs['cnPerGis'], dtype=np.float64)
+        cnImpGis = np.array(self.inputs['cnImpGis'], dtype=np.float64)
+        if 'CC' in event:
+            areaPerGis = np.array(self.inputs['areaPerCCGis'], dtype=np.float64)
+            areaImp1Gis = np.array(self.inputs['areaImp1CCGis'], dtype=np.float64)
+            areaImp2Gis = np.array(self.inputs['areaImp2CCGis'], dtype=np.float64) if imp2 else None
+        else:
+            areaPerGis = np.array(self.inputs['areaPerGis'], dtype=np.float64)
+            areaImp1Gis = np.array(self.inputs['areaImp1Gis'], dtype=np.float64)
+            areaImp2Gis = np.array(self.inputs['areaImp2Gis'], dtype=np.float64) if imp2 else None
 
-            # peak flow rate of unit hydrograph
-            qpImp2Gis = 0
-            if 'CC' in event:
-                qpPerGis = (self.inputs['uhCurve'] * runoffDepth24hPerGis * 0.001 * float(areaPerCCGis[j]) * 10000) / (tpPerGis * 3600)
-                qpImp1Gis = (self.inputs['uhCurve'] * runoffDepth24hImpGis * 0.001 * float(areaImp1CCGis[j]) * 10000) / (tpImpGis * 3600)
-                if self.inputs['areaImp2GisChecked']:
-                    qpImp2Gis = (self.inputs['uhCurve'] * runoffDepth24hImpGis * 0.001 * float(areaImp2CCGis[j]) * 10000) / (tpImpGis * 3600)
+        # soil storage
+        soilStoragePerGis = ((1000 / cnPerGis) - 10) * 25.4
+        soilStorageImpGis = ((1000 / cnImpGis) - 10) * 25.4
+
+        # runoff depth for 24h in mm
+        runoffDepth24hPerGis = ((depthCalcs - self.inputs['iniLossPer']) ** 2) / \
+                               ((depthCalcs - self.inputs['iniLossPer']) + soilStoragePerGis)
+        runoffDepth24hImpGis = ((depthCalcs - self.inputs['iniLossImp']) ** 2) / \
+                               ((depthCalcs - self.inputs['iniLossImp']) + soilStorageImpGis)
+
+        # time of peak and time of concentration
+        tpPerGis = np.zeros((nCatch,))
+        tpImpGis = np.zeros((nCatch,))
+        if self.inputs['tpTcGisChecked']:
+            tpTcGis = np.array(self.inputs['tpTcGis'], dtype=np.float64)
+            if self.inputs['tpGisChecked']:
+                tpPerGis = tpTcGis
+                tpImpGis = tpTcGis
             else:
-                qpPerGis = (self.inputs['uhCurve'] * runoffDepth24hPerGis * 0.001 * float(areaPerGis[j]) * 10000) / (tpPerGis * 3600)
-                qpImp1Gis = (self.inputs['uhCurve'] * runoffDepth24hImpGis * 0.001 * float(areaImp1Gis[j]) * 10000) / (tpImpGis * 3600)
-                if self.inputs['areaImp2GisChecked']:
-                    qpImp2Gis = (self.inputs['uhCurve'] * runoffDepth24hImpGis * 0.001 * float(areaImp2Gis[j]) * 10000) / (tpImpGis * 3600)
-
-            # interval step based on unit hydrograph step
-            intervalPerGis = tpPerGis * self.inputs['uhStep']
-            intervalImpGis = tpImpGis * self.inputs['uhStep']
-
-            # time column for calculations based on input interval
-            timePerGis = np.array([0])
-            timeImpGis = np.array([0])
-            tPerGis = timePerGis[-1]
-            while tPerGis < 23.999999:
-                tPerGis = timePerGis[-1] + intervalPerGis
-                timePerGis = np.append(timePerGis, tPerGis)
-            timePerGis = timePerGis.round(decimals=4)
-            tImpGis = timeImpGis[-1]
-            while tImpGis < 23.999999:
-                tImpGis = timeImpGis[-1] + intervalImpGis
-                timeImpGis = np.append(timeImpGis, tImpGis)
-            timeImpGis = timeImpGis.round(decimals=4)
-
-            # intensity
-            intensityPerGis = np.array([0])
-            intensityImpGis = np.array([0])
-            intensityPerGis = self.getIntensity(event, timePerGis, intensityPerGis)
-            intensityImpGis = self.getIntensity(event, timeImpGis, intensityImpGis)
-
-            # rainfall depth in mm for specified interval
-            rainfallDepthPerGis = ((depthCalcs * intensityPerGis) / (24 / intervalPerGis))
-            rainfallDepthImpGis = ((depthCalcs * intensityImpGis) / (24 / intervalImpGis))
-
-            # cumulative rainfall depth
-            cumulativeRainfallDepthPerGis = np.reshape(np.array(rainfallDepthPerGis[0]), 1)
-            cumulativeRainfallDepthImpGis = np.reshape(np.array(rainfallDepthImpGis[0]), 1)
-            for i in range(1, rainfallDepthPerGis.size):
-                cumulatedDepthPerGis = cumulativeRainfallDepthPerGis[i - 1] + rainfallDepthPerGis[i]
-                cumulativeRainfallDepthPerGis = np.append(cumulativeRainfallDepthPerGis, cumulatedDepthPerGis)
-            for i in range(1, rainfallDepthImpGis.size):
-                cumulatedDepthImpGis = cumulativeRainfallDepthImpGis[i - 1] + rainfallDepthImpGis[i]
-                cumulativeRainfallDepthImpGis = np.append(cumulativeRainfallDepthImpGis, cumulatedDepthImpGis)
-
-            # cumulative rainfall excess based on remaining initial loss
-            cumulativeRainfallExcessPerGis = np.array([])
-            for i in range(0, cumulativeRainfallDepthPerGis.size):
-                if cumulativeRainfallDepthPerGis[i] < self.inputs['iniLossPer']:
-                    cumulativeRainfallExcessPerGis = np.append(cumulativeRainfallExcessPerGis, 0)
-                else:
-                    cumulativeRainfallExcessPerGis = np.append(cumulativeRainfallExcessPerGis, cumulativeRainfallDepthPerGis[i])
-            cumulativeRainfallExcessImpGis = np.array([])
-            for i in range(0, cumulativeRainfallDepthImpGis.size):
-                if cumulativeRainfallDepthImpGis[i] < self.inputs['iniLossImp']:
-                    cumulativeRainfallExcessImpGis = np.append(cumulativeRainfallExcessImpGis, 0)
-                else:
-                    cumulativeRainfallExcessImpGis = np.append(cumulativeRainfallExcessImpGis, cumulativeRainfallDepthImpGis[i])
+                tpPerGis = tpTcGis / 3 * 2
+                tpImpGis = tpTcGis / 3 * 2
+        elif self.inputs['tpTcCalcsGisChecked']:
+            cGis = np.array(self.inputs['cGis'], dtype=np.float64)
+            lengthGis = np.array(self.inputs['lengthGis'], dtype=np.float64)
+            slopeGis = np.array(self.inputs['slopeGis'], dtype=np.float64)
+            tpPerGis = (0.14 * cGis * (lengthGis ** 0.66) * ((cnPerGis / (200 - cnPerGis)) ** -0.55) * (slopeGis ** - 0.3)) / 3 * 2
+            tpPerGis = np.maximum(tpPerGis, 0.11)
+            tpImpGis = (0.14 * cGis * (lengthGis ** 0.66) * ((cnImpGis / (200 - cnImpGis)) ** -0.55) * (slopeGis ** - 0.3)) / 3 * 2
+            tpImpGis = np.maximum(tpImpGis, 0.11)
 
-            # cumulative runoff depth
-            cumulativeRunoffDepthPerGis = np.array([])
-            for i in range(0, cumulativeRainfallExcessPerGis.size):
-                if cumulativeRainfallExcessPerGis[i] == 0:
-                    cumulativeRunoffDepthPerGis = np.append(cumulativeRunoffDepthPerGis, 0)
-                else:
-                    cumulatedRunoffDepthPerGis = ((cumulativeRainfallExcessPerGis[i] - self.inputs['iniLossPer']) ** 2) / (
-                                                      (cumulativeRainfallExcessPerGis[i] - self.inputs[
-                                                          'iniLossPer']) + soilStoragePerGis)
-                    cumulativeRunoffDepthPerGis = np.append(cumulativeRunoffDepthPerGis, cumulatedRunoffDepthPerGis)
-            cumulativeRunoffDepthImpGis = np.array([])
-            for i in range(0, cumulativeRainfallExcessImpGis.size):
-                if cumulativeRainfallExcessImpGis[i] == 0:
-                    cumulativeRunoffDepthImpGis = np.append(cumulativeRunoffDepthImpGis, 0)
-                else:
-                    cumulatedRunoffDepthImpGis = ((cumulativeRainfallExcessImpGis[i] - self.inputs['iniLossImp']) ** 2) / (
-                                                      (cumulativeRainfallExcessImpGis[i] - self.inputs[
-                                                          'iniLossImp']) + soilStorageImpGis)
-                    cumulativeRunoffDepthImpGis = np.append(cumulativeRunoffDepthImpGis, cumulatedRunoffDepthImpGis)
-
-            # runoff depth
-            runoffDepthPerGis = np.array([cumulativeRunoffDepthPerGis[0]])
-            for i in range(1, cumulativeRunoffDepthPerGis.size):
-                runoffDepthPerGis = np.append(runoffDepthPerGis, cumulativeRunoffDepthPerGis[i] - cumulativeRunoffDepthPerGis[i - 1])
-            #checkPerGis = runoffDepthPerGis.sum()
-            runoffDepthImpGis = np.array([cumulativeRunoffDepthImpGis[0]])
-            for i in range(1, cumulativeRunoffDepthImpGis.size):
-                runoffDepthImpGis = np.append(runoffDepthImpGis, cumulativeRunoffDepthImpGis[i] - cumulativeRunoffDepthImpGis[i - 1])
-            #checkImpGis = runoffDepthImpGis.sum()
-
-            # unit hydrograph - factored
-            uhFlowRateDimensionlessGis = self.inputs['uhOrdinates'][1, :]
-            uhFlowRateFactoredPerGis = np.array([])
-            for i in range(0, uhFlowRateDimensionlessGis.size):
-                uhFlowRateSinglePerGis = (uhFlowRateDimensionlessGis[i] * qpPerGis) / runoffDepth24hPerGis
-                uhFlowRateFactoredPerGis = np.append(uhFlowRateFactoredPerGis, uhFlowRateSinglePerGis)
-            uhFlowRateFactoredImp1Gis = np.array([])
-            for i in range(0, uhFlowRateDimensionlessGis.size):
-                uhFlowRateSingleImp1Gis = (uhFlowRateDimensionlessGis[i] * qpImp1Gis) / runoffDepth24hImpGis
-                uhFlowRateFactoredImp1Gis = np.append(uhFlowRateFactoredImp1Gis, uhFlowRateSingleImp1Gis)
-            uhFlowRateFactoredImp2Gis = np.array([])
-            if self.inputs['areaImp2GisChecked']:
-                for i in range(0, uhFlowRateDimensionlessGis.size):
-                    uhFlowRateSingleImp2Gis = (uhFlowRateDimensionlessGis[i] * qpImp2Gis) / runoffDepth24hImpGis
-                    uhFlowRateFactoredImp2Gis = np.append(uhFlowRateFactoredImp2Gis, uhFlowRateSingleImp2Gis)
-
-            # unit hydrograph inflows
-            uhFullPerGis = np.zeros((runoffDepthPerGis.size, runoffDepthPerGis.size))
-            for i in range(0, runoffDepthPerGis.size):
-                uhValuesPerGis = runoffDepthPerGis[i] * uhFlowRateFactoredPerGis
-                if i + uhValuesPerGis.size > runoffDepthPerGis.size:
-                    uhFullPerGis[i:runoffDepthPerGis.size, i] = uhValuesPerGis[:-(i + uhFlowRateFactoredPerGis.size - runoffDepthPerGis.size)]
-                else:
-                    uhFullPerGis[i:i + uhFlowRateFactoredPerGis.size, i] = uhValuesPerGis
+        # peak flow rate of unit hydrograph
+        qpPerGis = (self.inputs['uhCurve'] * runoffDepth24hPerGis * 0.001 * areaPerGis * 10000) / (tpPerGis * 3600)
+        qpImp1Gis = (self.inputs['uhCurve'] * runoffDepth24hImpGis * 0.001 * areaImp1Gis * 10000) / (tpImpGis * 3600)
+        qpImpGis = [qpImp1Gis]
+        if imp2:
+            qpImp2Gis = (self.inputs['uhCurve'] * runoffDepth24hImpGis * 0.001 * areaImp2Gis * 10000) / (tpImpGis * 3600)
+            qpImpGis.append(qpImp2Gis)
+
+        # interval step based on unit hydrograph step
+        intervalPerGis = tpPerGis * self.inputs['uhStep']
+        intervalImpGis = tpImpGis * self.inputs['uhStep']
+
+        # inflows at output interval - (output time x catchment) for each qp
+        inflowPerOutGis = self.getHydrographsGis(event, self.inputs['iniLossPer'], soilStoragePerGis,
+                                                 runoffDepth24hPerGis, [qpPerGis], intervalPerGis, timeOut)
+        inflowImpOutGis = self.getHydrographsGis(event, self.inputs['iniLossImp'], soilStorageImpGis,
+                                                 runoffDepth24hImpGis, qpImpGis, intervalImpGis, timeOut)
+
+        # columns ordered per catchment: pervious, impervious 1, (impervious 2)
+        inflowGis = np.stack(inflowPerOutGis + inflowImpOutGis, axis=2)
+
+        return inflowGis.reshape((inflowGis.shape[0], -1))
+
+    def getHydrographsGis(self, event, iniLoss, soilStorage, runoffDepth24h, qps, interval, timeOut) -> list:
+        """ Calculate the hydrographs for all catchments that share the same loss / interval inputs.
+            Each catchment has its own time step so arrays are padded to the longest time series.
+            :return: list of inflows at output interval (output time x catchment) - one per qp
+        """
 
-            uhFullImp1Gis = np.zeros((runoffDepthImpGis.size, runoffDepthImpGis.size))
-            for i in range(0, runoffDepthImpGis.size):
-                uhValuesImp1Gis = runoffDepthImpGis[i] * uhFlowRateFactoredImp1Gis
-                if i + uhValuesImp1Gis.size > runoffDepthImpGis.size:
-                    uhFullImp1Gis[i:runoffDepthImpGis.size, i] = uhValuesImp1Gis[:-(i + uhFlowRateFactoredImp1Gis.size - runoffDepthImpGis.size)]
-                else:
-                    uhFullImp1Gis[i:i + uhFlowRateFactoredImp1Gis.size, i] = uhValuesImp1Gis
+        depthCalcs = self.inputs[event]
+        nCatch = interval.size
 
-            if self.inputs['areaImp2GisChecked']:
-                uhFullImp2Gis = np.zeros((runoffDepthImpGis.size, runoffDepthImpGis.size))
-                for i in range(0, runoffDepthImpGis.size):
-                    uhValuesImp2Gis = runoffDepthImpGis[i] * uhFlowRateFactoredImp2Gis
-                    if i + uhValuesImp2Gis.size > runoffDepthImpGis.size:
-                        uhFullImp2Gis[i:runoffDepthImpGis.size, i] = uhValuesImp2Gis[:-(i + uhFlowRateFactoredImp2Gis.size - runoffDepthImpGis.size)]
-                    else:
-                        uhFullImp2Gis[i:i + uhFlowRateFactoredImp2Gis.size, i] = uhValuesImp2Gis
-
-            # final inflows with input interval
-            inflowPerGis = np.array([])
-            for i in range(0, runoffDepthPerGis.size):
-                inflowPerSumGis = uhFullPerGis[i, :].sum()
-                inflowPerGis = np.append(inflowPerGis, inflowPerSumGis).round(decimals=self.inputs['decimals'])
-
-            inflowImp1Gis = np.array([])
-            for i in range(0, runoffDepthImpGis.size):
-                inflowImp1SumGis = uhFullImp1Gis[i, :].sum()
-                inflowImp1Gis = np.append(inflowImp1Gis, inflowImp1SumGis).round(decimals=self.inputs['decimals'])
-
-            inflowImp2Gis = np.array([])
-            if self.inputs['areaImp2GisChecked']:
-                for i in range(0, runoffDepthImpGis.size):
-                    inflowImp2SumGis = uhFullImp2Gis[i, :].sum()
-                    inflowImp2Gis = np.append(inflowImp2Gis, inflowImp2SumGis).round(decimals=self.inputs['decimals'])
-
-
-            # final inflows with output interval
-            inflowPerOutGis = np.array([0])
-            inflowImp1OutGis = np.array([0])
-            inflowImp2OutGis = np.array([0])
-            for interval in timeOut:
-                if interval == 0:
-                    pass
-                else:
-                    indexPerGis = np.abs(timePerGis - interval).argmin()
-                    inflowPerOutGis = np.append(inflowPerOutGis, inflowPerGis[indexPerGis])
-                    indexImp1Gis = np.abs(timeImpGis - interval).argmin()
-                    inflowImp1OutGis = np.append(inflowImp1OutGis, inflowImp1Gis[indexImp1Gis])
-                    if self.inputs['areaImp2GisChecked']:
-                        indexImp2Gis = np.abs(timeImpGis - interval).argmin()
-                        inflowImp2OutGis = np.append(inflowImp2OutGis, inflowImp2Gis[indexImp2Gis])
+        # time column for calculations based on input interval (same accumulation as stepping one interval at a time)
+        time = self.getTimeGrid(interval)
+        nTime = (~np.isnan(time)).sum(axis=0)
+        nRow = time.shape[0] + 1
 
-            if self.inputs['areaImp2GisChecked']:
-                inflowGisJ = np.column_stack((inflowPerOutGis, inflowImp1OutGis, inflowImp2OutGis))
-            else:
-                inflowGisJ = np.column_stack((inflowPerOutGis, inflowImp1OutGis))
+        # intensity - first row is zero
+        intensity = np.zeros((nRow, nCatch))
+        intensity[1:] = np.where(np.isnan(time), 0., self.getIntensity(event, np.nan_to_num(time, nan=-1.), np.array([])).reshape(time.shape))
+
+        # rainfall depth in mm for specified interval
+        rainfallDepth = ((depthCalcs * intensity) / (24 / interval))
 
-            inflowGisCum = np.column_stack((inflowGisCum, inflowGisJ))
+        # cumulative rainfall depth
+        cumulativeRainfallDepth = np.cumsum(rainfallDepth, axis=0)
 
-        inflowGis = inflowGisCum[:,1:]
+        # cumulative rainfall excess based on remaining initial loss
+        cumulativeRainfallExcess = np.where(cumulativeRainfallDepth < iniLoss, 0., cumulativeRainfallDepth)
 
-        return inflowGis
+        # cumulative runoff depth
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cumulativeRunoffDepth = np.where(cumulativeRainfallExcess == 0, 0.,
+                                             ((cumulativeRainfallExcess - iniLoss) ** 2) /
+                                             ((cumulativeRainfallExcess - iniLoss) + soilStorage))
+
+        # runoff depth
+        runoffDepth = np.diff(cumulativeRunoffDepth, axis=0, prepend=0.)
+
+        # output interval lookup - nearest calculation time for each output time (zero is skipped)
+        timeOut = timeOut[timeOut != 0]
+        index = np.zeros((timeOut.size, nCatch), dtype=np.int64)
+        _, first, inverse = np.unique(interval, return_index=True, return_inverse=True)
+        for i, j in enumerate(first):
+            t = time[:nTime[j],j]
+            k = np.clip(np.searchsorted(t, timeOut), 1, max(t.size - 1, 1))
+            k -= np.abs(t[k-1] - timeOut) <= np.abs(t[np.minimum(k, t.size - 1)] - timeOut)
+            index[:,inverse.reshape(-1) == i] = np.maximum(k, 0)[:,np.newaxis]
+
+        # unit hydrograph convolution
+        uhFlowRateDimensionless = self.inputs['uhOrdinates'][1, :]
+        inflows = []
+        for qp in qps:
+            uhFlowRateFactored = (uhFlowRateDimensionless[:,np.newaxis] * qp) / runoffDepth24h
+            inflow = np.zeros((nRow, nCatch))
+            for k in range(min(uhFlowRateDimensionless.size, nRow)):
+                inflow[k:] += runoffDepth[:nRow-k] * uhFlowRateFactored[k]
+            inflow = inflow.round(decimals=self.inputs['decimals'])
+
+            inflowOut = np.zeros((timeOut.size + 1, nCatch))
+            inflowOut[1:] = np.take_along_axis(inflow, index, axis=0)
+            inflows.append(inflowOut)
+
+        return inflows
+
+    def getTimeGrid(self, interval) -> np.array:
+        """ Calculate the time column for each input interval - padded with nan (time x interval).
+            :return: time
+        """
+
+        kmax = int(np.ceil(23.999999 / np.nanmin(interval))) + 2
+        time = np.zeros((kmax + 1, interval.size))
+        time[1:] = np.cumsum(np.broadcast_to(interval, (kmax, interval.size)), axis=0)
+        nTime = np.argmax(time >= 23.999999, axis=0) + 1
+        time = time[:nTime.max()].round(decimals=4)
+        time[np.arange(time.shape[0])[:,np.newaxis] >= nTime] = np.nan
+
+        return time
 
     def getCatchIdManual(self) -> list:
         """ Create complete catchment IDs for manual calculation.
@@ -758,114 +673,21 @@ class SCS(QObject):
             :return: intensity
         """
 
+        time = np.asarray(time)
         if 'CC' in event:
-            for i in time:
-                if i >= 0 and i < 5.99999:
-                    intensity_value = 0.33
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 5.99999 and i <= 8.99999:
-                    intensity_value = 0.73
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 8.99999 and i <= 9.99999:
-                    intensity_value = 0.95
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 9.99999 and i <= 10.99999:
-                    intensity_value = 1.40
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 10.99999 and i <= 11.49999:
-                    intensity_value = 2.20
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 11.49999 and i <= 11.66666:
-                    intensity_value = 3.82
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 11.66666 and i <= 11.83332:
-                    intensity_value = 4.86
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 11.83332 and i <= 11.99999:
-                    intensity_value = 8.86
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 11.99999 and i <= 12.16666:
-                    intensity_value = 16.65
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 12.16666 and i <= 12.33332:
-                    intensity_value = 5.95
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 12.33332 and i <= 12.49999:
-                    intensity_value = 4.24
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 12.49999 and i <= 12.99999:
-                    intensity_value = 2.92
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 12.99999 and i <= 13.99999:
-                    intensity_value = 1.70
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 13.99999 and i <= 14.99999:
-                    intensity_value = 1.19
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 14.99999 and i <= 17.99999:
-                    intensity_value = 0.75
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 17.99999 and i <= 23.99999:
-                    intensity_value = 0.39
-                    intensity = np.append(intensity, intensity_value)
-                else:
-                    intensity_value = 0.00
-                    intensity = np.append(intensity, intensity_value)
+            values = [0.33, 0.73, 0.95, 1.40, 2.20, 3.82, 4.86, 8.86, 16.65, 5.95, 4.24, 2.92, 1.70, 1.19, 0.75, 0.39]
         else:
-            for i in time:
-                if i >= 0 and i < 5.99999:
-                    intensity_value = 0.34
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 5.99999 and i <= 8.99999:
-                    intensity_value = 0.74
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 8.99999 and i <= 9.99999:
-                    intensity_value = 0.96
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 9.99999 and i <= 10.99999:
-                    intensity_value = 1.40
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 10.99999 and i <= 11.49999:
-                    intensity_value = 2.20
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 11.49999 and i <= 11.66666:
-                    intensity_value = 3.80
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 11.66666 and i <= 11.83332:
-                    intensity_value = 4.80
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 11.83332 and i <= 11.99999:
-                    intensity_value = 8.70
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 11.99999 and i <= 12.16666:
-                    intensity_value = 16.20
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 12.16666 and i <= 12.33332:
-                    intensity_value = 5.90
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 12.33332 and i <= 12.49999:
-                    intensity_value = 4.20
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 12.49999 and i <= 12.99999:
-                    intensity_value = 2.90
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 12.99999 and i <= 13.99999:
-                    intensity_value = 1.70
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 13.99999 and i <= 14.99999:
-                    intensity_value = 1.20
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 14.99999 and i <= 17.99999:
-                    intensity_value = 0.75
-                    intensity = np.append(intensity, intensity_value)
-                elif i >= 17.99999 and i <= 23.99999:
-                    intensity_value = 0.40
-                    intensity = np.append(intensity, intensity_value)
-                else:
-                    intensity_value = 0.00
-                    intensity = np.append(intensity, intensity_value)
+            values = [0.34, 0.74, 0.96, 1.40, 2.20, 3.80, 4.80, 8.70, 16.20, 5.90, 4.20, 2.90, 1.70, 1.20, 0.75, 0.40]
 
-        return intensity
+        # the first matching time band is used
+        bands = [(5.99999, 8.99999), (8.99999, 9.99999), (9.99999, 10.99999), (10.99999, 11.49999),
+                 (11.49999, 11.66666), (11.66666, 11.83332), (11.83332, 11.99999), (11.99999, 12.16666),
+                 (12.16666, 12.33332), (12.33332, 12.49999), (12.49999, 12.99999), (12.99999, 13.99999),
+                 (13.99999, 14.99999), (14.99999, 17.99999), (17.99999, 23.99999)]
+        conditions = [(time >= 0) & (time < 5.99999)] + [(time >= a) & (time <= b) for a, b in bands]
+        intensity_value = np.select(conditions, values, 0.00)
+
+        return np.append(intensity, intensity_value)
 
     def getIntensityManual(self, event) -> np.array:
         """ Assign pervious and impervious intensity for manual calculation.
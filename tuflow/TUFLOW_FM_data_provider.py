@@ -3,7 +3,7 @@ import os
 import struct
 
 import numpy as np
-from .TUFLOW_results import ResData, Timeseries, NodeInfo, ChanInfo
+from .TUFLOW_results import ResData, Timeseries, NodeInfo, ChanInfo, IDIndex, NetworkGraph
 from .TUFLOW_XS import XS, XS_Data
 try:
     from pathlib import Path
@@ -101,6 +101,7 @@ class FM_NodeInfo(NodeInfo):
         self.node_channels = []
         self.message = ''
         self.error = False
+        self._node_index = IDIndex()
 
         # new
         self.nodes = nodes[:]
@@ -163,6 +164,7 @@ class FM_ChanInfo(ChanInfo):
 
         self.message = ''
         self.error = False
+        self._chan_index = IDIndex()
 
         if links is None:
             return
@@ -250,18 +252,19 @@ class FM_Timeseries(Timeseries):
         self.ID = zzn.labels()
         self.nVals = zzn.timestep_count()
         try:
-            values = zzn.get_time_series_data(type_).astype(np.float64, casting='same_kind')
+            data = zzn.get_time_series_data(type_)
         except EOFError:
             return True, 'End of file encountered - possibly incomplete result file'
         timesteps = zzn.timesteps()
-        ind = np.reshape(np.arange(1, self.nVals + 1), (self.nVals, 1))
-        timesteps = np.append(ind, timesteps, axis=1)
-        try:
-            values = np.insert(values, 0, timesteps[:,1], axis=1)
-            values = np.insert(values, 0, timesteps[:,0], axis=1)
-        except IndexError:
+        if not data.shape[0] or timesteps.shape[0] < data.shape[0]:
             return True, 'Possibly incomplete result file'
-        self.Values = np.ma.masked_values(values, self.null_data)
+        self.nVals = data.shape[0]  # only complete timesteps if the simulation is still running
+        # copy straight out of the memory mapped file into the final array
+        values = np.empty((self.nVals, data.shape[1] + 2), dtype=np.float64)
+        values[:,0] = np.arange(1, self.nVals + 1)
+        values[:,1] = timesteps[:self.nVals,0]
+        values[:,2:] = data
+        self.Values = np.ma.masked_values(values, self.null_data, copy=False)
         self.loaded = True
 
         return False, ''
@@ -754,16 +757,32 @@ class TuFloodModellerDataProvider(ResData):
         if not args:
             return
 
-        selected_ids = [x for x in args]
-        link_ids = [x.index for x in self.links]
-        link_upn = [x.us_node for x in self.links]
-        link_dnn = [x.ds_node for x in self.links]
+        selected_ids = set(args)
+        network = self.LP_network()
+        us_links = network.node_ds_channels  # node -> links with their downstream end at the node
+        ds_links = network.node_us_channels  # node -> links with their upstream end at the node
+        added = set()
+
+        def add_link(k, upstream):
+            added.add(self.links[k].index)
+            if upstream:
+                self.LP.chan_ids.insert(0, self.links[k].index)
+                self.LP.chan_index.insert(0, k)
+                self.LP.node_list.insert(0, self.links[k].us_node.id)
+            else:
+                self.LP.chan_ids.append(self.links[k].index)
+                self.LP.chan_index.append(k)
+                self.LP.node_list.append(self.links[k].ds_node.id)
+
+        def is_candidate(k):
+            return self.links[k].index in selected_ids and self.links[k].index not in added
 
         # assume first selection must be plotted and work up and down through selection
-        if selected_ids[0] not in link_ids:
+        if args[0] not in network.chan_index:
             return err, msg
-        i = link_ids.index(selected_ids[0])
-        self.LP.chan_ids.append(selected_ids[0])
+        i = network.chan_index[args[0]]
+        added.add(args[0])
+        self.LP.chan_ids.append(args[0])
         self.LP.chan_index.append(i)
         self.LP.node_list.append(self.links[i].us_node.id)
         self.LP.node_list.append(self.links[i].ds_node.id)
@@ -771,106 +790,67 @@ class TuFloodModellerDataProvider(ResData):
         # work upstream until no longer in selection
         while (1):
             found = False
-            if self.links[i].us_node in link_dnn:
-                count = link_dnn.count(self.links[i].us_node)
-                m = 0
-                for j in range(count):
-                    k = link_dnn[m:].index(self.links[i].us_node) + m
-                    m = k + 1
-                    if self.links[k].index in selected_ids:
-                        if self.links[k].index not in self.LP.chan_ids:
-                            self.LP.chan_ids.insert(0, self.links[k].index)
-                            self.LP.chan_index.insert(0, k)
-                            self.LP.node_list.insert(0, self.links[k].us_node.id)
+            for k in us_links.get(self.links[i].us_node, []):
+                if is_candidate(k):
+                    add_link(k, True)
+                    found = True
+                    i = k
+                    break
+            if not found:
+                if self.links[i].us_node.type.lower() == 'spill':  # can go the other way with spills
+                    for k in us_links.get(self.links[i].ds_node, []):
+                        if is_candidate(k):
+                            add_link(k, True)
                             found = True
                             i = k
                             break
-            if not found:
-                if self.links[i].us_node.type.lower() == 'spill':  # can go the other way with spills
-                    count = link_dnn.count(self.links[i].ds_node)
-                    m = 0
-                    for j in range(count):
-                        k = link_dnn[m:].index(self.links[i].ds_node) + m
-                        m = k + 1
-                        if self.links[k].index in selected_ids:
-                            if self.links[k].index not in self.LP.chan_ids:
-                                self.LP.chan_ids.insert(0, self.links[k].index)
-                                self.LP.chan_index.insert(0, k)
-                                self.LP.node_list.insert(0, self.links[k].us_node.id)
-                                found = True
-                                i = k
-                                break
-                if self.links[i].us_node in link_upn:
-                    count = link_upn.count(self.links[i].us_node)
-                    m = 0
-                    for j in range(count):
-                        k = link_upn[m:].index(self.links[i].us_node) + m
-                        m = k + 1
-                        if self.links[k].us_node.type.lower() == 'spill':
-                            if self.links[k].index in selected_ids:
-                                if self.links[k].index not in self.LP.chan_ids:
-                                    self.LP.chan_ids.insert(0, self.links[k].index)
-                                    self.LP.chan_index.insert(0, k)
-                                    self.LP.node_list.insert(0, self.links[k].us_node.id)
-                                    found = True
-                                    i = k
-                                    break
+                for k in ds_links.get(self.links[i].us_node, []):
+                    if self.links[k].us_node.type.lower() == 'spill' and is_candidate(k):
+                        add_link(k, True)
+                        found = True
+                        i = k
+                        break
                 if not found:
                     break
 
         # work downstream until no longer in selection
-        i = link_ids.index(selected_ids[0])
+        i = network.chan_index[args[0]]
         while (1):
             found = False
-            if self.links[i].ds_node in link_upn:
-                count = link_upn.count(self.links[i].ds_node)
-                m = 0
-                for j in range(count):
-                    k = link_upn[m:].index(self.links[i].ds_node) + m
-                    m = k + 1
-                    if self.links[k].index in selected_ids:
-                        if self.links[k].index not in self.LP.chan_ids:
-                            self.LP.chan_ids.append(self.links[k].index)
-                            self.LP.chan_index.append(k)
-                            self.LP.node_list.append(self.links[k].ds_node.id)
+            for k in ds_links.get(self.links[i].ds_node, []):
+                if is_candidate(k):
+                    add_link(k, False)
+                    found = True
+                    i = k
+                    break
+            if not found:
+                if self.links[i].us_node.type.lower() == 'spill':  # can go the other way with spills
+                    for k in ds_links.get(self.links[i].us_node, []):
+                        if is_candidate(k):
+                            add_link(k, False)
                             found = True
                             i = k
                             break
-            if not found:
-                if self.links[i].us_node.type.lower() == 'spill':  # can go the other way with spills
-                    count = link_upn.count(self.links[i].us_node)
-                    m = 0
-                    for j in range(count):
-                        k = link_upn[m:].index(self.links[i].us_node) + m
-                        m = k + 1
-                        if self.links[k].index in selected_ids:
-                            if self.links[k].index not in self.LP.chan_ids:
-                                self.LP.chan_ids.append(self.links[k].index)
-                                self.LP.chan_index.append(k)
-                                self.LP.node_list.append(self.links[k].ds_node.id)
-                                found = True
-                                i = k
-                                break
-                if self.links[i].ds_node in link_dnn:
-                    count = link_dnn.count(self.links[i].ds_node)
-                    m = 0
-                    for j in range(count):
-                        k = link_dnn[m:].index(self.links[i].ds_node) + m
-                        m = k + 1
-                        if self.links[k].us_node.type.lower() == 'spill':
-                            if self.links[k].index in selected_ids:
-                                if self.links[k].index not in self.LP.chan_ids:
-                                    self.LP.chan_ids.append(self.links[k].index)
-                                    self.LP.chan_index.append(k)
-                                    self.LP.node_list.append(self.links[k].ds_node.id)
-                                    found = True
-                                    i = k
-                                    break
+                for k in us_links.get(self.links[i].ds_node, []):
+                    if self.links[k].us_node.type.lower() == 'spill' and is_candidate(k):
+                        add_link(k, False)
+                        found = True
+                        i = k
+                        break
                 if not found:
                     break
 
         return err, msg
 
+    def LP_network(self):
+        """NetworkGraph of the Flood Modeller links - nodes are FM_Node objects rather than node names."""
+
+        if self._network is None or self._network_channels is not self.links:
+            self._network = NetworkGraph([x.index for x in self.links], [x.us_node for x in self.links],
+                                         [x.ds_node for x in self.links])
+            self._network_channels = self.links
+        return self._network
+
     def LP_getStaticData(self):
         # get the channel and node properties length, elevations etc doesn't change with results
 
@@ -885,6 +865,7 @@ class TuFloodModellerDataProvider(ResData):
         self.LP.node_bed = []
         self.LP.node_top = []
         self.LP.H_nd_index = []
+        self.LP.temporal = {}
         self.LP.node_index = []
         self.LP.Hmax = []
         self.LP.Emax = []
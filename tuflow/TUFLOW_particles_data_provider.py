@@ -1,8 +1,14 @@
+from collections import OrderedDict
 from datetime import datetime
 import re
 import netCDF4
+import numpy as np
 from qgis.PyQt.QtWidgets import QMessageBox
 
+
+CACHE_TIMESTEPS = 8  # number of timesteps of variable slices kept in memory
+PREFETCH_TIMESTEPS = 2  # number of timesteps read ahead in the direction the user is moving through time
+
 class TuParticlesDataProviderError(BaseException):
     pass
 
@@ -15,6 +21,11 @@ class TuParticlesDataProvider:
         self.default_reference_time = None
         self.has_reference_time = False
         self.crs = None
+        self.cache = OrderedDict()  # key time index: value dict -> key nc variable name: value numpy array
+        self.static_cache = {}  # key nc variable name: value numpy array (1D variables that don't change with time)
+        self.last_time_index = None
+        self.prefetch_time_index = None  # time index the queued prefetch reads were queued for
+        self.prefetch_queue = []  # list -> (nc variable name, time index) reads still to do
 
     def load_file(self, filename, defaultRefTime=None):
         """
@@ -27,6 +38,7 @@ class TuParticlesDataProvider:
         self.filename = filename
         self.default_reference_time = defaultRefTime
         self.nc = netCDF4.Dataset(self.filename, 'r')
+        self.clear_cache()
         try:
             self._fill_times_arr()
         except (KeyError, TuParticlesDataProviderError) as e:
@@ -56,9 +68,16 @@ class TuParticlesDataProvider:
             rel_times_in_hour += [hours]
         return rel_times_in_hour
 
-    def read_data_at_time(self, at_time):
+    def read_data_at_time(self, at_time, variables=None):
         """
         Return data for attributes for particular time index (at_time is the index in the self.times)
+
+        Each variable is read once per timestep (all components in a single read) and kept in a cache
+        of recent timesteps, so returning to a timestep doesn't require reading the file again.
+
+        :param at_time: int time index
+        :param variables: list -> str attribute names (as returned by get_all_variable_names) to read.
+                          x, y, z and stat are always read. None reads all variables.
         """
         if self.nc is None:
             return None
@@ -69,33 +88,124 @@ class TuParticlesDataProvider:
         if at_time < 0 or at_time >= self.times.shape[0]:
             return None
 
-        ignored_vars = ['Time']
+        if variables is not None:
+            variables = set(variables) | {'x', 'y', 'z', 'stat'}
+
         data = {}
-        variables = self.nc.variables.keys()
-        for var in variables:
-            if var in ignored_vars:  # if variable should be ignored, e.g. Time
+        for var in self._variables_to_read(variables):
+            values = self._read_variable(var, at_time)
+            if values is None:
                 continue
-            if self.nc.variables[var].ndim == 1:  # 1D variable
-                data[var] = self.nc.variables[var][:].data
-            elif self.nc.variables[var].ndim == 2:  # 2D variable
-                data[var] = self.nc.variables[var][at_time, :].data
-            elif self.nc.variables[var].ndim == 3:  # 3D variable
-                third_dimension_size = self.nc.variables[var].shape[2]
-                if third_dimension_size == 1:
-                    # variables with dimension time * trajectory * 1, so _x or _1 is unnecessary
-                    data[var] = self.nc.variables[var][at_time, :, 0].data
-                elif third_dimension_size == 3 and var != 'mass':  # variables f.e. uvw, uvw_water
-                    data[var + '_x'] = self.nc.variables[var][at_time, :, 0].data
-                    data[var + '_y'] = self.nc.variables[var][at_time, :, 1].data
-                    data[var + '_z'] = self.nc.variables[var][at_time, :, 2].data
-                else:  # other variables, f.e. mass
-                    for i in range(third_dimension_size):
-                        data[var + '_' + str(i)] = self.nc.variables[var][at_time, :, i].data
-            else:
-                pass  # unknown dimensions
+            if values.ndim == 1:
+                data[var] = values
+            elif values.shape[1] == 1:
+                # variables with dimension time * trajectory * 1, so _x or _1 is unnecessary
+                data[var] = values[:,0]
+            elif values.shape[1] == 3 and var != 'mass':  # variables f.e. uvw, uvw_water
+                data[var + '_x'] = values[:,0]
+                data[var + '_y'] = values[:,1]
+                data[var + '_z'] = values[:,2]
+            else:  # other variables, f.e. mass
+                for i in range(values.shape[1]):
+                    data[var + '_' + str(i)] = values[:,i]
+
+        if variables is not None:
+            data = {k: v for k, v in data.items() if k in variables}
+
+        self.last_time_index = at_time
 
         return data
 
+    def prefetch(self, at_time, variables=None, direction=1):
+        """
+        Queue reads of the next few timesteps in the direction the user is moving through time. Nothing is read
+        here - prefetch_next does one read at a time so it can be called when the application is idle without
+        blocking it. Any reads still queued for a previous timestep are abandoned.
+        """
+        self.prefetch_queue = []
+        self.prefetch_time_index = at_time
+        if not self._is_open() or self.times is None:
+            return
+
+        if variables is not None:
+            variables = set(variables) | {'x', 'y', 'z', 'stat'}
+        nc_vars = self._variables_to_read(variables)
+        for i in range(1, PREFETCH_TIMESTEPS + 1):
+            time_index = at_time + i * direction
+            if time_index < 0 or time_index >= self.times.shape[0]:
+                break
+            cached = self.cache.get(time_index, {})
+            self.prefetch_queue.extend([(var, time_index) for var in nc_vars
+                                        if self.nc.variables[var].ndim in (2, 3) and var not in cached])
+
+    def prefetch_next(self, at_time):
+        """
+        Does the next read queued by prefetch. The queue is abandoned if the user has moved to a different
+        timestep than at_time or the file has been closed.
+
+        :param at_time: int time index the reads were queued for
+        :return: bool -> True if there are more reads queued
+        """
+        if at_time != self.prefetch_time_index or at_time != self.last_time_index or not self._is_open():
+            self.prefetch_queue = []
+            return False
+
+        if self.prefetch_queue:
+            var, time_index = self.prefetch_queue.pop(0)
+            self._read_variable(var, time_index)
+
+        return bool(self.prefetch_queue)
+
+    def close(self):
+        self.prefetch_queue = []
+        if self._is_open():
+            self.nc.close()
+        self.nc = None
+        self.clear_cache()
+
+    def clear_cache(self):
+        self.cache.clear()
+        self.static_cache.clear()
+        self.last_time_index = None
+        self.prefetch_queue = []
+
+    def _is_open(self):
+        return self.nc is not None and self.nc.isopen()
+
+    def _variables_to_read(self, variables):
+        """Returns the netcdf variable names required for the given attribute names (None for all)."""
+        ignored_vars = ['Time']
+        nc_vars = [x for x in self.nc.variables.keys() if x not in ignored_vars]
+        if variables is None:
+            return nc_vars
+        # multi component variables are named e.g. uvw_x or mass_1
+        return [var for var in nc_vars if var in variables or any(x.rsplit('_', 1)[0] == var for x in variables)]
+
+    def _read_variable(self, var, at_time):
+        """
+        Returns the values of a variable at a time index (1D variables are returned as is). 3D variables
+        are returned as a 2D array (trajectory x component). Returns None for unknown dimensions.
+        """
+        ncvar = self.nc.variables[var]
+        if ncvar.ndim == 1:
+            if var not in self.static_cache:
+                self.static_cache[var] = np.ma.getdata(ncvar[:])
+            return self.static_cache[var]
+        if ncvar.ndim not in (2, 3):
+            return None  # unknown dimensions
+
+        if at_time in self.cache:
+            self.cache.move_to_end(at_time)
+        else:
+            self.cache[at_time] = {}
+            while len(self.cache) > CACHE_TIMESTEPS:
+                self.cache.popitem(last=False)
+        slices = self.cache[at_time]
+        if var not in slices:
+            ncvar.set_auto_mask(False)  # mask isn't used - skips building masked arrays
+            slices[var] = np.ma.getdata(ncvar[at_time])
+        return slices[var]
+
     def get_all_variable_names(self, debug=False):
         """
             Return the names of the attributes that are in the file
@@ -172,3 +282,4 @@ class TuParticlesDataProvider:
 
     def set_reference_time(self, time):
         self._fill_times_arr(override_reference_time=time)
+        self.clear_cache()
@@ -4,6 +4,8 @@ import numpy
 import csv
 import ctypes
 import re
+import itertools
+from collections import deque
 from qgis.PyQt.QtWidgets import QMessageBox
 from .tuflowqgis_library import (getOSIndependentFilePath, NC_Error,
 									   NcDim, NcVar, getNetCDFLibrary)
@@ -11,6 +13,8 @@ from dateutil.parser import parse
 from datetime import timedelta
 # from .utils.map_layer import layer_name_from_data_source
 from .compatibility_routines import Path
+from .ts_csv import read_ts_csv
+from .tuflow_plugin_cache import load_cached_arrays, save_cached_arrays
 version = '2018-03-AA' #added reporting location regions
 
 def clean_data_source(data_source: str) -> str:
@@ -31,6 +35,83 @@ def layer_name_from_data_source(data_source: str) -> str:
 		return Path(clean_data_source(data_source)).stem
 
 
+def load_attributes_from_cache(obj, fullpath, tag, names):
+	"""
+	Sets list attributes on obj from arrays cached by save_attributes_to_cache. Attributes that weren't cached
+	(because they were None) are set to None. Returns False if there is no valid cache for the file.
+	"""
+	arrays = load_cached_arrays(fullpath, tag)
+	if arrays is None:
+		return False
+	for name in names:
+		setattr(obj, name, arrays[name].tolist() if name in arrays else None)
+	return True
+
+
+def save_attributes_to_cache(obj, fullpath, tag, names):
+	arrays = {name: numpy.array(getattr(obj, name)) for name in names if getattr(obj, name) is not None}
+	save_cached_arrays(fullpath, tag, arrays)
+
+
+def time_index(times, time, tol=0.0001, time_interpolate='previous'):
+	"""
+	Returns the index of time in a sorted times array using a binary search. Times within tol are treated as
+	equal. If time isn't found, the index of the previous time is returned if time_interpolate == 'previous',
+	otherwise None.
+	"""
+	times = numpy.asarray(times, dtype=numpy.float64)
+	if not times.size:
+		return None
+	i = int(numpy.searchsorted(times, time - tol, side='left'))
+	if i < times.size and abs(times[i] - time) <= tol:
+		return i
+	if time_interpolate == 'previous' and i > 0:
+		return i - 1
+	return None
+
+
+class IDIndex:
+	"""
+	Hash index of a list of IDs (ID -> position of first occurrence). Replaces list.index() lookups.
+	The index is rebuilt if the list object or its length changes.
+	"""
+
+	def __init__(self):
+		self._ids = None
+		self._count = -1
+		self._index = {}
+
+	def index(self, ids, id):
+		if ids is not self._ids or len(ids) != self._count:
+			self._index = {}
+			for i, x in enumerate(ids):
+				self._index.setdefault(x, i)
+			self._ids = ids
+			self._count = len(ids)
+		try:
+			return self._index[id]
+		except (KeyError, TypeError):
+			raise ValueError('{0} is not in list'.format(id))
+
+
+def lp_profile_values(node_values, inverts=None):
+	"""
+	Expands node values (time x node or node) to the long profile plotting points - the first and last node
+	appear once and every other node twice (once for the channel either side). If inverts are given
+	(the LP chan_inv list) the values are not allowed to plot below the channel inverts.
+	"""
+	node_values = numpy.ma.asarray(node_values, dtype=numpy.float64)
+	n = node_values.shape[-1]
+	repeats = numpy.full((n,), 2, dtype=int)
+	if n:
+		repeats[0] = 1
+		repeats[-1] = 1
+	values = numpy.repeat(node_values, repeats, axis=-1)
+	if inverts is not None and n > 1:
+		values = numpy.ma.maximum(values, numpy.ma.asarray(inverts, dtype=numpy.float64))
+	return numpy.ascontiguousarray(numpy.ma.filled(values, numpy.nan))
+
+
 class DynamicResult:
 	def __init__(self, res, geom):
 		self.res = res
@@ -68,6 +149,104 @@ class LP():
 		self.adverseE = LP_Adverse()
 		self.id1 = None
 		self.id2 = None
+		self.temporal = {}  # dat_type -> time x profile point array (see LP_getDataAll)
+
+class NetworkGraph():
+	"""
+	1D network connectivity used for long profile path finding.
+
+	Adjacency is stored in dictionaries (node -> channels) so finding the channels up or downstream of a channel
+	doesn't require a search through all channels. Path finding is iterative so large networks don't hit the
+	recursion limit.
+	"""
+
+	def __init__(self, chan_names, us_nodes, ds_nodes):
+		self.chan_name = list(chan_names)
+		self.chan_US_Node = list(us_nodes)
+		self.chan_DS_Node = list(ds_nodes)
+		self.chan_index = {}
+		self.node_us_channels = {}  # node -> indexes of channels with their upstream end at the node
+		self.node_ds_channels = {}  # node -> indexes of channels with their downstream end at the node
+		for i, (chan, us_node, ds_node) in enumerate(zip(self.chan_name, self.chan_US_Node, self.chan_DS_Node)):
+			self.chan_index.setdefault(chan, i)
+			self.node_us_channels.setdefault(us_node, []).append(i)
+			self.node_ds_channels.setdefault(ds_node, []).append(i)
+		self._path_cache = {}
+
+	@staticmethod
+	def fromChanInfo(channels):
+		return NetworkGraph(channels.chan_name, channels.chan_US_Node, channels.chan_DS_Node)
+
+	def downstreamChannels(self, chan):
+		"""Returns channel names connected to the downstream end of chan."""
+		i = self.chan_index.get(chan)
+		if i is None:
+			return []
+		return [self.chan_name[x] for x in self.node_us_channels.get(self.chan_DS_Node[i], [])]
+
+	def upstreamChannels(self, chan):
+		"""Returns channel names connected to the upstream end of chan."""
+		i = self.chan_index.get(chan)
+		if i is None:
+			return []
+		return [self.chan_name[x] for x in self.node_ds_channels.get(self.chan_US_Node[i], [])]
+
+	def path(self, start_chan, end_chan=None):
+		"""
+		Returns a list of channel names from start_chan downstream to end_chan (inclusive) or None if they
+		aren't connected. The shortest path (number of channels) is returned and cached.
+
+		If end_chan is None, the path follows the first available downstream branch until an outlet is reached.
+		"""
+
+		key = (start_chan, end_chan)
+		if key not in self._path_cache:
+			if start_chan not in self.chan_index:
+				path = None
+			elif end_chan is None:
+				path = self._path_to_outlet(start_chan)
+			else:
+				path = self._shortest_path(start_chan, end_chan)
+			self._path_cache[key] = path
+		path = self._path_cache[key]
+		return path[:] if path is not None else None
+
+	def _shortest_path(self, start_chan, end_chan):
+		prev = {start_chan: None}
+		queue = deque([start_chan])
+		while queue:
+			chan = queue.popleft()
+			for ds_chan in self.downstreamChannels(chan):
+				if ds_chan in prev:
+					continue
+				prev[ds_chan] = chan
+				if ds_chan == end_chan:
+					path = [ds_chan]
+					while prev[path[-1]] is not None:
+						path.append(prev[path[-1]])
+					return path[::-1]
+				queue.append(ds_chan)
+		return None
+
+	def _path_to_outlet(self, start_chan):
+		path = [start_chan]
+		visited = {start_chan}
+		stack = [iter(self.downstreamChannels(start_chan))]
+		while stack:
+			chan = next(stack[-1], None)
+			if chan is None:
+				if not self.downstreamChannels(path[-1]):
+					return path  # outlet
+				stack.pop()
+				path.pop()
+				continue
+			if chan in visited:
+				continue
+			visited.add(chan)
+			path.append(chan)
+			stack.append(iter(self.downstreamChannels(chan)))
+		return None
+
 
 class LP_Adverse():
 	"""
@@ -230,7 +409,98 @@ class Timeseries():
 		self.uID = []  # unique ids - added for losses
 		self.lossNames = []  # record loss names because this will be useful later
 
-	def Load(self,fullpath,prefix, simID):
+		# lazy loading - values are only read from the csv the first time they are requested
+		self.fullpath = None
+		self.prefix = None
+		self._lazy = False
+		self._times = None
+		self._time_offset = 0.
+		self.cache = False  # use binary cache of parsed values (see tuflow_plugin_cache.save_cached_arrays)
+		self._column_index = IDIndex()
+
+	@property
+	def Values(self):
+		if self._lazy:
+			error, message = self.materialise()
+			if error:
+				raise IOError(message)
+		return self._values
+
+	@Values.setter
+	def Values(self, values):
+		self._values = values
+
+	def isMaterialised(self):
+		"""Returns True if the values have been read into memory (always True if not lazy loaded)."""
+		return not self._lazy
+
+	def materialise(self):
+		"""
+		Reads the values from the csv if they have been lazy loaded. If reading fails the values stay
+		lazy loaded so the read is tried again next time.
+
+		:return: bool error, str message
+		"""
+
+		if not self._lazy:
+			return False, ''
+		error, message = self.loadValues()
+		if not error:
+			self._lazy = False
+		return error, message
+
+	def times(self):
+		"""
+		Returns the time column. If the values have not been read yet (lazy loading) only the time column
+		is read from the csv so the remaining columns are not parsed.
+		"""
+
+		if not self._lazy:
+			times = self.Values[:,1]
+			return times if times.dtype == numpy.float64 else times.astype(float)
+		if self._times is None:
+			times = []
+			with open(self.fullpath, 'r', encoding='utf-8', errors='ignore') as csvfile:
+				next(csvfile)
+				for line in csvfile:
+					if not line.strip() or line.startswith('!'):
+						continue
+					times.append(float(line.split(',', 2)[1]))
+			self._times = numpy.array(times) + self._time_offset
+		return self._times
+
+	def columnIndex(self, id):
+		"""Returns the column index in Values for an ID (same as Header.index(id)). Raises ValueError if not found."""
+		return self._column_index.index(self.Header, id)
+
+	def columnIndexes(self, ids):
+		"""Returns an array of column indexes for a list of IDs. IDs that are not found are given -1."""
+		cols = numpy.full((len(ids),), -1, dtype=int)
+		for i, id in enumerate(ids):
+			try:
+				cols[i] = self.columnIndex(id)
+			except ValueError:
+				pass
+		return cols
+
+	def timeIndex(self, time, tol=0.0001, time_interpolate='previous'):
+		"""Returns the row index in Values for a given time (see time_index)."""
+		return time_index(self.times(), time, tol, time_interpolate)
+
+	def shiftTimes(self, offset):
+		"""
+		Adds offset (hrs) to the time column. If the values have not been read yet (lazy loading) the offset
+		is stored and applied once they are.
+		"""
+
+		if self._lazy:
+			self._time_offset += offset
+			if self._times is not None:
+				self._times = self._times + offset
+		else:
+			self._values[:,1] = self._values[:,1] + offset
+
+	def Load(self,fullpath,prefix, simID, lazy=False, cache=False):
 		error = False
 		message = ''
 		try:
@@ -279,26 +549,48 @@ class Timeseries():
 				self.nCols.append(nCol)
 				self.uID.append(header[i - 1])
 		self.Header = header
+		self.fullpath = fullpath
+		self.prefix = prefix
+		self.cache = cache
+		self._times = None
+		self._time_offset = 0.
+		if lazy:
+			self.Values = None
+			self.nLocs = len(self.Header)-2
+			self._lazy = True
+			self.loaded = True
+			return error, message
+
+		return self.loadValues()
+
+	def loadValues(self):
+		error = False
+		message = ''
+		fullpath = self.fullpath
+		prefix = self.prefix
 		try:
-			with open(fullpath, 'r', encoding='utf-8', errors='ignore') as csvfile:
-				next(csvfile)
+			cached = load_cached_arrays(fullpath, 'Timeseries') if self.cache else None
+			if cached is not None and 'values' in cached:
+				self._values = numpy.ma.masked_array(cached['values'], cached.get('mask', numpy.ma.nomask))
+			else:
 				if prefix == "F":
-					values = numpy.genfromtxt(csvfile, delimiter=",", skip_header=0, dtype=str, encoding='utf-8', comments='!')
+					self._values = read_ts_csv(fullpath, dtype=str, null_data=self.null_data, comments='!')
 				else:
-					values = numpy.genfromtxt(csvfile, delimiter=",", skip_header=0, encoding='utf-8')
-			# null_array = values == self.null_data)
-			# self.Values = numpy.ma.masked_array(values,null_array)
-			if values.dtype == numpy.float64:
-				self.Values = numpy.ma.masked_values(values, self.null_data)
-			else:
-				null_array = numpy.array([[True if y == str(self.null_data) else False for y in x] for x in values])
-				self.Values = numpy.ma.masked_array(values, null_array)
+					self._values = read_ts_csv(fullpath, null_data=self.null_data)
+				if self.cache:
+					arrays = {'values': self._values.data}
+					if self._values.mask is not numpy.ma.nomask and self._values.mask.any():
+						arrays['mask'] = self._values.mask
+					save_cached_arrays(fullpath, 'Timeseries', arrays)
 		except:
 			message = 'ERROR - Error reading data from: '+fullpath
 			error = True
 			return error, message
 		try:
-			self.nVals = len(self.Values[:,2])
+			if self._time_offset and self._values.dtype == numpy.float64:
+				self._values[:,1] = self._values[:,1] + self._time_offset
+				self._time_offset = 0.
+			self.nVals = len(self._values[:,2])
 			self.nLocs = len(self.Header)-2
 			self.loaded = True
 		except IOError:
@@ -506,10 +798,20 @@ class Node_Max():
 		self.EMax = []
 		self.nLocs = 0
 		self.loaded = False
+		self._id_index = IDIndex()
 
-	def Load(self,fullpath):
+	def idIndex(self, id):
+		"""Returns the index of an ID (same as ID.index(id)). Raises ValueError if not found."""
+		return self._id_index.index(self.ID, id)
+
+	def Load(self,fullpath, cache=False):
 		error = False
 		message = ''
+		cache_attrs = ['ID', 'HMax', 'tHmax', 'EMax']
+		if cache and load_attributes_from_cache(self, fullpath, 'Node_Max', cache_attrs):
+			self.nLocs = len(self.ID)
+			self.loaded = True
+			return error, message
 		hMax = True
 		tHmax = True
 		EMax = True
@@ -577,6 +879,8 @@ class Node_Max():
 		#normal end
 		self.nLocs = len(self.ID)
 		self.loaded = True
+		if cache:
+			save_attributes_to_cache(self, fullpath, 'Node_Max', cache_attrs)
 		return error, message
 
 class Chan_Max():
@@ -591,10 +895,20 @@ class Chan_Max():
 		self.tVmax = []
 		self.nLocs = 0
 		self.loaded = False
+		self._id_index = IDIndex()
 
-	def Load(self,fullpath):
+	def idIndex(self, id):
+		"""Returns the index of an ID (same as ID.index(id)). Raises ValueError if not found."""
+		return self._id_index.index(self.ID, id)
+
+	def Load(self,fullpath, cache=False):
 		error = False
 		message = ''
+		cache_attrs = ['ID', 'QMax', 'tQmax', 'VMax', 'tVmax']
+		if cache and load_attributes_from_cache(self, fullpath, 'Chan_Max', cache_attrs):
+			self.nLocs = len(self.ID)
+			self.loaded = True
+			return error, message
 		qmax = True
 		tqmax = True
 		vmax = True
@@ -665,6 +979,8 @@ class Chan_Max():
 		# normal return
 		self.nLocs = len(self.ID)
 		self.loaded = True
+		if cache:
+			save_attributes_to_cache(self, fullpath, 'Chan_Max', cache_attrs)
 		return error, message
 
 class RL_P_Max():
@@ -904,7 +1220,7 @@ class NodeInfo():
 	"""
 	Node Info data class
 	"""
-	def __init__(self,fullpath):
+	def __init__(self,fullpath, cache=False):
 		self.node_num = []
 		self.node_name = []
 		self.node_bed = []
@@ -913,8 +1229,19 @@ class NodeInfo():
 		self.node_channels = []
 		self.message = ''
 		self.error = False
+		self._node_index = IDIndex()
 		if not fullpath:
 			return
+		cache_attrs = ['node_num', 'node_name', 'node_bed', 'node_top', 'node_nChan', 'node_channels_flat',
+		               'node_channels_count']
+		if cache and load_attributes_from_cache(self, fullpath, 'NodeInfo', cache_attrs):
+			flat = self.node_channels_flat
+			i = 0
+			for n in self.node_channels_count:
+				self.node_channels.append(flat[i:i+n])
+				i += n
+			del self.node_channels_flat, self.node_channels_count
+			return
 		try:
 			with open(fullpath, 'r', encoding='utf-8', errors='ignore') as csvfile:
 				reader = csv.reader(csvfile, delimiter=',', quotechar='"')
@@ -953,12 +1280,21 @@ class NodeInfo():
 		except:
 			self.message = 'ERROR reading file: \n{0}'.format(fullpath)
 			self.error = True
+		if cache and not self.error:
+			self.node_channels_flat = list(itertools.chain.from_iterable(self.node_channels))
+			self.node_channels_count = [len(x) for x in self.node_channels]
+			save_attributes_to_cache(self, fullpath, 'NodeInfo', cache_attrs)
+			del self.node_channels_flat, self.node_channels_count
+
+	def nodeIndex(self, name):
+		"""Returns the index of a node name (same as node_name.index(name)). Raises ValueError if not found."""
+		return self._node_index.index(self.node_name, name)
 
 class ChanInfo():
 	"""
 	Channel Info data class
 	"""
-	def __init__(self,fullpath):
+	def __init__(self,fullpath, cache=False):
 		self.chan_num = []
 		self.chan_name = []
 		self.chan_US_Node = []
@@ -980,8 +1316,16 @@ class ChanInfo():
 
 		self.message = ''
 		self.error = False
+		self._chan_index = IDIndex()
 		if not fullpath:
 			return
+		cache_attrs = ['chan_num', 'chan_name', 'chan_US_Node', 'chan_DS_Node', 'chan_US_Chan', 'chan_DS_Chan',
+		               'chan_Flags', 'chan_Length', 'chan_FormLoss', 'chan_n', 'chan_slope', 'chan_US_Inv',
+		               'chan_DS_Inv', 'chan_LBUS_Obv', 'chan_RBUS_Obv', 'chan_LBDS_Obv', 'chan_RBDS_Obv',
+		               'chan_Blockage']
+		if cache and load_attributes_from_cache(self, fullpath, 'ChanInfo', cache_attrs):
+			self.nChan = len(self.chan_name)
+			return
 		try:
 			with open(fullpath, 'r', encoding='utf-8', errors='ignore') as csvfile:
 				reader = csv.reader(csvfile, delimiter=',', quotechar='"')
@@ -1061,6 +1405,12 @@ class ChanInfo():
 		except:
 			self.message = 'ERROR reading file: \n{0}'.format(fullpath)
 			self.error = True
+		if cache and not self.error:
+			save_attributes_to_cache(self, fullpath, 'ChanInfo', cache_attrs)
+
+	def chanIndex(self, name):
+		"""Returns the index of a channel name (same as chan_name.index(name)). Raises ValueError if not found."""
+		return self._chan_index.index(self.chan_name, name)
 
 # results class
 class ResData():
@@ -1105,6 +1455,14 @@ class ResData():
 
 		self.gpkg_filenames = []
 
+		# only read time series csv headers on load - values are read the first time they are requested
+		self.lazy_load = False
+		# store parsed csv results in the plugin cache folder and memory map them when the same files are reopened
+		self.cache_results = False
+
+		self._network = None  # NetworkGraph - built from self.Channels when first needed
+		self._network_channels = None
+
 	def __eq__(self, other):
 		if type(other) is type(self):
 			return self.fpath == other.fpath
@@ -1138,30 +1496,26 @@ class ResData():
 			if found:
 				return data[1]
 		else:
-			if time not in self.times:
-				if time_interpolate == 'previous':
-					t = list(filter(lambda x: x < time, self.times))
-					if t:
-						time = t[-1]
-					else:
-						return None
-				else:
-					return None
-
-			i = self.times.tolist().index(time)
 			found, ydata, message = self.getTSData(id, dom, res, None)
 			if found:
-				return ydata[i]
+				i = time_index(self.times, time, 0., time_interpolate)
+				if i is not None:
+					return ydata[i]
 
 		return None
 
 	def getTSData(self, id, dom, res, geom):
 		message = None
+		timeseries = self.getTimeseries(dom, res)
+		if timeseries is not None and timeseries.loaded:
+			error, err_message = timeseries.materialise()
+			if error:
+				return False, [0.0], err_message
 		if (dom.upper() == "1D"):
 			if res.upper() in ['VOL', 'VOLUME', 'VOLUMES']:
 				if self.Data_1D.Vol.loaded:
 					try:
-						ind = self.Data_1D.Vol.Header.index(id)
+						ind = self.Data_1D.Vol.columnIndex(id)
 						data = self.Data_1D.Vol.Values[:,ind]
 						self.times = self.Data_1D.Vol.Values[:,1]
 						return True, data, message
@@ -1171,7 +1525,7 @@ class ResData():
 			elif res.upper() in ['FLOW INTEGRAL', 'FLOW INTEGRALS']:
 				if self.Data_1D.QI.loaded:
 					try:
-						ind = self.Data_1D.QI.Header.index(id)
+						ind = self.Data_1D.QI.columnIndex(id)
 						data = self.Data_1D.QI.Values[:, ind]
 						self.times = self.Data_1D.QI.Values[:, 1]
 						return True, data, message
@@ -1181,7 +1535,7 @@ class ResData():
 			elif(res.upper() in ("H", "H_", "LEVEL","LEVELS")):
 				if self.Data_1D.H.loaded:
 					try:
-						ind = self.Data_1D.H.Header.index(id)
+						ind = self.Data_1D.H.columnIndex(id)
 						data = self.Data_1D.H.Values[:,ind]
 						self.times = self.Data_1D.H.Values[:,1]
 						return True, data, message
@@ -1194,7 +1548,7 @@ class ResData():
 			elif(res.upper() in ("E", "E_", "ENERGY LEVEL","ENERGY LEVELS")):
 				if self.Data_1D.E.loaded:
 					try:
-						ind = self.Data_1D.E.Header.index(id)
+						ind = self.Data_1D.E.columnIndex(id)
 						data = self.Data_1D.E.Values[:,ind]
 						self.times = self.Data_1D.E.Values[:,1]
 						return True, data, message
@@ -1207,7 +1561,7 @@ class ResData():
 			elif(res.upper() in ("Q","Q_","FLOW","FLOWS")):
 				if self.Data_1D.Q.loaded:
 					try:
-						ind = self.Data_1D.Q.Header.index(id)
+						ind = self.Data_1D.Q.columnIndex(id)
 						data = self.Data_1D.Q.Values[:,ind]
 						self.times = self.Data_1D.Q.Values[:,1]
 						return True, data, message
@@ -1220,7 +1574,7 @@ class ResData():
 			elif(res.upper() in ("V","V_","VELOCITY","VELOCITIES")):
 				if self.Data_1D.V.loaded:
 					try:
-						ind = self.Data_1D.V.Header.index(id)
+						ind = self.Data_1D.V.columnIndex(id)
 						data = self.Data_1D.V.Values[:,ind]
 						self.times = self.Data_1D.V.Values[:, 1]
 						return True, data, message
@@ -1233,7 +1587,7 @@ class ResData():
 			elif(res.upper() in ("A","A_","FLOW AREA","FLOW AREAS")):
 				if self.Data_1D.A.loaded:
 					try:
-						ind = self.Data_1D.A.Header.index(id)
+						ind = self.Data_1D.A.columnIndex(id)
 						data = self.Data_1D.A.Values[:,ind]
 						self.times = self.Data_1D.A.Values[:,1]
 						return True, data, message
@@ -1244,14 +1598,14 @@ class ResData():
 					message = 'No 1D Flow Area Data loaded for: '+self.displayname
 					return False, [0.0], message
 			elif(res.upper() in ("US_H", "US LEVELS")):
-				chan_list = tuple(self.Channels.chan_name)
-				if id not in chan_list:
+				try:
+					ind = self.Channels.chanIndex(str(id))
+				except ValueError:
 					message = 'Unable to find {0} in available channels'.format(id)
 					return False, [0.], message
-				ind = chan_list.index(str(id))
 				a = str(self.Channels.chan_US_Node[ind])
 				try:
-					ind = self.Data_1D.H.Header.index(a)
+					ind = self.Data_1D.H.columnIndex(a)
 				except:
 					message = 'Unable to find US node: ',+a+' for channel '+ id
 					return False, [0.0], message
@@ -1263,14 +1617,14 @@ class ResData():
 					message = 'Data not found for 1D H with ID: '+a
 					return False, [0.0], message
 			elif(res.upper() in ("DS_H","DS LEVELS")):
-				chan_list = tuple(self.Channels.chan_name)
-				if id not in chan_list:
+				try:
+					ind = self.Channels.chanIndex(str(id))
+				except ValueError:
 					message = 'Unable to find {0} in available channels'.format(id)
 					return False, [0.], message
-				ind = chan_list.index(str(id))
 				a = str(self.Channels.chan_DS_Node[ind])
 				try:
-					ind = self.Data_1D.H.Header.index(a)
+					ind = self.Data_1D.H.columnIndex(a)
 				except:
 					message = 'Unable to find DS node: ',+a+' for channel '+ id
 					return False, [0.0], message
@@ -1284,7 +1638,7 @@ class ResData():
 			elif (res.upper() in ("MB")):
 				if self.Data_1D.MB.loaded:
 					try:
-						ind = self.Data_1D.MB.Header.index(id)
+						ind = self.Data_1D.MB.columnIndex(id)
 						data = self.Data_1D.MB.Values[:, ind]
 						self.times = self.Data_1D.MB.Values[:, 1]
 						return True, data, message
@@ -1298,12 +1652,12 @@ class ResData():
 				if self.Data_1D.NF.loaded or self.Data_1D.CF.loaded:
 					try:
 						if id in self.Data_1D.NF.Header:
-							ind = self.Data_1D.NF.Header.index(id)
+							ind = self.Data_1D.NF.columnIndex(id)
 							data = self.Data_1D.NF.Values[:, ind]
 							self.times = self.Data_1D.NF.Values[:, 1].astype(float)
 							return True, data, message
 						elif id in self.Data_1D.CF.Header:
-							ind = self.Data_1D.CF.Header.index(id)
+							ind = self.Data_1D.CF.columnIndex(id)
 							data = self.Data_1D.CF.Values[:, ind]
 							self.times = self.Data_1D.CF.Values[:, 1].astype(float)
 							return True, data, message
@@ -1318,7 +1672,7 @@ class ResData():
 			elif (res.upper() in ("LOSSES", "CL")):
 				if self.Data_1D.CL.loaded:
 					try:
-						ind = self.Data_1D.CL.Header.index(id)
+						ind = self.Data_1D.CL.columnIndex(id)
 						iun = self.Data_1D.CL.uID.index(id)  # index unique name
 						nCol = self.Data_1D.CL.nCols[iun]  # number of columns associated with element losses
 						data = self.Data_1D.CL.Values[:, ind:ind + nCol]
@@ -1339,7 +1693,7 @@ class ResData():
 				timeSeries = self.Data_2D.dynamic_results[res].res
 				if timeSeries.loaded:
 					try:
-						ind = timeSeries.Header.index(id)
+						ind = timeSeries.columnIndex(id)
 						data = timeSeries.Values[:,ind]
 						self.times = timeSeries.Values[:,1]
 						return True, data, message
@@ -1349,7 +1703,7 @@ class ResData():
 			if(res.upper() in  ("H", "H_", "LEVEL","LEVELS","POINT WATER LEVEL")):
 				if self.Data_2D.H.loaded:
 					try:
-						ind = self.Data_2D.H.Header.index(id)
+						ind = self.Data_2D.H.columnIndex(id)
 						data = self.Data_2D.H.Values[:,ind]
 						self.times = self.Data_2D.H.Values[:,1]
 						return True, data, message
@@ -1362,7 +1716,7 @@ class ResData():
 			elif (res.upper() in ("D", "D_", "DEPTH", "DEPTHS", "POINT DEPTH")):
 				if self.Data_2D.D.loaded:
 					try:
-						ind = self.Data_2D.D.Header.index(id)
+						ind = self.Data_2D.D.columnIndex(id)
 						data = self.Data_2D.D.Values[:, ind]
 						self.times = self.Data_2D.D.Values[:, 1]
 						return True, data, message
@@ -1375,7 +1729,7 @@ class ResData():
 			elif(res.upper() in ("Q","Q_","FLOW","FLOWS")):
 				if self.Data_2D.Q.loaded:
 					try:
-						ind = self.Data_2D.Q.Header.index(id)
+						ind = self.Data_2D.Q.columnIndex(id)
 						data = self.Data_2D.Q.Values[:,ind]
 						self.times = self.Data_2D.Q.Values[:,1]
 						return True, data, message
@@ -1388,7 +1742,7 @@ class ResData():
 			elif (res.upper() in ("X FLOW")):
 				if self.Data_2D.Qx.loaded:
 					try:
-						ind = self.Data_2D.Qx.Header.index(id)
+						ind = self.Data_2D.Qx.columnIndex(id)
 						data = self.Data_2D.Qx.Values[:, ind]
 						self.times = self.Data_2D.Qx.Values[:, 1]
 						return True, data, message
@@ -1401,7 +1755,7 @@ class ResData():
 			elif (res.upper() in ("Y FLOW")):
 				if self.Data_2D.Qy.loaded:
 					try:
-						ind = self.Data_2D.Qy.Header.index(id)
+						ind = self.Data_2D.Qy.columnIndex(id)
 						data = self.Data_2D.Qy.Values[:, ind]
 						self.times = self.Data_2D.Qy.Values[:, 1]
 						return True, data, message
@@ -1414,7 +1768,7 @@ class ResData():
 			elif(res.upper() in ("V","V_","VELOCITY","VELOCITIES")):
 				if self.Data_2D.V.loaded:
 					try:
-						ind = self.Data_2D.V.Header.index(id)
+						ind = self.Data_2D.V.columnIndex(id)
 						data = self.Data_2D.V.Values[:,ind]
 						self.times = self.Data_2D.V.Values[:,1]
 						return True, data, message
@@ -1427,7 +1781,7 @@ class ResData():
 			elif(res.upper() in ("GL", "GAUGE LEVEL")):
 				if self.Data_2D.GL.loaded:
 					try:
-						ind = self.Data_2D.GL.Header.index(id)
+						ind = self.Data_2D.GL.columnIndex(id)
 						data = self.Data_2D.GL.Values[:,ind]
 						self.times = self.Data_2D.GL.Values[:,1]
 						return True, data, message
@@ -1440,7 +1794,7 @@ class ResData():
 			elif(res.upper() in ("QA", "FLOW AREA")):
 				if self.Data_2D.QA.loaded:
 					try:
-						ind = self.Data_2D.QA.Header.index(id)
+						ind = self.Data_2D.QA.columnIndex(id)
 						data = self.Data_2D.QA.Values[:,ind]
 						self.times = self.Data_2D.QA.Values[:,1]
 						return True, data, message
@@ -1453,7 +1807,7 @@ class ResData():
 			elif(res.upper() in ("QS", "STRUCTURE FLOW")):
 				if self.Data_2D.QS.loaded:
 					try:
-						ind = self.Data_2D.QS.Header.index(id)
+						ind = self.Data_2D.QS.columnIndex(id)
 						data = self.Data_2D.QS.Values[:,ind]
 						self.times = self.Data_2D.QS.Values[:,1]
 						return True, data, message
@@ -1466,7 +1820,7 @@ class ResData():
 			elif(res.upper() in ("HU", "US LEVELS")):
 				if self.Data_2D.HUS.loaded:
 					try:
-						ind = self.Data_2D.HUS.Header.index(id)
+						ind = self.Data_2D.HUS.columnIndex(id)
 						data = self.Data_2D.HUS.Values[:,ind]
 						self.times = self.Data_2D.HUS.Values[:,1]
 						return True, data, message
@@ -1479,7 +1833,7 @@ class ResData():
 			elif(res.upper() in ("HD", "DS LEVELS")):
 				if self.Data_2D.HDS.loaded:
 					try:
-						ind = self.Data_2D.HDS.Header.index(id)
+						ind = self.Data_2D.HDS.columnIndex(id)
 						data = self.Data_2D.HDS.Values[:,ind]
 						self.times = self.Data_2D.HDS.Values[:,1]
 						return True, data, message
@@ -1492,7 +1846,7 @@ class ResData():
 			elif(res.upper() in ("VX")):
 				if self.Data_2D.Vx.loaded:
 					try:
-						ind = self.Data_2D.Vx.Header.index(id)
+						ind = self.Data_2D.Vx.columnIndex(id)
 						data = self.Data_2D.Vx.Values[:,ind]
 						self.times = self.Data_2D.Vx.Values[:,1]
 						return True, data, message
@@ -1505,7 +1859,7 @@ class ResData():
 			elif(res.upper() in ("VY")):
 				if self.Data_2D.Vy.loaded:
 					try:
-						ind = self.Data_2D.Vy.Header.index(id)
+						ind = self.Data_2D.Vy.columnIndex(id)
 						data = self.Data_2D.Vy.Values[:,ind]
 						self.times = self.Data_2D.Vy.Values[:,1]
 						return True, data, message
@@ -1518,7 +1872,7 @@ class ResData():
 			elif (res.upper() in ("VU")):
 				if self.Data_2D.Vu.loaded:
 					try:
-						ind = self.Data_2D.Vu.Header.index(id)
+						ind = self.Data_2D.Vu.columnIndex(id)
 						data = self.Data_2D.Vu.Values[:, ind]
 						self.times = self.Data_2D.Vu.Values[:, 1]
 						return True, data, message
@@ -1531,7 +1885,7 @@ class ResData():
 			elif (res.upper() in ("VV")):
 				if self.Data_2D.Vv.loaded:
 					try:
-						ind = self.Data_2D.Vv.Header.index(id)
+						ind = self.Data_2D.Vv.columnIndex(id)
 						data = self.Data_2D.Vv.Values[:, ind]
 						self.times = self.Data_2D.Vv.Values[:, 1]
 						return True, data, message
@@ -1544,7 +1898,7 @@ class ResData():
 			elif (res.upper() in ("VA")):
 				if self.Data_2D.VA.loaded:
 					try:
-						ind = self.Data_2D.VA.Header.index(id)
+						ind = self.Data_2D.VA.columnIndex(id)
 						data = self.Data_2D.VA.Values[:, ind]
 						self.times = self.Data_2D.VA.Values[:, 1]
 						return True, data, message
@@ -1557,7 +1911,7 @@ class ResData():
 			elif(res.upper() in ("INTEGRAL FLOW","FLOW INTEGRAL")):
 				if self.Data_2D.QI.loaded:
 					try:
-						ind = self.Data_2D.QI.Header.index(id)
+						ind = self.Data_2D.QI.columnIndex(id)
 						data = self.Data_2D.QI.Values[:,ind]
 						self.times = self.Data_2D.QI.Values[:,1]
 						return True, data, message
@@ -1570,7 +1924,7 @@ class ResData():
 			elif(res.upper() in ("HAVG","AVERAGE LEVEL", "AVERAGE WATER LEVEL")):
 				if self.Data_2D.HAvg.loaded:
 					try:
-						ind = self.Data_2D.HAvg.Header.index(id)
+						ind = self.Data_2D.HAvg.columnIndex(id)
 						data = self.Data_2D.HAvg.Values[:,ind]
 						self.times = self.Data_2D.HAvg.Values[:,1]
 						return True, data, message
@@ -1583,7 +1937,7 @@ class ResData():
 			elif(res.upper() in ("HMAX","MAX LEVEL", "MAX WATER LEVEL")):
 				if self.Data_2D.HMax.loaded:
 					try:
-						ind = self.Data_2D.HMax.Header.index(id)
+						ind = self.Data_2D.HMax.columnIndex(id)
 						data = self.Data_2D.HMax.Values[:,ind]
 						self.times = self.Data_2D.HMax.Values[:,1]
 						return True, data, message
@@ -1596,7 +1950,7 @@ class ResData():
 			elif(res.upper() in ("QIN","FLOW INTO REGION", "FLOW INTO")):
 				if self.Data_2D.QIn.loaded:
 					try:
-						ind = self.Data_2D.QIn.Header.index(id)
+						ind = self.Data_2D.QIn.columnIndex(id)
 						data = self.Data_2D.QIn.Values[:,ind]
 						self.times = self.Data_2D.QIn.Values[:,1]
 						return True, data, message
@@ -1609,7 +1963,7 @@ class ResData():
 			elif(res.upper() in ("QOUT","FLOW OUT OF REGION", "FLOW OUT")):
 				if self.Data_2D.QOut.loaded:
 					try:
-						ind = self.Data_2D.QOut.Header.index(id)
+						ind = self.Data_2D.QOut.columnIndex(id)
 						data = self.Data_2D.QOut.Values[:,ind]
 						self.times = self.Data_2D.QOut.Values[:,1]
 						return True, data, message
@@ -1623,7 +1977,7 @@ class ResData():
 			elif(res.upper() in ("VOL","VOLUME")):
 				if self.Data_2D.Vol.loaded:
 					try:
-						ind = self.Data_2D.Vol.Header.index(id)
+						ind = self.Data_2D.Vol.columnIndex(id)
 						data = self.Data_2D.Vol.Values[:,ind]
 						self.times = self.Data_2D.Vol.Values[:,1]
 						return True, data, message
@@ -1636,7 +1990,7 @@ class ResData():
 			elif(res.upper() in ("SS","SINK/SOURCE")):
 				if self.Data_2D.SS.loaded:
 					try:
-						ind = self.Data_2D.SS.Header.index(id)
+						ind = self.Data_2D.SS.columnIndex(id)
 						data = self.Data_2D.SS.Values[:,ind]
 						self.times = self.Data_2D.SS.Values[:,1]
 						return True, data, message
@@ -1652,7 +2006,7 @@ class ResData():
 		if (dom.upper() == "RL"):
 			if(res.upper() in  ("H", "H_", "LEVEL","LEVELS","POINT WATER LEVEL","WATER LEVEL")):
 				try:
-					ind = self.Data_RL.H_P.Header.index(id)
+					ind = self.Data_RL.H_P.columnIndex(id)
 					data = self.Data_RL.H_P.Values[:,ind]
 					self.times = self.Data_RL.H_P.Values[:,1]
 					return True, data, message
@@ -1661,7 +2015,7 @@ class ResData():
 					return False, [0.0], message
 			elif(res.upper() in ("Q","Q_","FLOW","FLOWS")):
 				try:
-					ind = self.Data_RL.Q_L.Header.index(id)
+					ind = self.Data_RL.Q_L.columnIndex(id)
 					data = self.Data_RL.Q_L.Values[:,ind]
 					self.times = self.Data_RL.Q_L.Values[:,1]
 					return True, data, message
@@ -1670,7 +2024,7 @@ class ResData():
 					return False, [0.0], message
 			elif(res.upper() in ("VOL","VOLUME","VOLUMES")):
 				try:
-					ind = self.Data_RL.Vol_R.Header.index(id)
+					ind = self.Data_RL.Vol_R.columnIndex(id)
 					data = self.Data_RL.Vol_R.Values[:,ind]
 					self.times = self.Data_RL.Vol_R.Values[:,1]
 					return True, data, message
@@ -1684,13 +2038,113 @@ class ResData():
 			message = 'ERROR - Expecting model domain to be 1D or 2D.'
 			return False, [0.0], message
 
+	def getTimeseries(self, dom, res):
+		"""
+		Returns the Timeseries object for a domain and result type, or None if the result type isn't a
+		simple time series (e.g. US / DS levels, losses, flow regime).
+		"""
+
+		res = res.upper()
+		if dom.upper() == '1D':
+			types = [
+				(('VOL', 'VOLUME', 'VOLUMES'), self.Data_1D.Vol),
+				(('FLOW INTEGRAL', 'FLOW INTEGRALS'), self.Data_1D.QI),
+				(('H', 'H_', 'LEVEL', 'LEVELS'), self.Data_1D.H),
+				(('E', 'E_', 'ENERGY LEVEL', 'ENERGY LEVELS'), self.Data_1D.E),
+				(('Q', 'Q_', 'FLOW', 'FLOWS'), self.Data_1D.Q),
+				(('V', 'V_', 'VELOCITY', 'VELOCITIES'), self.Data_1D.V),
+				(('A', 'A_', 'FLOW AREA', 'FLOW AREAS'), self.Data_1D.A),
+				(('MB',), self.Data_1D.MB),
+			]
+		elif dom.upper() == '2D':
+			for name, dynamic_result in self.Data_2D.dynamic_results.items():
+				if name.upper() == res:
+					return dynamic_result.res
+			types = [
+				(('H', 'H_', 'LEVEL', 'LEVELS', 'POINT WATER LEVEL'), self.Data_2D.H),
+				(('D', 'D_', 'DEPTH', 'DEPTHS', 'POINT DEPTH'), self.Data_2D.D),
+				(('Q', 'Q_', 'FLOW', 'FLOWS'), self.Data_2D.Q),
+				(('X FLOW',), self.Data_2D.Qx),
+				(('Y FLOW',), self.Data_2D.Qy),
+				(('V', 'V_', 'VELOCITY', 'VELOCITIES'), self.Data_2D.V),
+				(('GL', 'GAUGE LEVEL'), self.Data_2D.GL),
+				(('QA', 'FLOW AREA'), self.Data_2D.QA),
+				(('QS', 'STRUCTURE FLOW'), self.Data_2D.QS),
+				(('HU', 'US LEVELS'), self.Data_2D.HUS),
+				(('HD', 'DS LEVELS'), self.Data_2D.HDS),
+				(('VX',), self.Data_2D.Vx),
+				(('VY',), self.Data_2D.Vy),
+				(('VU',), self.Data_2D.Vu),
+				(('VV',), self.Data_2D.Vv),
+				(('VA',), self.Data_2D.VA),
+				(('INTEGRAL FLOW', 'FLOW INTEGRAL'), self.Data_2D.QI),
+				(('HAVG', 'AVERAGE LEVEL', 'AVERAGE WATER LEVEL'), self.Data_2D.HAvg),
+				(('HMAX', 'MAX LEVEL', 'MAX WATER LEVEL'), self.Data_2D.HMax),
+				(('QIN', 'FLOW INTO REGION', 'FLOW INTO'), self.Data_2D.QIn),
+				(('QOUT', 'FLOW OUT OF REGION', 'FLOW OUT'), self.Data_2D.QOut),
+				(('VOL', 'VOLUME'), self.Data_2D.Vol),
+				(('SS', 'SINK/SOURCE'), self.Data_2D.SS),
+			]
+		elif dom.upper() == 'RL':
+			types = [
+				(('H', 'H_', 'LEVEL', 'LEVELS', 'POINT WATER LEVEL', 'WATER LEVEL'), self.Data_RL.H_P),
+				(('Q', 'Q_', 'FLOW', 'FLOWS'), self.Data_RL.Q_L),
+				(('VOL', 'VOLUME', 'VOLUMES'), self.Data_RL.Vol_R),
+			]
+		else:
+			return None
+
+		for names, timeseries in types:
+			if res in names:
+				return timeseries
+
+		return None
+
+	def getTSDataMany(self, ids, dom, res):
+		"""
+		Returns time series data for many IDs of the same result type in a single array slice.
+
+		:param ids: list -> str IDs
+		:param dom: str -> '1D', '2D' or 'RL'
+		:param res: str -> result type
+		:return: bool found, numpy masked array (time x ID) - columns for IDs not found are fully masked, str message
+		"""
+
+		message = None
+		timeseries = self.getTimeseries(dom, res)
+		if timeseries is None:
+			message = 'Warning - Unexpected data type for {0}: {1}'.format(dom, res)
+			return False, [0.0], message
+		if not timeseries.loaded:
+			message = 'No {0} {1} Data loaded for: {2}'.format(dom, res, self.displayname)
+			return False, [0.0], message
+		error, message = timeseries.materialise()
+		if error:
+			return False, [0.0], message
+
+		cols = timeseries.columnIndexes(ids)
+		missing = cols < 0
+		if missing.all():
+			message = 'Data not found for {0} {1} with IDs: {2}'.format(dom, res, ', '.join(ids))
+			return False, [0.0], message
+
+		cols[missing] = 0
+		data = numpy.ma.array(timeseries.Values[:,cols])
+		if missing.any():
+			data[:,missing] = numpy.ma.masked
+			message = 'Data not found for {0} {1} with IDs: {2}'.format(
+				dom, res, ', '.join([x for x, m in zip(ids, missing) if m]))
+		self.times = timeseries.Values[:,1]
+
+		return True, data, message
+
 	def getMAXData(self, id, dom, res):
 		message = None
 		if (dom.upper() == "1D"):
 			if(res.upper() in ("H", "H_", "LEVEL","LEVELS")):
 				if self.Data_1D.Node_Max.loaded:
 					try:
-						ind = self.Data_1D.Node_Max.ID.index(id)
+						ind = self.Data_1D.Node_Max.idIndex(id)
 						y = self.Data_1D.Node_Max.HMax[ind]
 						x = self.Data_1D.Node_Max.tHmax[ind]
 						return True, [x, y], message
@@ -1703,7 +2157,7 @@ class ResData():
 			elif (res.upper() in ("E", "E_", "ENERGY LEVEL", "ENERGY LEVELS")):
 				if self.Data_1D.Node_Max.loaded:
 					try:
-						ind = self.Data_1D.Node_Max.ID.index(id)
+						ind = self.Data_1D.Node_Max.idIndex(id)
 						y = self.Data_1D.Node_Max.EMax[ind]
 						x = self.Data_1D.Node_Max.tHmax[ind]
 						return True, [x, y], message
@@ -1716,7 +2170,7 @@ class ResData():
 			elif(res.upper() in ("Q","Q_","FLOW","FLOWS")):
 				if self.Data_1D.Chan_Max.loaded:
 					try:
-						ind = self.Data_1D.Chan_Max.ID.index(id)
+						ind = self.Data_1D.Chan_Max.idIndex(id)
 						y = self.Data_1D.Chan_Max.QMax[ind]
 						x = self.Data_1D.Chan_Max.tQmax[ind]
 						return True, [x, y], message
@@ -1729,7 +2183,7 @@ class ResData():
 			elif(res.upper() in ("V","V_","VELOCITY","VELOCITIES")):
 				if self.Data_1D.Chan_Max.loaded:
 					try:
-						ind = self.Data_1D.Chan_Max.ID.index(id)
+						ind = self.Data_1D.Chan_Max.idIndex(id)
 						y = self.Data_1D.Chan_Max.VMax[ind]
 						x = self.Data_1D.Chan_Max.tVmax[ind]
 						return True, [x, y], message
@@ -1740,11 +2194,10 @@ class ResData():
 					message = 'No maximum 1D Velocity Data loaded for: '+self.displayname
 					return False, [0.0], message
 			elif(res.upper() in ("US_H", "US LEVELS")):
-				chan_list = tuple(self.Channels.chan_name)
-				ind = chan_list.index(str(id))
+				ind = self.Channels.chanIndex(str(id))
 				a = str(self.Channels.chan_US_Node[ind])
 				try:
-					ind = self.Data_1D.Node_Max.ID.index(a)
+					ind = self.Data_1D.Node_Max.idIndex(a)
 				except:
 					message = 'Unable to find US node: ',+a+' for channel '+ id
 					return False, [0.0], message
@@ -1756,11 +2209,10 @@ class ResData():
 					message = 'Data not found for maximum 1D H with ID: '+a
 					return False, [0.0], message
 			elif(res.upper() in ("DS_H","DS LEVELS")):
-				chan_list = tuple(self.Channels.chan_name)
-				ind = chan_list.index(str(id))
+				ind = self.Channels.chanIndex(str(id))
 				a = str(self.Channels.chan_DS_Node[ind])
 				try:
-					ind = self.Data_1D.Node_Max.ID.index(a)
+					ind = self.Data_1D.Node_Max.idIndex(a)
 				except:
 					message = 'Unable to find DS node: ',+a+' for channel '+ id
 					return False, [0.0], message
@@ -1774,7 +2226,7 @@ class ResData():
 			elif (res.upper() in ("A", "A_", "FLOW AREA", "FLOW AREAS")):
 				if self.Data_1D.Chan_Max.loaded:
 					try:
-						ind = self.Data_1D.Chan_Max.ID.index(id)
+						ind = self.Data_1D.Chan_Max.idIndex(id)
 						y = self.Data_1D.Chan_Max.HMax[ind]
 						x = self.Data_1D.Chan_Max.tHmax[ind]
 						return True, [x, y], message
@@ -1792,6 +2244,47 @@ class ResData():
 			message = 'ERROR - Expecting model domain to be 1D.'
 			return False, [0.0], message
 
+	def LP_network(self):
+		"""
+		Returns the NetworkGraph for the 1D channels. It is built the first time it is needed and rebuilt
+		if the channel info is replaced.
+		"""
+
+		if self._network is None or self._network_channels is not self.Channels:
+			self._network = NetworkGraph.fromChanInfo(self.Channels)
+			self._network_channels = self.Channels
+		return self._network
+
+	def LP_follow_main_path(self, id1, end_chan=None):
+		"""
+		Follows the main downstream path (chan_DS_Chan) from channel id1 and populates the LP channel and node lists.
+		Stops at end_chan (if given), at a channel with no downstream channel, or if a loop is found.
+
+		:return: bool found - end_chan was reached, bool error, str message
+		"""
+
+		ind1 = self.Channels.chanIndex(str(id1))
+		self.LP.chan_list = [id1]
+		self.LP.chan_index = [ind1]
+		self.LP.node_list = [(self.Channels.chan_US_Node[ind1])]
+		self.LP.node_list.append(self.Channels.chan_DS_Node[ind1])
+		visited = {id1}
+		id = ind1
+		while True:
+			chan = self.Channels.chan_DS_Chan[id]
+			if chan == '------' or chan in visited:
+				return False, False, None
+			self.LP.chan_list.append(chan)
+			visited.add(chan)
+			try:
+				id = self.Channels.chanIndex(chan)
+				self.LP.chan_index.append(id)
+				self.LP.node_list.append(self.Channels.chan_DS_Node[id])
+			except ValueError:
+				return False, True, 'ERROR - Unable to process channel: '+chan
+			if end_chan is not None and chan == end_chan:
+				return True, False, None
+
 	def LP_getConnectivity(self,id1,id2, *args, **kwargs):
 		#print('determining LP connectivity')
 		message = None
@@ -1805,154 +2298,52 @@ class ResData():
 
 		if self.Channels is None:
 			return error, message
-		if id2 == None: # only one channel selected
-			finished = False
-			i = 0
-			chan_list = tuple(self.Channels.chan_name)
-			try:
-				ind1 = chan_list.index(str(id1))
-			except:
-				#QMessageBox.information(iface.mainWindow(),"ERROR", ("ID not found: " + str(id1)))
-				#print('ERROR - ID not found: ' + str(id1))
-				message = 'ERROR - ID not found: ' + str(id1)
-				error = True
-				return error, message
-			self.LP.chan_list = [id1]
-			self.LP.chan_index = [ind1]
-			self.LP.node_list = [(self.Channels.chan_US_Node[ind1])]
-			self.LP.node_list.append(self.Channels.chan_DS_Node[ind1])
-			id = ind1
-			while not finished:
-				i = i + 1
-				chan = self.Channels.chan_DS_Chan[id]
-				if chan == '------' or chan in self.LP.chan_list:
-					finished = True
-				else:
-					self.LP.chan_list.append(chan)
-					try:
-						id = self.Channels.chan_name.index(chan)
-						self.LP.chan_index.append(id)
-						self.LP.node_list.append(self.Channels.chan_DS_Node[id])
-					except:
-						error = True
-						message = 'ERROR - Unable to process channel: '+chan
-						return error, message
-			if not error:
-				self.LP.connected = True
-			return error, message
 
-		else: # two channels selected (check for more than two in main routine)
-			finished = False
-			found = False
-			i = 0
-			chan_list = tuple(self.Channels.chan_name)
-			# check 1st ID exists
-			try:
-				ind1 = chan_list.index(str(id1))
-			except:
-				error = True
-				message = 'ERROR - ID not found: '+str(id1)
-				return error, message
-			# check 2nd ID exists
+		# check IDs exist
+		for id in [id1, id2]:
+			if id is None:
+				continue
 			try:
-				ind2 = chan_list.index(str(id2))
-			except:
-				#QMessageBox.information(iface.mainWindow(),"ERROR", ("ID not found: " + str(id2)))
+				self.Channels.chanIndex(str(id))
+			except ValueError:
+				message = 'ERROR - ID not found: ' + str(id)
 				error = True
-				message = 'ERROR - ID not found: '+str(id2)
 				return error, message
-			# assume ID2 is downstream of ID1
-			endchan = id2
-			self.LP.chan_list = [id1]
-			self.LP.chan_index = [ind1]
-			self.LP.node_list = [(self.Channels.chan_US_Node[ind1])]
-			self.LP.node_list.append(self.Channels.chan_DS_Node[ind1])
-			id = ind1
-			while not finished:
-				i = i + 1
-				chan = self.Channels.chan_DS_Chan[id]
-				if chan == '------' or chan in self.LP.chan_list:
-					finished = True
-				elif chan == endchan:
-					found = True
-					finished = True
-					self.LP.chan_list.append(chan)
-					try:
-						id = self.Channels.chan_name.index(chan)
-						self.LP.chan_index.append(id)
-						self.LP.node_list.append(self.Channels.chan_DS_Node[id])
-					except:
-						error = True
-						message = 'ERROR - Unable to process channel: '+chan
-						return error, message
-				else:
-					self.LP.chan_list.append(chan)
-					try:
-						id = self.Channels.chan_name.index(chan)
-						self.LP.chan_index.append(id)
-						self.LP.node_list.append(self.Channels.chan_DS_Node[id])
-					except:
-						error = True
-						message = 'ERROR - ID not found: '+str(id)
-						return error, message
 
-			if not found: # id2 is not downstream of 1d1, reverse direction and try again...
-				#QMessageBox.information(iface.mainWindow(), "DEBUG", "reverse direction and try again")
-				finished = False
-				found = False
-				i = 0
-				endchan = id1
-				self.LP.chan_list = [id2]
-				self.LP.chan_index = [ind2]
-				self.LP.node_list = [(self.Channels.chan_US_Node[ind2])]
-				self.LP.node_list.append(self.Channels.chan_DS_Node[ind2])
-				id = ind2
-				while not finished:
-					i = i + 1
-					chan = self.Channels.chan_DS_Chan[id]
-					if chan == '------' or chan in self.LP.chan_list:
-						finished = True
-					elif chan == endchan:
-						found = True
-						finished = True
-						self.LP.chan_list.append(chan)
-						try:
-							id = self.Channels.chan_name.index(chan)
-							self.LP.chan_index.append(id)
-							self.LP.node_list.append(self.Channels.chan_DS_Node[id])
-						except:
-							error = True
-							message = 'ERROR - Unable to process channel: '+chan
-							return error, message
-					else:
-						self.LP.chan_list.append(chan)
-						try:
-							id = self.Channels.chan_name.index(chan)
-							self.LP.chan_index.append(id)
-							self.LP.node_list.append(self.Channels.chan_DS_Node[id])
-						except:
-							error = True
-							message = 'ERROR - Unable to process channel: '+chan
-							return error, message
-			if found:
+		if id2 == None: # only one channel selected
+			found, error, message = self.LP_follow_main_path(id1)
+			if not error:
 				self.LP.connected = True
-				return error, message
+			return error, message
 
-			# could be that id1 and id2 are connected, but not by main path
-			# once again assume id1 is upstream of id2
-			found = self.LP_force_connection(id1, id2)
-			if found:
-				self.LP.connected = True
+		# two channels selected (check for more than two in main routine)
+		# assume ID2 is downstream of ID1
+		found, error, message = self.LP_follow_main_path(id1, id2)
+		if error:
+			return error, message
+		if not found: # id2 is not downstream of 1d1, reverse direction and try again...
+			found, error, message = self.LP_follow_main_path(id2, id1)
+			if error:
 				return error, message
+		if found:
+			self.LP.connected = True
+			return error, message
 
-			# reverse id1 and id2
-			found = self.LP_force_connection(id2, id1)
-			if found:
-				self.LP.connected = True
-				return error, message
+		# could be that id1 and id2 are connected, but not by main path
+		# once again assume id1 is upstream of id2
+		found = self.LP_force_connection(id1, id2)
+		if found:
+			self.LP.connected = True
+			return error, message
 
+		# reverse id1 and id2
+		found = self.LP_force_connection(id2, id1)
+		if found:
+			self.LP.connected = True
 			return error, message
 
+		return error, message
+
 	def LP_force_connection(self, start_chan, end_chan):
 		# assume checking channels exist has already been done
 		self.LP.chan_list = []
@@ -1960,11 +2351,10 @@ class ResData():
 		self.LP.node_list = []
 
 		branches = []
-		chan_ids = []
-		found = self.find_branches(start_chan, end_chan, chan_ids[:], branches)
+		found = self.find_branches(start_chan, end_chan, [], branches)
 		if found and branches and branches[-1]:
 			for j, chan_name in enumerate(branches[-1]):
-				i = self.Channels.chan_name.index(chan_name)
+				i = self.Channels.chanIndex(chan_name)
 				self.LP.chan_list.append(chan_name)
 				self.LP.chan_index.append(i)
 				if j == 0:
@@ -1974,43 +2364,22 @@ class ResData():
 		return found
 
 	def find_branches(self, start_chan, end_chan, chan_ids, branches):
-		found = False
-		if start_chan:
-			chan_ids.append(start_chan)
-			i = 0
-			for chan in self.LP_iterate_downstream_channels(start_chan):
-				if chan in chan_ids:
-					branches.append(chan_ids)
-					return found
-				if chan == end_chan:
-					chan_ids.append(chan)
-					branches.append(chan_ids)
-					return True
-
-				i += 1
-				try:
-					found = self.find_branches(chan, end_chan, chan_ids[:], branches)
-					if found:
-						return found
-				except RecursionError:
-					branches.append(chan_ids)
-					return found
-
-			if not i:
-				branches.append(chan_ids)
-				if end_chan is None:
-					found = True
+		"""
+		Finds the (shortest) downstream path from start_chan to end_chan and appends it to branches.
+		If end_chan is None, the path follows the network downstream until it reaches an outlet.
+		"""
 
-		return found
+		if not start_chan:
+			return False
+		path = self.LP_network().path(start_chan, end_chan)
+		if path is None:
+			return False
+		branches.append(chan_ids + path)
+		return True
 
 	def LP_iterate_downstream_channels(self, channel_id):
-		try:
-			ds_node = self.Channels.chan_DS_Node[self.Channels.chan_name.index(channel_id)]
-		except (ValueError, IndexError):
-			return
-		for i, node in enumerate(self.Channels.chan_US_Node):
-			if node == ds_node:
-				yield self.Channels.chan_name[i]
+		for chan in self.LP_network().downstreamChannels(channel_id):
+			yield chan
 
 	def LP_getStaticData(self):
 		# get the channel and node properties length, elevations etc doesn't change with results
@@ -2026,6 +2395,7 @@ class ResData():
 		self.LP.node_bed = []
 		self.LP.node_top = []
 		self.LP.H_nd_index = []
+		self.LP.temporal = {}
 		self.LP.node_index = []
 		self.LP.Hmax = []
 		self.LP.Emax = []
@@ -2051,14 +2421,14 @@ class ResData():
 		#		message = 'Unable to find node in _Nodes.csv file. Node: '+nd
 		#		return error, message
 		#	try: #get index to data in 1d_H.csv used when getting temporal data
-		#		ind = self.Data_1D.H.Header.index(nd)
+		#		ind = self.Data_1D.H.columnIndex(nd)
 		#		self.LP.H_nd_index.append(ind)
 		#	except:
 		#		error = True
 		#		message = 'Unable to find node in _1d_H.csv for node: '+nd
 		#		return error, message
 		#	try:
-		#		ind = self.Data_1D.Node_Max.ID.index(nd)
+		#		ind = self.Data_1D.Node_Max.idIndex(nd)
 		#		if self.Data_1D.Node_Max.HMax:
 		#			self.LP.Hmax.append(self.Data_1D.Node_Max.HMax[ind])
 		#		if self.Data_1D.Node_Max.EMax:
@@ -2153,14 +2523,14 @@ class ResData():
 				message = 'Unable to find node in _Nodes.csv file. Node: '+nd
 				return error, message
 			try: #get index to data in 1d_H.csv used when getting temporal data
-				ind = self.Data_1D.H.Header.index(nd)
+				ind = self.Data_1D.H.columnIndex(nd)
 				self.LP.H_nd_index.append(ind)
 			except:
 				error = True
 				message = 'Unable to find node in _1d_H.csv for node: '+nd
 				return error, message
 			try:
-				ind = self.Data_1D.Node_Max.ID.index(nd)
+				ind = self.Data_1D.Node_Max.idIndex(nd)
 				if self.Data_1D.Node_Max.HMax:
 					if i == 0:
 						self.LP.Hmax.append(max(self.Data_1D.Node_Max.HMax[ind], self.LP.chan_inv[i]))
@@ -2253,46 +2623,51 @@ class ResData():
 			self.times = self.times.astype(numpy.float64)
 		elif isinstance(self.times, list) and self.times and not isinstance(self.times[0], float):
 			self.times = [float(t) for t in self.times]
-		dt_abs = abs(self.times - time)
+		dt_abs = abs(numpy.asarray(self.times) - time)
 		t_ind = dt_abs.argmin()
 		if (self.times[t_ind] - time)>dt_tol:
 			error = True
 			message = 'ERROR - Closest time: '+str(self.times[t_ind])+' outside time search tolerance: '+str(dt_tol)
 			return  error, message
+
+		error, message, data = self.LP_getDataAll(dat_type)
+		if error:
+			return error, message
 		if dat_type == 'Water Level':
-			self.LP.Hdata = []
+			self.LP.Hdata = data[t_ind]
+		else:
+			self.LP.Edata = data[t_ind]
+
+		return error, message
+
+	def LP_getDataAll(self, dat_type):
+		"""
+		Returns the long profile temporal data for every timestep as a single array (time x profile point).
+		All nodes on the profile are taken from the result in one array slice (getTSDataMany) and the result is stored
+		until the profile changes so stepping through time (or animating) is a row lookup.
+
+		:param dat_type: str -> 'Water Level' or 'Energy Level'
+		:return: bool error, str message, numpy array
+		"""
+
+		if dat_type == 'Water Level':
+			res = 'H'
 			if not self.Data_1D.H.loaded:
-				error = True
-				message = 'ERROR - No water level data loaded.'
-				return error, message
-			for i, h_ind in enumerate(self.LP.H_nd_index):
-				if i == 0:
-					self.LP.Hdata.append(max(self.Data_1D.H.Values[t_ind,h_ind], self.LP.chan_inv[i]))
-				elif i < len(self.LP.H_nd_index) - 1:
-					self.LP.Hdata.append(max(self.Data_1D.H.Values[t_ind,h_ind], self.LP.chan_inv[2*i-1]))
-					self.LP.Hdata.append(max(self.Data_1D.H.Values[t_ind,h_ind], self.LP.chan_inv[2*i]))
-				else:
-					self.LP.Hdata.append(max(self.Data_1D.H.Values[t_ind,h_ind], self.LP.chan_inv[2*i-1]))
+				return True, 'ERROR - No water level data loaded.', None
 		elif dat_type == 'Energy Level':
-			self.LP.Edata = []
+			res = 'E'
 			if not self.Data_1D.E.loaded:
-				error = True
-				message = 'ERROR - No energy level data loaded.'
-				return error, message
-			for i, h_ind in enumerate(self.LP.H_nd_index):
-				if i == 0:
-					self.LP.Edata.append(max(self.Data_1D.E.Values[t_ind,h_ind], self.LP.chan_inv[i]))
-				elif i < len(self.LP.H_nd_index) - 1:
-					self.LP.Edata.append(max(self.Data_1D.E.Values[t_ind,h_ind], self.LP.chan_inv[2*i-1]))
-					self.LP.Edata.append(max(self.Data_1D.E.Values[t_ind,h_ind], self.LP.chan_inv[2*i]))
-				else:
-					self.LP.Edata.append(max(self.Data_1D.E.Values[t_ind,h_ind], self.LP.chan_inv[2*i-1]))
+				return True, 'ERROR - No energy level data loaded.', None
 		else:
-			error = True
-			message = 'ERROR - Only head or energy supported for LP temporal data'
-			return  error, message
+			return True, 'ERROR - Only head or energy supported for LP temporal data', None
 
-		return error, message
+		if dat_type not in self.LP.temporal:
+			found, data, message = self.getTSDataMany(self.LP.node_list, '1D', res)
+			if not found:
+				return True, message, None
+			self.LP.temporal[dat_type] = lp_profile_values(data, self.LP.chan_inv)
+
+		return False, None, self.LP.temporal[dat_type]
 
 	def getResFileFormat(self):
 		try:
@@ -2555,7 +2930,7 @@ class ResData():
 			elif dat_type == '1D Channel Info':
 				if rdata != 'NONE':
 					fullpath = getOSIndependentFilePath(self.fpath, rdata)
-					self.Channels = ChanInfo(fullpath)
+					self.Channels = ChanInfo(fullpath, cache=self.cache_results)
 					if self.Channels.error:
 						return self.Channels.error, self.Channels.message
 					if self.Data_1D.nChan != self.Channels.nChan:
@@ -2565,20 +2940,20 @@ class ResData():
 			elif dat_type == '1D Node Info':
 				if rdata != 'NONE':
 					fullpath = getOSIndependentFilePath(self.fpath, rdata)
-					self.nodes = NodeInfo(fullpath)
+					self.nodes = NodeInfo(fullpath, cache=self.cache_results)
 					if self.nodes.error:
 						return self.nodes.error, self.nodes.message
 			elif dat_type == '1D Water Levels':
 				if self.resFileFormat == "CSV":
 					if rdata != 'NONE':
 						fullpath = getOSIndependentFilePath(self.fpath, rdata)
-						error, message = self.Data_1D.H.Load(fullpath, 'H', self.displayname)
+						error, message = self.Data_1D.H.Load(fullpath, 'H', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						self.Types.append('1D Water Levels')
 						if self.nTypes == 1:
-							self.times = self.Data_1D.H.Values[:,1]
+							self.times = self.Data_1D.H.times()
 				elif self.resFileFormat == "NC":
 					print(self.ncopen)
 					if self.netcdf_fpath:
@@ -2595,13 +2970,13 @@ class ResData():
 				if self.resFileFormat == "CSV":
 					if rdata != 'NONE':
 						fullpath = getOSIndependentFilePath(self.fpath, rdata)
-						error, message = self.Data_1D.Vol.Load(fullpath, 'Vol', self.displayname)
+						error, message = self.Data_1D.Vol.Load(fullpath, 'Vol', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						self.Types.append('1D Volumes')
 						if self.nTypes == 1:
-							self.times = self.Data_1D.Vol.Values[:,1]
+							self.times = self.Data_1D.Vol.times()
 				elif self.resFileFormat == "NC":
 					if self.netcdf_fpath:
 						error, message = self.Data_1D.Vol.loadFromNetCDF(self.netcdf_fpath, "node_storage_volume_1d", "node_names",
@@ -2617,13 +2992,13 @@ class ResData():
 				if self.resFileFormat == "CSV":
 					if rdata != 'NONE':
 						fullpath = getOSIndependentFilePath(self.fpath, rdata)
-						error, message = self.Data_1D.QI.Load(fullpath, 'QI', self.displayname)
+						error, message = self.Data_1D.QI.Load(fullpath, 'QI', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						self.Types.append('1D Flow Integral')
 						if self.nTypes == 1:
-							self.times = self.Data_1D.QI.Values[:,1]
+							self.times = self.Data_1D.QI.times()
 				elif self.resFileFormat == "NC":
 					if self.netcdf_fpath:
 						error, message = self.Data_1D.QI.loadFromNetCDF(self.netcdf_fpath, "integral_flow_1d", "channel_names",
@@ -2639,13 +3014,13 @@ class ResData():
 				if self.resFileFormat == "CSV":
 					if rdata != 'NONE':
 						fullpath = getOSIndependentFilePath(self.fpath, rdata)
-						error, message = self.Data_1D.E.Load(fullpath, 'E', self.displayname)
+						error, message = self.Data_1D.E.Load(fullpath, 'E', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						self.Types.append('1D Energy Levels')
 						if self.nTypes == 1:
-							self.times = self.Data_1D.H.Values[:,1]
+							self.times = self.Data_1D.E.times()
 				elif self.resFileFormat == "NC":
 					if self.netcdf_fpath:
 						error, message = self.Data_1D.E.loadFromNetCDF(self.netcdf_fpath, "energy_levels_1d", "node_names",
@@ -2661,13 +3036,13 @@ class ResData():
 				if self.resFileFormat == "CSV":
 					if rdata != 'NONE':
 						fullpath = getOSIndependentFilePath(self.fpath, rdata)
-						error, message = self.Data_RL.H_P.Load(fullpath, 'H', self.displayname)
+						error, message = self.Data_RL.H_P.Load(fullpath, 'H', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						self.Types.append('RL Water Levels')
 						if self.nTypes == 1:
-							self.times = self.Data_RL.H_P.Values[:, 1]
+							self.times = self.Data_RL.H_P.times()
 				elif self.resFileFormat == "NC":
 					if self.netcdf_fpath:
 						error, message = self.Data_RL.H_P.loadFromNetCDF(self.netcdf_fpath, "water_levels_rl", "name_water_levels_rl",
@@ -2684,13 +3059,13 @@ class ResData():
 				if self.resFileFormat == "CSV":
 					if rdata != 'NONE':
 						fullpath = getOSIndependentFilePath(self.fpath, rdata)
-						error, message = self.Data_RL.Q_L.Load(fullpath, 'Q', self.displayname)
+						error, message = self.Data_RL.Q_L.Load(fullpath, 'Q', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						self.Types.append('RL Flows')
 						if self.nTypes == 1:
-							self.times = self.Data_RL.Q_L.Values[:, 1]
+							self.times = self.Data_RL.Q_L.times()
 				elif self.resFileFormat == "NC":
 					if self.netcdf_fpath:
 						error, message = self.Data_RL.Q_L.loadFromNetCDF(self.netcdf_fpath, "flows_rl", "name_flows_rl",
@@ -2707,13 +3082,13 @@ class ResData():
 				if self.resFileFormat == "CSV":
 					if rdata != 'NONE':
 						fullpath = getOSIndependentFilePath(self.fpath, rdata)
-						error, message = self.Data_RL.Vol_R.Load(fullpath, 'Vol', self.displayname)
+						error, message = self.Data_RL.Vol_R.Load(fullpath, 'Vol', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						self.Types.append('RL Region Volume')
 						if self.nTypes == 1:
-							self.times = self.Data_RL.Vol_R.Values[:, 1]
+							self.times = self.Data_RL.Vol_R.times()
 						try:
 							chk_nLocs = self.Data_RL.nRegion
 							if (chk_nLocs != self.Data_RL.Vol_R.nLocs):
@@ -2737,26 +3112,26 @@ class ResData():
 			elif dat_type == '1D Node Maximums':
 				if rdata != 'NONE':
 					fullpath = getOSIndependentFilePath(self.fpath, rdata)
-					error, message = self.Data_1D.Node_Max.Load(fullpath)
+					error, message = self.Data_1D.Node_Max.Load(fullpath, cache=self.cache_results)
 					if error:
 						return error, message
 			elif dat_type == '1D Channel Maximums':
 				if rdata != 'NONE':
 					fullpath = getOSIndependentFilePath(self.fpath, rdata)
-					error, message = self.Data_1D.Chan_Max.Load(fullpath)
+					error, message = self.Data_1D.Chan_Max.Load(fullpath, cache=self.cache_results)
 					if error:
 						return error, message
 			elif dat_type == '1D Flows':
 				if self.resFileFormat == "CSV":
 					if rdata != 'NONE':
 						fullpath = getOSIndependentFilePath(self.fpath, rdata)
-						error, message = self.Data_1D.Q.Load(fullpath, 'Q', self.displayname)
+						error, message = self.Data_1D.Q.Load(fullpath, 'Q', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						self.Types.append('1D Flows')
 						if self.nTypes == 1:
-							self.times = self.Data_1D.Q.Values[:,1]
+							self.times = self.Data_1D.Q.times()
 				elif self.resFileFormat == "NC":
 					if self.netcdf_fpath:
 						error, message = self.Data_1D.Q.loadFromNetCDF(self.netcdf_fpath, "flow_1d",
@@ -2774,13 +3149,13 @@ class ResData():
 				if self.resFileFormat == "CSV":
 					if rdata != 'NONE':
 						fullpath = getOSIndependentFilePath(self.fpath, rdata)
-						error, message = self.Data_1D.A.Load(fullpath, 'A', self.displayname)
+						error, message = self.Data_1D.A.Load(fullpath, 'A', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						self.Types.append('1D Flow Area')
 						if self.nTypes == 1:
-							self.times = self.Data_1D.A.Values[:,1]
+							self.times = self.Data_1D.A.times()
 				elif self.resFileFormat == "NC":
 					if self.netcdf_fpath:
 						error, message = self.Data_1D.A.loadFromNetCDF(self.netcdf_fpath, "flow_areas_1d",
@@ -2798,13 +3173,13 @@ class ResData():
 				if self.resFileFormat == "CSV":
 					if rdata != 'NONE':
 						fullpath = getOSIndependentFilePath(self.fpath, rdata)
-						error, message = self.Data_1D.V.Load(fullpath, 'V', self.displayname)
+						error, message = self.Data_1D.V.Load(fullpath, 'V', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						self.Types.append('1D Velocities')
 						if self.nTypes == 1:
-							self.times = self.Data_1D.V.Values[:,1]
+							self.times = self.Data_1D.V.times()
 				elif self.resFileFormat == "NC":
 					if self.netcdf_fpath:
 						error, message = self.Data_1D.V.loadFromNetCDF(self.netcdf_fpath, "velocities_1d",
@@ -2825,7 +3200,7 @@ class ResData():
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
 						#self.Data_2D.QA = Timeseries(fullpath,'QA',self.displayname)
-						error, message = self.Data_2D.QA.Load(fullpath, 'QA', self.displayname)
+						error, message = self.Data_2D.QA.Load(fullpath, 'QA', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
@@ -2865,12 +3240,12 @@ class ResData():
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
 						#self.Data_2D.Q = Timeseries(fullpath,'Q',self.displayname)
-						error, message = self.Data_2D.Q.Load(fullpath, 'Q', self.displayname)
+						error, message = self.Data_2D.Q.Load(fullpath, 'Q', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						if self.nTypes == 1:
-							self.times = self.Data_2D.Q.Values[:,1]
+							self.times = self.Data_2D.Q.times()
 						self.Types.append('2D Line Flow')
 						try:
 							chk_nLocs = int(dat_type[indA+1:indB])
@@ -2900,13 +3275,13 @@ class ResData():
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
 						#self.Data_2D.Vx = Timeseries(fullpath,'VX',self.displayname)
-						error, message = self.Data_2D.Qx.Load(fullpath, 'QX', self.displayname)
+						error, message = self.Data_2D.Qx.Load(fullpath, 'QX', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						self.Types.append('2D Line X-Flow')
 						if self.nTypes == 1:
-							self.times = self.Data_2D.Qx.Values[:, 1]
+							self.times = self.Data_2D.Qx.times()
 				elif self.resFileFormat == "NC":
 					if self.netcdf_fpath:
 						pass  # for now not written to netcdf
@@ -2928,13 +3303,13 @@ class ResData():
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
 						#self.Data_2D.Vx = Timeseries(fullpath,'VX',self.displayname)
-						error, message = self.Data_2D.Qy.Load(fullpath, 'QY', self.displayname)
+						error, message = self.Data_2D.Qy.Load(fullpath, 'QY', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						self.Types.append('2D Line Y-Flow')
 						if self.nTypes == 1:
-							self.times = self.Data_2D.Qy.Values[:, 1]
+							self.times = self.Data_2D.Qy.times()
 				elif self.resFileFormat == "NC":
 					if self.netcdf_fpath:
 						pass  # for now not written to netcdf
@@ -2956,7 +3331,7 @@ class ResData():
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
 						#self.Data_2D.GL = Timeseries(fullpath,'G',self.displayname)
-						error, message = self.Data_2D.GL.Load(fullpath, 'G', self.displayname)
+						error, message = self.Data_2D.GL.Load(fullpath, 'G', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
@@ -2990,13 +3365,13 @@ class ResData():
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
 						#self.Data_2D.H = Timeseries(fullpath,'H',self.displayname)
-						error, message = self.Data_2D.H.Load(fullpath, 'H', self.displayname)
+						error, message = self.Data_2D.H.Load(fullpath, 'H', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						self.Types.append('2D Point Water Level')
 						if self.nTypes == 1:
-							self.times = self.Data_2D.H.Values[:,1]
+							self.times = self.Data_2D.H.times()
 						try:
 							chk_nLocs = int(dat_type[indA+1:indB])
 							if (chk_nLocs != self.Data_2D.H.nLocs):
@@ -3025,13 +3400,13 @@ class ResData():
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
 						#self.Data_2D.H = Timeseries(fullpath,'H',self.displayname)
-						error, message = self.Data_2D.D.Load(fullpath, 'D', self.displayname)
+						error, message = self.Data_2D.D.Load(fullpath, 'D', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						self.Types.append('2D Point Depth')
 						if self.nTypes == 1:
-							self.times = self.Data_2D.D.Values[:,1]
+							self.times = self.Data_2D.D.times()
 						try:
 							chk_nLocs = int(dat_type[indA+1:indB])
 							if (chk_nLocs != self.Data_2D.D.nLocs):
@@ -3060,7 +3435,7 @@ class ResData():
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
 						#self.Data_2D.Vx = Timeseries(fullpath,'VX',self.displayname)
-						error, message = self.Data_2D.Vx.Load(fullpath, 'VX', self.displayname)
+						error, message = self.Data_2D.Vx.Load(fullpath, 'VX', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
@@ -3094,7 +3469,7 @@ class ResData():
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
 						#self.Data_2D.Vy = Timeseries(fullpath,'VY',self.displayname)
-						error, message = self.Data_2D.Vy.Load(fullpath, 'VY', self.displayname)
+						error, message = self.Data_2D.Vy.Load(fullpath, 'VY', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
@@ -3128,13 +3503,13 @@ class ResData():
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
 						#self.Data_2D.Vx = Timeseries(fullpath,'VX',self.displayname)
-						error, message = self.Data_2D.Vu.Load(fullpath, 'Vu', self.displayname)
+						error, message = self.Data_2D.Vu.Load(fullpath, 'Vu', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						self.Types.append('2D Point u-Vel')
 						if self.nTypes == 1:
-							self.times = self.Data_2D.Vu.Values[:, 1]
+							self.times = self.Data_2D.Vu.times()
 				elif self.resFileFormat == "NC":
 					if self.netcdf_fpath:
 						pass  # for now not written to netcdf
@@ -3156,13 +3531,13 @@ class ResData():
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
 						#self.Data_2D.Vx = Timeseries(fullpath,'VX',self.displayname)
-						error, message = self.Data_2D.Vv.Load(fullpath, 'Vv', self.displayname)
+						error, message = self.Data_2D.Vv.Load(fullpath, 'Vv', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						self.Types.append('2D Point v-Vel')
 						if self.nTypes == 1:
-							self.times = self.Data_2D.Vv.Values[:, 1]
+							self.times = self.Data_2D.Vv.times()
 				elif self.resFileFormat == "NC":
 					if self.netcdf_fpath:
 						pass  # for now not written to netcdf
@@ -3184,13 +3559,13 @@ class ResData():
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
 						#self.Data_2D.Vx = Timeseries(fullpath,'VX',self.displayname)
-						error, message = self.Data_2D.VA.Load(fullpath, 'VA', self.displayname)
+						error, message = self.Data_2D.VA.Load(fullpath, 'VA', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						self.Types.append('2D Point Velocity Angle')
 						if self.nTypes == 1:
-							self.times = self.Data_2D.VA.Values[:, 1]
+							self.times = self.Data_2D.VA.times()
 				elif self.resFileFormat == "NC":
 					if self.netcdf_fpath:
 						pass  # for now not written to netcdf
@@ -3212,7 +3587,7 @@ class ResData():
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
 						#self.Data_2D.V = Timeseries(fullpath,'V',self.displayname)
-						error, message = self.Data_2D.V.Load(fullpath, 'V', self.displayname)
+						error, message = self.Data_2D.V.Load(fullpath, 'V', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
@@ -3245,7 +3620,7 @@ class ResData():
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
 						#self.Data_2D.QI = Timeseries(fullpath,'QI',self.displayname)
-						error, message = self.Data_2D.QI.Load(fullpath, 'QI', self.displayname)
+						error, message = self.Data_2D.QI.Load(fullpath, 'QI', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
@@ -3278,7 +3653,7 @@ class ResData():
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
 						#self.Data_2D.QI = Timeseries(fullpath,'QI',self.displayname)
-						error, message = self.Data_2D.QS.Load(fullpath, 'QS', self.displayname)
+						error, message = self.Data_2D.QS.Load(fullpath, 'QS', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
@@ -3311,7 +3686,7 @@ class ResData():
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
 						#self.Data_2D.QI = Timeseries(fullpath,'QI',self.displayname)
-						error, message = self.Data_2D.HUS.Load(fullpath, 'HU', self.displayname)
+						error, message = self.Data_2D.HUS.Load(fullpath, 'HU', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
@@ -3344,7 +3719,7 @@ class ResData():
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
 						#self.Data_2D.QI = Timeseries(fullpath,'QI',self.displayname)
-						error, message = self.Data_2D.HDS.Load(fullpath, 'HD', self.displayname)
+						error, message = self.Data_2D.HDS.Load(fullpath, 'HD', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
@@ -3376,7 +3751,7 @@ class ResData():
 						fullpath = getOSIndependentFilePath(self.fpath, rdata)
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
-						error, message = self.Data_2D.HAvg.Load(fullpath, 'HA', self.displayname)
+						error, message = self.Data_2D.HAvg.Load(fullpath, 'HA', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
@@ -3409,7 +3784,7 @@ class ResData():
 						fullpath = getOSIndependentFilePath(self.fpath, rdata)
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
-						error, message = self.Data_2D.HMax.Load(fullpath,'HM',self.displayname)
+						error, message = self.Data_2D.HMax.Load(fullpath,'HM',self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
@@ -3442,7 +3817,7 @@ class ResData():
 						fullpath = getOSIndependentFilePath(self.fpath, rdata)
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
-						error, message = self.Data_2D.QIn.Load(fullpath,'FI',self.displayname)
+						error, message = self.Data_2D.QIn.Load(fullpath,'FI',self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
@@ -3474,7 +3849,7 @@ class ResData():
 						fullpath = getOSIndependentFilePath(self.fpath, rdata)
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
-						error, message = self.Data_2D.QOut.Load(fullpath,'FO',self.displayname)
+						error, message = self.Data_2D.QOut.Load(fullpath,'FO',self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
@@ -3506,7 +3881,7 @@ class ResData():
 						fullpath = getOSIndependentFilePath(self.fpath, rdata)
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
-						error, message = self.Data_2D.Vol.Load(fullpath,'VL',self.displayname)
+						error, message = self.Data_2D.Vol.Load(fullpath,'VL',self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
@@ -3539,7 +3914,7 @@ class ResData():
 						fullpath = getOSIndependentFilePath(self.fpath, rdata)
 						indA = dat_type.index('[')
 						indB = dat_type.index(']')
-						error, message = self.Data_2D.SS.Load(fullpath,'SS',self.displayname)
+						error, message = self.Data_2D.SS.Load(fullpath,'SS',self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
@@ -3587,13 +3962,13 @@ class ResData():
 				if self.resFileFormat == "CSV":
 					if rdata != 'NONE':
 						fullpath = getOSIndependentFilePath(self.fpath, rdata)
-						error, message = self.Data_1D.MB.Load(fullpath, 'MB', self.displayname)
+						error, message = self.Data_1D.MB.Load(fullpath, 'MB', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						self.Types.append('1D Mass Balance Error')
 						if self.nTypes == 1:
-							self.times = self.Data_1D.MB.Values[:, 1]
+							self.times = self.Data_1D.MB.times()
 				elif self.resFileFormat == "NC":
 					if self.netcdf_fpath:
 						error, message = self.Data_1D.MB.loadFromNetCDF(self.netcdf_fpath, "mass_balance_error_1d",
@@ -3611,13 +3986,13 @@ class ResData():
 				if self.resFileFormat == "CSV":
 					if rdata != 'NONE':
 						fullpath = getOSIndependentFilePath(self.fpath, rdata)
-						error, message = self.Data_1D.NF.Load(fullpath, 'F', self.displayname)
+						error, message = self.Data_1D.NF.Load(fullpath, 'F', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						self.Types.append('1D Node Flow Regime')
 						if self.nTypes == 1:
-							self.times = self.Data_1D.NF.Values[:, 1].astype(float)
+							self.times = self.Data_1D.NF.times()
 				elif self.resFileFormat == "NC":
 					if self.netcdf_fpath:
 						error, message = self.Data_1D.NF.loadFromNetCDF(self.netcdf_fpath, "node_flow_regime_1d",
@@ -3635,13 +4010,13 @@ class ResData():
 				if self.resFileFormat == "CSV":
 					if rdata != 'NONE':
 						fullpath = getOSIndependentFilePath(self.fpath, rdata)
-						error, message = self.Data_1D.CF.Load(fullpath, 'F', self.displayname)
+						error, message = self.Data_1D.CF.Load(fullpath, 'F', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						self.Types.append('1D Channel Flow Regime')
 						if self.nTypes == 1:
-							self.times = self.Data_1D.CF.Values[:, 1].astype(float)
+							self.times = self.Data_1D.CF.times()
 				elif self.resFileFormat == "NC":
 					if self.netcdf_fpath:
 						error, message = self.Data_1D.CF.loadFromNetCDF(self.netcdf_fpath, "channel_flow_regime_1d",
@@ -3659,13 +4034,13 @@ class ResData():
 				if self.resFileFormat == "CSV":
 					if rdata != 'NONE':
 						fullpath = getOSIndependentFilePath(self.fpath, rdata)
-						error, message = self.Data_1D.CL.Load(fullpath, 'LC', self.displayname)
+						error, message = self.Data_1D.CL.Load(fullpath, 'LC', self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 						if error:
 							return error, message
 						self.nTypes = self.nTypes + 1
 						self.Types.append('1D Channel Losses')
 						if self.nTypes == 1:
-							self.times = self.Data_1D.CL.Values[:, 1]
+							self.times = self.Data_1D.CL.times()
 				elif self.resFileFormat == "NC":
 					if self.netcdf_fpath:
 						error, message = self.Data_1D.CL.loadFromNetCDF(self.netcdf_fpath, "losses_1d",
@@ -3689,7 +4064,7 @@ class ResData():
 				if self.resFileFormat == "CSV":
 					fullpath = getOSIndependentFilePath(self.fpath, rdata)
 					timeSeries = Timeseries()
-					error, message = timeSeries.Load(fullpath, res_type, self.displayname)
+					error, message = timeSeries.Load(fullpath, res_type, self.displayname, lazy=self.lazy_load, cache=self.cache_results)
 					if error:
 						return error, message
 					self.nTypes += 1
@@ -3883,57 +4258,57 @@ class ResData():
 			return
 
 		if self.Data_1D.H.loaded:
-			self.Data_1D.H.Values[:,1] = self.Data_1D.H.Values[:,1] + diff.total_seconds() / factor
+			self.Data_1D.H.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_1D.V.loaded:
-			self.Data_1D.V.Values[:,1] = self.Data_1D.V.Values[:,1] + diff.total_seconds() / factor
+			self.Data_1D.V.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_1D.E.loaded:
-			self.Data_1D.E.Values[:,1] = self.Data_1D.E.Values[:,1] + diff.total_seconds() / factor
+			self.Data_1D.E.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_1D.Q.loaded:
-			self.Data_1D.Q.Values[:,1] = self.Data_1D.Q.Values[:,1] + diff.total_seconds() / factor
+			self.Data_1D.Q.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_1D.A.loaded:
-			self.Data_1D.A.Values[:,1] = self.Data_1D.A.Values[:,1] + diff.total_seconds() / factor
+			self.Data_1D.A.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_2D.H.loaded:
-			self.Data_2D.H.Values[:,1] = self.Data_2D.H.Values[:,1] + diff.total_seconds() / factor
+			self.Data_2D.H.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_2D.V.loaded:
-			self.Data_2D.V.Values[:,1] = self.Data_2D.V.Values[:,1] + diff.total_seconds() / factor
+			self.Data_2D.V.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_2D.Q.loaded:
-			self.Data_2D.Q.Values[:,1] = self.Data_2D.Q.Values[:,1] + diff.total_seconds() / factor
+			self.Data_2D.Q.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_2D.GL.loaded:
-			self.Data_2D.GL.Values[:,1] = self.Data_2D.GL.Values[:,1] + diff.total_seconds() / factor
+			self.Data_2D.GL.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_2D.QA.loaded:
-			self.Data_2D.QA.Values[:,1] = self.Data_2D.QA.Values[:,1] + diff.total_seconds() / factor
+			self.Data_2D.QA.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_2D.QI.loaded:
-			self.Data_2D.QI.Values[:,1] = self.Data_2D.QI.Values[:,1] + diff.total_seconds() / factor
+			self.Data_2D.QI.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_2D.Vx.loaded:
-			self.Data_2D.Vx.Values[:,1] = self.Data_2D.Vx.Values[:,1] + diff.total_seconds() / factor
+			self.Data_2D.Vx.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_2D.Vy.loaded:
-			self.Data_2D.Vy.Values[:,1] = self.Data_2D.Vy.Values[:,1] + diff.total_seconds() / factor
+			self.Data_2D.Vy.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_2D.QS.loaded:
-			self.Data_2D.QS.Values[:,1] = self.Data_2D.QS.Values[:,1] + diff.total_seconds() / factor
+			self.Data_2D.QS.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_2D.HUS.loaded:
-			self.Data_2D.HUS.Values[:,1] = self.Data_2D.HUS.Values[:,1] + diff.total_seconds() / factor
+			self.Data_2D.HUS.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_2D.HDS.loaded:
-			self.Data_2D.HDS.Values[:,1] = self.Data_2D.HDS.Values[:,1] + diff.total_seconds() / factor
+			self.Data_2D.HDS.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_2D.HAvg.loaded:
-			self.Data_2D.HAvg.Values[:,1] = self.Data_2D.HAvg.Values[:,1] + diff.total_seconds() / factor
+			self.Data_2D.HAvg.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_2D.HMax.loaded:
-			self.Data_2D.HMax.Values[:,1] = self.Data_2D.HMax.Values[:,1] + diff.total_seconds() / factor
+			self.Data_2D.HMax.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_2D.QIn.loaded:
-			self.Data_2D.QIn.Values[:,1] = self.Data_2D.QIn.Values[:,1] + diff.total_seconds() / factor
+			self.Data_2D.QIn.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_2D.QOut.loaded:
-			self.Data_2D.QOut.Values[:,1] = self.Data_2D.QOut.Values[:,1] + diff.total_seconds() / factor
+			self.Data_2D.QOut.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_2D.SS.loaded:
-			self.Data_2D.SS.Values[:,1] = self.Data_2D.SS.Values[:,1] + diff.total_seconds() / factor
+			self.Data_2D.SS.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_2D.Vol.loaded:
-			self.Data_2D.Vol.Values[:,1] = self.Data_2D.Vol.Values[:,1] + diff.total_seconds() / factor
+			self.Data_2D.Vol.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_RL.H_P.loaded:
-			self.Data_RL.H_P.Values[:,1] = self.Data_RL.H_P.Values[:,1] + diff.total_seconds() / factor
+			self.Data_RL.H_P.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_RL.Q_L.loaded:
-			self.Data_RL.Q_L.Values[:,1] = self.Data_RL.Q_L.Values[:,1] + diff.total_seconds() / factor
+			self.Data_RL.Q_L.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_RL.Vol_R.loaded:
-			self.Data_RL.Vol_R.Values[:,1] = self.Data_RL.Vol_R.Values[:,1] + diff.total_seconds() / factor
+			self.Data_RL.Vol_R.shiftTimes(diff.total_seconds() / factor)
 		if self.Data_2D.D.loaded:
-			self.Data_2D.D.Values[:, 1] = self.Data_2D.D.Values[:, 1] + diff.total_seconds() / factor
+			self.Data_2D.D.shiftTimes(diff.total_seconds() / factor)
 
 		if self.has_reference_time:
 			self._tmp_reference_time = zeroTime
@@ -3952,57 +4327,57 @@ class ResData():
 		self.reloadTimesteps(zero_time)
 		
 		if self.Data_1D.H.loaded:
-			return self.Data_1D.H.Values[:,1]
+			return self.Data_1D.H.times()
 		elif self.Data_1D.V.loaded:
-			return self.Data_1D.V.Values[:,1]
+			return self.Data_1D.V.times()
 		elif self.Data_1D.E.loaded:
-			return self.Data_1D.E.Values[:,1]
+			return self.Data_1D.E.times()
 		elif self.Data_1D.Q.loaded:
-			return self.Data_1D.Q.Values[:,1]
+			return self.Data_1D.Q.times()
 		elif self.Data_1D.A.loaded:
-			return self.Data_1D.A.Values[:,1]
+			return self.Data_1D.A.times()
 		elif self.Data_2D.H.loaded:
-			return self.Data_2D.H.Values[:,1]
+			return self.Data_2D.H.times()
 		elif self.Data_2D.V.loaded:
-			return self.Data_2D.V.Values[:,1]
+			return self.Data_2D.V.times()
 		elif self.Data_2D.Q.loaded:
-			return self.Data_2D.Q.Values[:,1]
+			return self.Data_2D.Q.times()
 		elif self.Data_2D.GL.loaded:
-			return self.Data_2D.GL.Values[:,1]
+			return self.Data_2D.GL.times()
 		elif self.Data_2D.QA.loaded:
-			return self.Data_2D.QA.Values[:,1]
+			return self.Data_2D.QA.times()
 		elif self.Data_2D.QI.loaded:
-			return self.Data_2D.QI.Values[:,1]
+			return self.Data_2D.QI.times()
 		elif self.Data_2D.Vx.loaded:
-			return self.Data_2D.Vx.Values[:,1]
+			return self.Data_2D.Vx.times()
 		elif self.Data_2D.Vy.loaded:
-			return self.Data_2D.Vy.Values[:,1]
+			return self.Data_2D.Vy.times()
 		elif self.Data_2D.QS.loaded:
-			return self.Data_2D.QS.Values[:,1]
+			return self.Data_2D.QS.times()
 		elif self.Data_2D.HUS.loaded:
-			return self.Data_2D.HUS.Values[:,1]
+			return self.Data_2D.HUS.times()
 		elif self.Data_2D.HDS.loaded:
-			return self.Data_2D.HDS.Values[:,1]
+			return self.Data_2D.HDS.times()
 		elif self.Data_2D.HAvg.loaded:
-			return self.Data_2D.HAvg.Values[:,1]
+			return self.Data_2D.HAvg.times()
 		elif self.Data_2D.HMax.loaded:
-			return self.Data_2D.HMax.Values[:,1]
+			return self.Data_2D.HMax.times()
 		elif self.Data_2D.QIn.loaded:
-			return self.Data_2D.QIn.Values[:,1]
+			return self.Data_2D.QIn.times()
 		elif self.Data_2D.QOut.loaded:
-			return self.Data_2D.QOut.Values[:,1]
+			return self.Data_2D.QOut.times()
 		elif self.Data_2D.SS.loaded:
-			return self.Data_2D.SS.Values[:,1]
+			return self.Data_2D.SS.times()
 		elif self.Data_2D.Vol.loaded:
-			return self.Data_2D.Vol.Values[:,1]
+			return self.Data_2D.Vol.times()
 		elif self.Data_RL.H_P.loaded:
-			return self.Data_RL.H_P.Values[:,1]
+			return self.Data_RL.H_P.times()
 		elif self.Data_RL.Q_L.loaded:
-			return self.Data_RL.Q_L.Values[:,1]
+			return self.Data_RL.Q_L.times()
 		elif self.Data_RL.Vol_R.loaded:
-			return self.Data_RL.Vol_R.Values[:,1]
+			return self.Data_RL.Vol_R.times()
 		elif self.Data_2D.D.loaded:
-			return self.Data_2D.D.Values[:,1]
+			return self.Data_2D.D.times()
 		else:
 			return []
 
@@ -4020,57 +4395,57 @@ class ResData():
 		rt = self.reference_time
 
 		if self.Data_1D.H.loaded:
-			return self.Data_1D.H.Values[:, 1]
+			return self.Data_1D.H.times()
 		elif self.Data_1D.V.loaded:
-			return self.Data_1D.V.Values[:, 1]
+			return self.Data_1D.V.times()
 		elif self.Data_1D.E.loaded:
-			return self.Data_1D.E.Values[:, 1]
+			return self.Data_1D.E.times()
 		elif self.Data_1D.Q.loaded:
-			return self.Data_1D.Q.Values[:, 1]
+			return self.Data_1D.Q.times()
 		elif self.Data_1D.A.loaded:
-			return self.Data_1D.A.Values[:, 1]
+			return self.Data_1D.A.times()
 		elif self.Data_2D.H.loaded:
-			return self.Data_2D.H.Values[:, 1]
+			return self.Data_2D.H.times()
 		elif self.Data_2D.V.loaded:
-			return self.Data_2D.V.Values[:, 1]
+			return self.Data_2D.V.times()
 		elif self.Data_2D.Q.loaded:
-			return self.Data_2D.Q.Values[:, 1]
+			return self.Data_2D.Q.times()
 		elif self.Data_2D.GL.loaded:
-			return self.Data_2D.GL.Values[:, 1]
+			return self.Data_2D.GL.times()
 		elif self.Data_2D.QA.loaded:
-			return self.Data_2D.QA.Values[:, 1]
+			return self.Data_2D.QA.times()
 		elif self.Data_2D.QI.loaded:
-			return self.Data_2D.QI.Values[:, 1]
+			return self.Data_2D.QI.times()
 		elif self.Data_2D.Vx.loaded:
-			return self.Data_2D.Vx.Values[:, 1]
+			return self.Data_2D.Vx.times()
 		elif self.Data_2D.Vy.loaded:
-			return self.Data_2D.Vy.Values[:, 1]
+			return self.Data_2D.Vy.times()
 		elif self.Data_2D.QS.loaded:
-			return self.Data_2D.QS.Values[:, 1]
+			return self.Data_2D.QS.times()
 		elif self.Data_2D.HUS.loaded:
-			return self.Data_2D.HUS.Values[:, 1]
+			return self.Data_2D.HUS.times()
 		elif self.Data_2D.HDS.loaded:
-			return self.Data_2D.HDS.Values[:, 1]
+			return self.Data_2D.HDS.times()
 		elif self.Data_2D.HAvg.loaded:
-			return self.Data_2D.HAvg.Values[:, 1]
+			return self.Data_2D.HAvg.times()
 		elif self.Data_2D.HMax.loaded:
-			return self.Data_2D.HMax.Values[:, 1]
+			return self.Data_2D.HMax.times()
 		elif self.Data_2D.QIn.loaded:
-			return self.Data_2D.QIn.Values[:, 1]
+			return self.Data_2D.QIn.times()
 		elif self.Data_2D.QOut.loaded:
-			return self.Data_2D.QOut.Values[:, 1]
+			return self.Data_2D.QOut.times()
 		elif self.Data_2D.SS.loaded:
-			return self.Data_2D.SS.Values[:, 1]
+			return self.Data_2D.SS.times()
 		elif self.Data_2D.Vol.loaded:
-			return self.Data_2D.Vol.Values[:, 1]
+			return self.Data_2D.Vol.times()
 		elif self.Data_RL.H_P.loaded:
-			return self.Data_RL.H_P.Values[:, 1]
+			return self.Data_RL.H_P.times()
 		elif self.Data_RL.Q_L.loaded:
-			return self.Data_RL.Q_L.Values[:, 1]
+			return self.Data_RL.Q_L.times()
 		elif self.Data_RL.Vol_R.loaded:
-			return self.Data_RL.Vol_R.Values[:, 1]
+			return self.Data_RL.Vol_R.times()
 		elif self.Data_2D.D.loaded:
-			return self.Data_2D.D.Values[:, 1]
+			return self.Data_2D.D.times()
 		else:
 			return []
 
@@ -1,4 +1,5 @@
 import tempfile
+import numpy as np
 from osgeo import ogr, gdal
 
 from qgis.PyQt.QtCore import QCoreApplication, QVariant
@@ -25,6 +26,9 @@ except ImportError:
     from pathlib_ import Path_ as Path
 
 
+WRITE_CHUNK_SIZE = 100000  # points converted and written between progress updates
+
+
 def get_driver_by_extension(driver_type, ext):
     if not ext:
         return
@@ -183,6 +187,30 @@ class TmoToPoints_CustomDialog(AlgorithmDialog):
 
 class TmoToPoints(QgsProcessingAlgorithm):
 
+    def write_points(self, lyr, x, y, values, domain_index):
+        """
+        Writes point features from arrays of co-ordinates and values. A single feature and geometry are reused
+        for every point and the arrays are converted to python floats a chunk at a time.
+        """
+        feat = ogr.Feature(lyr.GetLayerDefn())
+        geom = ogr.Geometry(ogr.wkbPoint)
+        geom.AddPoint(0., 0.)
+        feat.SetField(1, int(domain_index))
+        for i in range(0, values.size, WRITE_CHUNK_SIZE):
+            if self.feedback.isCanceled():
+                return False
+            chunk = zip(x[i:i+WRITE_CHUNK_SIZE].tolist(), y[i:i+WRITE_CHUNK_SIZE].tolist(),
+                        values[i:i+WRITE_CHUNK_SIZE].astype(np.float64).tolist())
+            for x_, y_, val in chunk:
+                geom.SetPoint(0, x_, y_)
+                feat.SetGeometry(geom)
+                feat.SetField(0, val)
+                feat.SetFID(ogr.NullFID)
+                lyr.CreateFeature(feat)
+            self.count += min(WRITE_CHUNK_SIZE, values.size - i)
+            self.feedback.setCurrentStep(self.count)
+        return True
+
     def call_back_prog(self, *args, **kwargs):
         self.count += 1
         self.feedback.setCurrentStep(self.count)
@@ -253,19 +281,16 @@ class TmoToPoints(QgsProcessingAlgorithm):
             field = ogr.FieldDefn('Domain', ogr.OFTInteger)
             lyr.CreateField(field)
 
-            # iterate through points and create feature
+            # read each domain as arrays and write the points
             self.count = 0
+            time_index = tmo.time_index(parameters['times'])
             dataset.StartTransaction()
-            for point in tmo.data_at_time(parameters['times'], self.call_back_log, self.call_back_prog):
-                x, y, val, dom_ind = point
-                feat = ogr.Feature(lyr.GetLayerDefn())
-                geom = ogr.Geometry(ogr.wkbPoint)
-                geom.AddPoint(x, y)
-                feat.SetGeometry(geom)
-                feat.SetField(0, float(val))
-                feat.SetField(1, int(dom_ind))
-                lyr.CreateFeature(feat)
-                feat = None
+            for i, domain in enumerate(tmo.header.domains):
+                self.call_back_log('Reading file data for domain: {0}\n{1}\n'.format(i, domain))
+                x, y, values = tmo.domain_arrays_at_time(time_index, i)
+                self.count += domain.row_count * domain.col_count - values.size  # dry cells
+                if not self.write_points(lyr, x, y, values, i):
+                    break
             dataset.CommitTransaction()
 
             dataset, lyr = None, None
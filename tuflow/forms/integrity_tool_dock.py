@@ -762,6 +762,9 @@ class Ui_IntegrityTool(object):
         self.pbRun = QtWidgets.QPushButton(self.dockWidgetContents)
         self.pbRun.setObjectName("pbRun")
         self.horizontalLayout_5.addWidget(self.pbRun)
+        self.pbRunAll = QtWidgets.QPushButton(self.dockWidgetContents)
+        self.pbRunAll.setObjectName("pbRunAll")
+        self.horizontalLayout_5.addWidget(self.pbRunAll)
         self.verticalLayout.addLayout(self.horizontalLayout_5)
         IntegrityTool.setWidget(self.dockWidgetContents)
 
@@ -860,5 +863,6 @@ class Ui_IntegrityTool(object):
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_2), _translate("IntegrityTool", "Empty Geometry"))
         self.runStatus.setText(_translate("IntegrityTool", "Ready"))
         self.pbRun.setText(_translate("IntegrityTool", "Run"))
+        self.pbRunAll.setText(_translate("IntegrityTool", "Run All Checks"))
 from qgscollapsiblegroupbox import QgsCollapsibleGroupBox
 import tuflow.resources.tuflow
@@ -508,6 +508,9 @@ class Ui_TuViewOptions(object):
         self.cbParticleDebug = QtWidgets.QCheckBox(self.groupBox_9)
         self.cbParticleDebug.setObjectName("cbParticleDebug")
         self.verticalLayout_11.addWidget(self.cbParticleDebug)
+        self.cbParticleStyledVarsOnly = QtWidgets.QCheckBox(self.groupBox_9)
+        self.cbParticleStyledVarsOnly.setObjectName("cbParticleStyledVarsOnly")
+        self.verticalLayout_11.addWidget(self.cbParticleStyledVarsOnly)
         self.verticalLayout_9.addWidget(self.groupBox_9)
         spacerItem22 = QtWidgets.QSpacerItem(20, 40, QT_SIZE_POLICY_MINIMUM, QT_SIZE_POLICY_EXPANDING)
         self.verticalLayout_9.addItem(spacerItem22)
@@ -622,5 +625,7 @@ class Ui_TuViewOptions(object):
         self.cbMeshIntCheck.setText(_translate("TuViewOptions", "Mesh intercept locations (for map plotting line types e.g. cross section)"))
         self.groupBox_9.setTitle(_translate("TuViewOptions", "Particles"))
         self.cbParticleDebug.setText(_translate("TuViewOptions", "Particles - Include X, Y, Z, Time info in attribute table"))
+        self.cbParticleStyledVarsOnly.setToolTip(_translate("TuViewOptions", "Only read the variables used by the layer style and labels. Other attributes will be empty."))
+        self.cbParticleStyledVarsOnly.setText(_translate("TuViewOptions", "Particles - Only read variables used by style / labels"))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.check), _translate("TuViewOptions", "Check / Debug"))
 from qgscolorbutton import QgsColorButton
@@ -1,26 +1,23 @@
 from qgis.PyQt.QtCore import *
 from qgis.core import *
 from math import pi
+import numpy as np
 from .Enumerators import *
 from tuflow.tuflowqgis_library import getNetworkMidLocation, interpolateObvert
 from .FlowTraceLongPlot_V2 import Connectivity
+from .Flags import Flag, flagFeatures
 
 from ..compatibility_routines import QT_DOUBLE, QT_STRING
 
-class ContinuityTool(QObject):
+class ContinuityChecks():
+    """
+    The continuity checks. The network can be a DataCollector or a NetworkSnapshot - only the ids,
+    features, connections and drapes are used so the checks can be run away from the GUI thread.
 
-    # some custom signals to let the gui know what's going on
-    updated = pyqtSignal()
-    finished = pyqtSignal()
-    error = pyqtSignal(str)
-    
-    def __init__(self, iface=None, dataCollector=None, outputLyr=None, limitAngle=0, limitCover=99999, limitArea=100,
-                 checkArea=False, checkAngle=False, checkInvert=False, checkCover=False):
-        # initialise inherited QObject
-        QObject.__init__(self, parent=None)
+    """
 
-        # some custom properties
-        self.iface = iface
+    def __init__(self, dataCollector=None, limitAngle=0, limitCover=99999, limitArea=100,
+                 checkArea=False, checkAngle=False, checkInvert=False, checkCover=False):
         self.dataCollector = dataCollector
 
         self.bCheckArea = checkArea
@@ -31,35 +28,35 @@ class ContinuityTool(QObject):
         self.limitCover = limitCover
         self.limitArea = limitArea
         
-        self.flaggedAreaUniqueIds = []
+        self.flaggedAreaUniqueIds = set()  # set so checking for duplicate locations is quick
         self.flaggedAreaIds = []
         self.flaggedAreas = []
         self.flaggedAreaMessages = []
         self.flaggedAreaMag = []
         self.flaggedAreaLabel = []
         
-        self.flaggedInvertUniqueIds = []
+        self.flaggedInvertUniqueIds = set()
         self.flaggedInvertIds = []
         self.flaggedInverts = []
         self.flaggedInvertMessages = []
         self.flaggedInvertMag = []
         self.flaggedInvertLabel = []
         
-        self.flaggedGradientUniqueIds = []
+        self.flaggedGradientUniqueIds = set()
         self.flaggedGradientIds = []
         self.flaggedGradients = []
         self.flaggedGradientMessages = []
         self.flaggedGradientMag = []
         self.flaggedGradientLabel = []
         
-        self.flaggedAngleUniqueIds = []
+        self.flaggedAngleUniqueIds = set()
         self.flaggedAngleIds = []
         self.flaggedAngles = []
         self.flaggedAngleMessages = []
         self.flaggedAngleMag = []
         self.flaggedAngleLabel = []
         
-        self.flaggedCoverUniqueIds = []
+        self.flaggedCoverUniqueIds = set()
         self.flaggedCoverIds = []
         self.flaggedCoverIds_ = []
         self.flaggedCover = []
@@ -67,131 +64,99 @@ class ContinuityTool(QObject):
         self.flaggedCoverMag = []
         self.flaggedCoverChainage = []
         self.flaggedCoverLabel = []
-        
-        # prepare the outputlyr
-        if outputLyr is not None:
-            self.outputLyr = outputLyr
-            self.dp = outputLyr.dataProvider()
-        else:
-            if self.iface is not None:
-                crs = QgsProject.instance().crs()
-                uri = "point?crs={0}".format(crs.authid().lower())
-            else:
-                uri = "point"
-            self.outputLyr = QgsVectorLayer(uri, "output", "memory")
-            self.dp = self.outputLyr.dataProvider()
-            self.dp.addAttributes([QgsField('Warning', QT_STRING),
-                                   QgsField("Message", QT_STRING),
-                                   QgsField("Tool", QT_STRING),
-                                   QgsField("Magnitude", QT_DOUBLE)])
-            self.outputLyr.updateFields()
 
-        self.ids_to_assess = None
-        if dataCollector.flowTrace and len(dataCollector.startLocs) > 1:
-            connectivity = Connectivity(dataCollector.startLocs, dataCollector)
-            connectivity.getBranches()
-            if not connectivity.valid:
-                self.error.emit('Selected channels are not connected')
-                return
-            if not connectivity.branches or not connectivity.branches[0]:
-                self.error.emit('Did not find any channels to assess')
-                return
+    def checkAll(self, ids_to_assess=None):
+        """
+        Run the selected checks on every channel.
+
+        :param ids_to_assess: set -> str ids to check (None for all)
+        :return: void
+        """
 
-            self.ids_to_assess = set(sum(connectivity.branches, []))
-            
         # loop through features and check continuity
-        for id in dataCollector.ids:
-            if self.ids_to_assess is not None and id not in self.ids_to_assess:
+        for id in self.dataCollector.ids:
+            if ids_to_assess is not None and id not in ids_to_assess:
                 continue
 
-            fData = dataCollector.features[id]
-            cData = dataCollector.connections[id]
+            fData = self.dataCollector.features[id]
+            cData = self.dataCollector.connections[id]
             
             # Check Downstream Area
-            if checkArea:
+            if self.bCheckArea:
                 self.checkArea(fData, cData)
             
             # Check Downstream Inverts
-            if checkInvert:
+            if self.bCheckInvert:
                 self.checkInverts(fData, cData)
             
                 # Check Gradient
                 self.checkGradient(fData)
             
             # Check outflow angle
-            if checkAngle:
+            if self.bCheckAngle:
                 self.checkAngles(fData, cData)
             
             # Check pipe cover
-            if checkCover:
+            if self.bCheckCover:
                 self.checkCover(fData)
-            
-        # write out outputlyr shape file
-        feats = []
+
+    def flags(self):
+        """
+        Flagged locations to write to the output layer.
+
+        :return: list -> Flag
+        """
+
+        flags = []
         # area
         for i, point in enumerate(self.flaggedAreas):
-            id = self.flaggedAreaIds[i]
-            message = self.flaggedAreaMessages[i]
-            
-            feat = QgsFeature()
-            feat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(point)))
-            feat.setAttributes(['Flow area decreases downstream of {0}'.format(id),
-                                '{0}'.format(message),
-                                'Continuity: Flow Area Check',
-                                self.flaggedAreaMag[i]])
-            feats.append(feat)
+            flags.append(Flag(point.x(), point.y(),
+                              'Flow area decreases downstream of {0}'.format(self.flaggedAreaIds[i]),
+                              '{0}'.format(self.flaggedAreaMessages[i]),
+                              'Continuity: Flow Area Check',
+                              self.flaggedAreaMag[i]))
         # inverts
         for i, point in enumerate(self.flaggedInverts):
-            id = self.flaggedInvertIds[i]
-            message = self.flaggedInvertMessages[i]
-    
-            feat = QgsFeature()
-            feat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(point)))
-            feat.setAttributes(['Invert increases downstream of {0}'.format(id),
-                                '{0}'.format(message),
-                                'Continuity: Invert Check',
-                                self.flaggedInvertMag[i]])
-            feats.append(feat)
+            flags.append(Flag(point.x(), point.y(),
+                              'Invert increases downstream of {0}'.format(self.flaggedInvertIds[i]),
+                              '{0}'.format(self.flaggedInvertMessages[i]),
+                              'Continuity: Invert Check',
+                              self.flaggedInvertMag[i]))
         # gradients
         for i, point in enumerate(self.flaggedGradients):
-            id = self.flaggedGradientIds[i]
-            message = self.flaggedGradientMessages[i]
-    
-            feat = QgsFeature()
-            feat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(point)))
-            feat.setAttributes(['Adverse gradient at {0}'.format(id),
-                                '{0}'.format(message),
-                                'Continuity: Gradient Check',
-                                self.flaggedGradientMag[i]])
-            feats.append(feat)
+            flags.append(Flag(point.x(), point.y(),
+                              'Adverse gradient at {0}'.format(self.flaggedGradientIds[i]),
+                              '{0}'.format(self.flaggedGradientMessages[i]),
+                              'Continuity: Gradient Check',
+                              self.flaggedGradientMag[i]))
         # angle
         for i, point in enumerate(self.flaggedAngles):
-            id = self.flaggedAngleIds[i]
-            message = self.flaggedAngleMessages[i]
-    
-            feat = QgsFeature()
-            feat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(point)))
-            feat.setAttributes(['Accute outflow angle at {0}'.format(id),
-                                '{0}'.format(message),
-                                'Continuity: Outflow Angle Check',
-                                self.flaggedAngleMag[i]])
-            feats.append(feat)
+            flags.append(Flag(point.x(), point.y(),
+                              'Accute outflow angle at {0}'.format(self.flaggedAngleIds[i]),
+                              '{0}'.format(self.flaggedAngleMessages[i]),
+                              'Continuity: Outflow Angle Check',
+                              self.flaggedAngleMag[i]))
         # cover
         for i, point in enumerate(self.flaggedCover):
-            id = self.flaggedCoverIds[i]
-            message = self.flaggedCoverMessages[i]
-    
-            feat = QgsFeature()
-            feat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(point)))
-            feat.setAttributes(['Insufficient cover at {0}'.format(id),
-                                '{0}'.format(message),
-                                'Continuity: Cover Check',
-                                self.flaggedCoverMag[i]])
-            feats.append(feat)
-
-        self.dp.addFeatures(feats)
-        self.outputLyr.updateExtents()
-        self.outputLyr.triggerRepaint()
+            flags.append(Flag(point.x(), point.y(),
+                              'Insufficient cover at {0}'.format(self.flaggedCoverIds[i]),
+                              '{0}'.format(self.flaggedCoverMessages[i]),
+                              'Continuity: Cover Check',
+                              self.flaggedCoverMag[i]))
+
+        return flags
+
+    def midLocation(self, fData):
+        """
+        Mid point along a channel. A NetworkSnapshot has no QgsFeature so it is taken from the drape.
+
+        :param fData: FeatureData
+        :return: QgsPoint or SnapshotPoint
+        """
+
+        if fData.feature is not None:
+            return getNetworkMidLocation(fData.feature)
+        return self.dataCollector.midVertex(fData.id)
 
     def checkArea(self, fData, cData):
         """
@@ -227,7 +192,7 @@ class ContinuityTool(QObject):
                 uniqueId = (fData.endVertex.x(), fData.endVertex.y())
                 if uniqueId not in self.flaggedAreaUniqueIds:
                     self.flaggedAreaIds.append(fData.id)
-                    self.flaggedAreaUniqueIds.append(uniqueId)
+                    self.flaggedAreaUniqueIds.add(uniqueId)
                     #self.flaggedAreaIds.append(fData.id)
                     self.flaggedAreas.append(fData.endVertex)
                     self.flaggedAreaMessages.append('Area changes from {0:.02f} to {1:.02f}'.format(area, areaDs))
@@ -254,7 +219,7 @@ class ContinuityTool(QObject):
                     if invert < invertDs:
                         uniqueId = (fData.endVertex.x(), fData.endVertex.y())
                         if uniqueId not in self.flaggedInvertUniqueIds:
-                            self.flaggedInvertUniqueIds.append(uniqueId)
+                            self.flaggedInvertUniqueIds.add(uniqueId)
                             self.flaggedInvertIds.append(fData.id)
                             self.flaggedInverts.append(fData.endVertex)
                             self.flaggedInvertMessages.append(
@@ -272,10 +237,10 @@ class ContinuityTool(QObject):
         
         if fData.invertUs != -99999 and fData.invertDs != -99999:
             if fData.invertUs < fData.invertDs:
-                point = getNetworkMidLocation(fData.feature)
+                point = self.midLocation(fData)
                 uniqueId = (point.x(), point.y())
                 if uniqueId not in self.flaggedGradientUniqueIds:
-                    self.flaggedGradientUniqueIds.append(uniqueId)
+                    self.flaggedGradientUniqueIds.add(uniqueId)
                     self.flaggedGradientIds.append(fData.id)
                     self.flaggedGradients.append(point)
                     self.flaggedGradientMessages.append(
@@ -311,7 +276,7 @@ class ContinuityTool(QObject):
                     if outFlowAngle < self.limitAngle:
                         uniqueId = (fData.endVertex.x(), fData.endVertex.y())
                         if uniqueId not in self.flaggedAngleUniqueIds:
-                            self.flaggedAngleUniqueIds.append(uniqueId)
+                            self.flaggedAngleUniqueIds.add(uniqueId)
                             self.flaggedAngleIds.append(fData.id)
                             self.flaggedAngles.append(fData.endVertex)
                             self.flaggedAngleMessages.append('Outflow angle is {0:.02f}'.format(outFlowAngle))
@@ -329,28 +294,31 @@ class ContinuityTool(QObject):
         # get pipe obvert
         if fData.type and (fData.type.upper()[0] == 'C' or fData.type.upper()[0] == 'R'):
             if fData.invertUs != -99999 and fData.invertDs != -99999:
+                if fData.id not in self.dataCollector.drapes:
+                    return
                 dData = self.dataCollector.drapes[fData.id]
                 chainages = dData.chainages
+                if not chainages or not dData.elevations:
+                    return  # no drape e.g. channel is outside the DEM
                 height = fData.height_
-                obverts = interpolateObvert(fData.invertUs, fData.invertDs, height, chainages)
-                min_cover, min_ground, min_obvert, min_chainage, min_x, min_y, min_point = [9e29 for x in range(7)]
-                for i, obvert in enumerate(obverts):
-                    ground = dData.elevations[i]
-                    point = dData.points[i]
-                    if ground is not None:
-                        cover = ground - obvert
-                        if cover < self.limitCover and cover < min_cover:
-                            min_cover = min(min_cover, cover)
-                            min_ground = ground
-                            min_obvert = obvert
-                            min_chainage = chainages[i]
-                            min_x = point.x()
-                            min_y = point.y()
-                            min_point = point
+                obverts = np.array(interpolateObvert(fData.invertUs, fData.invertDs, height, chainages))
+                ground = np.array([np.nan if x is None else x for x in dData.elevations], dtype=np.float64)
+                with np.errstate(invalid='ignore'):
+                    cover = ground - obverts
+                    cover[~(cover < self.limitCover)] = np.inf  # also excludes no ground data (nan)
+                i = int(np.argmin(cover))  # first occurrence of the minimum cover
+                min_cover = cover[i] if np.isfinite(cover[i]) else 9e29
+                if min_cover < self.limitCover:
+                    min_ground = ground[i]
+                    min_obvert = obverts[i]
+                    min_chainage = chainages[i]
+                    min_point = dData.points[i]
+                    min_x = min_point.x()
+                    min_y = min_point.y()
                 if min_cover < self.limitCover:
                     uniqueId = (min_x, min_y)
                     if uniqueId not in self.flaggedCoverUniqueIds:
-                        self.flaggedCoverUniqueIds.append(uniqueId)
+                        self.flaggedCoverUniqueIds.add(uniqueId)
                         self.flaggedCoverIds.append(uniqueId)
                         self.flaggedCover.append(min_point)
                         self.flaggedCoverMessages.append("Pipe cover drops below limit: {0:.02f}".format(min_cover))
@@ -498,3 +466,74 @@ class ContinuityTool(QObject):
             return self.dataCollector.connections[id].linesDs
         elif whichDirection == NETWORK.UpstreamUpstream:
             return self.dataCollector.connections[id].linesUsUs
+
+
+class ContinuityTool(QObject, ContinuityChecks):
+
+    # some custom signals to let the gui know what's going on
+    updated = pyqtSignal()
+    finished = pyqtSignal()
+    error = pyqtSignal(str)
+    
+    def __init__(self, iface=None, dataCollector=None, outputLyr=None, limitAngle=0, limitCover=99999, limitArea=100,
+                 checkArea=False, checkAngle=False, checkInvert=False, checkCover=False):
+        # initialise inherited QObject
+        QObject.__init__(self, parent=None)
+        ContinuityChecks.__init__(self, dataCollector, limitAngle, limitCover, limitArea,
+                                  checkArea, checkAngle, checkInvert, checkCover)
+
+        # some custom properties
+        self.iface = iface
+        
+        # prepare the outputlyr
+        if outputLyr is not None:
+            self.outputLyr = outputLyr
+            self.dp = outputLyr.dataProvider()
+        else:
+            if self.iface is not None:
+                crs = QgsProject.instance().crs()
+                uri = "point?crs={0}".format(crs.authid().lower())
+            else:
+                uri = "point"
+            self.outputLyr = QgsVectorLayer(uri, "output", "memory")
+            self.dp = self.outputLyr.dataProvider()
+            self.dp.addAttributes([QgsField('Warning', QT_STRING),
+                                   QgsField("Message", QT_STRING),
+                                   QgsField("Tool", QT_STRING),
+                                   QgsField("Magnitude", QT_DOUBLE)])
+            self.outputLyr.updateFields()
+
+        self.ids_to_assess = None
+        if dataCollector.flowTrace and len(dataCollector.startLocs) > 1:
+            connectivity = Connectivity(dataCollector.startLocs, dataCollector)
+            connectivity.getBranches()
+            if not connectivity.valid:
+                self.error.emit('Selected channels are not connected')
+                return
+            if not connectivity.branches or not connectivity.branches[0]:
+                self.error.emit('Did not find any channels to assess')
+                return
+
+            self.ids_to_assess = set(sum(connectivity.branches, []))
+
+        self.checkAll(self.ids_to_assess)
+            
+        # write out outputlyr shape file
+        self.dp.addFeatures(flagFeatures(self.flags()))
+        self.outputLyr.updateExtents()
+        self.outputLyr.triggerRepaint()
+
+
+def continuityFlags(network, limitAngle=0, limitCover=99999, limitArea=100,
+                    checkArea=False, checkAngle=False, checkInvert=False, checkCover=False):
+    """
+    Run the continuity checks on a network and return the flags.
+
+    :param network: NetworkSnapshot or DataCollector
+    :return: list -> Flag
+    """
+
+    checks = ContinuityChecks(network, limitAngle, limitCover, limitArea, checkArea, checkAngle, checkInvert,
+                              checkCover)
+    checks.checkAll()
+    return checks.flags()
@@ -9,6 +9,9 @@ from qgis.PyQt.QtWidgets import *
 from .Enumerators import *
 from .FeatureData import FeatureData
 from .DrapeData import DrapeData
+from .RasterSampler import RasterSampler
+from .DrapeCache import DrapeCache
+from .EndpointIndex import EndpointIndex
 from .ConnectionData import ConnectionData
 from .NetworkVertex import NetworkVertex
 from tuflow.tuflowqgis_library import is1dNetwork, lineToPoints, getRasterValue, readInvFromCsv
@@ -87,10 +90,19 @@ class DataCollector(QObject):
         self.flowTrace = False
 
         self.helper = EstryHelper()
+        self.rasterSampler = RasterSampler()
+        self.drapeCache = DrapeCache()
+        self.drapeUnits = None
 
     def setHelper(self, helper):
         self.helper = helper
 
+    def setRasterSampler(self, rasterSampler):
+        self.rasterSampler = rasterSampler
+
+    def setDrapeCache(self, drapeCache):
+        self.drapeCache = drapeCache
+
     def collectData(self, inputs=(), dem=None, lines=(), lineDataCollector=None, exclRadius=15, tables=(),
                     startLocs=(), flowTrace=False):
         """
@@ -134,6 +146,13 @@ class DataCollector(QObject):
         self.startLocs = startLocs[:]
         self.flowTrace = flowTrace
 
+        # DEM tiles are cached by the sampler - reset if DEM has changed since the last run
+        self.rasterSampler.setRaster(dem)
+        if self.iface is not None:
+            self.drapeUnits = self.iface.mapCanvas().mapUnits()
+        else:
+            self.drapeUnits = QgsUnitTypes.DistanceMeters
+
         # loop through all inputs and start collecting
         #for layer in inputs:
             #if layer is not None:
@@ -157,6 +176,20 @@ class DataCollector(QObject):
                     allFeatures = {f.id(): f for f in layer.getFeatures()}
                     self.allFeatures[layer.name()] = allFeatures
             
+        # index end points of the layers checked for snapping
+        # so nearby features can be found without a spatial query per feature
+        if lines and self.geomType == GEOM_TYPE.Point:
+            reqInputs = lines
+            snapFeatures = lineDataCollector.allFeatures
+        else:
+            reqInputs = inputs
+            for reqLayer in inputs:
+                if reqLayer.name() not in self.allFeatures:
+                    self.allFeatures[reqLayer.name()] = {f.id(): f for f in reqLayer.getFeatures()}
+            snapFeatures = self.allFeatures
+        endpointIndex = EndpointIndex(exclRadius)
+        endpointIndex.build(reqInputs, snapFeatures)
+
         # iterate through all features in layer
         # connectivity tool only works if X connectors are assessed first
         err = self.getFeaturesToAssess(inputs, startLocs, flowTrace, lines, lineDataCollector)
@@ -210,30 +243,20 @@ class DataCollector(QObject):
                     self.vertexes[id] = closestVertexToUs
                 closestVertexToDs = None
 
-            # create buffer object then find features in buffered region
-            request = self.createRequest(featureData, exclRadius)
-            if lines and self.geomType == GEOM_TYPE.Point:
-                # if lines have been input separately
-                # inputs must be points - so check
-                # snapping against lines not itself
-                reqInputs = lines
-            else:
-                reqInputs = inputs
+            # find features with an end point within the exclusion radius of the feature end points
+            # if lines have been input separately inputs must be points - so check
+            # snapping against lines not itself
+            endPoints = [featureData.startVertex, featureData.endVertex]
 
             snappedFeatures = []
             snappedLayers = []
             additional_features = []
             for reqLayer in reqInputs:
-                if not lines:
-                    if reqLayer.name() in self.spatialIndexes:
-                        spatialIndex = self.spatialIndexes[reqLayer.name()]
-                    else:
-                        spatialIndex = QgsSpatialIndex(reqLayer)
-                        self.spatialIndexes[reqLayer.name()] = spatialIndex
-                else:
-                    spatialIndex = lineDataCollector.spatialIndexes[reqLayer.name()]
+                if not lines and reqLayer.name() not in self.spatialIndexes:
+                    # still required for X connector checks
+                    self.spatialIndexes[reqLayer.name()] = QgsSpatialIndex(reqLayer)
 
-                for fid in spatialIndex.intersects(request):
+                for fid in endpointIndex.features(reqLayer.name(), endPoints, exclRadius):
                     # create feature data object if not already done so
                     if lines and self.geomType == GEOM_TYPE.Point:
                         reqFeat = lineDataCollector.allFeatures[reqLayer.name()][fid]
@@ -369,10 +392,15 @@ class DataCollector(QObject):
         self.nullCounter = featureData.getNullCounter()
 
         # create drape data object and store in dict
-        drapeData = DrapeData(self.iface, id, layer, feature, dem)
-        if drapeData.error:
-            self.errMessage = drapeData.message
-            return
+        # drape is reused from previous runs if the feature and DEM haven't changed
+        fingerprint = self.drapeCache.fingerprint(feature, self.rasterSampler.key, self.drapeUnits)
+        drapeData = self.drapeCache.get(layer, feature, fingerprint, id)
+        if drapeData is None:
+            drapeData = DrapeData(self.iface, id, layer, feature, dem, self.rasterSampler)
+            if drapeData.error:
+                self.errMessage = drapeData.message
+                return
+            self.drapeCache.add(layer, feature, fingerprint, drapeData)
         self.drapes[id] = drapeData
 
         return featureData
@@ -0,0 +1,119 @@
+import copy
+
+
+class DrapeCache():
+    """
+    Class for keeping DrapeData between integrity tool runs so
+    only features that have changed need to be draped again.
+
+    DrapeData is stored against the layer and feature id along with a fingerprint
+    of the feature geometry, DEM (source, save date, size) and map units. A cached drape
+    is only used if the fingerprint still matches. Layer edit signals are used
+    to drop entries as soon as a feature is edited or deleted so the cache
+    doesn't fill up with stale data.
+
+    FeatureData and ConnectionData are not cached - they are cheap to collect and
+    depend on things other than the feature itself (1d tables, neighbouring features).
+
+    """
+
+    def __init__(self):
+        self.drapes = {}  # key (layer id, fid): value (fingerprint, DrapeData)
+        self.layers = {}  # key layer id: value layer source
+
+    def fingerprint(self, feature, demKey, units):
+        """
+        Returns the fingerprint for a feature. Changes if the geometry,
+        DEM or units change.
+
+        :param feature: QgsFeature
+        :param demKey: tuple RasterSampler.key
+        :param units: QgsUnitTypes.DistanceUnit
+        :return: tuple
+        """
+
+        return hash(bytes(feature.geometry().asWkb())), demKey, units
+
+    def get(self, layer, feature, fingerprint, id):
+        """
+        Returns cached DrapeData if the feature hasn't changed, otherwise None.
+
+        :param layer: QgsVectorLayer
+        :param feature: QgsFeature
+        :param fingerprint: tuple
+        :param id: str feature ID
+        :return: DrapeData
+        """
+
+        key = (layer.id(), feature.id())
+        if key not in self.drapes or self.layers.get(layer.id()) != layer.source():
+            return None
+
+        cachedFingerprint, drapeData = self.drapes[key]
+        if cachedFingerprint != fingerprint:
+            return None
+
+        # ID attribute may have been changed without touching the geometry
+        if drapeData.id != id:
+            drapeData = copy.copy(drapeData)
+            drapeData.id = id
+
+        return drapeData
+
+    def add(self, layer, feature, fingerprint, drapeData):
+        """
+        Add DrapeData to the cache.
+
+        :param layer: QgsVectorLayer
+        :param feature: QgsFeature
+        :param fingerprint: tuple
+        :param drapeData: DrapeData
+        :return: void
+        """
+
+        if drapeData.error:
+            return
+
+        self.watchLayer(layer)
+        self.drapes[(layer.id(), feature.id())] = (fingerprint, drapeData)
+
+    def watchLayer(self, layer):
+        """
+        Connect to layer edit signals so edited features are removed from the cache.
+
+        :param layer: QgsVectorLayer
+        :return: void
+        """
+
+        layerId = layer.id()
+        if layerId in self.layers:
+            if self.layers[layerId] != layer.source():
+                self.removeLayer(layerId)
+                self.layers[layerId] = layer.source()
+            return
+
+        self.layers[layerId] = layer.source()
+        layer.geometryChanged.connect(lambda fid, geom: self.removeFeature(layerId, fid))
+        layer.featureDeleted.connect(lambda fid: self.removeFeature(layerId, fid))
+        layer.dataSourceChanged.connect(lambda: self.removeLayer(layerId))
+        layer.willBeDeleted.connect(lambda: self.removeLayer(layerId, True))
+
+    def removeFeature(self, layerId, fid):
+        self.drapes.pop((layerId, fid), None)
+
+    def removeLayer(self, layerId, forget=False):
+        """
+        Remove all cached features for a layer.
+
+        :param layerId: str
+        :param forget: bool also stop tracking the layer (layer is being deleted)
+        :return: void
+        """
+
+        for key in [x for x in self.drapes if x[0] == layerId]:
+            del self.drapes[key]
+        if forget:
+            self.layers.pop(layerId, None)
+
+    def clear(self):
+        self.drapes.clear()
@@ -11,7 +11,7 @@ class DrapeData():
 
     """
 
-    def __init__(self, iface, id=None, layer=None, feature=None, dem=None):
+    def __init__(self, iface, id=None, layer=None, feature=None, dem=None, sampler=None):
         self.id = id
         self.points = []
         self.chainages = []
@@ -24,10 +24,9 @@ class DrapeData():
             if layer.geometryType() == QgsWkbTypes.PointGeometry:
                 point = feature.geometry().asPoint()
                 chainage = 0
-                elevations = getRasterValue(point, dem) if dem is not None else None
                 self.points = [point]
                 self.chainages = [chainage]
-                self.elevations = [elevations]
+                self.elevations = self.getElevations(self.points, dem, sampler)
                 self.directions = None
             elif layer.geometryType() == QgsWkbTypes.LineGeometry:
                 if dem is not None:
@@ -47,11 +46,26 @@ class DrapeData():
                     self.error = True
                     self.message = "Could not process 1d_nwk line layer. Could be projection related error."
                     return
-                elevations = []
-                for point in points:
-                    elevation = getRasterValue(point, dem) if dem is not None else None
-                    elevations.append(elevation)
                 self.points = points
                 self.chainages = chainages
-                self.elevations = elevations
+                self.elevations = self.getElevations(points, dem, sampler)
                 self.directions = directions
+
+    def getElevations(self, points, dem, sampler=None):
+        """
+        Returns the DEM elevation at each point. If a RasterSampler is given, all points
+        are sampled in one go, otherwise the raster is queried one point at a time.
+
+        :param points: list -> QgsPointXY
+        :param dem: QgsRasterLayer
+        :param sampler: RasterSampler
+        :return: list -> float
+        """
+
+        if dem is None:
+            return [None for _ in points]
+        if sampler is not None:
+            if sampler.raster is not dem:
+                sampler.setRaster(dem)
+            return sampler.sample(points)
+        return [getRasterValue(point, dem) for point in points]
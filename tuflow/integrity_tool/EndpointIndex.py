@@ -0,0 +1,142 @@
+import numpy as np
+from qgis.core import QgsWkbTypes
+
+
+class EndpointIndex():
+    """
+    Class for finding 1d network end points (line start / end vertexes and points)
+    near a location.
+
+    End points for all features are stored in numpy arrays and hashed into
+    a regular grid with a cell size equal to the search radius, so a search only
+    has to look at the 3 x 3 grid cells surrounding each location.
+
+    """
+
+    def __init__(self, radius):
+        self.radius = float(radius) if radius and radius > 0. else 1.
+        self.layers = []  # str layer name - position is the layer index
+        self.x = np.zeros((0,), dtype=np.float64)
+        self.y = np.zeros((0,), dtype=np.float64)
+        self.layer = np.zeros((0,), dtype=np.int64)
+        self.fid = np.zeros((0,), dtype=np.int64)
+        self.cells = {}  # key (column, row): value numpy array of end point indexes
+
+    def build(self, layers, allFeatures):
+        """
+        Index the end points of all features in the input layers.
+
+        :param layers: list -> QgsVectorLayer
+        :param allFeatures: dict -> key str layer name: value dict -> key fid: value QgsFeature
+        :return: void
+        """
+
+        x, y, lyr, fid = [], [], [], []
+        for layer in layers:
+            if layer.name() in self.layers or layer.name() not in allFeatures:
+                continue
+            ilyr = len(self.layers)
+            self.layers.append(layer.name())
+            for f in allFeatures[layer.name()].values():
+                for p in self.endPoints(layer, f):
+                    x.append(p.x())
+                    y.append(p.y())
+                    lyr.append(ilyr)
+                    fid.append(f.id())
+
+        self.x = np.array(x, dtype=np.float64)
+        self.y = np.array(y, dtype=np.float64)
+        self.layer = np.array(lyr, dtype=np.int64)
+        self.fid = np.array(fid, dtype=np.int64)
+
+        # group end points by grid cell
+        self.cells.clear()
+        if not self.x.size:
+            return
+        col, row = self.cell(self.x, self.y)
+        order = np.lexsort((row, col))
+        keys = np.stack((col[order], row[order]), axis=1)
+        breaks = np.flatnonzero((keys[1:] != keys[:-1]).any(axis=1)) + 1
+        for idx, key in zip(np.split(order, breaks), keys[np.r_[0, breaks]]):
+            self.cells[(int(key[0]), int(key[1]))] = idx
+
+    def endPoints(self, layer, feature):
+        """
+        Returns the end points of a feature - same definition as FeatureData start / end vertex.
+
+        :param layer: QgsVectorLayer
+        :param feature: QgsFeature
+        :return: list -> QgsPointXY
+        """
+
+        geom = feature.geometry()
+        if not geom or geom.isEmpty():
+            return []
+        if layer.geometryType() == QgsWkbTypes.PointGeometry:
+            return [geom.asPoint()]
+        elif layer.geometryType() == QgsWkbTypes.LineGeometry:
+            if geom.isMultipart():
+                line = geom.asMultiPolyline()
+                if not line or not line[0] or not line[-1]:
+                    return []
+                return [line[0][0], line[-1][-1]]
+            line = geom.asPolyline()
+            if not line:
+                return []
+            return [line[0], line[-1]]
+        return []
+
+    def cell(self, x, y):
+        return np.floor(x / self.radius).astype(np.int64), np.floor(y / self.radius).astype(np.int64)
+
+    def nearby(self, points, radius=None):
+        """
+        Returns the indexes of all end points within the search radius of any of the input points.
+
+        :param points: list -> QgsPointXY
+        :param radius: float - must not be larger than the index radius
+        :return: numpy array
+        """
+
+        if radius is None:
+            radius = self.radius
+        if not self.cells or not points:
+            return np.zeros((0,), dtype=np.int64)
+
+        qx = np.array([p.x() for p in points], dtype=np.float64)
+        qy = np.array([p.y() for p in points], dtype=np.float64)
+        qcol, qrow = self.cell(qx, qy)
+        blocks = []
+        for c, r in set(zip(qcol.tolist(), qrow.tolist())):
+            for dc in (-1, 0, 1):
+                for dr in (-1, 0, 1):
+                    idx = self.cells.get((c + dc, r + dr))
+                    if idx is not None:
+                        blocks.append(idx)
+        if not blocks:
+            return np.zeros((0,), dtype=np.int64)
+
+        idx = np.unique(np.concatenate(blocks))
+        dx = self.x[idx][:,np.newaxis] - qx
+        dy = self.y[idx][:,np.newaxis] - qy
+        within = ((dx * dx + dy * dy) <= radius * radius).any(axis=1)
+
+        return idx[within]
+
+    def features(self, layerName, points, radius=None):
+        """
+        Returns the fids of features in a layer that have an end point within the search radius
+        of any of the input points. Sorted by fid.
+
+        :param layerName: str
+        :param points: list -> QgsPointXY
+        :param radius: float
+        :return: list -> int
+        """
+
+        if layerName not in self.layers:
+            return []
+        idx = self.nearby(points, radius)
+        idx = idx[self.layer[idx] == self.layers.index(layerName)]
+
+        return np.unique(self.fid[idx]).tolist()
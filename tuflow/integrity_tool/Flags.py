@@ -0,0 +1,24 @@
+from collections import namedtuple
+from qgis.core import QgsFeature, QgsGeometry, QgsPointXY
+
+
+# an output layer point - Warning, Message, Tool and Magnitude are the output layer attributes
+Flag = namedtuple('Flag', ['x', 'y', 'warning', 'message', 'tool', 'magnitude'])
+
+
+def flagFeatures(flags):
+    """
+    Output layer features for the flags.
+
+    :param flags: list -> Flag
+    :return: list -> QgsFeature
+    """
+
+    feats = []
+    for flag in flags:
+        feat = QgsFeature()
+        feat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(flag.x, flag.y)))
+        feat.setAttributes([flag.warning, flag.message, flag.tool, flag.magnitude])
+        feats.append(feat)
+
+    return feats
@@ -0,0 +1,152 @@
+import traceback
+from qgis.PyQt.QtCore import QObject, pyqtSignal
+from qgis.core import QgsApplication, QgsTask, QgsVectorLayer, QgsField
+from .Flags import flagFeatures
+
+from ..compatibility_routines import QT_DOUBLE, QT_STRING
+
+
+class IntegrityCheck:
+    """
+    One of the independent integrity checks - func(network, *args) -> list of Flag.
+
+    The network is a NetworkSnapshot (plain python objects) so the check can run away from the GUI thread.
+    Each run gets its own copy of the network as some checks modify the connection lists they work with.
+
+    """
+
+    def __init__(self, name, func, network, *args):
+        self.name = name
+        self.func = func
+        self.network = network
+        self.args = args
+
+    def run(self):
+        return self.func(self.network.copy(), *self.args)
+
+
+class IntegrityCheckTask(QgsTask):
+    """
+    Runs an IntegrityCheck in the QGIS task manager.
+
+    """
+
+    def __init__(self, check):
+        QgsTask.__init__(self, 'Integrity Tool: {0}'.format(check.name), QgsTask.CanCancel)
+        self.check = check
+        self.flags = None  # stays None if the task is cancelled or fails
+        self.errMessage = None
+
+    def run(self):
+        try:
+            flags = self.check.run()
+        except Exception:
+            self.errMessage = '{0}\n{1}'.format(self.check.name, traceback.format_exc())
+            return False
+
+        if self.isCanceled():
+            return False
+
+        self.flags = flags
+        return True
+
+
+class IntegrityChecksRunner(QObject):
+    """
+    Runs the integrity checks as QgsTasks (so the checks run alongside each other without blocking the GUI)
+    and collects the flags once they have all finished.
+
+    Flags are ordered by check (not by which check finished first) so the output is the same each run.
+
+    """
+
+    finished = pyqtSignal(QObject)
+
+    def __init__(self, checks=()):
+        QObject.__init__(self)
+        self.checks = list(checks)
+        self.tasks = []
+        self.flags = []
+        self.errMessages = []
+        self.cancelled = False
+        self.remaining = 0
+
+    def start(self):
+        self.flags.clear()
+        self.errMessages.clear()
+        self.cancelled = False
+        self.tasks = [IntegrityCheckTask(x) for x in self.checks]  # python references keep the tasks alive
+        self.remaining = len(self.tasks)
+        if not self.tasks:
+            self.finished.emit(self)
+            return
+
+        for task in self.tasks:
+            task.taskCompleted.connect(self.taskFinished)
+            task.taskTerminated.connect(self.taskFinished)
+            QgsApplication.taskManager().addTask(task)
+
+    def cancel(self):
+        self.cancelled = True
+        for task in self.tasks:
+            try:
+                task.cancel()
+            except RuntimeError:
+                pass  # already finished and deleted by the task manager
+
+    def taskFinished(self):
+        self.remaining -= 1
+        if self.remaining > 0:
+            return
+
+        # only python attributes are used here - the task manager deletes the QgsTask once it has finished
+        for task in self.tasks:
+            if task.errMessage is not None:
+                self.errMessages.append(task.errMessage)
+            elif task.flags is None:
+                self.cancelled = True
+            else:
+                self.flags.extend(task.flags)
+        self.tasks.clear()
+
+        self.finished.emit(self)
+
+
+def runChecks(checks):
+    """
+    Run the checks one after the other in the current thread and return the flags.
+
+    :param checks: list -> IntegrityCheck
+    :return: list -> Flag
+    """
+
+    flags = []
+    for check in checks:
+        flags.extend(check.run())
+
+    return flags
+
+
+def createOutputLayer(flags, crs=None):
+    """
+    Create the output (memory) layer and add the flags to it.
+
+    :param flags: list -> Flag
+    :param crs: QgsCoordinateReferenceSystem
+    :return: QgsVectorLayer
+    """
+
+    uri = "point"
+    if crs is not None and crs.isValid():
+        uri = "point?crs={0}".format(crs.authid().lower())
+    outputLyr = QgsVectorLayer(uri, "output", "memory")
+    dp = outputLyr.dataProvider()
+    dp.addAttributes([QgsField('Warning', QT_STRING),
+                      QgsField("Message", QT_STRING),
+                      QgsField("Tool", QT_STRING),
+                      QgsField("Magnitude", QT_DOUBLE)])
+    outputLyr.updateFields()
+    dp.addFeatures(flagFeatures(flags))
+    outputLyr.updateExtents()
+
+    return outputLyr
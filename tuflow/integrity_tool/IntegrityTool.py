@@ -12,13 +12,17 @@ from tuflow.toc.toc import tuflowqgis_get_geopackage_from_layer, tuflowqgis_find
     findAllRasterLyrs, findAllVectorLyrsWithGroups
 from ..tuflowqgis_dialog import StackTraceDialog
 from .DataCollector import DataCollector
-from .SnappingTool import SnappingTool
-from .ContinuityTool import ContinuityTool
+from .RasterSampler import RasterSampler
+from .DrapeCache import DrapeCache
+from .SnappingTool import SnappingTool, snappingFlags
+from .ContinuityTool import ContinuityTool, continuityFlags
 from .FlowTraceTool import DataCollectorFlowTrace, FlowTraceTool, FlowTracePlot
-from .PipeDirectionTool import PipeDirectionTool
+from .PipeDirectionTool import PipeDirectionTool, pipeDirectionFlags
 from .Enumerators import *
-from .UniqueIds import UniqueIds, DuplicateRule, CreateNameRule, CreateNameRules
+from .UniqueIds import UniqueIds, DuplicateRule, CreateNameRule, CreateNameRules, uniqueIdFlags
 from .NullGeometry import NullGeometry, NullGeometryDialog
+from .NetworkSnapshot import NetworkSnapshot
+from .IntegrityChecks import IntegrityCheck, IntegrityChecksRunner, createOutputLayer
 
 from tuflow.tuflow_swmm.swmm_gis_info import is_swmm_network_layer
 from .helpers import SwmmHelper
@@ -46,12 +50,17 @@ class IntegrityToolDock(QDockWidget, Ui_IntegrityTool):
         self.selectedFeats = {}
 
         # add caculation objects
+        # DEM sampler shared by all data collectors so DEM tiles are only read once
+        self.rasterSampler = RasterSampler()
+        # draped DEM data is kept between runs and only recalculated for edited features
+        self.drapeCache = DrapeCache()
         # data collectors
         self.dataCollectorLines = DataCollector(self.iface)
         self.dataCollectorPoints = DataCollector(self.iface)
         self.dataCollectorTables = DataCollector(self.iface)
         self.uniqueIds = UniqueIds()
         self.nullGeometry = NullGeometry()
+        self.integrityChecks = None  # background runner for 'Run All Checks'
 
         self.plot = None
 
@@ -118,6 +127,7 @@ class IntegrityToolDock(QDockWidget, Ui_IntegrityTool):
 
         # what happend when the Run button is pressed
         self.pbRun.clicked.connect(self.check)
+        self.pbRunAll.clicked.connect(self.runAllChecks)
 
     def qgisDisconnect(self):
         """Disconnect signals"""
@@ -166,6 +176,12 @@ class IntegrityToolDock(QDockWidget, Ui_IntegrityTool):
             self.pbRun.clicked.disconnect(self.check)
         except:
             pass
+        try:
+            self.pbRunAll.clicked.disconnect(self.runAllChecks)
+        except:
+            pass
+        if self.integrityChecks is not None:
+            self.integrityChecks.cancel()
 
     def check(self):
         """
@@ -174,11 +190,22 @@ class IntegrityToolDock(QDockWidget, Ui_IntegrityTool):
         :return: None
         """
 
+        if self.validInputs(self.tabWidget.currentIndex()):
+            self.run()
+
+    def validInputs(self, toolType):
+        """
+        Check the inputs are ok to run a tool
+
+        :param toolType: TOOL_TYPE
+        :return: bool
+        """
+
         # check there is at least a 1d_nwk line layer to use
-        if self.tabWidget.currentIndex() != TOOL_TYPE.NullGeometry:
+        if toolType != TOOL_TYPE.NullGeometry:
             if not self.getInputs('lines'):
                 QMessageBox.critical(self, "Integrity Tool", "No Network Line(s) input.")
-                return
+                return False
         # check all input layers exist in the workspace
         inputTypes = ['lines', 'points', 'tables']
         for inputType in inputTypes:
@@ -186,13 +213,13 @@ class IntegrityToolDock(QDockWidget, Ui_IntegrityTool):
                 if input is None:
                     QMessageBox.critical(self, "Integrity Tool",
                                          "Layer Does Not Exist In Workspace: {0}".format(input))
-                    return
+                    return False
         # check dem layer exists in the workspace
         if self.gbDem.isChecked():
             if tuflowqgis_find_layer(self.cboDem.currentText()) is None:
                 QMessageBox.critical(self, "Integrity Tool",
                                      "DEM Layer Does Not Exist In Workspace: {0}".format(self.cboDem.currentText()))
-                return
+                return False
         # check all layers are correct type
         for inputType in inputTypes:
             for layer in self.getInputs(inputType):
@@ -206,7 +233,7 @@ class IntegrityToolDock(QDockWidget, Ui_IntegrityTool):
                                                        "Do you wish to continue?".format(layer.name()),
                                                        QT_MESSAGE_BOX_YES | QT_MESSAGE_BOX_NO | QT_MESSAGE_BOX_CANCEL)
                         if question != QT_MESSAGE_BOX_YES:
-                            return
+                            return False
                     if inputType == 'lines':
                         i = 2 if layer.storageType() == 'GPKG' else 1
                         for f in layer.getFeatures():
@@ -214,14 +241,14 @@ class IntegrityToolDock(QDockWidget, Ui_IntegrityTool):
                                 QMessageBox.critical(self, "Integrity Tool",
                                                      'Feature "Type" must be populated (cannot be blank '
                                                      "or NULL).\nLayer: {0}\nFID: {1}".format(layer.name(), f.id()))
-                                return
+                                return False
                 else:  # tables
                     if not is1dTable(layer):
                         QMessageBox.critical(self, "Integrity Tool",
                                              "Layer Is Not a 1d_ta Type: {0}".format(layer.name()))
-                        return
+                        return False
 
-        self.run()
+        return True
 
     def run(self):
         """
@@ -273,13 +300,129 @@ class IntegrityToolDock(QDockWidget, Ui_IntegrityTool):
             # unexpected error
             exc_type, exc_value, exc_traceback = sys.exc_info()
             trace = ''.join(traceback.extract_tb(exc_traceback).format()) + '{0}{1}'.format(exc_type, exc_value)
-            message = "Unexpected Error Occurred.\nPlease Email Stack Trace To support@tuflow.com" \
-                .format(exc_value)
-            self.runStatus.setText("Unexpected Error")
-            self.progressBar.setValue(100)
-            QMessageBox.critical(self, "Integrity Tool", message)
-            stackTraceDialog = StackTraceDialog(trace)
-            stackTraceDialog.exec()
+            self.unexpectedError(trace)
+
+        self.setGuiActive(True)
+
+    def unexpectedError(self, trace):
+        """
+        Let the user know an unexpected error occurred and show the stack trace
+
+        :param trace: str
+        :return: void
+        """
+
+        message = "Unexpected Error Occurred.\nPlease Email Stack Trace To support@tuflow.com"
+        self.runStatus.setText("Unexpected Error")
+        self.progressBar.setRange(0, 100)
+        self.progressBar.setValue(100)
+        QMessageBox.critical(self, "Integrity Tool", message)
+        stackTraceDialog = StackTraceDialog(trace)
+        stackTraceDialog.exec()
+
+    def runAllChecks(self):
+        """
+        Run the channel ID, snapping, pipe direction and continuity checks together.
+
+        The network is collected once and copied into plain python objects (NetworkSnapshot) so the checks
+        can run as background tasks. The flags from all checks are written to a single output layer once the
+        checks have finished. Nothing is edited (no auto snapping or reversing channels) - use the individual
+        tools for that.
+
+        :return: void
+        """
+
+        if not self.validInputs(TOOL_TYPE.Snapping):
+            return
+
+        self.setGuiActive(False)
+
+        try:
+            # check for null geometries
+            if not self.checkNullGeometries():
+                self.setGuiActive(True)
+                return
+
+            # Get inputs
+            # input dem
+            if self.gbDem.isChecked():
+                dem = tuflowqgis_find_layer(self.cboDem.currentText())
+            else:
+                dem = None
+            # input vector layers
+            inputLines = self.getInputs('lines')
+            inputPoints = self.getInputs('points')
+            inputTables = self.getInputs('tables')
+
+            # run data collectors - QGIS objects have to be read on the GUI thread
+            self.runDataCollectors(inputLines, inputPoints, inputTables, dem, tool='All Checks')
+            if self.dataCollectorLines.errMessage is not None:
+                self.setGuiActive(True)
+                return
+            networkLines = NetworkSnapshot.fromDataCollector(self.dataCollectorLines, inputLines)
+            networkPoints = None
+            if self.dataCollectorPoints is not None:
+                networkPoints = NetworkSnapshot.fromDataCollector(self.dataCollectorPoints)
+
+            # user limits
+            exclRadius = self.sbExclRadius.value() if self.cbExclRadius.isChecked() else 99999
+            limitAngle = self.sbContinuityAngle.value()
+            limitCover = self.sbContinuityCover.value()
+            limitArea = self.sbContinuityArea.value()
+
+            # user checks
+            checkArea = self.cbContinuityArea.isChecked()
+            checkInvert = self.cbContinuityInverts.isChecked()
+            checkAngle = self.cbContinuityAngle.isChecked()
+            checkCover = self.cbContinuityCover.isChecked()
+
+            checks = [
+                IntegrityCheck('Channel IDs', uniqueIdFlags, networkLines),
+                IntegrityCheck('Snapping', snappingFlags, networkLines, exclRadius),
+                IntegrityCheck('Pipe Direction', pipeDirectionFlags, networkLines),
+                IntegrityCheck('Continuity', continuityFlags, networkLines, limitAngle, limitCover, limitArea,
+                               checkArea, checkAngle, checkInvert, checkCover),
+            ]
+            if networkPoints is not None:
+                checks.insert(2, IntegrityCheck('Snapping (points)', snappingFlags, networkPoints, exclRadius))
+
+            self.runStatus.setText("Running checks. . .")
+            self.progressBar.setRange(0, 0)  # busy - tasks report their own progress in the task manager
+            self.integrityChecks = IntegrityChecksRunner(checks)
+            self.integrityChecks.finished.connect(self.finishedAllChecks)
+            self.integrityChecks.start()
+
+        except Exception:
+            # unexpected error
+            exc_type, exc_value, exc_traceback = sys.exc_info()
+            trace = ''.join(traceback.extract_tb(exc_traceback).format()) + '{0}{1}'.format(exc_type, exc_value)
+            self.unexpectedError(trace)
+            self.setGuiActive(True)
+
+    def finishedAllChecks(self, runner):
+        """
+        Write the flags from 'Run All Checks' to the output layer
+
+        :param runner: IntegrityChecksRunner
+        :return: void
+        """
+
+        self.integrityChecks = None
+        self.progressBar.setRange(0, 100)
+        self.progressBar.setValue(100)
+
+        if runner.errMessages:
+            self.unexpectedError('\n'.join(runner.errMessages))
+        elif runner.cancelled:
+            self.runStatus.setText("Cancelled")
+        else:
+            try:
+                self.outputLyr = createOutputLayer(runner.flags, QgsProject.instance().crs())
+                QgsProject.instance().addMapLayer(self.outputLyr)
+                tuflowqgis_apply_check_tf_clayer(self.iface, layer=self.outputLyr)
+            except RuntimeError:
+                self.outputLyr = None
+            self.runStatus.setText("Finished All Checks")
 
         self.setGuiActive(True)
 
@@ -750,12 +893,16 @@ class IntegrityToolDock(QDockWidget, Ui_IntegrityTool):
         del self.dataCollectorPoints
         self.dataCollectorLines = DataCollector(self.iface)
         self.dataCollectorPoints = DataCollector(self.iface)
+        self.dataCollectorLines.setRasterSampler(self.rasterSampler)
+        self.dataCollectorPoints.setRasterSampler(self.rasterSampler)
+        self.dataCollectorLines.setDrapeCache(self.drapeCache)
+        self.dataCollectorPoints.setDrapeCache(self.drapeCache)
 
         # lines
         if inputLines:
             if is_swmm_network_layer(inputLines[0]):
                 self.dataCollectorLines.helper = SwmmHelper()
-                if tool == 'Continuity Tool':
+                if tool == 'Continuity Tool' or tool == 'All Checks':
                     self.dataCollectorLines.helper.offsets_are_elevations = \
                         self.cbxSwmmLinkOffsetOptionContinuity.currentText() == 'Elevation'
 
@@ -771,7 +918,7 @@ class IntegrityToolDock(QDockWidget, Ui_IntegrityTool):
         if inputPoints:
             if is_swmm_network_layer(inputPoints[0]):
                 self.dataCollectorPoints.helper = SwmmHelper()
-                if tool == 'Continuity Tool':
+                if tool == 'Continuity Tool' or tool == 'All Checks':
                     self.dataCollectorPoints.helper.offsets_are_elevations = \
                         self.cbxSwmmLinkOffsetOptionContinuity.currentText() == 'Elevation'
 
@@ -804,6 +951,10 @@ class IntegrityToolDock(QDockWidget, Ui_IntegrityTool):
         del self.dataCollectorPoints
         self.dataCollectorLines = DataCollectorFlowTrace(self.iface)
         self.dataCollectorPoints = DataCollectorFlowTrace(self.iface)
+        self.dataCollectorLines.setRasterSampler(self.rasterSampler)
+        self.dataCollectorPoints.setRasterSampler(self.rasterSampler)
+        self.dataCollectorLines.setDrapeCache(self.drapeCache)
+        self.dataCollectorPoints.setDrapeCache(self.drapeCache)
 
         # lines
         if inputLines:
@@ -1290,7 +1441,7 @@ class IntegrityToolDock(QDockWidget, Ui_IntegrityTool):
                    self.cbContinuityAngle, self.sbContinuityAngle, self.cbContinuityCover, self.sbContinuityCover,
                    self.cbFlowTraceArea, self.cbFlowTraceInverts, self.sbContinuityArea, self.sbFlowTraceArea,
                    self.cbFlowTraceAngle, self.sbFlowTraceAngle, self.cbFlowTraceCover, self.sbFlowTraceCover,
-                   self.pbRun, self.sbExclRadius,
+                   self.pbRun, self.pbRunAll, self.sbExclRadius,
                    self.cbFindNonCompIDs, self.cbFixChannelIDs, self.rbDuplicateUseLetters, self.rbDuplicateUseNumbers,
                    self.leCustomDelim, self.leDefaultPrefix, self.leType1, self.lePrefix1, self.leType2, self.lePrefix2,
                    self.leType3, self.lePrefix3, self.leType4, self.lePrefix4]
@@ -0,0 +1,201 @@
+import copy
+from .Enumerators import *
+
+
+class SnapshotPoint(tuple):
+    """
+    (x, y) point with the x() and y() accessors of QgsPointXY so the checks can use either.
+
+    """
+
+    def __new__(cls, x, y):
+        return tuple.__new__(cls, (float(x), float(y)))
+
+    def __getnewargs__(self):  # so copy / pickle pass x and y back to __new__
+        return tuple(self)
+
+    def x(self):
+        return self[0]
+
+    def y(self):
+        return self[1]
+
+
+class SnapshotFeature():
+    """
+    The parts of FeatureData used by the checks.
+
+    """
+
+    def __init__(self, fData):
+        self.id = fData.id
+        self.geomType = fData.geomType
+        self.feature = None  # no QGIS objects - see NetworkSnapshot.midVertex
+        self.startVertex = toPoint(fData.startVertex)
+        self.endVertex = toPoint(fData.endVertex)
+        self.type = fData.type
+        self.invertUs = fData.invertUs
+        self.invertDs = fData.invertDs
+        self.height_ = fData.height_
+        self.area = fData.area
+
+
+class SnapshotConnection():
+    """
+    The parts of ConnectionData used by the checks.
+
+    """
+
+    def __init__(self, cData):
+        self.id = cData.id
+        self.linesUs = cData.linesUs[:]
+        self.linesDs = cData.linesDs[:]
+        self.linesUsUs = cData.linesUsUs[:]
+        self.linesDsDs = cData.linesDsDs[:]
+
+
+class SnapshotDrape():
+    """
+    The parts of DrapeData used by the checks.
+
+    """
+
+    def __init__(self, dData):
+        self.id = dData.id
+        self.points = [toPoint(x) for x in dData.points]
+        self.chainages = list(dData.chainages)
+        self.directions = list(dData.directions) if dData.directions is not None else None
+        self.elevations = list(dData.elevations)
+
+
+class SnapshotVertex():
+    """
+    The parts of NetworkVertex used by the checks.
+
+    """
+
+    def __init__(self, vertex):
+        self.id = vertex.id
+        self.vertex = vertex.vertex
+        self.distanceToClosest = vertex.distanceToClosest
+
+
+class NetworkSnapshot():
+    """
+    Copy of the network in a DataCollector as plain python objects (no QGIS objects) so the checks can be
+    run away from the GUI thread. Has the same ids, features, connections, drapes and unsnappedVertexes
+    properties as the DataCollector so the checks can use either.
+
+    """
+
+    def __init__(self):
+        self.ids = []
+        self.features = {}
+        self.connections = {}
+        self.drapes = {}
+        self.unsnappedVertexes = []
+        self.geomType = GEOM_TYPE.Null
+        self.flowTrace = False
+        self.startLocs = []
+        self.isSwmm = False
+        self.channels = []  # list -> (id, type, SnapshotPoint) every feature in the inputs - used to check IDs
+
+    @staticmethod
+    def fromDataCollector(dataCollector, layers=()):
+        """
+        Take a snapshot of a DataCollector after collectData has been run.
+
+        :param dataCollector: DataCollector
+        :param layers: list -> QgsVectorLayer - take the ID and type attributes of every feature for the ID check
+        :return: NetworkSnapshot
+        """
+
+        from .helpers import SwmmHelper
+
+        snapshot = NetworkSnapshot()
+        snapshot.ids = dataCollector.ids[:]
+        snapshot.features = {k: SnapshotFeature(v) for k, v in dataCollector.features.items()}
+        snapshot.connections = {k: SnapshotConnection(v) for k, v in dataCollector.connections.items()}
+        snapshot.drapes = {k: SnapshotDrape(v) for k, v in dataCollector.drapes.items()}
+        snapshot.unsnappedVertexes = [SnapshotVertex(x) for x in dataCollector.unsnappedVertexes]
+        snapshot.geomType = dataCollector.geomType
+        snapshot.isSwmm = isinstance(dataCollector.helper, SwmmHelper)
+
+        for layer in layers:
+            iid = 1 if layer.storageType() == 'GPKG' else 0
+            if layer.fields().count() < iid + 2:
+                continue
+            # features are already in memory if the layer was collected
+            feats = dataCollector.allFeatures[layer.name()].values() if layer.name() in dataCollector.allFeatures \
+                else layer.getFeatures()
+            for f in feats:
+                geom = f.geometry()
+                if geom.isEmpty():
+                    continue
+                point = geom.pointOnSurface().asPoint()
+                snapshot.channels.append((toValue(f.attribute(iid)), toValue(f.attribute(iid + 1)), toPoint(point)))
+
+        return snapshot
+
+    def copy(self):
+        """Deep copy so a check can't change the network used by other checks."""
+
+        return copy.deepcopy(self)
+
+    def midVertex(self, id):
+        """
+        Mid point along a channel (from the drape points - there is no QgsFeature to measure).
+
+        :param id: str
+        :return: SnapshotPoint
+        """
+
+        dData = self.drapes[id]
+        return pointAlongLine(dData.points, dData.chainages, dData.chainages[-1] / 2.)
+
+
+def toPoint(point):
+    """
+    QgsPointXY / QgsPoint -> SnapshotPoint
+
+    :param point: QgsPointXY
+    :return: SnapshotPoint
+    """
+
+    if point is None:
+        return None
+    return SnapshotPoint(point.x(), point.y())
+
+
+def toValue(value):
+    """
+    Attribute value -> python value (NULL -> None)
+
+    :param value: QVariant or python value
+    :return: python value
+    """
+
+    if value is None or (hasattr(value, 'isNull') and value.isNull()):
+        return None
+    return value
+
+
+def pointAlongLine(points, chainages, chainage):
+    """
+    Location at a chainage along a line given as points and their chainages.
+
+    :param points: list -> SnapshotPoint
+    :param chainages: list -> float
+    :param chainage: float
+    :return: SnapshotPoint
+    """
+
+    for i in range(1, len(chainages)):
+        if chainages[i] >= chainage:
+            break
+    else:
+        return points[-1]
+    ch0, ch1 = chainages[i - 1], chainages[i]
+    frac = (chainage - ch0) / (ch1 - ch0) if ch1 > ch0 else 0.
+    p0, p1 = points[i - 1], points[i]
+    return SnapshotPoint(p0.x() + (p1.x() - p0.x()) * frac, p0.y() + (p1.y() - p0.y()) * frac)
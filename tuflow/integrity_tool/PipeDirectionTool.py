@@ -4,6 +4,7 @@ from .FeatureData import FeatureData
 from .Enumerators import *
 from tuflow.tuflowqgis_library import is1dNetwork, getNetworkMidLocation
 from .helpers import EstryHelper, SwmmHelper
+from .Flags import Flag
 
 from tuflow.tuflow_swmm.swmm_gis_info import is_swmm_network_layer
 
@@ -65,31 +66,30 @@ class PipeDirectionTool():
                     self.helper.register_temp_layer(lyr, layer)
 
         for layer in self.tmpLyrs:
-            for f in layer.getFeatures():
+            # all features are reversed in one edit session
+            layer.startEditing()
+            for f in list(layer.getFeatures()):
                 fData = FeatureData(self.helper, layer, f)
-                if fData.type.lower() != 'x':
-                    if fData.invertUs != -99999 and fData.invertDs != -99999:
-                        if fData.invertUs < fData.invertDs:
-                            # flip line direction
-                            geomMulti = f.geometry()
-                            geomMulti.convertToMultiType()
-                            geom = geomMulti.asMultiPolyline()
-                            layer.startEditing()
-                            for g in geom:
-                                reversedGeom = g[::-1]
-                                for i in range(len(g)):
-                                    layer.moveVertex(reversedGeom[i].x(), reversedGeom[i].y(), f.id(), i)
-                                # TODO - Needs to be handled differently for SWMM
-                                layer.changeAttributeValue(f.id(), 6, fData.invertDs, fData.invertUs)
-                                layer.changeAttributeValue(f.id(), 7, fData.invertUs, fData.invertDs)
-                            layer.commitChanges()
-
-                            # log change
-                            midPoint = getNetworkMidLocation(f)
-                            self.flagGradientPoint.append(midPoint)
-                            message = '{0} has been reversed based on inverts ' \
-                                      '({1:.3f}RL, {2:.3f}RL)'.format(fData.id, fData.invertUs, fData.invertDs)
-                            self.flagGradientMessage.append(message)
+                if isReversedByGradient(fData):
+                    # flip line direction
+                    geomMulti = f.geometry()
+                    geomMulti.convertToMultiType()
+                    geom = geomMulti.asMultiPolyline()
+                    for g in geom:
+                        reversedGeom = g[::-1]
+                        for i in range(len(g)):
+                            layer.moveVertex(reversedGeom[i].x(), reversedGeom[i].y(), f.id(), i)
+                        # TODO - Needs to be handled differently for SWMM
+                        layer.changeAttributeValue(f.id(), 6, fData.invertDs, fData.invertUs)
+                        layer.changeAttributeValue(f.id(), 7, fData.invertUs, fData.invertDs)
+
+                    # log change
+                    midPoint = getNetworkMidLocation(f)
+                    self.flagGradientPoint.append(midPoint)
+                    message = '{0} has been reversed based on inverts ' \
+                              '({1:.3f}RL, {2:.3f}RL)'.format(fData.id, fData.invertUs, fData.invertDs)
+                    self.flagGradientMessage.append(message)
+            layer.commitChanges()
 
         # add features to outputlyr
         feats = []
@@ -127,27 +127,24 @@ class PipeDirectionTool():
                     self.tmpLyrs.append(lyr)
                     self.tmplyr2oldlyr[lyr.id()] = layer.id()
 
+        # all features are reversed in one edit session per layer
+        for layer in self.tmpLyrs:
+            layer.startEditing()
+
         for id in dataCollector.ids:
             if '__connector__' not in id:
                 if id in dataCollector.connections:
-                    linesDs = dataCollector.connections[id].linesDs
-                    linesUs = dataCollector.connections[id].linesUs
-                    linesDsDs = dataCollector.connections[id].linesDsDs
-                    linesUsUs = dataCollector.connections[id].linesUsUs
-
-                    if linesDsDs and linesUsUs and not linesDs and not linesUs:
+                    if isReversedByContinuity(dataCollector.connections[id]):
                         # reverse direction
                         layer = dataCollector.features[id].tmpLayer
                         f = dataCollector.features[id].tmpFeature
                         geomMulti = f.geometry()
                         geomMulti.convertToMultiType()
                         geom = geomMulti.asMultiPolyline()
-                        layer.startEditing()
                         for g in geom:
                             reversedGeom = g[::-1]
                             for i in range(len(g)):
                                 layer.moveVertex(reversedGeom[i].x(), reversedGeom[i].y(), f.id(), i)
-                        layer.commitChanges()
 
                         # log change
                         midPoint = getNetworkMidLocation(f)
@@ -155,6 +152,9 @@ class PipeDirectionTool():
                         message = '{0} has been reversed based on continuity'.format(id)
                         self.flagContinuityMessage.append(message)
 
+        for layer in self.tmpLyrs:
+            layer.commitChanges()
+
         # add features to outputlyr
         feats = []
         for i, point in enumerate(self.flagContinuityPoint):
@@ -193,17 +193,81 @@ class PipeDirectionTool():
         dp.addAttributes(fields)
         lyr.updateFields()
 
-        for i, f in enumerate(copylyr.getFeatures()):
+        fids = []
+        feats = []
+        for f in copylyr.getFeatures():
             feat = QgsFeature(f)
             if copylyr.storageType() == 'GPKG':
                 feat.deleteAttribute(j)
-            dp.addFeature(feat)
-            lyr.updateExtents()
+            fids.append(f.id())
+            feats.append(feat)
+        _, feats = dp.addFeatures(feats)
+        lyr.updateExtents()
 
+        for fid, feat in zip(fids, feats):
             if dataCollector is not None:
                 # update fData with a tmp feature and layer the vertex can be moved if necessary
-                id = dataCollector.getIdFromFid(copylyr.name(), f.id())
+                id = dataCollector.getIdFromFid(copylyr.name(), fid)
                 dataCollector.features[id].tmpLayer = lyr
                 dataCollector.features[id].tmpFeature = feat
 
         return lyr
+
+
+def isReversedByGradient(fData):
+    """
+    Channel inverts are adverse so the channel may be digitised in the wrong direction.
+
+    :param fData: FeatureData
+    :return: bool
+    """
+
+    if not fData.type or fData.type.lower() == 'x':
+        return False
+    if fData.invertUs == -99999 or fData.invertDs == -99999:
+        return False
+    return fData.invertUs < fData.invertDs
+
+
+def isReversedByContinuity(cData):
+    """
+    Channel only connects upstream to upstream and downstream to downstream so the channel
+    may be digitised in the wrong direction.
+
+    :param cData: ConnectionData
+    :return: bool
+    """
+
+    return bool(cData.linesDsDs and cData.linesUsUs and not cData.linesDs and not cData.linesUs)
+
+
+def pipeDirectionFlags(network):
+    """
+    Channels that look like they are digitised in the wrong direction. Unlike PipeDirectionTool
+    nothing is reversed, the channels are only flagged.
+
+    :param network: NetworkSnapshot
+    :return: list -> Flag
+    """
+
+    flags = []
+    if network.isSwmm:  # not supported for SWMM yet - see PipeDirectionTool
+        return flags
+
+    for id in network.ids:
+        if '__connector__' in id or network.features[id].geomType != GEOM_TYPE.Line:
+            continue
+        fData = network.features[id]
+        if isReversedByGradient(fData):
+            point = network.midVertex(id)
+            flags.append(Flag(point.x(), point.y(), 'Pipe Direction Incorrect',
+                              '{0} may need reversing based on inverts ({1:.3f}RL, {2:.3f}RL)'.format(
+                                  id, fData.invertUs, fData.invertDs),
+                              'Pipe Direction: Gradient', 1.))
+        if id in network.connections and isReversedByContinuity(network.connections[id]):
+            point = network.midVertex(id)
+            flags.append(Flag(point.x(), point.y(), 'Pipe Direction Incorrect',
+                              '{0} may need reversing based on continuity'.format(id),
+                              'Pipe Direction: Continuity', 1.))
+
+    return flags
@@ -0,0 +1,226 @@
+import os
+from collections import OrderedDict
+
+import numpy as np
+from osgeo import gdal
+
+from tuflow.tuflowqgis_library import getRasterValue
+
+
+TILE_SIZE = 512  # tile width / height in raster cells
+MAX_TILES = 32  # maximum number of tiles held in memory (32 x 512 x 512 x 8 bytes = 64 MB)
+
+
+class RasterSampler():
+    """
+    Class for sampling DEM elevations at many locations.
+
+    The raster is read in tiles (GDAL ReadAsArray windows) that are kept
+    in a least recently used cache so a tile is only read from disk once while
+    it is in use. Points are sampled in bulk using numpy. If the raster can't be opened
+    by GDAL, sampling falls back to the raster data provider (getRasterValue).
+
+    One sampler can be shared between data collectors (and tool runs) - the cache is
+    cleared if the raster layer or the file on disk changes.
+
+    """
+
+    def __init__(self, tileSize=TILE_SIZE, maxTiles=MAX_TILES):
+        self.tileSize = tileSize
+        self.maxTiles = maxTiles
+        self.raster = None
+        self.key = None
+        self.ds = None
+        self.band = None
+        self.nodata = None
+        self.invGeoTransform = None
+        self.xsize = 0
+        self.ysize = 0
+        self.tiles = OrderedDict()  # key (tile row, tile col): value 2D float array
+
+    def setRaster(self, raster):
+        """
+        Set the raster to sample. Cached tiles are kept if the raster
+        has not changed since the last call.
+
+        :param raster: QgsRasterLayer
+        :return: void
+        """
+
+        key = self.rasterKey(raster)
+        if raster is self.raster and key == self.key:
+            return
+
+        self.close()
+        self.raster = raster
+        self.key = key
+        if raster is None or raster.providerType() != 'gdal':
+            return
+
+        ds = gdal.Open(raster.dataProvider().dataSourceUri())
+        if ds is None or ds.RasterCount < 1:
+            return
+        invGeoTransform = gdal.InvGeoTransform(ds.GetGeoTransform())
+        if not invGeoTransform:
+            return
+        # older GDAL versions return (success, geotransform)
+        if len(invGeoTransform) == 2:
+            if not invGeoTransform[0]:
+                return
+            invGeoTransform = invGeoTransform[1]
+
+        self.ds = ds
+        self.band = ds.GetRasterBand(1)
+        self.nodata = self.band.GetNoDataValue()
+        self.invGeoTransform = invGeoTransform
+        self.xsize = ds.RasterXSize
+        self.ysize = ds.RasterYSize
+
+    def rasterKey(self, raster):
+        """
+        Returns a key that changes if the raster source is changed or modified on disk.
+
+        :param raster: QgsRasterLayer
+        :return: tuple
+        """
+
+        if raster is None:
+            return None
+        source = raster.dataProvider().dataSourceUri()
+        try:
+            stat = os.stat(source)
+            return source, stat.st_mtime, stat.st_size
+        except (OSError, ValueError):
+            return source, None, None
+
+    def close(self):
+        self.tiles.clear()
+        self.band = None
+        self.ds = None
+        self.invGeoTransform = None
+        self.nodata = None
+        self.xsize = 0
+        self.ysize = 0
+
+    def sample(self, points, method='nearest'):
+        """
+        Returns the raster value at each point. Locations outside the raster
+        or on no data cells are returned as None (same as the raster identify tool).
+
+        :param points: list -> QgsPointXY
+        :param method: str 'nearest' or 'bilinear'
+        :return: list -> float
+        """
+
+        if not points:
+            return []
+        if self.raster is None:
+            return [None for _ in points]
+        if self.ds is None:
+            return [getRasterValue(p, self.raster) for p in points]
+
+        xy = np.array([(p.x(), p.y()) for p in points], dtype=np.float64)
+        values = self.sampleArray(xy[:,0], xy[:,1], method)
+
+        return [None if np.isnan(x) else float(x) for x in values]
+
+    def sampleArray(self, x, y, method='nearest'):
+        """
+        Vectorised sampling of raster values. Returns NaN outside the raster or on no data cells.
+
+        :param x: numpy array x coordinates
+        :param y: numpy array y coordinates
+        :param method: str 'nearest' or 'bilinear'
+        :return: numpy array
+        """
+
+        igt = self.invGeoTransform
+        px = igt[0] + x * igt[1] + y * igt[2]
+        py = igt[3] + x * igt[4] + y * igt[5]
+
+        if method == 'nearest':
+            return self.cellValues(np.floor(py).astype(np.int64), np.floor(px).astype(np.int64))
+
+        if method != 'bilinear':
+            raise ValueError('Unrecognised sampling method: {0}'.format(method))
+
+        # bilinear - interpolate between cell centres using the valid neighbouring cells
+        px = px - 0.5
+        py = py - 0.5
+        col = np.floor(px).astype(np.int64)
+        row = np.floor(py).astype(np.int64)
+        fx = px - col
+        fy = py - row
+        total = np.zeros(x.shape, dtype=np.float64)
+        weights = np.zeros(x.shape, dtype=np.float64)
+        for dr, dc, w in ((0, 0, (1. - fx) * (1. - fy)), (0, 1, fx * (1. - fy)),
+                          (1, 0, (1. - fx) * fy), (1, 1, fx * fy)):
+            values = self.cellValues(row + dr, col + dc)
+            valid = ~np.isnan(values)
+            total[valid] += values[valid] * w[valid]
+            weights[valid] += w[valid]
+
+        # points outside the raster (not just within half a cell of the edge) are no data
+        outside = (px < -0.5) | (py < -0.5) | (px >= self.xsize - 0.5) | (py >= self.ysize - 0.5)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            values = np.where((weights > 0.) & ~outside, total / weights, np.nan)
+
+        return values
+
+    def cellValues(self, row, col):
+        """
+        Returns the value of the given cells reading only the tiles required.
+
+        :param row: numpy array int
+        :param col: numpy array int
+        :return: numpy array
+        """
+
+        values = np.full(row.shape, np.nan, dtype=np.float64)
+        inside = (row >= 0) & (row < self.ysize) & (col >= 0) & (col < self.xsize)
+        if not inside.any():
+            return values
+
+        idx = np.flatnonzero(inside)
+        r, c = row[idx], col[idx]
+        tr, tc = r // self.tileSize, c // self.tileSize
+        ntc = (self.xsize - 1) // self.tileSize + 1
+        tileIds = tr * ntc + tc
+        for tileId in np.unique(tileIds):
+            mask = tileIds == tileId
+            tileRow, tileCol = divmod(int(tileId), ntc)
+            tile = self.tile(tileRow, tileCol)
+            values[idx[mask]] = tile[r[mask] - tileRow * self.tileSize, c[mask] - tileCol * self.tileSize]
+
+        return values
+
+    def tile(self, tileRow, tileCol):
+        """
+        Returns the tile from the cache or reads it from the raster.
+
+        :param tileRow: int
+        :param tileCol: int
+        :return: 2D numpy array
+        """
+
+        key = (tileRow, tileCol)
+        if key in self.tiles:
+            self.tiles.move_to_end(key)
+            return self.tiles[key]
+
+        xoff, yoff = tileCol * self.tileSize, tileRow * self.tileSize
+        xsize = min(self.tileSize, self.xsize - xoff)
+        ysize = min(self.tileSize, self.ysize - yoff)
+        a = self.band.ReadAsArray(xoff, yoff, xsize, ysize)
+        if a is None:
+            a = np.full((ysize, xsize), np.nan, dtype=np.float64)
+        else:
+            a = a.astype(np.float64)
+            if self.nodata is not None and not np.isnan(self.nodata):
+                a[a == self.nodata] = np.nan
+
+        self.tiles[key] = a
+        while len(self.tiles) > self.maxTiles:
+            self.tiles.popitem(last=False)
+
+        return a
@@ -3,6 +3,7 @@ from qgis.core import *
 from qgis.PyQt.QtWidgets import *
 from qgis.PyQt.QtCore import *
 from .Enumerators import *
+from .Flags import Flag, flagFeatures
 
 from ..compatibility_routines import QT_DOUBLE, QT_STRING
 
@@ -45,31 +46,7 @@ class SnappingTool:
 
         if dataCollector is not None:
 
-            feats = []
-
-            for vertex in dataCollector.unsnappedVertexes:
-                if vertex.distanceToClosest < self.cutoffLimit:
-                
-                    id = vertex.id
-                    
-                    if id in dataCollector.features:
-                        fData = dataCollector.features[id]
-
-                        if vertex.vertex == VERTEX.Last:
-                            loc = fData.endVertex
-                        else:
-                            loc = fData.startVertex
-
-                        feat = QgsFeature()
-                        feat.setGeometry(QgsGeometry.fromPointXY(loc))
-                        geom = 'point' if fData.geomType == GEOM_TYPE.Point else 'line vertex'
-                        feat.setAttributes(['Unsnapped {0}'.format(geom),
-                                            'Unsnapped {0} at {1}, {2}'.format(geom, loc.x(), loc.y()),
-                                            'Snapping: Check',
-                                            vertex.distanceToClosest])
-                        feats.append(feat)
-
-            self.dp.addFeatures(feats)
+            self.dp.addFeatures(flagFeatures(snappingFlags(dataCollector, self.cutoffLimit)))
             self.outputLyr.updateExtents()
             self.outputLyr.triggerRepaint()
 
@@ -93,6 +70,12 @@ class SnappingTool:
                             moveableVertexes.append(v)
 
                 if moveableVertexes:
+                    # names are only needed to avoid clashes when naming temp layers - layers aren't
+                    # added to the project until after auto snapping so only collect once
+                    lyrnames = [x.name() for _, x in QgsProject.instance().mapLayers().items()]
+                    tmpLyrs = {x.name(): x for x in self.tmpLyrs}
+                    editedLyrs = []
+                    feats = []
                     for v in moveableVertexes:
                         if not v.snapped:  # and not v.hasPoint:
                             if v.hasPoint:
@@ -103,7 +86,6 @@ class SnappingTool:
                                 if pointVertex not in self.dataCollectorPoints.unsnappedVertexes:
                                     self.dataCollectorPoints.unsnappedVertexes.append(pointVertex)
 
-                            lyrnames = [x.name() for _, x in QgsProject.instance().mapLayers().items()]
                             if re.findall(r'_SN\d+$', v.layer.name()):
                                 cnt = int(re.findall(r'\d+$', v.layer.name())[0])
                                 name_ = re.split(r'_SN\d+', v.layer.name())[0]
@@ -115,15 +97,19 @@ class SnappingTool:
                                 cnt += 1
                                 tempLyrName = '{0}_SN{1}'.format(name_, cnt)
 
-                            if tempLyrName not in [x.name() for x in self.tmpLyrs]:
+                            if tempLyrName not in tmpLyrs:
                                 lyr = self.copyLayerToTemp(v.layer, tempLyrName)
                                 self.tmpLyrs.append(lyr)
+                                tmpLyrs[tempLyrName] = lyr
                             else:
-                                i = [x.name() for x in self.tmpLyrs].index(tempLyrName)
-                                lyr = self.tmpLyrs[i]
+                                lyr = tmpLyrs[tempLyrName]
 
                             self.tmplyr2oldlyr[lyr.id()] = v.layer.id()
-                            lyr.startEditing()
+                            if lyr not in editedLyrs:
+                                # all vertex moves for a layer go into a single edit command
+                                lyr.startEditing()
+                                lyr.beginEditCommand('Auto snap')
+                                editedLyrs.append(lyr)
                             
                             # get position to move to
                             closestId = v.closestVertex.id
@@ -172,10 +158,15 @@ class SnappingTool:
                                                     'Moved {0} {1:.4f} to {2}'.format(geom, v.distanceToClosest, geom2),
                                                     'Snapping: Auto',
                                                     v.distanceToClosest])
-                                self.dp.addFeature(feat)
-                                self.outputLyr.updateExtents()
-                                
-                            lyr.commitChanges()
+                                feats.append(feat)
+
+                    for lyr in editedLyrs:
+                        lyr.endEditCommand()
+                        lyr.commitChanges()
+
+                    if feats:
+                        self.dp.addFeatures(feats)
+                        self.outputLyr.updateExtents()
                             
                 else:
                     return
@@ -214,16 +205,20 @@ class SnappingTool:
         dp.addAttributes(fields)
         lyr.updateFields()
         
+        fids = []
         feats = []
-        for i, f in enumerate(copylyr.getFeatures()):
+        for f in copylyr.getFeatures():
             feat = QgsFeature(f)
             if copylyr.storageType() == 'GPKG':
                 feat.deleteAttribute(j)
-            dp.addFeature(feat)
-            lyr.updateExtents()
-            
+            fids.append(f.id())
+            feats.append(feat)
+        _, feats = dp.addFeatures(feats)
+        lyr.updateExtents()
+
+        for fid, feat in zip(fids, feats):
             # update the vertex with a tmp fid so the vertex can be moved if necessary
-            id = self.dataCollector.getIdFromFid(copylyr.name(), f.id())
+            id = self.dataCollector.getIdFromFid(copylyr.name(), fid)
             if self.dataCollector.geomType == GEOM_TYPE.Line:
                 pos = [VERTEX.First, VERTEX.Last]
                 for p in pos:
@@ -236,4 +231,37 @@ class SnappingTool:
                     v = self.dataCollector.vertexes[id]
                     v.tmpFid = feat.id()
         
-        return lyr
\ No newline at end of file
+        return lyr
+
+
+def snappingFlags(dataCollector, cutoffLimit=10):
+    """
+    Unsnapped vertexes closer than the cutoff limit to another vertex.
+
+    :param dataCollector: DataCollector or NetworkSnapshot
+    :param cutoffLimit: float
+    :return: list -> Flag
+    """
+
+    flags = []
+    for vertex in dataCollector.unsnappedVertexes:
+        if vertex.distanceToClosest < cutoffLimit:
+
+            id = vertex.id
+
+            if id in dataCollector.features:
+                fData = dataCollector.features[id]
+
+                if vertex.vertex == VERTEX.Last:
+                    loc = fData.endVertex
+                else:
+                    loc = fData.startVertex
+
+                geom = 'point' if fData.geomType == GEOM_TYPE.Point else 'line vertex'
+                flags.append(Flag(loc.x(), loc.y(),
+                                  'Unsnapped {0}'.format(geom),
+                                  'Unsnapped {0} at {1}, {2}'.format(geom, loc.x(), loc.y()),
+                                  'Snapping: Check',
+                                  vertex.distanceToClosest))
+
+    return flags
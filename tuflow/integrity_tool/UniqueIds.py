@@ -2,12 +2,56 @@ import re
 from qgis.PyQt.QtCore import QObject, pyqtSignal
 from qgis.core import QgsVectorLayer, NULL, QgsProject, QgsFeature, QgsField
 from datetime import datetime
+from .Flags import Flag
 
 
 MAX_FIELD_LENGTH_PRE_2020_01_AB = 12
 MAX_FIELD_LENGTH = 36  # maximum id length - since 2020-01-AB
 MAX_ITERATIONS = 1000  # used to cap 'while' loops
 
+# channelIdStatus return values
+ID_UNIQUE = 'unique'
+ID_DUPLICATE = 'duplicate'
+ID_NULL = 'null'
+
+
+def channelIdStatus(id_, type_, ids):
+    """
+    Whether a channel ID is unique, a duplicate of one in 'ids', or NULL / empty.
+    Returns None for 'x' type channels and channels without a type - these don't need an ID.
+    """
+
+    if type_ is None or type_ == NULL or type_.lower() == 'x':
+        return None
+    if id_ is None or id_ == NULL or id_.strip() == '':
+        return ID_NULL
+    if id_ in ids:
+        return ID_DUPLICATE
+    return ID_UNIQUE
+
+
+def uniqueIdFlags(network):
+    """
+    Flags at channels that have a duplicate ID or a NULL / empty ID. Same output as
+    checkForDuplicates followed by findNonCompliantIds but from the channel IDs and types
+    stored in a NetworkSnapshot (see NetworkSnapshot.channels).
+    """
+
+    flags = []
+    ids = set()
+    for id_, type_, point in network.channels:
+        status = channelIdStatus(id_, type_, ids)
+        if status == ID_NULL:
+            flags.append(Flag(point.x(), point.y(), 'NULL or empty ID', 'NULL or empty ID',
+                              'Channel ID: find NULL or empty ID tool', 1.0))
+        elif status == ID_UNIQUE:
+            ids.add(id_)
+        elif status == ID_DUPLICATE:
+            flags.append(Flag(point.x(), point.y(), 'Duplicate ID: {0}'.format(id_), 'Duplicate ID: {0}'.format(id_),
+                              'Channel ID: find duplicate ID tool', 1.0))
+
+    return flags
+
 
 class FeatKey:
 
@@ -225,12 +269,13 @@ class UniqueIds(QObject):
             for feat in gis_layer.getFeatures():
                 id_ = feat.attributes()[iid]
                 feat_key = FeatKey(gis_layer, feat)
-                if feat.attributes()[iid+1] != NULL and feat.attributes()[iid+1].lower() != 'x' and (id_ == NULL or id_.strip() == ''):
+                status = channelIdStatus(id_, feat.attributes()[iid+1], self.ids)
+                if status == ID_NULL:
                     self.null_id_count += 1
                     self.null_id_feats[feat_key] = feat_key
-                elif feat.attributes()[iid+1] != NULL and feat.attributes()[iid+1].lower() != 'x' and id_ not in self.ids:
+                elif status == ID_UNIQUE:
                     self.ids.append(id_)
-                elif feat.attributes()[iid + 1] != NULL and feat.attributes()[iid + 1].lower() != 'x':
+                elif status == ID_DUPLICATE:
                     self.duplicate_ids.append(id_)
                     self.duplicate_feats[feat_key] = feat_key
 
@@ -0,0 +1,86 @@
+from unittest import TestCase
+
+import numpy as np
+from tuflow.ARR2016.ARR_TUFLOW_func_lib import (arf_eqn241, arf_eqn242, arf_eqn243, arf_eqn244, arf_factors,
+                                                interpolate_nan, extend_array_aep)
+
+
+DURATIONS = [10, 15, 20, 25, 30, 45, 60, 90, 120, 180, 270, 360, 540, 720, 900, 1080, 1440, 1800, 2160, 2880,
+             4320, 5760, 7200, 8640, 10080]
+AEP_NAMES = ['12EY', '6EY', '4EY', '3EY', '2EY', '1EY', '0.5EY', '50%', '20%', '0.2EY', '10%', '5%', '2%', '1%',
+             '1 in 200', '1 in 500', '1 in 2000']
+AEPS = [99.85, 99.75, 98.17, 95.02, 86.47, 63.21, 39.35, 50., 20., 18.13, 10., 5., 2., 1., 0.5, 0.2, 0.05]
+ARF_PARAM = [0.158, 0.276, 0.372, 0.315, 0.000141, 0.41, 0.15, 0.01, -0.0027]  # a - i (ARR datahub)
+
+
+def scalar_arf(area, duration, aep, param, ARF_frequent, min_ARF):
+    """ARF for a single duration / AEP(%) using the scalar equations."""
+    AEP_max = 100 if ARF_frequent else 50
+    if not 0.05 <= aep <= AEP_max:
+        return 1.
+    area_ = 10 if area <= 10 else area
+    if duration <= 720:
+        arf = arf_eqn241(area_, duration, aep / 100)
+    elif duration < 1440:
+        arf = arf_eqn243(duration, arf_eqn241(area_, 720, aep / 100), arf_eqn242(area_, 1440, aep / 100, *param))
+    else:
+        arf = arf_eqn242(area_, duration, aep / 100, *param)
+    if area <= 10:
+        arf = arf_eqn244(area, arf)
+    return max(arf, min_ARF)
+
+
+class TestArf(TestCase):
+
+    def test_arf_factors(self):
+        for area in [1.5, 5., 10., 50., 999., 1500., 20000., 40000.]:
+            for ARF_frequent in [False, True]:
+                for min_ARF in [0.2, 0.9]:
+                    arf = arf_factors(area, DURATIONS, AEP_NAMES, *ARF_PARAM, ARF_frequent, min_ARF)
+                    expected = [[scalar_arf(area, d, aep, ARF_PARAM, ARF_frequent, min_ARF) for aep in AEPS]
+                                for d in DURATIONS]
+                    self.assertEqual((len(DURATIONS), len(AEP_NAMES)), arf.shape)
+                    np.testing.assert_allclose(arf, expected, rtol=1e-13, atol=0.)
+
+    def test_arf_factors_single_duration_group(self):
+        arf = arf_factors(50., [1440, 2880], AEP_NAMES, *ARF_PARAM, False, 0.2)
+        expected = [[scalar_arf(50., d, aep, ARF_PARAM, False, 0.2) for aep in AEPS] for d in [1440, 2880]]
+        np.testing.assert_allclose(arf, expected, rtol=1e-13, atol=0.)
+
+
+class TestLossInterpolation(TestCase):
+
+    def test_interpolate_nan(self):
+        dur = [30, 60, 90, 120, 180, 360, 720]
+        il = np.array([[np.nan, np.nan], [10., 20.], [np.nan, np.nan], [16., 26.], [np.nan, np.nan], [22., 32.],
+                       [np.nan, np.nan]])
+        expected = np.array([[5., 10.], [10., 20.], [13., 23.], [16., 26.], [17.5, 27.5], [22., 32.],
+                             [np.nan, np.nan]])
+        np.testing.assert_allclose(interpolate_nan(il, dur, 30., lossMethod='interpolate'), expected,
+                                   rtol=1e-13, equal_nan=True)
+
+    def test_interpolate_nan_loss_methods(self):
+        dur = [10, 30, 60, 120]
+        il = np.array([[np.nan, np.nan], [np.nan, np.nan], [10., 20.], [14., 24.]])
+        static = interpolate_nan(il, dur, 30., lossMethod='static', staticLoss=5.)
+        np.testing.assert_allclose(static[:2], [[5., 5.], [5., 5.]])
+        min60 = interpolate_nan(il, dur, 30., lossMethod='60min')
+        np.testing.assert_allclose(min60[:2], [[10., 20.], [10., 20.]])
+        log = interpolate_nan(il, dur, 30., lossMethod='interpolate_log')
+        expected = [[np.interp(np.log10(d), [0, np.log10(60.)], [0, v]) for v in (10., 20.)] for d in dur[:2]]
+        np.testing.assert_allclose(log[:2], expected, rtol=1e-13)
+        np.testing.assert_allclose(log[2:], il[2:])
+
+    def test_interpolate_nan_long_durations(self):
+        dur = [60, 1440, 4320, 5760, 7200]
+        il = np.array([[10., 20.], [np.nan, np.nan], [30., 40.], [np.nan, np.nan], [np.nan, np.nan]])
+        il = interpolate_nan(il, dur, 30., lossMethod='interpolate')
+        np.testing.assert_allclose(il[3:], [[30., 40.], [30., 40.]])
+
+    def test_extend_array_aep(self):
+        il = np.array([[10., 20., 30.], [11., 21., 31.]])
+        il = extend_array_aep(['50%', '20%', '10%'], ['50%', '0.5EY', '20%', '0.2EY', '10%'], il)
+        self.assertEqual((2, 5), il.shape)
+        np.testing.assert_allclose(il[:,[0, 2, 4]], [[10., 20., 30.], [11., 21., 31.]])
+        np.testing.assert_allclose(il[:,1], np.array([10., 11.]) + 10. / (4.48 - 1.44) * (2 - 1.44))
+        np.testing.assert_allclose(il[:,3], np.array([20., 21.]) + 10. / (10 - 4.48) * (5 - 4.48))
@@ -12,10 +12,13 @@ from tuflow.integrity_tool.Enumerators import *
 from tuflow.integrity_tool.FeatureData import FeatureData
 from tuflow.integrity_tool.DrapeData import DrapeData
 from tuflow.integrity_tool.DataCollector import DataCollector
-from tuflow.integrity_tool.SnappingTool import SnappingTool
-from tuflow.integrity_tool.ContinuityTool import ContinuityTool
+from tuflow.integrity_tool.SnappingTool import SnappingTool, snappingFlags
+from tuflow.integrity_tool.ContinuityTool import ContinuityTool, continuityFlags
 from tuflow.integrity_tool.FlowTraceTool import DataCollectorFlowTrace, FlowTraceTool, FlowTracePlot
-from tuflow.integrity_tool.PipeDirectionTool import PipeDirectionTool
+from tuflow.integrity_tool.PipeDirectionTool import PipeDirectionTool, pipeDirectionFlags
+from tuflow.integrity_tool.UniqueIds import uniqueIdFlags
+from tuflow.integrity_tool.NetworkSnapshot import NetworkSnapshot
+from tuflow.integrity_tool.IntegrityChecks import IntegrityCheck, runChecks, createOutputLayer
 from tuflow.integrity_tool.helpers import EstryHelper
 
 # initialise QGIS data providers
@@ -405,5 +408,51 @@ class TestPipeDirection(unittest.TestCase):
         self.assertTrue(pipeDirectionTool.outputLyr.isValid())
         self.assertEqual(pipeDirectionTool.outputLyr.featureCount(), 1)
 
+
+class TestIntegrityChecks(unittest.TestCase):
+
+    def test_continuity(self):
+        dataCollector = DataCollector(None)
+        dataCollector.collectData([pipe_L_broken], dem=dem)
+        network = NetworkSnapshot.fromDataCollector(dataCollector, [pipe_L_broken])
+        check = IntegrityCheck('Continuity', continuityFlags, network, 90, 0.5, 20, True, True, True, True)
+
+        flags = runChecks([check])
+        self.assertEqual(10, len(flags))
+        self.assertEqual(flags, runChecks([check]))  # the snapshot isn't changed by the checks
+
+        continuityTool = ContinuityTool(dataCollector=dataCollector, limitAngle=90, limitCover=0.5, limitArea=20,
+                                        checkArea=True, checkAngle=True, checkInvert=True, checkCover=True)
+        self.assertEqual(sorted(f.attribute(1) for f in continuityTool.outputLyr.getFeatures()),
+                         sorted(x.message for x in flags))
+
+    def test_snapping(self):
+        dataCollectorLines = DataCollector(None)
+        dataCollectorLines.collectData([pipe_L_broken, culv_L], dem)
+        dataCollectorPoints = DataCollector(None)
+        dataCollectorPoints.collectData([pits_P_broken], dem, [pipe_L_broken, culv_L], dataCollectorLines)
+        networkLines = NetworkSnapshot.fromDataCollector(dataCollectorLines)
+        networkPoints = NetworkSnapshot.fromDataCollector(dataCollectorPoints)
+
+        flags = runChecks([IntegrityCheck('Snapping', snappingFlags, networkLines, 10),
+                           IntegrityCheck('Snapping (points)', snappingFlags, networkPoints, 10)])
+        self.assertEqual(snappingFlags(dataCollectorLines) + snappingFlags(dataCollectorPoints), flags)
+
+        outputLyr = createOutputLayer(flags)
+        self.assertTrue(outputLyr.isValid())
+        self.assertEqual(len(flags), outputLyr.featureCount())
+
+    def test_pipe_direction_and_ids(self):
+        dataCollector = DataCollector(None)
+        dataCollector.collectData([pipe_L_broken])
+        network = NetworkSnapshot.fromDataCollector(dataCollector, [pipe_L_broken])
+
+        flags = runChecks([IntegrityCheck('Channel IDs', uniqueIdFlags, network),
+                           IntegrityCheck('Pipe Direction', pipeDirectionFlags, network)])
+        self.assertEqual(2, len([x for x in flags if x.tool == 'Pipe Direction: Gradient']))
+        self.assertEqual(1, len([x for x in flags if x.tool == 'Pipe Direction: Continuity']))
+        self.assertEqual(0, len([x for x in flags if x.tool.startswith('Channel ID')]))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,46 @@
+# benchmark for reading TUFLOW time series csv files (e.g. _1d_H.csv)
+# synthetic files are written to the temp directory: python -m tuflow.test.results.speed_test_ts_csv [ncol] [nrow]
+import sys
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+from tuflow.ts_csv import read_ts_csv, has_pandas
+
+
+def write_synthetic_csv(file_path, ncol, nrow):
+    rng = np.random.default_rng(0)
+    with open(file_path, 'w') as f:
+        f.write(','.join(['Timestep', 'Time'] + ['H Node{0} [sim]'.format(i) for i in range(ncol)]) + '\n')
+        for i in range(nrow):
+            row = rng.random(ncol) * 10.
+            row[rng.random(ncol) < 0.01] = -99999.
+            f.write('{0},{1:.4f},'.format(i + 1, i / 60.) + ','.join('{0:.3f}'.format(x) for x in row) + '\n')
+
+
+def time_it(name, func):
+    t = time.perf_counter()
+    a = func()
+    print('{0:<24}{1:>8.2f}s  shape={2}'.format(name, time.perf_counter() - t, a.shape))
+    return a
+
+
+if __name__ == '__main__':
+    ncol = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    nrow = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    with tempfile.TemporaryDirectory() as tmpdir:
+        file_path = Path(tmpdir) / 'synthetic_1d_H.csv'
+        print('writing {0} columns x {1} rows...'.format(ncol, nrow))
+        write_synthetic_csv(file_path, ncol, nrow)
+        print('file size: {0:.0f} MB'.format(file_path.stat().st_size / 1e6))
+
+        def genfromtxt():
+            with file_path.open() as f:
+                next(f)
+                return np.ma.masked_values(np.genfromtxt(f, delimiter=',', encoding='utf-8'), -99999.)
+
+        time_it('numpy.genfromtxt', genfromtxt)
+        time_it('read_ts_csv (numpy)', lambda: read_ts_csv(file_path, engine='numpy'))
+        time_it('read_ts_csv (float32)', lambda: read_ts_csv(file_path, dtype=np.float32, engine='numpy'))
+        if has_pandas:
+            time_it('read_ts_csv (pandas)', lambda: read_ts_csv(file_path, engine='pandas'))
@@ -0,0 +1,81 @@
+import os
+import tempfile
+import time
+from pathlib import Path
+from unittest import TestCase, mock
+
+import numpy as np
+
+from tuflow import tuflow_plugin_cache
+from tuflow.tuflow_plugin_cache import save_cached_arrays, load_cached_arrays, array_cache_dir, evict_cached_arrays
+
+
+class TestArrayCache(TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        cache_root = self.root / 'cache'
+        patcher = mock.patch.object(tuflow_plugin_cache, 'cache_dir',
+                                    lambda sub_dir='': cache_root / sub_dir if sub_dir else cache_root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def source(self, name, size=10):
+        p = self.root / name
+        p.write_text('x' * size)
+        return p
+
+    def test_save_load(self):
+        src = self.source('a.csv')
+        a = np.arange(12.).reshape((3, 4))
+        self.assertTrue(save_cached_arrays(src, 'Test', {'values': a}, max_size=0))
+        arrays = load_cached_arrays(src, 'Test')
+        np.testing.assert_array_equal(a, arrays['values'])
+
+    def test_changed_source(self):
+        src = self.source('a.csv')
+        save_cached_arrays(src, 'Test', {'values': np.arange(3.)}, max_size=0)
+        src.write_text('changed')
+        self.assertIsNone(load_cached_arrays(src, 'Test'))
+
+    def test_resave_new_version(self):
+        src = self.source('a.csv')
+        save_cached_arrays(src, 'Test', {'values': np.arange(3.)}, max_size=0)
+        mapped = load_cached_arrays(src, 'Test')  # still mapped while the arrays are saved again
+        save_cached_arrays(src, 'Test', {'values': np.arange(5.)}, max_size=0)
+        np.testing.assert_array_equal(np.arange(5.), load_cached_arrays(src, 'Test')['values'])
+        del mapped
+        versions = [x for x in array_cache_dir(src, 'Test').iterdir()]
+        self.assertEqual(1, len(versions))
+        self.assertFalse([x for x in versions if x.suffix == '.tmp'])
+
+    def test_failed_save_removes_temp(self):
+        src = self.source('a.csv')
+        self.assertFalse(save_cached_arrays(src, 'Test', {'values': np.array([object()])}, max_size=0))
+        self.assertEqual([], list(array_cache_dir(src, 'Test').iterdir()))
+
+    def test_evict_least_recently_used(self):
+        srcs = [self.source('{0}.csv'.format(i)) for i in range(3)]
+        for i, src in enumerate(srcs):
+            save_cached_arrays(src, 'Test', {'values': np.zeros(1000)}, max_size=0)
+            t = time.time() - 100 + i
+            for version in array_cache_dir(src, 'Test').iterdir():
+                os.utime(version, (t, t))
+        load_cached_arrays(srcs[0], 'Test')  # most recently used now
+        size = sum(os.path.getsize(os.path.join(d, f)) for d, _, fs in os.walk(array_cache_dir(srcs[0], 'Test'))
+                   for f in fs)
+        self.assertGreater(evict_cached_arrays(size * 2), 0)
+        self.assertIsNotNone(load_cached_arrays(srcs[0], 'Test'))
+        self.assertIsNone(load_cached_arrays(srcs[1], 'Test'))
+        self.assertIsNotNone(load_cached_arrays(srcs[2], 'Test'))
+
+    def test_save_evicts_other_files(self):
+        srcs = [self.source('{0}.csv'.format(i)) for i in range(2)]
+        save_cached_arrays(srcs[0], 'Test', {'values': np.zeros(1000)}, max_size=0)
+        save_cached_arrays(srcs[1], 'Test', {'values': np.zeros(1000)}, max_size=1)
+        self.assertIsNone(load_cached_arrays(srcs[0], 'Test'))
+        self.assertIsNotNone(load_cached_arrays(srcs[1], 'Test'))
@@ -0,0 +1,137 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+import numpy as np
+
+from tuflow.TUFLOW_results import ResData, Timeseries
+
+
+class TestLazyLoad(TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.file = Path(self.tmpdir.name) / 'sim_1d_H.csv'
+        self.times = np.array([0., 0.25, 0.5, 0.75, 1.])
+        self.values = np.array([[1.5, 10.], [2.5, 11.], [3.5, 12.], [4.5, 13.], [5.5, 14.]])
+        with self.file.open('w') as f:
+            f.write('Timestep,Time,H N1 [sim],H N2 [sim]\n')
+            for i, (time, row) in enumerate(zip(self.times, self.values)):
+                f.write('{0},{1},{2},{3}\n'.format(i + 1, time, *row))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def load(self, lazy):
+        ts = Timeseries()
+        error, message = ts.Load(str(self.file), 'H', 'sim', lazy=lazy)
+        self.assertFalse(error, message)
+        return ts
+
+    def test_header_only(self):
+        ts = self.load(True)
+        self.assertTrue(ts.loaded)
+        self.assertFalse(ts.isMaterialised())
+        self.assertEqual(['Timestep', 'Time', 'N1', 'N2'], ts.Header)
+        self.assertEqual(2, ts.nLocs)
+        self.assertEqual(3, ts.columnIndex('N2'))
+
+    def test_values_read_on_first_access(self):
+        ts = self.load(True)
+        self.assertTrue(np.allclose(self.values[:,1], ts.Values[:,3]))
+        self.assertTrue(ts.isMaterialised())
+        self.assertEqual(5, ts.nVals)
+
+    def test_same_as_eager(self):
+        lazy, eager = self.load(True), self.load(False)
+        self.assertTrue(eager.isMaterialised())
+        self.assertTrue(np.allclose(eager.Values, lazy.Values))
+
+    def test_times_does_not_materialise(self):
+        ts = self.load(True)
+        self.assertTrue(np.allclose(self.times, ts.times()))
+        self.assertFalse(ts.isMaterialised())
+        self.assertEqual(2, ts.timeIndex(0.5))
+
+    def test_times(self):
+        ts = self.load(False)
+        self.assertEqual(np.float64, ts.times().dtype)
+        self.assertTrue(np.allclose(self.times, ts.times()))
+
+    def test_shift_before_materialise(self):
+        ts = self.load(True)
+        ts.shiftTimes(1.)
+        self.assertFalse(ts.isMaterialised())
+        self.assertTrue(np.allclose(self.times + 1., ts.times()))
+        ts.shiftTimes(0.5)
+        self.assertTrue(np.allclose(self.times + 1.5, ts.times()))
+        self.assertTrue(np.allclose(self.times + 1.5, ts.Values[:,1]))
+        self.assertTrue(np.allclose(self.times + 1.5, ts.times()))
+
+    def test_shift_after_materialise(self):
+        ts = self.load(True)
+        ts.materialise()
+        ts.shiftTimes(-0.25)
+        self.assertTrue(np.allclose(self.times - 0.25, ts.Values[:,1]))
+        self.assertTrue(np.allclose(self.times - 0.25, ts.times()))
+
+    def test_shift_eager(self):
+        ts = self.load(False)
+        ts.shiftTimes(2.)
+        self.assertTrue(np.allclose(self.times + 2., ts.times()))
+
+    def test_missing_file(self):
+        ts = self.load(True)
+        self.file.unlink()
+        error, message = ts.materialise()
+        self.assertTrue(error)
+        self.assertFalse(ts.isMaterialised())
+        with self.assertRaises(IOError):
+            ts.Values
+
+
+class TestGetTSData(TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.file = Path(self.tmpdir.name) / 'sim_1d_H.csv'
+        with self.file.open('w') as f:
+            f.write('Timestep,Time,H N1 [sim],H N2 [sim]\n1,0.0,1.5,10.0\n2,0.5,2.5,11.0\n')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def res(self, lazy):
+        res = ResData()
+        res.displayname = 'sim'
+        error, message = res.Data_1D.H.Load(str(self.file), 'H', 'sim', lazy=lazy)
+        self.assertFalse(error, message)
+        return res
+
+    def test_lazy(self):
+        res = self.res(True)
+        found, data, message = res.getTSData('N2', '1D', 'H', 'P')
+        self.assertTrue(found)
+        self.assertIsNone(message)
+        self.assertTrue(np.allclose([10., 11.], data))
+        self.assertTrue(np.allclose([0., 0.5], res.times))
+
+    def test_eager(self):
+        res = self.res(False)
+        found, data, message = res.getTSData('N1', '1D', 'H', 'P')
+        self.assertTrue(found)
+        self.assertIsNone(message)
+        self.assertTrue(np.allclose([1.5, 2.5], data))
+
+    def test_not_found(self):
+        res = self.res(True)
+        found, data, message = res.getTSData('X', '1D', 'H', 'P')
+        self.assertFalse(found)
+        self.assertTrue(message)
+
+    def test_read_error(self):
+        res = self.res(True)
+        self.file.unlink()
+        found, data, message = res.getTSData('N1', '1D', 'H', 'P')
+        self.assertFalse(found)
+        self.assertTrue(message)
@@ -0,0 +1,97 @@
+import sys
+from unittest import TestCase
+
+from tuflow.TUFLOW_results import NetworkGraph, ResData, ChanInfo
+
+
+def chain(count):
+    """Channels C0 -> C1 -> ... with node Ni upstream of Ci."""
+    return ['C{0}'.format(i) for i in range(count)], ['N{0}'.format(i) for i in range(count)], \
+        ['N{0}'.format(i + 1) for i in range(count)]
+
+
+class TestNetworkGraph(TestCase):
+
+    def setUp(self):
+        # C1 splits into C2 and C3 at N2 which join again at N5 and flow out through C6
+        self.network = NetworkGraph(['C1', 'C2', 'C3', 'C4', 'C5', 'C6'],
+                                    ['N1', 'N2', 'N2', 'N3', 'N4', 'N5'],
+                                    ['N2', 'N3', 'N4', 'N5', 'N5', 'N6'])
+
+    def test_adjacency(self):
+        self.assertEqual(['C2', 'C3'], self.network.downstreamChannels('C1'))
+        self.assertEqual(['C4', 'C5'], self.network.upstreamChannels('C6'))
+        self.assertEqual([], self.network.downstreamChannels('C6'))
+        self.assertEqual([], self.network.downstreamChannels('X'))
+
+    def test_path(self):
+        self.assertEqual(['C1', 'C2', 'C4', 'C6'], self.network.path('C1', 'C6'))
+        self.assertEqual(['C3', 'C5', 'C6'], self.network.path('C3', 'C6'))
+
+    def test_path_to_outlet(self):
+        self.assertEqual(['C1', 'C2', 'C4', 'C6'], self.network.path('C1'))
+        self.assertEqual(['C6'], self.network.path('C6'))
+
+    def test_not_connected(self):
+        self.assertIsNone(self.network.path('C6', 'C1'))
+        self.assertIsNone(self.network.path('C2', 'C5'))
+        self.assertIsNone(self.network.path('X', 'C6'))
+        self.assertIsNone(self.network.path('X'))
+
+    def test_path_is_a_copy(self):
+        path = self.network.path('C1', 'C6')
+        path.append('X')
+        self.assertEqual(['C1', 'C2', 'C4', 'C6'], self.network.path('C1', 'C6'))
+
+    def test_cycle(self):
+        # A -> B -> C loops back to A, D is the only way out
+        network = NetworkGraph(['A', 'B', 'C', 'D'], ['N1', 'N2', 'N3', 'N3'], ['N2', 'N3', 'N1', 'N4'])
+        self.assertEqual(['A', 'B', 'D'], network.path('A'))
+        self.assertEqual(['B', 'C', 'A'], network.path('B', 'A'))
+        self.assertEqual(['C', 'A', 'B', 'D'], network.path('C', 'D'))
+
+    def test_cycle_without_outlet(self):
+        network = NetworkGraph(['A', 'B', 'C'], ['N1', 'N2', 'N3'], ['N2', 'N3', 'N1'])
+        self.assertIsNone(network.path('A'))
+        self.assertIsNone(network.path('A', 'X'))
+        self.assertEqual(['A', 'B', 'C'], network.path('A', 'C'))
+
+    def test_deep_network(self):
+        # used to raise RecursionError
+        count = sys.getrecursionlimit() * 3
+        network = NetworkGraph(*chain(count))
+        path = network.path('C0')
+        self.assertEqual(count, len(path))
+        self.assertEqual('C{0}'.format(count - 1), path[-1])
+        self.assertEqual(count, len(network.path('C0', 'C{0}'.format(count - 1))))
+        self.assertEqual(['C{0}'.format(count - 2), 'C{0}'.format(count - 1)],
+                         network.path('C{0}'.format(count - 2), 'C{0}'.format(count - 1)))
+
+
+class TestLongProfileConnectivity(TestCase):
+
+    def res(self, chan_names, us_nodes, ds_nodes):
+        res = ResData()
+        res.Channels = ChanInfo(None)
+        res.Channels.chan_name = list(chan_names)
+        res.Channels.chan_US_Node = list(us_nodes)
+        res.Channels.chan_DS_Node = list(ds_nodes)
+        res.Channels.chan_DS_Chan = ['------'] * len(chan_names)  # no main path - connection is forced
+        return res
+
+    def test_force_connection(self):
+        res = self.res(['C1', 'C2', 'C3', 'C4'], ['N1', 'N2', 'N2', 'N3'], ['N2', 'N3', 'N4', 'N5'])
+        error, message = res.LP_getConnectivity('C4', 'C1')
+        self.assertFalse(error)
+        self.assertTrue(res.LP.connected)
+        self.assertEqual(['C1', 'C2', 'C4'], res.LP.chan_list)
+        self.assertEqual([0, 1, 3], res.LP.chan_index)
+        self.assertEqual(['N1', 'N2', 'N3', 'N5'], res.LP.node_list)
+
+    def test_force_connection_deep_network(self):
+        count = sys.getrecursionlimit() * 3
+        res = self.res(*chain(count))
+        error, message = res.LP_getConnectivity('C0', 'C{0}'.format(count - 1))
+        self.assertFalse(error)
+        self.assertEqual(count, len(res.LP.chan_list))
+        self.assertEqual(count + 1, len(res.LP.node_list))
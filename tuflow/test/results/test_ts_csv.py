@@ -0,0 +1,68 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+import numpy as np
+
+from tuflow.ts_csv import read_ts_csv, has_pandas
+
+
+class TestTSCsv(TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.file = Path(self.tmpdir.name) / 'test_1d_H.csv'
+        rng = np.random.default_rng(0)
+        self.values = np.round(rng.random((25, 12)) * 10., 3)
+        self.values[:, 0] = np.arange(1, 26)
+        self.values[4, 5] = -99999.
+        with self.file.open('w') as f:
+            f.write(','.join(['Timestep', 'Time'] + ['H N{0} [sim]'.format(i) for i in range(10)]) + '\n')
+            for row in self.values:
+                f.write(','.join('{0}'.format(x) for x in row) + '\n')
+            f.write('\n')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def expected(self):
+        with self.file.open() as f:
+            next(f)
+            return np.ma.masked_values(np.genfromtxt(f, delimiter=',', encoding='utf-8'), -99999.)
+
+    def test_numpy_engine(self):
+        a = read_ts_csv(self.file, engine='numpy', chunk_size=7)
+        exp = self.expected()
+        self.assertEqual(exp.shape, a.shape)
+        self.assertTrue((exp.mask == a.mask).all())
+        self.assertTrue(np.allclose(exp.filled(0.), a.filled(0.)))
+
+    def test_pandas_engine(self):
+        if not has_pandas:
+            self.skipTest('pandas not installed')
+        a = read_ts_csv(self.file, engine='pandas', chunk_size=7)
+        exp = self.expected()
+        self.assertEqual(exp.shape, a.shape)
+        self.assertTrue((exp.mask == a.mask).all())
+        self.assertTrue(np.allclose(exp.filled(0.), a.filled(0.)))
+
+    def test_float32(self):
+        a = read_ts_csv(self.file, dtype=np.float32, engine='numpy')
+        self.assertEqual(np.float32, a.dtype)
+        self.assertTrue(a.mask[4, 5])
+
+    def test_empty_field(self):
+        with self.file.open('w') as f:
+            f.write('Timestep,Time,H N1 [sim],H N2 [sim]\n1,0.0,1.5,\n2,0.1,2.5,3.5\n')
+        a = read_ts_csv(self.file, engine='numpy')
+        self.assertEqual((2, 4), a.shape)
+        self.assertTrue(np.isnan(a[0, 3]))
+        self.assertEqual(3.5, a[1, 3])
+
+    def test_flow_regime(self):
+        with self.file.open('w') as f:
+            f.write('Timestep,Time,F N1 [sim],F N2 [sim]\n1,0.0,S,-99999.0\n2,0.1,C,S\n')
+        a = read_ts_csv(self.file, dtype=str, comments='!')
+        self.assertEqual((2, 4), a.shape)
+        self.assertEqual('S', a[0, 2])
+        self.assertTrue(a.mask[0, 3])
@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+import numpy as np
+from tuflow.tuflowqgis_tuviewer.tuflowqgis_tuflux import flow_across_line
+
+
+# straight line from west to east, 100 m long
+XY = np.array([[0., 0.], [25., 0.], [50., 0.], [100., 0.]])
+CHAINAGES = np.array([0., 25., 50., 100.])
+
+
+def uniform(value, ntimes=2):
+    return np.full((ntimes, XY.shape[0]), value, dtype=np.float64)
+
+
+class TestFlowAcrossLine(TestCase):
+
+    def test_perpendicular_flow(self):
+        q = flow_across_line(XY, CHAINAGES, uniform(2.), uniform(1.5), uniform(0.), uniform(1.5))
+        np.testing.assert_allclose(q, [300., 300.])
+
+    def test_reverse_flow_is_negative(self):
+        q = flow_across_line(XY, CHAINAGES, uniform(2.), uniform(1.5), uniform(0.), uniform(-1.5))
+        np.testing.assert_allclose(q, [-300., -300.])
+
+    def test_parallel_flow_is_zero(self):
+        q = flow_across_line(XY, CHAINAGES, uniform(2.), uniform(1.), uniform(1.), uniform(0.))
+        np.testing.assert_allclose(q, [0., 0.])
+
+    def test_oblique_flow_uses_velocity_magnitude(self):
+        vx, vy = uniform(0.6), uniform(0.8)
+        q = flow_across_line(XY, CHAINAGES, uniform(1.), uniform(1.), vx, vy)
+        np.testing.assert_allclose(q, [100., 100.])
+
+    def test_dry_and_nan_values(self):
+        depth = uniform(1.)
+        depth[0,3] = np.nan  # last segment is half depth and half velocity
+        depth[1] = 0.
+        q = flow_across_line(XY, CHAINAGES, depth, uniform(1.), uniform(0.), uniform(1.))
+        np.testing.assert_allclose(q, [50. + 0.5 * 0.5 * 50., 0.])
+
+    def test_direction_carried_from_previous_segment(self):
+        # velocities cancel out on the last segment so it uses the direction of the segment before
+        vy = np.array([[1., 1., 1., -1.]])
+        vm = np.abs(vy)
+        q = flow_across_line(XY, CHAINAGES, np.ones((1, 4)), vm, np.zeros((1, 4)), vy)
+        np.testing.assert_allclose(q, [100.])
+
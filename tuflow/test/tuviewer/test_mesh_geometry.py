@@ -0,0 +1,108 @@
+from unittest import TestCase
+
+import numpy as np
+from tuflow.tuflowqgis_tuviewer.tuflowqgis_tumeshgeometry import TuMeshGeometry
+
+
+NX, NY = 30, 20  # quads in x, y
+DX, DY = 2., 1.5
+
+
+def structured_mesh():
+    """Rectangular mesh of quads with every third quad split into two triangles."""
+    vx, vy = np.meshgrid(np.arange(NX + 1) * DX, np.arange(NY + 1) * DY)
+    vertices = np.column_stack((vx.ravel(), vy.ravel()))
+    faces = []
+    for j in range(NY):
+        for i in range(NX):
+            a, b, c, d = j * (NX + 1) + i, j * (NX + 1) + i + 1, (j + 1) * (NX + 1) + i + 1, (j + 1) * (NX + 1) + i
+            if (i + j) % 3 == 0:
+                faces.extend([[a, b, c], [a, c, d]])
+            else:
+                faces.append([a, b, c, d])
+    return vertices, faces
+
+
+class TestMeshGeometry(TestCase):
+
+    def setUp(self):
+        self.vertices, self.faces = structured_mesh()
+        self.geom = TuMeshGeometry.fromArrays(self.vertices, self.faces)
+
+    def test_locate(self):
+        points = np.random.default_rng(0).uniform([-5., -5.], [NX * DX + 5., NY * DY + 5.], (2000, 2))
+        faces, vertices, weights = self.geom.locate(points)
+        inside = (points >= 0.).all(axis=1) & (points <= [NX * DX, NY * DY]).all(axis=1)
+        np.testing.assert_array_equal(inside, faces >= 0)
+        for f, p in zip(faces[inside], points[inside]):
+            xy = self.vertices[self.faces[f]]
+            self.assertTrue((xy.min(axis=0) - 1e-9 <= p).all() and (p <= xy.max(axis=0) + 1e-9).all())
+
+    def test_locate_interpolates_linear_field(self):
+        points = np.random.default_rng(1).uniform([0., 0.], [NX * DX, NY * DY], (500, 2))
+        faces, vertices, weights = self.geom.locate(points)
+        field = 3. * self.vertices[:,0] - 2. * self.vertices[:,1] + 1.
+        np.testing.assert_allclose((weights * field[vertices]).sum(axis=1), 3. * points[:,0] - 2. * points[:,1] + 1.)
+
+    def test_line_intersects(self):
+        # crosses every vertical edge plus the diagonal of each split quad in the first row
+        points, faces = self.geom.lineIntersects([[-1., 0.75], [61., 0.75]])
+        self.assertEqual(2 + (NX + 1) + NX // 3, points.shape[0])
+        self.assertEqual(points.shape[0] - 1, faces.size)
+        self.assertTrue((np.diff(points[:,0]) > 0).all())
+        self.assertEqual(-1, faces[0])
+        self.assertEqual(-1, faces[-1])
+        self.assertTrue((faces[1:-1] >= 0).all())
+
+    def test_line_intersects_through_vertices(self):
+        points, faces = self.geom.lineIntersects([[0., 0.], [6., 4.5]])
+        np.testing.assert_allclose(points, [[0., 0.], [2., 1.5], [4., 3.], [6., 4.5]])
+        self.assertTrue((faces >= 0).all())
+
+
+def mixed_mesh():
+    """
+    Fine structured mesh with large triangles on either side - the large triangles span the height of the fine
+    mesh and are much wider than it.
+    """
+    vertices, faces = structured_mesh()
+    vertices = np.vstack((vertices, [[-1000., 0.], [-1000., NY * DY], [NX * DX + 1000., 0.], [NX * DX + 1000., NY * DY]]))
+    n = vertices.shape[0]
+    bl, tl, br, tr = 0, NY * (NX + 1), NX, (NY + 1) * (NX + 1) - 1
+    faces.extend([[n - 4, bl, tl], [n - 4, tl, n - 3], [br, n - 2, n - 1], [br, n - 1, tr]])
+    return vertices, faces
+
+
+class TestMixedMeshGeometry(TestCase):
+
+    def setUp(self):
+        self.vertices, self.faces = mixed_mesh()
+        self.geom = TuMeshGeometry.fromArrays(self.vertices, self.faces)
+        self.nfine = len(self.faces) - 4
+
+    def test_index_size(self):
+        np.testing.assert_array_equal(np.arange(self.nfine, self.nfine + 4), self.geom.largeFaces)
+        self.assertLess(self.geom.cellFaces.size, 4 * self.nfine)
+
+    def test_locate(self):
+        points = np.array([[-500., 1.], [-999., 29.], [30., 15.], [NX * DX + 500., 20.], [-500., 31.]])
+        faces, vertices, weights = self.geom.locate(points)
+        for f, p in zip(faces[:4], points[:4]):
+            xy = self.vertices[self.faces[f]]
+            self.assertTrue((xy.min(axis=0) - 1e-9 <= p).all() and (p <= xy.max(axis=0) + 1e-9).all())
+        self.assertTrue(faces[0] >= self.nfine)
+        self.assertTrue(faces[1] >= self.nfine)
+        self.assertTrue(faces[2] < self.nfine)
+        self.assertTrue(faces[3] >= self.nfine)
+        self.assertEqual(-1, faces[4])
+        np.testing.assert_allclose(1., weights[:4].sum(axis=1))
+
+    def test_line_intersects(self):
+        # crosses the outer edge and the shared edge of the large triangles on each side and the fine mesh in between
+        points, faces = self.geom.lineIntersects([[-1001., 0.75], [NX * DX + 1001., 0.75]])
+        self.assertEqual(2 + 4 + (NX + 1) + NX // 3, points.shape[0])
+        self.assertTrue((np.diff(points[:,0]) > 0).all())
+        self.assertEqual(-1, faces[0])
+        self.assertEqual(-1, faces[-1])
+        self.assertTrue((faces[1:-1] >= 0).all())
+        self.assertTrue(faces[1] >= self.nfine and faces[-2] >= self.nfine)
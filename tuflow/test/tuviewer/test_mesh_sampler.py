@@ -0,0 +1,11 @@
+from unittest import TestCase
+
+import numpy as np
+from tuflow.tuflowqgis_tuviewer.tuflowqgis_tumeshsampler import index_runs
+
+
+class TestIndexRuns(TestCase):
+
+    def test_index_runs(self):
+        self.assertEqual([], index_runs(np.array([], dtype=int)))
+        self.assertEqual([(3, 5), (140, 61), (900, 1)], index_runs(np.array([3, 5, 7, 140, 200, 900])))
@@ -0,0 +1,17 @@
+from unittest import TestCase
+
+import numpy as np
+from tuflow.tuflowqgis_tuviewer.tuflowqgis_tusection import section_profile
+
+
+class TestSectionProfile(TestCase):
+
+    def test_vertex_values(self):
+        x, y = section_profile(np.array([0., 1.5, 4.]), np.array([2., np.nan, 3.]), True)
+        self.assertEqual([0., 1.5, 4.], x)
+        np.testing.assert_array_equal([2., np.nan, 3.], y)
+
+    def test_face_values(self):
+        x, y = section_profile(np.array([0., 1.5, 4., 5.]), np.array([2., np.nan, 3.]), False)
+        self.assertEqual([0., 1.5, 1.5, 4., 4., 5.], x)
+        np.testing.assert_array_equal([2., 2., np.nan, np.nan, 3., 3.], y)
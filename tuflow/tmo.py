@@ -8,7 +8,7 @@ class TMO:
     Class for handling .tmo outputs from TUFLOW.
 
     Only header information is read in when the class is initialised.
-    Values can be obtained using "data_at_time" method.
+    Values can be obtained using "data_at_time" method, or as arrays using "arrays_at_time".
     """
 
     def __init__(self, file_path):
@@ -72,48 +72,71 @@ class TMO:
 
         return pos
 
+    def time_index(self, time):
+        """Returns the index of the input time (see translate_time). Raises an exception if the time is not found."""
+        time = self.translate_time(time)
+        if time is None or time not in self.header.times:
+            raise Exception('Invalid input time: {0}\nAvailable times: {1}'.format(time, self.header.times))
+
+        return self.header.times.index(time)
+
     def data_at_time(self, time, call_back_log = None, call_back_progress = None):
         """
         Returns values at a given time for all domains.
         The values returned is a list of tuples of real world co-ordinates (x, y, value).
         """
-        time = self.translate_time(time)
-        if time is None or time not in self.header.times:
-            raise Exception('Invalid input time: {0}\nAvailable times: {1}'.format(time, self.header.times))
+        time_index = self.time_index(time)
 
-        time_index = self.header.times.index(time)
+        for i, domain in enumerate(self.header.domains):
+            if call_back_log is not None:
+                call_back_log('Reading file data for domain: {0}\n{1}\n'.format(i, domain))
+            x, y, a = self.domain_arrays_at_time(time_index, i)
+            if call_back_progress is not None:
+                for _ in range(domain.row_count * domain.col_count - a.size):  # dry cells
+                    call_back_progress()
+            for j in range(a.size):
+                if call_back_progress is not None:
+                    call_back_progress()
 
-        xrw = lambda x, y, ox, ang: ox + x * np.cos(ang) - y * np.sin(ang)
-        yrw = lambda x, y, oy, ang: oy + x * np.sin(ang) + y * np.cos(ang)
+                yield x[j], y[j], a[j], i
+
+    def arrays_at_time(self, time, call_back_log = None):
+        """
+        Returns values at a given time for all domains as 1D arrays (x, y, value, domain index).
+        Dry cells are not included if there is a companion _wd.tmo.
+        """
+        time_index = self.time_index(time)
+
+        x, y, values, domains = [], [], [], []
         for i, domain in enumerate(self.header.domains):
             if call_back_log is not None:
                 call_back_log('Reading file data for domain: {0}\n{1}\n'.format(i, domain))
-            a = self.row_col_data_at_time(time_index, i)
-            if self.wd is not None:
-                wd = self.wd.row_col_data_at_time(time_index, i)
-                if wd is not None:
-                    mask = wd < 1
-                    a = np.ma.masked_where(mask, a, True)
-            for n in range(domain.row_count):
-                for m in range(domain.col_count):
-                    if self.wd is not None and wd is not None and mask[n,m]:
-                        if call_back_progress is not None:
-                            call_back_progress()
-                        continue
-                    if self.header.version >= 3:
-                        x = xrw(m * domain.dx, n * domain.dy, domain.origin_x, domain.geo_angle)
-                        y = yrw(m * domain.dx, n * domain.dy, domain.origin_y, domain.geo_angle)
-                    else:
-                        x = xrw(m * domain.dx + domain.dx / 2., n * domain.dy + domain.dy / 2., domain.origin_x,
-                                domain.geo_angle)
-                        y = yrw(m * domain.dx + domain.dx / 2., n * domain.dy + domain.dy / 2., domain.origin_y,
-                                domain.geo_angle)
-
-                    if call_back_progress is not None:
-                        call_back_progress()
-
-                    yield x, y, a[n,m], i
+            x_, y_, a = self.domain_arrays_at_time(time_index, i)
+            x.append(x_)
+            y.append(y_)
+            values.append(a)
+            domains.append(np.full(a.shape, i, dtype=np.int32))
+
+        if not values:
+            return np.array([]), np.array([]), np.array([]), np.array([], dtype=np.int32)
 
+        return np.concatenate(x), np.concatenate(y), np.concatenate(values), np.concatenate(domains)
+
+    def domain_arrays_at_time(self, time_index, domain_index):
+        """
+        Returns 1D arrays of real world co-ordinates and values (x, y, value) for a domain at a given time index.
+        Dry cells are removed if there is a companion _wd.tmo.
+        """
+        domain = self.header.domains[domain_index]
+        a = self.row_col_data_at_time(time_index, domain_index)
+        x, y = domain.cell_coordinates(self.header.version)
+        if self.wd is not None:
+            wd = self.wd.row_col_data_at_time(time_index, domain_index)
+            if wd is not None:
+                wet = wd >= 1
+                return x[wet], y[wet], np.asarray(a[wet])
+
+        return x.ravel(), y.ravel(), np.asarray(a).ravel()
 
     def row_col_data_at_time(self, time_index, domain_index):
         """Returns the 2D array of values at the requested time and domain index."""
@@ -244,8 +267,8 @@ class TMO_Domain:
             raise IndexError('Index must be of type integer')
         try:
             dtype_ = np.float32 if self.data_size == 4 else np.int8
-            a = np.fromfile(self.file_path, offset=item, dtype=dtype_, count=self.col_count * self.row_count)
-            return np.reshape(a, (self.row_count, self.col_count))
+            return np.memmap(self.file_path, dtype=dtype_, mode='r', offset=item,
+                             shape=(self.row_count, self.col_count))
         except struct.error as e:
             raise Exception('Error reading TMO domain {0} data at time index {1}, possibly incomplete file: {2}'.format(
                 self.domain_index + 1, item, e))
@@ -254,6 +277,16 @@ class TMO_Domain:
                                                                                               item, e))
 
 
+    def cell_coordinates(self, version):
+        """Returns the real world x, y co-ordinates of the cells as 2D arrays (row x col)."""
+        offset_x, offset_y = (0., 0.) if version >= 3 else (self.dx / 2., self.dy / 2.)
+        lx = np.arange(self.col_count) * self.dx + offset_x
+        ly = np.arange(self.row_count) * self.dy + offset_y
+        cos, sin = np.cos(self.geo_angle), np.sin(self.geo_angle)
+        x = self.origin_x + lx[np.newaxis,:] * cos - ly[:,np.newaxis] * sin
+        y = self.origin_y + lx[np.newaxis,:] * sin + ly[:,np.newaxis] * cos
+        return x, y
+
     def _read_block_1(self, col_count, row_count, *args):
         self.col_count = col_count
         self.row_count = row_count
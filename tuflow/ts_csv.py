@@ -0,0 +1,154 @@
+import warnings
+import numpy as np
+try:
+    import pandas as pd
+    has_pandas = True
+except ImportError:
+    has_pandas = False
+
+
+CHUNK_SIZE = 500  # number of rows parsed at a time
+
+
+def read_ts_csv(file_path, dtype=np.float64, null_data=-99999., comments='#', engine=None, chunk_size=CHUNK_SIZE):
+    """
+    Reads the values from a TUFLOW time series csv (1D / 2D / RL) into a 2D masked array
+    (row = timestep, column = csv column). The header line is skipped.
+
+    Rows are parsed in chunks and written into a preallocated array so there is only ever one full size copy
+    of the data in memory. Values equal to null_data are masked.
+
+    engine:
+        'pandas' - uses the pandas C parser (default if pandas is installed)
+        'numpy' - pure numpy parser
+    dtype:
+        np.float64 / np.float32 or str (e.g. flow regime results)
+    """
+
+    if dtype is str:
+        return _read_ts_csv_str(file_path, null_data, comments)
+
+    if engine is None:
+        engine = 'pandas' if has_pandas else 'numpy'
+    if engine == 'pandas' and not has_pandas:
+        engine = 'numpy'
+
+    nrows, ncols = _table_shape(file_path, comments)
+    a = np.empty((nrows, ncols), dtype=dtype)
+    if engine == 'pandas':
+        irow = _read_pandas(file_path, a, comments, chunk_size)
+    else:
+        irow = _read_numpy(file_path, a, comments, chunk_size)
+    a = a[:irow]
+
+    return np.ma.masked_values(a, null_data, copy=False)
+
+
+def _table_shape(file_path, comments):
+    """
+    Returns an upper bound on the number of data rows (number of line endings after the header) and
+    the number of columns (taken from the first data row).
+    """
+
+    nlines = 0
+    last_byte = b'\n'
+    with open(file_path, 'rb') as f:
+        while True:
+            b = f.read(1 << 24)
+            if not b:
+                break
+            nlines += b.count(b'\n')
+            last_byte = b[-1:]
+    if last_byte != b'\n':
+        nlines += 1
+
+    ncols = 0
+    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        next(f, None)
+        for line in f:
+            line = _strip_comment(line, comments)
+            if line:
+                ncols = len(line.split(','))
+                break
+
+    return max(nlines - 1, 0), ncols
+
+
+def _strip_comment(line, comments):
+    if comments and comments in line:
+        line = line.split(comments, 1)[0]
+    return line.strip()
+
+
+def _parse_line(line, ncols, dtype):
+    """Slow per line parse - used if a chunk can't be parsed in one go (e.g. empty fields)."""
+    row = np.full((ncols,), np.nan, dtype=dtype)
+    for i, x in enumerate(line.split(',')[:ncols]):
+        try:
+            row[i] = float(x)
+        except ValueError:
+            pass
+    return row
+
+
+def _read_numpy(file_path, a, comments, chunk_size):
+    nrows, ncols = a.shape
+    irow = 0
+    chunk = []
+
+    def flush(irow):
+        n = len(chunk)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')  # older numpy warns rather than raises on unmatched data
+                values = np.fromstring(','.join(chunk), dtype=a.dtype, sep=',')
+        except ValueError:
+            values = None
+        if values is not None and values.size == n * ncols:
+            a[irow:irow+n] = values.reshape((n, ncols))
+        else:
+            for i, line in enumerate(chunk):
+                a[irow+i] = _parse_line(line, ncols, a.dtype)
+        chunk.clear()
+        return irow + n
+
+    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        next(f, None)
+        for line in f:
+            line = _strip_comment(line, comments)
+            if not line:
+                continue
+            chunk.append(line)
+            if len(chunk) == chunk_size:
+                irow = flush(irow)
+        if chunk:
+            irow = flush(irow)
+
+    return irow
+
+
+def _read_pandas(file_path, a, comments, chunk_size):
+    nrows, ncols = a.shape
+    irow = 0
+    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        reader = pd.read_csv(f, header=None, skiprows=1, usecols=range(ncols), dtype=a.dtype, engine='c',
+                             comment=comments if comments else None, skip_blank_lines=True, chunksize=chunk_size)
+        for df in reader:
+            n = df.shape[0]
+            a[irow:irow+n] = df.to_numpy(dtype=a.dtype)
+            irow += n
+
+    return irow
+
+
+def _read_ts_csv_str(file_path, null_data, comments):
+    rows = []
+    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        next(f, None)
+        for line in f:
+            line = _strip_comment(line, comments)
+            if line:
+                rows.append(line.split(','))
+    a = np.array(rows, dtype=str)
+
+    return np.ma.masked_array(a, a == str(null_data))
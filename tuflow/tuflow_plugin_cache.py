@@ -1,5 +1,15 @@
+import hashlib
+import json
+import os
+import shutil
+import time
 from pathlib import Path
 
+import numpy as np
+
+
+ARRAY_CACHE_MAX_SIZE_GB = 2.  # default size limit of the array cache (see array_cache_max_size)
+
 
 def cache_dir(sub_dir: str = '') -> Path:
     cachedir = Path.home() / '.tuflow_plugin'
@@ -22,3 +32,154 @@ def get_cached_content(path: Path | str, data_type: type) -> str | bytes:
     mode = 'r' if data_type is str else 'rb'
     with p.open(mode) as f:
         return f.read()
+
+
+def file_fingerprint(path: Path | str) -> dict:
+    """Returns the path, modified time and size of a file - used to check if a cached copy is still valid."""
+    p = Path(path).resolve()
+    st = p.stat()
+    return {'path': str(p), 'mtime_ns': st.st_mtime_ns, 'size': st.st_size}
+
+
+def array_cache_dir(path: Path | str, tag: str) -> Path:
+    """
+    Returns the cache folder that holds the parsed arrays for a given file. Tag separates different readers.
+    Each save is written to its own version sub-folder (see save_cached_arrays).
+    """
+    key = hashlib.sha1('{0}|{1}'.format(Path(path).resolve(), tag).encode('utf-8')).hexdigest()
+    return cache_dir('array_cache') / key
+
+
+def array_cache_max_size() -> int:
+    """
+    Returns the size limit of the array cache in bytes (0 = no limit). Set in GB with the
+    TUFLOW/array_cache_max_size_gb setting.
+    """
+    try:
+        from qgis.PyQt.QtCore import QSettings
+        size_gb = QSettings().value('TUFLOW/array_cache_max_size_gb', ARRAY_CACHE_MAX_SIZE_GB, type=float)
+    except (ImportError, TypeError):
+        size_gb = ARRAY_CACHE_MAX_SIZE_GB
+    return int(size_gb * 1024 ** 3) if size_gb and size_gb > 0 else 0
+
+
+def save_cached_arrays(path: Path | str, tag: str, arrays: dict[str, np.ndarray], max_size: int = None) -> bool:
+    """
+    Saves a dictionary of arrays parsed from a file into the plugin cache as .npy files so they can be
+    memory mapped by load_cached_arrays. Returns False if the arrays could not be saved.
+
+    The arrays are written to a new version folder rather than over the previous one as the previous arrays
+    may still be memory mapped (which stops them being replaced on Windows). Older versions are removed if they
+    can be and the least recently used files are then evicted to keep the cache within max_size bytes
+    (array_cache_max_size() if None).
+    """
+    p = array_cache_dir(path, tag)
+    version = p / '{0:x}_{1}'.format(time.time_ns(), os.getpid())
+    tmp = p / '{0}.tmp'.format(version.name)
+    try:
+        fingerprint = file_fingerprint(path)
+        tmp.mkdir(parents=True)
+        for name, a in arrays.items():
+            np.save(tmp / '{0}.npy'.format(name), np.asarray(a), allow_pickle=False)
+        with (tmp / 'fingerprint.json').open('w') as f:
+            json.dump(fingerprint, f)
+        tmp.rename(version)
+    except (OSError, ValueError, TypeError):
+        shutil.rmtree(tmp, ignore_errors=True)
+        return False
+
+    for old in _array_cache_versions(p)[1:]:
+        _remove_array_cache_version(old)
+    evict_cached_arrays(array_cache_max_size() if max_size is None else max_size, keep=p)
+    return True
+
+
+def load_cached_arrays(path: Path | str, tag: str, mmap_mode: str = 'c') -> dict[str, np.ndarray] | None:
+    """
+    Loads arrays saved by save_cached_arrays. Returns None if nothing is cached or if the source file has changed
+    (modified time or size) since the arrays were cached.
+
+    Arrays are memory mapped by default (copy-on-write) so values are only paged in when they are used.
+    """
+    try:
+        fingerprint = file_fingerprint(path)
+        for version in _array_cache_versions(array_cache_dir(path, tag)):
+            fpath = version / 'fingerprint.json'
+            if not fpath.exists():
+                continue
+            with fpath.open() as f:
+                if json.load(f) != fingerprint:
+                    return None
+            arrays = {}
+            for file in version.glob('*.npy'):
+                a = np.load(file, mmap_mode=mmap_mode, allow_pickle=False)
+                arrays[file.stem] = a
+            os.utime(version)  # last used time for evict_cached_arrays
+            return arrays
+    except (OSError, ValueError):
+        return None
+    return None
+
+
+def evict_cached_arrays(max_size: int, keep: Path = None) -> int:
+    """
+    Deletes the least recently used cached arrays until the array cache is within max_size bytes (0 = no limit).
+    The folder keep (e.g. the arrays just saved) is not deleted. Files that can't be deleted (memory mapped on
+    Windows) are left and are tried again next time. Returns the number of bytes freed.
+    """
+    root = cache_dir('array_cache')
+    if not max_size or not root.exists():
+        return 0
+    folders = {}  # folder: (last used, size)
+    for folder in root.iterdir():
+        if not folder.is_dir():
+            continue
+        try:
+            last_used = max([x.stat().st_mtime for x in folder.iterdir()], default=folder.stat().st_mtime)
+        except OSError:
+            continue
+        folders[folder] = (last_used, _folder_size(folder))
+    total = sum(x[1] for x in folders.values())
+
+    freed = 0
+    for folder in sorted(folders, key=lambda x: folders[x][0]):
+        if total - freed <= max_size:
+            break
+        if keep is not None and folder == keep:
+            continue
+        for version in folder.iterdir():
+            _remove_array_cache_version(version)
+        try:
+            folder.rmdir()
+        except OSError:
+            pass
+        freed += folders[folder][1] - _folder_size(folder)
+    return freed
+
+
+def _array_cache_versions(p: Path) -> list[Path]:
+    """Version folders of a cache folder, newest first."""
+    if not p.exists():
+        return []
+    return sorted([x for x in p.iterdir() if x.is_dir() and x.suffix != '.tmp'],
+                  key=lambda x: int(x.name.split('_')[0], 16), reverse=True)
+
+
+def _remove_array_cache_version(p: Path):
+    """Removes a version folder. The fingerprint goes first so a partly removed version is never loaded."""
+    try:
+        (p / 'fingerprint.json').unlink()
+    except OSError:
+        pass
+    shutil.rmtree(p, ignore_errors=True)
+
+
+def _folder_size(folder: Path) -> int:
+    size = 0
+    for dirpath, _, filenames in os.walk(folder):
+        for fname in filenames:
+            try:
+                size += os.path.getsize(os.path.join(dirpath, fname))
+            except OSError:
+                pass
+    return size
@@ -7,7 +7,7 @@ from sqlite3 import DatabaseError
 
 import numpy as np
 
-from .TUFLOW_results import ResData, ChanInfo, NodeInfo
+from .TUFLOW_results import ResData, ChanInfo, NodeInfo, time_index, lp_profile_values
 from .compatibility_routines import Path
 from .gui.logging import Logging
 
@@ -17,6 +17,10 @@ GisFeatureType = typing.Union['QgsFeature', 'ogr.Feature']
 
 import re
 
+SQL_MAX_VARIABLES = 500  # IDs per "IN (...)" query, older SQLite builds are limited to 999 host parameters
+SQL_MMAP_SIZE = 1 << 30  # bytes of the database SQLite can memory map
+SQL_CACHE_SIZE = -65536  # page cache size, negative values are in KiB
+
 _VALID_IDENTIFIER = re.compile(r"^[A-Za-z0-9_][A-Za-z0-9_\s\\-]*$")
 
 def _safe_identifier(name: str) -> str:
@@ -244,6 +248,7 @@ class ResData_GPKG(ResData):
         self._gis_line_feat_count = None
         self._gis_region_feat_count = None
         self._saved_results = {}
+        self._id_indexes = {}  # table: temp ID index table name (None if not needed)
         self.LP.id1 = None
         self.LP.id2 = None
         self.LP.loaded = False
@@ -517,12 +522,33 @@ class ResData_GPKG(ResData):
         return valid
 
     def close(self) -> None:
-        self.close_db()
+        if self._db is not None:
+            self._keep_open = 0
+            self._db.close()
+            self._db = None
+            self._cur = None
+            self._id_indexes = {}  # temp tables are dropped with the connection
+            self.Channels.cur = None
+            self.nodes.cur = None
+
+    def connect(self) -> sqlite3.Connection:
+        """Read-only connection to the results. The connection is kept open (until close() is called) so
+        the SQLite page cache and memory map are reused between queries."""
+        try:
+            db = sqlite3.connect('{0}?mode=ro'.format(Path(self._fname).resolve().as_uri()), uri=True)
+        except (sqlite3.Error, ValueError):
+            # e.g. UNC paths the SQLite uri parser doesn't accept
+            db = sqlite3.connect(self._fname)
+        db.execute('PRAGMA query_only = 1;')
+        db.execute('PRAGMA mmap_size = {0};'.format(SQL_MMAP_SIZE))
+        db.execute('PRAGMA cache_size = {0};'.format(SQL_CACHE_SIZE))
+        db.execute('PRAGMA temp_store = FILE;')  # temp ID index tables can be large - see id_index()
+        return db
 
     def open_db(self) -> None:
         if self._db is None:
             try:
-                self._db = sqlite3.connect(self._fname)
+                self._db = self.connect()
                 self._cur = self._db.cursor()
                 self.Channels.cur = self._cur
                 self.nodes.cur = self._cur
@@ -533,19 +559,52 @@ class ResData_GPKG(ResData):
             self._keep_open += 1
 
     def close_db(self) -> None:
-        if self._db is not None:
-            if not self._keep_open:
-                try:
-                    self._cur = None
-                    self._db.close()
-                    self._db = None
-                    self.Channels.cur = None
-                    self.nodes.cur = None
-                except Exception as e:
-                    Logging.warning(e)
-                    raise e
-            else:
-                self._keep_open -= 1
+        # connection stays open for the next query - see close()
+        if self._db is not None and self._keep_open:
+            self._keep_open -= 1
+
+    def id_index(self, table: str, build: bool = True) -> typing.Optional[str]:
+        """TUFLOW does not index the ID column of the time series tables so every ID lookup is a full table
+        scan. On first use an (ID, rowid) lookup table with an index is built in the connection's temp
+        database instead, so the results file is never modified. Building it is a scan of the whole table so
+        it is only worth it for batched lookups - with build=False an index is only returned if it has already
+        been built. Returns the temp table name, or None if the table already has an ID index (or the temp
+        index hasn't / couldn't be created)."""
+        if table in self._id_indexes:
+            return self._id_indexes[table]
+        if not build:
+            return None
+        self._id_indexes[table] = None
+        try:
+            for index in self._cur.execute(f'PRAGMA index_list({_safe_identifier(table)});').fetchall():  # nosec B608
+                info = self._cur.execute(f'PRAGMA index_info({_safe_identifier(index[1])});').fetchall()  # nosec B608
+                if info and info[0][2] == 'ID':
+                    return None
+            name = table + '_ID_rows'
+            self._cur.execute('PRAGMA query_only = 0;')  # only the temp database is written to
+            try:
+                self._cur.execute(
+                    f'CREATE TEMP TABLE {_safe_identifier(name)} AS '  # nosec B608
+                    f'SELECT ID, rowid AS rid FROM {_safe_identifier(table)};'  # nosec B608
+                )
+                self._cur.execute(
+                    f'CREATE INDEX temp.{_safe_identifier(name + "_idx")} ON {_safe_identifier(name)} (ID);'  # nosec B608
+                )
+            finally:
+                self._cur.execute('PRAGMA query_only = 1;')
+            self._id_indexes[table] = name
+        except Exception as e:
+            Logging.warning(e)
+        return self._id_indexes[table]
+
+    def id_filter(self, table: str, count: int, build_index: bool = True) -> str:
+        """SQL condition selecting count IDs (as ? placeholders) from a table - uses the temp ID index if there is one.
+        build_index=False won't build the temp ID index if it doesn't exist yet (e.g. single ID lookups)."""
+        placeholders = ', '.join('?' * count)
+        index = self.id_index(table, build_index)
+        if index is None:
+            return f'ID IN ({placeholders})'
+        return f'rowid IN (SELECT rid FROM temp.{_safe_identifier(index)} WHERE ID IN ({placeholders}))'  # nosec B608
 
     def Load(self, fname: str) -> typing.Tuple[bool, str]:
         """Load file. This routine just checks compatibility etc. Load data on the fly as needed."""
@@ -576,6 +635,10 @@ class ResData_GPKG(ResData):
         self.GIS.L = r'{0}|layername={1}'.format(self._fname, self.gis_line_layer_name)
         self.GIS.R = None
 
+        # don't hold the file open (and locked) for callers that only load the result to check it,
+        # the connection is opened again (and kept open) by the first query
+        self.close()
+
         return err, msg
 
     def timestep_interval(self, layer_name: str, result_type: str) -> float:
@@ -644,20 +707,16 @@ class ResData_GPKG(ResData):
         if key in self._saved_results:
             return True, self._saved_results[key], ''
 
-        if res in self.pointResultTypesTS():
-            tbl = self.gis_point_layer_name
-        elif res in self.lineResultTypesTS():
-            tbl = self.gis_line_layer_name
-        elif res in self.regionResultTypesTS():
-            tbl = self.gis_region_layer_name
-        else:
+        tbl = self.result_table(res)
+        if tbl is None:
             return False, [0.], 'No data'
 
         y = []
         try:
             self.open_db()
             for row in self._cur.execute(
-                    f'SELECT {_safe_identifier(res)} FROM {_safe_identifier(tbl)} WHERE ID = ?;', (id_,)):  # nosec B608
+                    f'SELECT {_safe_identifier(res)} FROM {_safe_identifier(tbl)} '  # nosec B608
+                    f'WHERE {self.id_filter(tbl, 1, False)} ORDER BY rowid;', (id_,)):  # nosec B608
                 try:
                     y.append(float(row[0]))
                 except (TypeError, ValueError, IndexError):
@@ -674,6 +733,96 @@ class ResData_GPKG(ResData):
 
         return err, data, msg
 
+    def getTSDataMany(self, ids: typing.List[str], dom: str,
+                      res: typing.Union[str, typing.List[str]]) -> typing.Tuple[bool, typing.Any, str]:
+        """Time series data for many IDs in one query per table rather than one query per ID.
+
+        If res is a single result type the data is returned as a masked (time x ID) array, if res is a list of
+        result types a dictionary of arrays is returned (one per result type). Columns for IDs not found
+        are masked."""
+        res_types = [res] if isinstance(res, str) else list(res)
+        ntime = len(self.timeSteps())
+        tables = {}
+        for r in res_types:
+            tbl = self.result_table(r)
+            if tbl is not None:
+                tables.setdefault(tbl, []).append(r)
+        if not tables:
+            return False, [0.], 'No data'
+
+        for tbl, types in tables.items():
+            todo = [x for x in dict.fromkeys(ids) if any(self.create_key(x, r) not in self._saved_results for r in types)]
+            if todo:
+                try:
+                    self.load_ts_data(tbl, todo, types, ntime)
+                except Exception as e:
+                    Logging.error(e, Logging.get_stack_trace())
+                    return False, [0.], 'No data'
+
+        data, found = {}, False
+        for r in res_types:
+            a = np.ma.masked_all((ntime, len(ids)))
+            for j, id_ in enumerate(ids):
+                y = self._saved_results.get(self.create_key(id_, r))
+                if y is not None and len(y) == ntime:
+                    a[:,j] = y
+                    found = True
+            data[r] = a
+
+        missing = [x for x in ids if all(len(self._saved_results.get(self.create_key(x, r), [])) != ntime for r in res_types)]
+        msg = 'Data not found for IDs: {0}'.format(', '.join(missing)) if missing else ''
+        if isinstance(res, str):
+            return found, data.get(res, [0.]), msg
+        return found, data, msg
+
+    def load_ts_data(self, table: str, ids: typing.List[str], res_types: typing.List[str], ntime: int) -> None:
+        """Loads the given result types for many (unique) IDs from a table into _saved_results."""
+        id_col = {x: j for j, x in enumerate(ids)}
+        values = np.full((len(res_types), ntime, len(ids)), np.nan)
+        found = np.zeros((len(ids),), dtype=bool)
+        cols = ', '.join(_safe_identifier(x) for x in res_types)
+        try:
+            self.open_db()
+            for k in range(0, len(ids), SQL_MAX_VARIABLES):
+                batch = ids[k:k+SQL_MAX_VARIABLES]
+                rows = self._cur.execute(
+                    f'SELECT ID, TimeId, {cols} FROM {_safe_identifier(table)} '  # nosec B608
+                    f'WHERE {self.id_filter(table, len(batch))};', batch  # nosec B608
+                ).fetchall()
+                if not rows:
+                    continue
+                col = np.array([id_col[x[0]] for x in rows], dtype=int)
+                row = np.array([x[1] for x in rows], dtype=int) - 1  # TimeId is 1 based
+                try:
+                    val = np.array([x[2:] for x in rows], dtype=np.float64)  # None -> nan
+                except (TypeError, ValueError):
+                    val = np.array([[self._float(y) for y in x[2:]] for x in rows], dtype=np.float64)
+                valid = (row >= 0) & (row < ntime)
+                values[:,row[valid],col[valid]] = val[valid].T
+                found[col] = True
+        finally:
+            self.close_db()
+
+        for j in np.flatnonzero(found):
+            for i, r in enumerate(res_types):
+                self._saved_results[self.create_key(ids[j], r)] = values[i,:,j]
+
+    @staticmethod
+    def _float(value: typing.Any) -> float:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return np.nan
+
+    def result_table(self, res: str) -> str:
+        """Name of the GIS layer (table) that holds the result type."""
+        if res in self.pointResultTypesTS():
+            return self.gis_point_layer_name
+        elif res in self.lineResultTypesTS():
+            return self.gis_line_layer_name
+        elif res in self.regionResultTypesTS():
+            return self.gis_region_layer_name
+
     def result_types_from_table(self, table: str) -> typing.List[str]:
         types = []
         try:
@@ -755,6 +904,7 @@ class ResData_GPKG(ResData):
         self.LP.node_top = []
         self.LP.dist_nodes = [0.0]
         self.LP.H_nd_index = []
+        self.LP.temporal = {}
         self.LP.node_index = []
         self.LP.Hmax = []
         self.LP.Emax = []
@@ -833,16 +983,15 @@ class ResData_GPKG(ResData):
 
         # max water level
         if self.LP.node_list:
-            placeholders = ', '.join('?' * len(self.LP.node_list))
             case_whens = ''.join(f' WHEN ? THEN {i}' for i in range(len(self.LP.node_list)))
-            sql = (
-                f'SELECT MAX("Water Level") FROM {_safe_identifier(self.gis_point_layer_name)} '  # nosec B608
-                f'WHERE ID IN ({placeholders}) GROUP BY ID '  # nosec B608
-                f'ORDER BY CASE ID{case_whens} END;'  # nosec B608
-            )
             params = list(self.LP.node_list) * 2  # once for IN, once for CASE WHEN
             try:
                 self.open_db()
+                sql = (
+                    f'SELECT MAX("Water Level") FROM {_safe_identifier(self.gis_point_layer_name)} '  # nosec B608
+                    f'WHERE {self.id_filter(self.gis_point_layer_name, len(self.LP.node_list))} GROUP BY ID '  # nosec B608
+                    f'ORDER BY CASE ID{case_whens} END;'  # nosec B608
+                )
                 self._cur.execute(sql, params)  # nosec B608
                 for row in self._cur.fetchall():
                     try:
@@ -893,21 +1042,32 @@ class ResData_GPKG(ResData):
         return False, ''
 
     def LP_getData(self, dat_type: str, time: float, dt_tol: float) -> typing.Tuple[bool, str]:
-        values = []
-        for i, node in enumerate(self.LP.node_list):
-            found, data, msg = self.getTSData(node, '1D', dat_type, 'P')
-            if not found:
-                return True, 'Error loading {0}'.format(dat_type)
-            j = self.timeSteps().index(time)
-            v = data[j]
-            values.append(v)
-            if 0 < i < len(self.LP.node_list) - 1:
-                values.append(v)
+        j = time_index(self.timeSteps(), time, dt_tol, None)
+        if j is None:
+            return True, 'Time {0} not found in results'.format(time)
+        err, msg, data = self.LP_getDataAll(dat_type)
+        if err:
+            return err, msg
 
         if dat_type == 'Water Level':
-            self.LP.Hdata = values
+            self.LP.Hdata = data[j]
         return False, ''
 
+    def LP_getDataAll(self, dat_type: str) -> typing.Tuple[bool, str, np.ndarray]:
+        """Long profile data for all timesteps (time x profile point). Nodes are queried together
+        (getTSDataMany) rather than one query per node and the array is kept until the profile changes."""
+        if dat_type in self.LP.temporal:
+            return False, '', self.LP.temporal[dat_type]
+        if dat_type not in self.pointResultTypesTS():
+            return True, 'Error loading {0}'.format(dat_type), None
+
+        found, values, msg = self.getTSDataMany(self.LP.node_list, '1D', dat_type)
+        if not found:
+            return True, 'Error loading {0}'.format(dat_type), None
+
+        self.LP.temporal[dat_type] = lp_profile_values(values)
+        return False, '', self.LP.temporal[dat_type]
+
     def getGeometry(self):
         pass
 
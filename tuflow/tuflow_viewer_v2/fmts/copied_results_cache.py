@@ -0,0 +1,284 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+from datetime import datetime
+from pathlib import Path
+
+import logging
+logger = logging.getLogger('tuflow_viewer')
+
+
+HASH_CHUNK_SIZE = 8 * 1024 * 1024  # bytes read at a time when hashing result files
+PARTIAL_HASH_SIZE = 1024 * 1024  # bytes read from each end of a file for the quick comparison
+
+
+class CopiedResultsCache:
+    """Manages the local copies of results made by CopyOnLoadMixin.
+
+    Copies are stored in their own folder under ~/.tuflow_plugin/tuflow_viewer/copied_results and are tracked in
+    mapped_paths.json as {source: [copy, source mtime, last used, sha1]}. Older versions of the plugin wrote
+    [copy, source mtime] entries - these are still read and are upgraded when the entry is next saved.
+
+    The cache is kept under a size limit by deleting the least recently used copies. Copies that are locked
+    (open in QGIS), loaded in the TUFLOW Viewer, or still being copied in the background are never deleted. Sources with the same contents
+    share a single copy. Contents are compared with a sha1 hash, which is only calculated when the file sizes and
+    a hash of the start and end of the files (partial_hash) match.
+    """
+
+    SUB_DIR = 'tuflow_viewer/copied_results'
+    MAPPING_FILE = 'tuflow_viewer/copied_results/mapped_paths.json'
+
+    # copies being written by a background copy - shared by all instances as they are created per operation
+    _pending: set[Path] = set()
+
+    def __init__(self, max_size_gb: float = 0.):
+        self.max_size = int(max_size_gb * 1024 ** 3) if max_size_gb and max_size_gb > 0 else 0
+
+    @staticmethod
+    def root() -> Path:
+        from ...tuflow_plugin_cache import cache_dir
+        return Path(cache_dir(CopiedResultsCache.SUB_DIR))
+
+    def mapped_paths(self) -> dict:
+        from ...tuflow_plugin_cache import get_cached_content
+        mapped_paths = get_cached_content(self.MAPPING_FILE, str)
+        try:
+            mapped_paths = json.loads(mapped_paths) if mapped_paths else {}
+        except json.JSONDecodeError:
+            logger.warning('Copied results mapping file is corrupt, starting a new one')
+            return {}
+        for src, entry in mapped_paths.items():
+            if len(entry) < 4:
+                mapped_paths[src] = list(entry[:2]) + [entry[1], None]  # last used defaults to source mtime
+        return mapped_paths
+
+    def save_mapped_paths(self, mapped_paths: dict):
+        from ...tuflow_plugin_cache import save_cached_content
+        save_cached_content(self.MAPPING_FILE, json.dumps(mapped_paths, indent=2))
+
+    def new_path(self, fpath: Path | str) -> Path:
+        fpath = Path(fpath)
+        name = f'{fpath.stem}_{fpath.suffix[1:]}_{hex(int(datetime.now().timestamp()))[2:]}_{hex(int(os.path.getmtime(fpath)))[2:]}'
+        return self.root() / name / fpath.name
+
+    def lookup(self, fpath: Path | str) -> Path | None:
+        """Returns the copy of the file if it exists and is up to date, and marks it as used."""
+        mapped_paths = self.mapped_paths()
+        entry = mapped_paths.get(str(fpath))
+        if not entry or not Path(entry[0]).exists() or entry[1] != os.path.getmtime(fpath):
+            return None
+        entry[2] = time.time()
+        self.save_mapped_paths(mapped_paths)
+        return Path(entry[0])
+
+    def find_duplicate(self, fpath: Path | str) -> tuple[Path | None, str | None]:
+        """Returns an existing copy with the same contents as the file and the sha1 of the file (None if it
+        wasn't needed). The whole file is only hashed if an existing copy has the same size and partial hash, so
+        usually only the start and end of the (possibly remote) file are read. Pass the sha1 to add() so it
+        isn't calculated again.
+        """
+        mapped_paths = self.mapped_paths()
+        size = os.path.getsize(fpath)
+        candidates = {}  # copy: [entries]
+        for src, entry in mapped_paths.items():
+            if src != str(fpath) and Path(entry[0]).exists() and os.path.getsize(entry[0]) == size:
+                candidates.setdefault(entry[0], []).append(entry)
+        if candidates:
+            partial = self.partial_hash(fpath)
+            candidates = {k: v for k, v in candidates.items() if self.partial_hash(k) == partial}
+        if not candidates:
+            return None, None
+
+        sha1 = self.file_hash(fpath)
+        found = None
+        for dst, entries in candidates.items():
+            dst_hash = next((x[3] for x in entries if x[3]), None)
+            if dst_hash is None:
+                dst_hash = self.file_hash(dst)
+                for entry in entries:
+                    entry[3] = dst_hash
+            if dst_hash == sha1:
+                found = Path(dst)
+                break
+        self.save_mapped_paths(mapped_paths)
+        return found, sha1
+
+    def add(self, fpath: Path | str, dst: Path | str, sha1: str = None, mtime: float = None):
+        """Record a copy of the file. mtime is the source modified time when the copy started (defaults to now)."""
+        mapped_paths = self.mapped_paths()
+        if sha1 is None:
+            # copy is shared with an identical file that has already been hashed
+            sha1 = next((x[3] for k, x in mapped_paths.items() if k != str(fpath) and x[0] == str(dst) and x[3]), None)
+        mtime = os.path.getmtime(fpath) if mtime is None else mtime
+        mapped_paths[str(fpath)] = [str(dst), mtime, time.time(), sha1]
+        self.save_mapped_paths(mapped_paths)
+
+    def is_shared(self, fpath: Path | str, dst: Path | str) -> bool:
+        """Returns True if another source file also maps to the copy."""
+        return any(x[0] == str(dst) for src, x in self.mapped_paths().items() if src != str(fpath))
+
+    @staticmethod
+    def is_cached_copy(fpath: Path | str) -> bool:
+        """Returns True if the file is a copy in the cache (rather than an original result file)."""
+        return CopiedResultsCache.root().resolve() in Path(fpath).resolve().parents
+
+    def discard(self, fpath: Path | str) -> bool:
+        """Delete a copy that has been replaced. Only deleted if it is in the cache, no source file maps to it,
+        and it isn't locked. Returns True if the copy was deleted.
+        """
+        fpath = Path(fpath)
+        if not self.is_cached_copy(fpath) or not fpath.exists() or fpath.parent.resolve() == self.root().resolve():
+            return False
+        if any(Path(x[0]) == fpath for x in self.mapped_paths().values()):
+            return False
+        if self.is_locked(fpath):
+            logger.info('Original copied file is locked, cannot remove: {}'.format(fpath))
+            return False
+        self.remove(fpath.parent)
+        logger.info('Deleted previously copied file: {}'.format(fpath))
+        return True
+
+    @staticmethod
+    def partial_hash(fpath: Path | str) -> str:
+        """Hash of the file size and the first and last PARTIAL_HASH_SIZE bytes - quick check before file_hash."""
+        size = os.path.getsize(fpath)
+        sha1 = hashlib.sha1(str(size).encode())
+        with open(fpath, 'rb') as f:
+            sha1.update(f.read(PARTIAL_HASH_SIZE))
+            if size > PARTIAL_HASH_SIZE:
+                f.seek(max(PARTIAL_HASH_SIZE, size - PARTIAL_HASH_SIZE))
+                sha1.update(f.read())
+        return sha1.hexdigest()
+
+    @staticmethod
+    def file_hash(fpath: Path | str) -> str:
+        sha1 = hashlib.sha1()
+        with open(fpath, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                sha1.update(chunk)
+        return sha1.hexdigest()
+
+    @staticmethod
+    def is_locked(fpath: Path | str) -> bool:
+        try:
+            with open(fpath, 'rb+'):
+                pass
+        except FileNotFoundError:
+            return False
+        except Exception:
+            return True
+        return False
+
+    @staticmethod
+    def in_use() -> set[Path]:
+        """Returns the copies that are loaded in the TUFLOW Viewer."""
+        from ..tvinstance import get_viewer_instance
+        viewer = get_viewer_instance()
+        if viewer is None:
+            return set()
+        return {Path(x) for output in viewer.outputs() for x in getattr(output, 'copied_files', {})}
+
+    def copies(self) -> list[Path]:
+        """Returns the folders of all copies in the cache, including folders no longer in the mapping file."""
+        root = self.root()
+        if not root.exists():
+            return []
+        return [x for x in root.iterdir() if x.is_dir()]
+
+    @staticmethod
+    def folder_size(folder: Path) -> int:
+        size = 0
+        for dirpath, _, filenames in os.walk(folder):
+            for fname in filenames:
+                try:
+                    size += os.path.getsize(os.path.join(dirpath, fname))
+                except OSError:
+                    pass
+        return size
+
+    @staticmethod
+    def add_pending(dst: Path | str):
+        """Mark a copy as being written so it isn't evicted before it is finished (and added to the mapping)."""
+        CopiedResultsCache._pending.add(Path(dst))
+
+    @staticmethod
+    def remove_pending(dst: Path | str):
+        CopiedResultsCache._pending.discard(Path(dst))
+
+    @staticmethod
+    def is_pending(folder: Path) -> bool:
+        return any(x.parent == folder for x in CopiedResultsCache._pending)
+
+    def removable(self, folder: Path, in_use: set[Path]) -> bool:
+        if self.is_pending(folder):
+            return False
+        for file in folder.iterdir():
+            if file in in_use or self.is_locked(file):
+                return False
+        return True
+
+    def remove(self, folder: Path) -> int:
+        """Delete a copy folder and any mapping to it. Returns the number of bytes freed."""
+        size = self.folder_size(folder)
+        shutil.rmtree(folder, ignore_errors=True)
+        if folder.exists():
+            return size - self.folder_size(folder)
+        mapped_paths = self.mapped_paths()
+        for src in [k for k, v in mapped_paths.items() if Path(v[0]).parent == folder]:
+            del mapped_paths[src]
+        self.save_mapped_paths(mapped_paths)
+        return size
+
+    def evict(self, required: int = 0) -> int:
+        """
+        Delete least recently used copies until the cache plus the required bytes fits within the size limit.
+        Folders that are not in the mapping file (e.g. left behind when an older copy was locked) are deleted first.
+        Returns the number of bytes freed.
+        """
+        if not self.max_size:
+            return 0
+        folders = {x: self.folder_size(x) for x in self.copies()}
+        total = sum(folders.values())
+        if total + required <= self.max_size:
+            return 0
+
+        last_used = {}
+        for entry in self.mapped_paths().values():
+            folder = Path(entry[0]).parent
+            last_used[folder] = max(last_used.get(folder, 0.), entry[2] or 0.)
+        in_use = self.in_use()
+        freed = 0
+        for folder in sorted(folders, key=lambda x: last_used.get(x, -1.)):
+            if total + required - freed <= self.max_size:
+                break
+            if not self.removable(folder, in_use):
+                continue
+            logger.info('Removing copied results to keep cache within size limit: {}'.format(folder))
+            freed += self.remove(folder)
+        if total + required - freed > self.max_size:
+            logger.warning('Copied results cache is over the size limit but remaining copies are in use')
+        return freed
+
+    def stats(self) -> dict:
+        """Returns the number of copies, size (bytes), size limit (bytes) and number of copies in use."""
+        in_use = self.in_use()
+        folders = self.copies()
+        return {
+            'count': len(folders),
+            'size': sum(self.folder_size(x) for x in folders),
+            'max_size': self.max_size,
+            'in_use': sum(1 for x in folders if not self.removable(x, in_use)),
+        }
+
+    def cleanup(self) -> int:
+        """Delete all copies that are not in use. Returns the number of bytes freed."""
+        in_use = self.in_use()
+        freed = 0
+        for folder in self.copies():
+            if self.removable(folder, in_use):
+                freed += self.remove(folder)
+        mapped_paths = self.mapped_paths()
+        self.save_mapped_paths({k: v for k, v in mapped_paths.items() if Path(v[0]).exists()})
+        return freed
@@ -1,9 +1,8 @@
-import json
 import os
-from datetime import datetime
 from pathlib import Path
 
-from qgis.core import QgsMapLayer
+from qgis.core import QgsMapLayer, Qgis
+from qgis.PyQt.QtCore import QTimer
 from qgis.PyQt.QtCore import QSettings
 
 if not QSettings().value('TUFLOW/TestCase', False, type=bool):
@@ -11,6 +10,8 @@ if not QSettings().value('TUFLOW/TestCase', False, type=bool):
 else:
     from tuflow.pt.pytuflow import TuflowPath
 
+from .copied_results_cache import CopiedResultsCache
+
 import logging
 logger = logging.getLogger('tuflow_viewer')
 
@@ -18,52 +19,102 @@ logger = logging.getLogger('tuflow_viewer')
 class CopyOnLoadMixin:
     """Mixin to add copy on load functionality to mesh drivers."""
 
+    def copied_results_cache(self) -> CopiedResultsCache:
+        from ..tvinstance import get_viewer_instance
+        viewer = get_viewer_instance()
+        max_size = viewer.settings.copy_results_cache_size if viewer is not None else 0.
+        return CopiedResultsCache(max_size)
+
     def mapped_paths(self):
-        from ...tuflow_plugin_cache import get_cached_content
-        mapped_paths = get_cached_content('tuflow_viewer/copied_results/mapped_paths.json', str)
-        return json.loads(mapped_paths) if mapped_paths else {}
+        return self.copied_results_cache().mapped_paths()
 
     def save_mapped_paths(self, mapped_paths: dict):
-        from ...tuflow_plugin_cache import save_cached_content
-        save_cached_content('tuflow_viewer/copied_results/mapped_paths.json', json.dumps(mapped_paths, indent=2))
+        self.copied_results_cache().save_mapped_paths(mapped_paths)
 
     def new_path(self, fpath: Path | str) -> Path:
-        from ...tuflow_plugin_cache import cache_dir
-        fpath = Path(fpath)
-        name = f'{fpath.stem}_{fpath.suffix[1:]}_{hex(int(datetime.now().timestamp()))[2:]}_{hex(int(os.path.getmtime(fpath)))[2:]}'
-        return Path(cache_dir('tuflow_viewer/copied_results')) / name / fpath.name
+        return self.copied_results_cache().new_path(fpath)
 
     def copy(self, fpath: Path) -> Path:
-        from ...utils.copy_file import copy_file_with_progbar
+        from ...utils.copy_file import copy_file_with_progbar, copy_file_in_background
         from qgis.utils import iface
 
         logger.info('Copying file before loading into QGIS')
-        mapped_paths = self.mapped_paths()
-        dst, mtime = mapped_paths[str(fpath)] if str(fpath) in mapped_paths else [self.new_path(fpath), -1]
-        dst = Path(dst)
-        if dst.exists() and mtime == os.path.getmtime(fpath):
+        cache = self.copied_results_cache()
+        dst = cache.lookup(fpath)
+        if dst is not None:
             logger.info('Copied file already exists and is up to date, using existing copy: {}'.format(dst))
             return dst
 
-        if dst.exists() and mtime < os.path.getmtime(fpath):
+        dst, sha1 = cache.find_duplicate(fpath)
+        if dst is not None:
+            logger.info('Identical file has already been copied, using existing copy: {}'.format(dst))
+            cache.add(fpath, dst, sha1=sha1)
+            return dst
+
+        mapped_paths = cache.mapped_paths()
+        dst = Path(mapped_paths[str(fpath)][0]) if str(fpath) in mapped_paths else cache.new_path(fpath)
+        if dst.exists():
             logger.info('Copied file exists but is outdated, creating new copy')
-            try:
-                with open(dst, 'rb+'):
-                    pass
-                # old file is not locked, safe to copy over
-            except Exception:
-                dst = self.new_path(fpath)
-                logger.info('Original copied file is locked, copying to a new location')
+            if cache.is_shared(fpath, dst) or cache.is_locked(dst):
+                dst = cache.new_path(fpath)
+                logger.info('Original copied file is locked or shared, copying to a new location')
 
+        cache.evict(os.path.getsize(fpath))
         parent = iface.mainWindow() if iface is not None else None
         if not dst.parent.exists():
             dst.parent.mkdir(parents=True)
+        if self.copy_in_background(fpath):
+            logger.info('Loading original file while it is copied in the background')
+            mtime = os.path.getmtime(fpath)
+            size = os.path.getsize(fpath)
+            cache.add_pending(dst)
+            copy_file_in_background(
+                fpath, dst,
+                lambda x: self.background_copy_finished(fpath, dst, mtime, size=size, sha1=sha1),
+                lambda e: self.background_copy_failed(dst, e)
+            )
+            return Path(fpath)
         copy_file_with_progbar(fpath, dst, parent=parent)
         logger.info(f'Copied file to: {dst}')
-        mapped_paths[str(fpath)] = [str(dst), os.path.getmtime(fpath)]
-        self.save_mapped_paths(mapped_paths)
+        cache.add(fpath, dst, sha1=sha1)
         return dst
 
+    def copy_in_background(self, fpath: Path) -> bool:
+        """Returns True if the original file should be loaded straight away and swapped for the copy once the
+        copy is complete. Swapping the XMDF data source requires QGIS 3.42 or later.
+        """
+        from ..tvinstance import get_viewer_instance
+        viewer = get_viewer_instance()
+        if viewer is None or not viewer.settings.copy_results_in_background:
+            return False
+        return Path(fpath).suffix.lower() != '.xmdf' or Qgis.QGIS_VERSION_INT >= 34200
+
+    def background_copy_finished(self, fpath: Path, dst: Path, mtime: float, attempt: int = 0, size: int = None,
+                                 sha1: str = None):
+        """Switch outputs that are using the original file over to the copy. Called in the GUI thread."""
+        from ..tvinstance import get_viewer_instance
+        if attempt == 0:
+            cache = self.copied_results_cache()
+            cache.remove_pending(dst)
+            if size is not None and (not Path(dst).exists() or os.path.getsize(dst) != size):
+                logger.error(f'Copied file is incomplete, continuing to use original file: {dst}')
+                return
+            logger.info(f'Copied file to: {dst}')
+            cache.add(fpath, dst, sha1=sha1, mtime=mtime)
+        viewer = get_viewer_instance()
+        outputs = [x for x in viewer.outputs() if str(fpath) in getattr(x, 'copied_files', {})] if viewer else []
+        if not outputs:
+            # copy can finish before the output has been added to the viewer
+            if attempt < 10:
+                QTimer.singleShot(1000, lambda: self.background_copy_finished(fpath, dst, mtime, attempt + 1))
+            return
+        for output in outputs:
+            output.set_data_source(Path(dst))
+
+    def background_copy_failed(self, dst: Path, e: Exception):
+        self.copied_results_cache().remove_pending(dst)
+        logger.error(f'Failed to copy file, continuing to use original file: {e}')
+
     def reload_layer(self, layer: QgsMapLayer, copied_map: dict):
         from ...utils.copy_file import copy_file_with_progbar
         from ..tvinstance import get_viewer_instance
@@ -86,13 +137,13 @@ class CopyOnLoadMixin:
             logger.info('Copied file is up to date, no need to reload layer')
             return
 
-        new_dst = self.new_path(src)
+        cache = self.copied_results_cache()
+        new_dst = cache.new_path(src)
         logger.info('Copying updated file into: {}'.format(new_dst))
+        cache.evict(os.path.getsize(src))
         parent = iface.mainWindow() if iface is not None else None
         if not new_dst.parent.exists():
             new_dst.parent.mkdir(parents=True)
         output = get_viewer_instance().map_layer_to_output(layer)
-        mapped_paths = self.mapped_paths()
-        mapped_paths[str(src)] = [str(new_dst), os.path.getmtime(src)]
-        self.save_mapped_paths(mapped_paths)
+        cache.add(src, new_dst)
         copy_file_with_progbar(src, new_dst, parent, lambda x: output.set_data_source(new_dst))
@@ -1,5 +1,4 @@
 import os
-import shutil
 from pathlib import Path
 
 import numpy as np
@@ -19,6 +18,7 @@ from .nc_grid_layer import NetCDFGridLayer
 from ..tvinstance import get_viewer_instance
 from ..temporal_controller_widget import temporal_controller
 from .copy_on_load_mixin import CopyOnLoadMixin
+from .copied_results_cache import CopiedResultsCache
 
 if not QSettings().value('TUFLOW/TestCase', False, type=bool):
     from ...pt.pytuflow import NCGrid as NCGridBase
@@ -98,14 +98,7 @@ class NCGrid(NCGridBase, MapOutputMixin, CopyOnLoadMixin):
         self.copied_files.clear()
         self.copied_files[str(new_fpath)] = (str(orig[0]), os.path.getmtime(orig[0]))
 
-        try:
-            with open(old_src, 'rb+'):
-                pass
-            Path(old_src).unlink()
-            shutil.rmtree(Path(old_src).parent, ignore_errors=True)
-            logger.info('Deleted previously copied file: {}'.format(old_src))
-        except Exception:
-            logger.info('Original copied file is locked, cannot remove: {}'.format(old_src))
+        CopiedResultsCache().discard(old_src)
 
         self.init_temporal_properties()
         self._init_styling(self._map_layers, self._lyr2resultstyle)
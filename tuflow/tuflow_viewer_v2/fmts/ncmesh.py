@@ -1,5 +1,4 @@
 from pathlib import Path
-import shutil
 import os
 
 from qgis.PyQt.QtCore import QSettings
@@ -8,6 +7,7 @@ from qgis.core import QgsMeshLayer
 from .mesh_mixin import MeshMixin
 from .qgis_mesh_api_mixin import QgisMeshAPIMixin
 from .pyncmesh import PyNCMesh
+from .copied_results_cache import CopiedResultsCache
 
 if not QSettings().value('TUFLOW/TestCase', False, type=bool):
     from ...pt.pytuflow import NCMesh as NCMeshBase
@@ -81,14 +81,7 @@ class NCMesh(NCMeshBase, MeshMixin, QgisMeshAPIMixin):
         self.copied_files.clear()
         self.copied_files[str(new_fpath)] = (str(orig[0]), os.path.getmtime(orig[0]))
 
-        try:
-            with open(old_src, 'rb+'):
-                pass
-            Path(old_src).unlink()
-            shutil.rmtree(Path(old_src).parent, ignore_errors=True)
-            logger.info('Deleted previously copied file: {}'.format(old_src))
-        except Exception:
-            logger.info('Original copied file is locked, cannot remove: {}'.format(old_src))
+        CopiedResultsCache().discard(old_src)
 
         self.init_temporal_properties()
         self._init_styling(self._map_layers, self._lyr2resultstyle)
@@ -1,6 +1,5 @@
 import json
 import os
-import shutil
 from pathlib import Path
 
 from qgis.core import (QgsMeshLayer, QgsProject, Qgis, QgsMeshDatasetIndex)
@@ -9,6 +8,7 @@ from qgis.PyQt.QtCore import QSettings, QDateTime, QDate, QTime, QTimeZone, QTim
 from .mesh_mixin import MeshMixin
 from .qgis_mesh_api_mixin import QgisMeshAPIMixin
 from .pyxmdf import PyXMDF
+from .copied_results_cache import CopiedResultsCache
 
 if not QSettings().value('TUFLOW/TestCase', False, type=bool):
     from ...pt.pytuflow import XMDF as XMDFBase, Output, Mesh
@@ -177,14 +177,7 @@ class XMDF(XMDFBase, MeshMixin, QgisMeshAPIMixin):
         self._layer.reload()
         self._initial_load()
 
-        try:
-            with open(old_src, 'rb+'):
-                pass
-            Path(old_src).unlink()
-            shutil.rmtree(Path(old_src).parent, ignore_errors=True)
-            logger.info('Deleted previously copied file: {}'.format(old_src))
-        except Exception:
-            logger.info('Original copied file is locked, cannot remove: {}'.format(old_src))
+        CopiedResultsCache().discard(old_src)
 
         for extra in self._layer.dataProvider().extraDatasets():
             if extra == str(new_fpath):
@@ -0,0 +1,223 @@
+import os
+import tempfile
+import time
+from pathlib import Path
+from unittest import TestCase, mock
+
+from .stubs.qgis_stubs import QGIS
+
+from ... import tuflow_plugin_cache
+from ..fmts import copied_results_cache
+from ..fmts.copied_results_cache import CopiedResultsCache
+
+
+class TestCopiedResultsCache(TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmpdir.name)
+        cache_root = self.dir / 'cache'
+        patcher = mock.patch.object(tuflow_plugin_cache, 'cache_dir',
+                                    lambda sub_dir='': cache_root / sub_dir if sub_dir else cache_root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(CopiedResultsCache, 'in_use', return_value=set())
+        self.in_use = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache = CopiedResultsCache()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def source(self, name: str, content: bytes = b'x' * 1000) -> Path:
+        p = self.dir / 'results' / name
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_bytes(content)
+        return p
+
+    def copy(self, src: Path, last_used: float = None) -> Path:
+        dst = self.cache.new_path(src)
+        dst.parent.mkdir(parents=True)
+        dst.write_bytes(src.read_bytes())
+        self.cache.add(src, dst)
+        if last_used is not None:
+            mapped_paths = self.cache.mapped_paths()
+            mapped_paths[str(src)][2] = last_used
+            self.cache.save_mapped_paths(mapped_paths)
+        return dst
+
+    def copies(self, name: str) -> list[Path]:
+        return [x for x in self.cache.copies() if x.name.startswith(name)]
+
+    def test_lookup(self):
+        src = self.source('a.nc')
+        dst = self.copy(src)
+        self.assertEqual(dst, self.cache.lookup(src))
+
+    def test_lookup_source_changed(self):
+        src = self.source('a.nc')
+        self.copy(src)
+        t = os.path.getmtime(src) + 10
+        os.utime(src, (t, t))
+        self.assertIsNone(self.cache.lookup(src))
+
+    def test_evict_least_recently_used(self):
+        now = time.time()
+        srcs = [self.source('{0}.nc'.format(x)) for x in 'abc']
+        self.copy(srcs[0], now - 10)
+        self.copy(srcs[1], now - 30)
+        self.copy(srcs[2], now - 20)
+        self.cache.max_size = 2500
+
+        self.assertEqual(1000, self.cache.evict())
+        self.assertIsNotNone(self.cache.lookup(srcs[0]))
+        self.assertIsNone(self.cache.lookup(srcs[1]))
+        self.assertIsNotNone(self.cache.lookup(srcs[2]))
+        self.assertNotIn(str(srcs[1]), self.cache.mapped_paths())
+        self.assertEqual([], self.copies('b_nc'))
+
+    def test_evict_required(self):
+        now = time.time()
+        srcs = [self.source('{0}.nc'.format(x)) for x in 'ab']
+        self.copy(srcs[0], now - 10)
+        self.copy(srcs[1], now - 20)
+        self.cache.max_size = 2500
+
+        self.assertEqual(0, self.cache.evict())
+        self.assertEqual(1000, self.cache.evict(1000))
+        self.assertIsNotNone(self.cache.lookup(srcs[0]))
+        self.assertIsNone(self.cache.lookup(srcs[1]))
+
+    def test_evict_skips_in_use(self):
+        now = time.time()
+        srcs = [self.source('{0}.nc'.format(x)) for x in 'abc']
+        dst = self.copy(srcs[0], now - 30)
+        self.copy(srcs[1], now - 20)
+        self.copy(srcs[2], now - 10)
+        self.in_use.return_value = {dst}
+        self.cache.max_size = 2500
+
+        self.assertEqual(1000, self.cache.evict())
+        self.assertEqual(dst, self.cache.lookup(srcs[0]))
+        self.assertIsNone(self.cache.lookup(srcs[1]))
+
+    def test_evict_no_limit(self):
+        self.copy(self.source('a.nc'))
+        self.assertEqual(0, self.cache.evict(10 ** 12))
+        self.assertEqual(1, len(self.cache.copies()))
+
+    def test_find_duplicate(self):
+        src = self.source('a.nc')
+        dst = self.copy(src)
+        found, sha1 = self.cache.find_duplicate(self.source('b.nc'))
+        self.assertEqual(dst, found)
+        self.assertEqual(CopiedResultsCache.file_hash(src), sha1)
+        self.assertEqual(sha1, self.cache.mapped_paths()[str(src)][3])
+
+    def test_find_duplicate_same_size_different_contents(self):
+        self.copy(self.source('a.nc'))
+        with mock.patch.object(CopiedResultsCache, 'file_hash') as file_hash:
+            self.assertEqual((None, None), self.cache.find_duplicate(self.source('b.nc', b'y' * 1000)))
+        file_hash.assert_not_called()  # partial hashes don't match
+
+    def test_find_duplicate_different_middle(self):
+        with mock.patch.object(copied_results_cache, 'PARTIAL_HASH_SIZE', 10):
+            self.copy(self.source('a.nc'))
+            found, sha1 = self.cache.find_duplicate(self.source('b.nc', b'x' * 500 + b'y' + b'x' * 499))
+        self.assertIsNone(found)
+        self.assertEqual(CopiedResultsCache.file_hash(self.source('c.nc', b'x' * 500 + b'y' + b'x' * 499)), sha1)
+
+    def test_find_duplicate_different_size(self):
+        self.copy(self.source('a.nc'))
+        with mock.patch.object(CopiedResultsCache, 'file_hash') as file_hash:
+            self.assertEqual((None, None), self.cache.find_duplicate(self.source('b.nc', b'x' * 999)))
+        file_hash.assert_not_called()
+
+    def test_find_duplicate_source_changed(self):
+        # the copy is of the old contents - a file matching the new contents isn't a duplicate
+        src = self.source('a.nc')
+        dst = self.copy(src)
+        self.cache.find_duplicate(self.source('b.nc'))  # stores the hash of the copy
+        src.write_bytes(b'y' * 1000)
+        t = os.path.getmtime(src) + 10
+        os.utime(src, (t, t))
+
+        self.assertIsNone(self.cache.lookup(src))
+        self.assertIsNone(self.cache.find_duplicate(self.source('c.nc', b'y' * 1000))[0])
+        self.assertEqual(dst, self.cache.find_duplicate(self.source('d.nc'))[0])
+
+    def test_add_shared_copy_uses_hash(self):
+        src = self.source('a.nc')
+        dst = self.copy(src)
+        other = self.source('b.nc')
+        found, sha1 = self.cache.find_duplicate(other)
+        self.assertEqual(dst, found)
+        self.cache.add(other, dst, sha1=sha1)
+        mapped_paths = self.cache.mapped_paths()
+        self.assertEqual(mapped_paths[str(src)][3], mapped_paths[str(other)][3])
+        self.assertTrue(self.cache.is_shared(src, dst))
+
+    def test_evict_orphans_first(self):
+        now = time.time()
+        src = self.source('a.nc')
+        self.copy(src, now - 30)
+        orphan = self.cache.root() / 'orphan'
+        orphan.mkdir()
+        (orphan / 'b.nc').write_bytes(b'x' * 1000)
+        self.cache.max_size = 1500
+
+        self.assertEqual(1000, self.cache.evict())
+        self.assertFalse(orphan.exists())
+        self.assertIsNotNone(self.cache.lookup(src))
+
+    def pending(self, name: str) -> Path:
+        """Copy being written in the background - no mapping until it has finished."""
+        dst = self.cache.new_path(self.source(name))
+        dst.parent.mkdir(parents=True)
+        dst.write_bytes(b'x' * 1000)
+        self.cache.add_pending(dst)
+        self.addCleanup(self.cache.remove_pending, dst)
+        return dst
+
+    def test_evict_skips_pending(self):
+        src = self.source('a.nc')
+        self.copy(src, time.time() - 10)
+        pending = self.pending('b.nc')
+        self.cache.max_size = 1500
+
+        self.assertEqual(1000, self.cache.evict())
+        self.assertTrue(pending.exists())
+        self.assertIsNone(self.cache.lookup(src))
+
+    def test_cleanup_skips_pending(self):
+        pending = self.pending('a.nc')
+        self.assertEqual(0, self.cache.cleanup())
+        self.assertTrue(pending.exists())
+        self.cache.remove_pending(pending)
+        self.assertEqual(1000, self.cache.cleanup())
+
+    def test_cleanup(self):
+        srcs = [self.source('{0}.nc'.format(x)) for x in 'ab']
+        dst = self.copy(srcs[0])
+        self.copy(srcs[1])
+        orphan = self.cache.root() / 'orphan'
+        orphan.mkdir()
+        (orphan / 'c.nc').write_bytes(b'x' * 1000)
+        self.in_use.return_value = {dst}
+
+        self.assertEqual(2000, self.cache.cleanup())
+        self.assertEqual([dst.parent], self.cache.copies())
+        self.assertEqual([str(srcs[0])], list(self.cache.mapped_paths()))
+
+    def test_discard(self):
+        src = self.source('a.nc')
+        old = self.copy(src)
+        new = self.cache.root() / 'new' / src.name
+        new.parent.mkdir()
+        new.write_bytes(src.read_bytes())
+        self.cache.add(src, new)
+
+        self.assertTrue(self.cache.discard(old))
+        self.assertFalse(old.parent.exists())
+        self.assertFalse(self.cache.discard(new))
+        self.assertTrue(new.exists())
@@ -1,8 +1,9 @@
 from qgis.PyQt.QtWidgets import (QWidget, QBoxLayout, QComboBox, QLabel, QVBoxLayout, QHBoxLayout, QRadioButton,
-                                 QButtonGroup)
+                                 QButtonGroup, QDoubleSpinBox, QPushButton)
 from qgis.gui import QgsCollapsibleGroupBox
 
 from ...tvinstance import get_viewer_instance
+from ...fmts.copied_results_cache import CopiedResultsCache
 
 
 class General:
@@ -62,6 +63,57 @@ class General:
         self.copy_on_load_layout.addWidget(self.copy_on_load_yes)
         self.output_loading_layout.addLayout(self.copy_on_load_layout)
 
+        # Loading results / Copy in background
+        self.copy_in_background_layout = QHBoxLayout()
+        self.copy_in_background_label = QLabel('Load original file while copying:')
+        self.copy_in_background_label.setToolTip(
+            'If enabled, results are loaded from the original file straight away and copied in the background.'
+            '\nThe layers are switched over to the copy once it is complete.'
+            '\n\nThe original file is held open until the copy is complete. Requires QGIS 3.42 or later for XMDF.')
+        self.copy_in_background_button_grp = QButtonGroup()
+        self.copy_in_background_no = QRadioButton('No')
+        self.copy_in_background_button_grp.addButton(self.copy_in_background_no)
+        self.copy_in_background_yes = QRadioButton('Yes')
+        self.copy_in_background_button_grp.addButton(self.copy_in_background_yes)
+        if get_viewer_instance().settings.copy_results_in_background:
+            self.copy_in_background_yes.setChecked(True)
+        else:
+            self.copy_in_background_no.setChecked(True)
+        self.copy_in_background_button_grp.buttonClicked.connect(self.copy_in_background_changed)
+        self.copy_in_background_layout.addWidget(self.copy_in_background_label)
+        self.copy_in_background_layout.addStretch()
+        self.copy_in_background_layout.addWidget(self.copy_in_background_no)
+        self.copy_in_background_layout.addWidget(self.copy_in_background_yes)
+        self.output_loading_layout.addLayout(self.copy_in_background_layout)
+
+        # Loading results / Copied results cache size
+        self.copy_cache_size_layout = QHBoxLayout()
+        self.copy_cache_size_label = QLabel('Copied results cache size limit (GB):')
+        self.copy_cache_size_label.setToolTip(
+            'The least recently used copied results are deleted when the cache grows beyond this size.'
+            '\nCopies that are currently loaded are never deleted.\n\nSet to 0 for no limit.')
+        self.copy_cache_size_sb = QDoubleSpinBox()
+        self.copy_cache_size_sb.setRange(0., 100000.)
+        self.copy_cache_size_sb.setDecimals(1)
+        self.copy_cache_size_sb.setValue(get_viewer_instance().settings.copy_results_cache_size)
+        self.copy_cache_size_sb.valueChanged.connect(self.copy_cache_size_changed)
+        self.copy_cache_size_layout.addWidget(self.copy_cache_size_label)
+        self.copy_cache_size_layout.addStretch()
+        self.copy_cache_size_layout.addWidget(self.copy_cache_size_sb)
+        self.output_loading_layout.addLayout(self.copy_cache_size_layout)
+
+        # Loading results / Copied results cache stats and cleanup
+        self.copy_cache_stats_layout = QHBoxLayout()
+        self.copy_cache_stats_label = QLabel()
+        self.copy_cache_clear_btn = QPushButton('Clear Cache')
+        self.copy_cache_clear_btn.setToolTip('Delete all copied results that are not currently loaded.')
+        self.copy_cache_clear_btn.clicked.connect(self.copy_cache_clear)
+        self.copy_cache_stats_layout.addWidget(self.copy_cache_stats_label)
+        self.copy_cache_stats_layout.addStretch()
+        self.copy_cache_stats_layout.addWidget(self.copy_cache_clear_btn)
+        self.output_loading_layout.addLayout(self.copy_cache_stats_layout)
+        self.update_copy_cache_stats()
+
         self.general_layout.addStretch()
         layout.addWidget(self.general_widget)
         self.general_widget.hide()
@@ -76,3 +128,21 @@ class General:
             get_viewer_instance().settings.copy_results_on_load = True
         else:
             get_viewer_instance().settings.copy_results_on_load = False
+
+    def copy_in_background_changed(self, button: QRadioButton):
+        if button == self.copy_in_background_yes:
+            get_viewer_instance().settings.copy_results_in_background = True
+        else:
+            get_viewer_instance().settings.copy_results_in_background = False
+
+    def copy_cache_size_changed(self, value: float):
+        get_viewer_instance().settings.copy_results_cache_size = value
+
+    def update_copy_cache_stats(self):
+        stats = CopiedResultsCache().stats()
+        self.copy_cache_stats_label.setText('Copied results: {0} ({1:.2f} GB, {2} in use)'.format(
+            stats['count'], stats['size'] / 1024 ** 3, stats['in_use']))
+
+    def copy_cache_clear(self):
+        CopiedResultsCache().cleanup()
+        self.update_copy_cache_stats()
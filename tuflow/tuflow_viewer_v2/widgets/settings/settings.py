@@ -39,6 +39,8 @@ class TuflowViewerSettings:
         self.enabled_fmts.callback = self.save
         self.theme_name = 'Light'
         self.copy_results_on_load = False
+        self.copy_results_in_background = False
+        self.copy_results_cache_size = 20.  # GB - least recently used copies are deleted above this. 0 = no limit
 
         self._block_save = False
         self.load()
@@ -1951,6 +1951,7 @@ class tuflowqgis_import_check_dialog(QDialog, Ui_tuflowqgis_import_check):
 from .forms.ui_tuflowqgis_arr2016 import *
 from tuflow.ARR2016.arr_cc_dlg import ARRCCDialog
 from tuflow.ARR2016.ARR_to_TUFLOW import ARR_to_TUFLOW
+from tuflow.ARR2016.downloader import Downloader as ArrDownloader
 
 
 class tuflowqgis_extract_arr2016_dialog(QDialog, Ui_tuflowqgis_arr2016):
@@ -2849,6 +2850,8 @@ class Arr2016(QObject):
 	def run(self):
 		# try:
 		errors = ''
+		# catchments at the same location / in the same region share BOM, datahub and temporal pattern downloads
+		ArrDownloader.enable_cache(True)
 		for i, sys_args in enumerate(self.sys_args):
 			if i > 0:
 				self.updated.emit(i)
@@ -2907,7 +2910,8 @@ class Arr2016(QObject):
 		# 	if type(e) is bytes:
 		# 		e = err.decode('utf-8')
 		# 	errors += e
-		
+
+		ArrDownloader.enable_cache(False)
 		self.finished.emit(errors)
 		
 
@@ -3706,6 +3710,7 @@ class TuOptionsDialog(QDialog, Ui_TuViewOptions):
 		else:
 			self.cbMeshIntCheck.setChecked(False)
 		self.cbParticleDebug.setChecked(self.tuOptions.particlesWriteDebugInfo)
+		self.cbParticleStyledVarsOnly.setChecked(self.tuOptions.particlesStyledVariablesOnly)
 
 		if self.tuOptions.tcfLoadMethod == 'scenario_selection':
 			self.rbByScenSelection.setChecked(True)
@@ -3974,6 +3979,7 @@ class TuOptionsDialog(QDialog, Ui_TuViewOptions):
 		else:
 			self.tuOptions.writeMeshIntersects = False
 		self.tuOptions.particlesWriteDebugInfo = self.cbParticleDebug.isChecked()
+		self.tuOptions.particlesStyledVariablesOnly = self.cbParticleStyledVarsOnly.isChecked()
 
 		# icon size
 		self.tuOptions.iconSize = int(self.cboIconSize.currentText())
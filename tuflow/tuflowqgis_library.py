@@ -7662,6 +7662,7 @@ def isPlotLayer(layer, geom=''):
     if isgpkg:
         res = ResData_GPKG()
         err, _ = res.Load(file_from_data_source(layer.dataProvider().dataSourceUri()))
+        res.close()
         if not err:
             return True
         correctPlotType = [QVariant.LongLong, QVariant.String, QVariant.String, QVariant.String]
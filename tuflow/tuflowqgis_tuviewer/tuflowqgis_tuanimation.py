@@ -6,6 +6,8 @@ import tempfile
 import zipfile
 import subprocess
 import re
+import queue
+import threading
 from datetime import datetime, timedelta
 from qgis.core import QgsApplication as qApp
 from qgis.PyQt.QtWidgets import *
@@ -513,6 +515,7 @@ def composition_set_plots(dialog, cfg, time, layout, dir, layout_type, showCurre
 		else:
 			fname = os.path.join('{0}'.format(cfg['tmpdir']), '{0}-{1}-{2}.svg'.format(l.name(), plot, datetimestr))
 		fig.savefig(fname)
+		plt.close(fig)
 		layoutcfg['plots'][plot]['source'] = fname
 		
 		if cPlot:
@@ -713,7 +716,33 @@ def composition_set_dynamic_text(dialog, cfg, layout):
 			return cText
 	return None
 
-	
+
+def update_composition(layout, time, cfg, dialog, tuResults=None, meshLayer=None):
+	"""
+	Updates the time dependent items (temporal range, time text, plots, dynamic text) of a layout that has already
+	been prepared by prepare_composition or prepare_composition_from_template.
+	"""
+	layoutcfg = cfg['layout']
+	margin = cfg['page margin'] if 'page margin' in cfg else None
+
+	setTemporalRange(tuResults, layout, time, meshLayer)
+
+	composition_set_time(layout, cfg['time text'])
+	if layoutcfg['type'] != 'file' and 'time' in layoutcfg:
+		cTime = findLayoutLabel(layout, 'time')
+		if cTime is not None:
+			cTime.adjustSizeToText()
+			set_item_pos(cTime, layoutcfg['time']['position'], layout, margin)
+
+	if 'plots' in layoutcfg:
+		composition_set_plots(dialog, cfg, time, layout, cfg['tmpdir'], 'template', True, True)
+
+	if layoutcfg['type'] == 'file':
+		cText = composition_set_dynamic_text(dialog, cfg, layout)
+		if cText is not None:
+			fix_label_box_size(layout, cText, layoutcfg)
+
+
 def _page_size(layout, margin):
 	""" returns QgsLayoutSize """
 	main_page = layout.pageCollection().page(0)
@@ -724,7 +753,7 @@ def _page_size(layout, margin):
 	return QgsLayoutSize(width, height)
 
 
-def animation(cfg, iface, progress_fn=None, dialog=None, preview=False):
+def animation(cfg, iface, progress_fn=None, dialog=None, preview=False, video_pipe=None):
 	# get version
 	qv = Qgis.QGIS_VERSION_INT
 
@@ -758,6 +787,7 @@ def animation(cfg, iface, progress_fn=None, dialog=None, preview=False):
 
 	# animate
 	imgnum = 0
+	layout = None
 	#for i in range(count):
 	for i, time in enumerate(timesteps):
 
@@ -842,36 +872,43 @@ def animation(cfg, iface, progress_fn=None, dialog=None, preview=False):
 				dialog.tuView.tuResults.tuResultsParticles.updateActiveTime(time)
 				break
 
-		# Prepare layout
-		layout = QgsPrintLayout(QgsProject.instance())
-		layout.initializeDefaults()
-		layout.setName('tuflow')
-
+		# Prepare layout - only built for the first frame, after that only the time dependent items are updated
 		layoutcfg = cfg['layout']
-		if layoutcfg['type'] == 'file':
-			prepare_composition_from_template(layout, cfg, time, dialog, os.path.dirname(imgfile), True, True,
-			                                  tuResults=tuResults, meshLayer=l)
-			# when using composition from template, match video's aspect ratio to paper size
-			# by updating video's width (keeping the height)
-			aspect = _page_size(layout, margin).width() / _page_size(layout, margin).height()
-			w = int(round(aspect * h))
-		else:  # type == 'default'
-			layout.renderContext().setDpi(dpi)
-			layout.setUnits(QgsUnitTypes.LayoutMillimeters)
-			main_page = layout.pageCollection().page(0)
-			main_page.setPageSize(QgsLayoutSize(w * 25.4 / dpi, h * 25.4 / dpi, QgsUnitTypes.LayoutMillimeters))
-			prepare_composition(layout, time, cfg, layoutcfg, extent, layers, crs, os.path.dirname(imgfile), dialog,
-			                    tuResults=tuResults, meshLayer=l)
+		if layout is None:
+			layout = QgsPrintLayout(QgsProject.instance())
+			layout.initializeDefaults()
+			layout.setName('tuflow')
+
+			if layoutcfg['type'] == 'file':
+				prepare_composition_from_template(layout, cfg, time, dialog, os.path.dirname(imgfile), True, True,
+				                                  tuResults=tuResults, meshLayer=l)
+				# when using composition from template, match video's aspect ratio to paper size
+				# by updating video's width (keeping the height)
+				aspect = _page_size(layout, margin).width() / _page_size(layout, margin).height()
+				w = int(round(aspect * h))
+			else:  # type == 'default'
+				layout.renderContext().setDpi(dpi)
+				layout.setUnits(QgsUnitTypes.LayoutMillimeters)
+				main_page = layout.pageCollection().page(0)
+				main_page.setPageSize(QgsLayoutSize(w * 25.4 / dpi, h * 25.4 / dpi, QgsUnitTypes.LayoutMillimeters))
+				prepare_composition(layout, time, cfg, layoutcfg, extent, layers, crs, os.path.dirname(imgfile), dialog,
+				                    tuResults=tuResults, meshLayer=l)
+			layout_exporter = QgsLayoutExporter(layout)
+		else:
+			update_composition(layout, time, cfg, dialog, tuResults=tuResults, meshLayer=l)
 
 		imgnum += 1
-		fname = imgfile % imgnum
-		layout_exporter = QgsLayoutExporter(layout)
-		image_export_settings = QgsLayoutExporter.ImageExportSettings()
-		image_export_settings.dpi = dpi
-		image_export_settings.imageSize = QSize(w, h)
-		res = layout_exporter.exportToImage(os.path.abspath(fname), image_export_settings)
-		if res != QgsLayoutExporter.Success:
-			raise RuntimeError()
+		if video_pipe is not None:
+			# straight to ffmpeg, no temporary image
+			video_pipe.write(layout_exporter.renderPageToImage(0, QSize(w, h), dpi))
+		else:
+			fname = imgfile % imgnum
+			image_export_settings = QgsLayoutExporter.ImageExportSettings()
+			image_export_settings.dpi = dpi
+			image_export_settings.imageSize = QSize(w, h)
+			res = layout_exporter.exportToImage(os.path.abspath(fname), image_export_settings)
+			if res != QgsLayoutExporter.Success:
+				raise RuntimeError()
 		
 		if preview:
 			return layout
@@ -1391,6 +1428,108 @@ def images_to_video_gif(tmp_img_dir, output_file, fps=10, qual=1,
 	return res == 0, ''
 
 
+def video_pipe_command(output_file, width, height, fps=10, qual=1, ffmpeg_bin="ffmpeg", method1=False,
+                       target_dur=15, frame_count=1):
+	"""
+	ffmpeg command that reads raw BGRA frames from stdin. Output options match images_to_video (method1),
+	images_to_video_gif and images_to_video2.
+	"""
+	gif = os.path.splitext(output_file)[1].upper() == '.GIF'
+	rate = fps if method1 else max(frame_count, 1) / target_dur  # input framerate (not output fps)
+	cmd = [ffmpeg_bin, "-f", "rawvideo", "-pix_fmt", "bgra", "-s", '{0}x{1}'.format(width, height),
+	       '-framerate', f'{rate}']
+	if not method1 and not gif:
+		cmd.extend(['-t', f'{target_dur}'])
+	cmd.extend(['-i', '-'])
+
+	if gif and not method1:
+		cmd.extend(["-filter_complex", "split[v0][v1];[v0]palettegen[p];[v1][p]paletteuse[v]", "-map", "[v]"])
+	elif qual == 0 and method1:  # lossless
+		cmd.extend(["-vcodec", "ffv1"])
+	else:
+		bitrate = 10000 if qual <= 1 else 2000
+		cmd.extend(["-vcodec", "mpeg4", "-b:v", str(bitrate) + "K"])
+
+	cmd.extend(['-r', f'{fps}'])
+	if method1:
+		cmd.extend(['-f', 'avi'])
+	cmd.extend(['-y', output_file])
+
+	return cmd
+
+
+def qimage_to_bytes(image):
+	"""Returns the pixels of a QImage as BGRA bytes (ARGB32 on little endian)."""
+	image = image.convertToFormat(QT_IMAGE_FORMAT_ARGB32)
+	ptr = image.constBits()
+	ptr.setsize(image.height() * image.bytesPerLine())
+	return bytes(ptr)
+
+
+class VideoPipe:
+	"""
+	Streams rendered frames straight into ffmpeg's stdin rather than writing temporary images to disk.
+
+	ffmpeg is started with the first frame (the frame size is not known until the layout is prepared). Frames are
+	passed to a writer thread through a bounded queue so ffmpeg is encoding while the next frame is rendered.
+	"""
+
+	def __init__(self, command, queue_size=8):
+		self.command = command  # callable (width, height) -> ffmpeg command
+		self.proc = None
+		self.error = None
+		self.queue = queue.Queue(maxsize=queue_size)
+		self.thread = None
+		if sys.version_info >= (3, 12):
+			self.log = tempfile.NamedTemporaryFile(prefix="tuflow", suffix=".txt", delete=False, delete_on_close=False)
+		else:
+			self.log = tempfile.NamedTemporaryFile(prefix="tuflow", suffix=".txt", delete=False)
+
+	def _start(self, width, height):
+		cmd = self.command(width, height)
+		self.log.write(str.encode(" ".join(cmd) + "\n\n"))
+		self.log.flush()
+		self.proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=self.log, stderr=self.log)
+		self.thread = threading.Thread(target=self._run, daemon=True)
+		self.thread.start()
+
+	def _run(self):
+		while True:
+			frame = self.queue.get()
+			if frame is None:
+				break
+			if self.error is not None:
+				continue
+			try:
+				self.proc.stdin.write(frame)
+			except (BrokenPipeError, OSError) as e:
+				self.error = e
+
+	def write(self, image):
+		if self.error is not None:
+			return  # ffmpeg has stopped - reported in close()
+		if self.proc is None:
+			self._start(image.width(), image.height())
+		self.queue.put(qimage_to_bytes(image))
+
+	def close(self):
+		"""Waits for ffmpeg to finish. Returns success and the path to the log file."""
+		res = -1
+		if self.proc is not None:
+			self.queue.put(None)
+			self.thread.join()
+			try:
+				self.proc.stdin.close()
+			except OSError:
+				pass
+			res = self.proc.wait()
+		self.log.close()
+		success = res == 0 and self.error is None
+		if success:
+			os.remove(self.log.name)
+		return success, self.log.name
+
+
 class TuAnimationDialog(QDialog, Ui_AnimationDialog):
 	
 	INSERT_BEFORE = 0
@@ -3152,23 +3291,25 @@ class TuAnimationDialog(QDialog, Ui_AnimationDialog):
 		for pb, dialog in self.pbDialogs.items():
 			dialog.setDefaults(self, self.dialog2Plot[dialog][0].text(), self.dialog2Plot[dialog][1].text().split(';;'),
 			                   xAxisDates=self.tuView.tuOptions.xAxisDates)
-		self.layout = animation(d, self.iface, prog, self, preview)
+		video_pipe = None
+		if not preview:
+			frame_count = len([x for x in timesteps if tStart <= x <= tEnd])
+			quality = self.quality() if m1 else max(1, self.quality())  # lossless only supported by method 1
+			video_pipe = VideoPipe(lambda w_, h_: video_pipe_command(output_file, w_, h_, fps, quality, self.ffmpeg_bin,
+			                                                         m1, target_dur, frame_count))
+		try:
+			self.layout = animation(d, self.iface, prog, self, preview, video_pipe)
+		except Exception:
+			if video_pipe is not None:
+				video_pipe.close()
+			raise
 		self.tuView.tuPlot.updateCurrentPlot(0, retain_flow=True)
 		self.tuView.tuPlot.updateCurrentPlot(1)
 		
 		if preview:
 			self.iface.openLayoutDesigner(layout=self.layout)
 		else:
-			if m1:
-				ffmpeg_res, logfile = images_to_video(img_output_tpl, output_file, fps, self.quality(), self.ffmpeg_bin)
-			else:
-				if os.path.splitext(output_file)[1].upper() == '.GIF':
-					ffmpeg_res, logfile = images_to_video_gif(img_output_tpl, output_file, fps, self.quality(),
-					                                          self.ffmpeg_bin, target_dur)
-				else:
-					# remove lossless - doesn't seem to work very well and doesn't support mp4
-					ffmpeg_res, logfile = images_to_video2(img_output_tpl, output_file, fps, max(1, self.quality()), self.ffmpeg_bin,
-					                                       target_dur)
+			ffmpeg_res, logfile = video_pipe.close()
 			
 			if ffmpeg_res:
 				shutil.rmtree(tmpdir)
@@ -3188,8 +3329,7 @@ class TuAnimationDialog(QDialog, Ui_AnimationDialog):
 				else:
 					print(msg)
 			else:
-				msg = "An error occurred when converting images to video. " \
-				      "The images are still available in " + tmpdir + "\n\n" \
+				msg = "An error occurred when converting images to video.\n\n" \
 				      "This should not happen. Please email support@tuflow.com " \
 				      "with the contents from the log file:\n" + logfile
 				if self.tuView.iface is not None:
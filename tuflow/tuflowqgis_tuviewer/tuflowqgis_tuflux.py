@@ -0,0 +1,84 @@
+import numpy as np
+
+from .tuflowqgis_tumeshsampler import TuMeshSampler
+
+
+def flow_across_line(xy, chainages, depth, velMag, velX, velY):
+	"""
+	Calculate flow across a line for all timesteps. Flow across each segment is calculated from
+	the average depth, velocity magnitude and segment width and is positive when the velocity is to
+	the left of the line direction. Segments where the average velocity has no direction use the
+	direction of the previous segment.
+
+	:param xy: np.ndarray -> (npoints, 2) point coordinates along the line
+	:param chainages: np.ndarray -> (npoints,) chainage of each point
+	:param depth: np.ndarray -> (ntimes, npoints)
+	:param velMag: np.ndarray -> (ntimes, npoints)
+	:param velX: np.ndarray -> (ntimes, npoints)
+	:param velY: np.ndarray -> (ntimes, npoints)
+	:return: np.ndarray -> (ntimes,) flow
+	"""
+
+	depth = np.where(np.isnan(depth), 0., depth)
+	wet = (depth > 0) & ~np.isnan(velMag)
+	velMag = np.where(wet, velMag, 0.)
+	velX = np.where(wet, velX, 0.)
+	velY = np.where(wet, velY, 0.)
+
+	def average(a):
+		"""Average of consecutive points, if one is nan then use the other"""
+		a0, a1 = a[:,:-1], a[:,1:]
+		return np.where(np.isnan(a0), a1, np.where(np.isnan(a1), a0, (a0 + a1) / 2.))
+
+	avDepth = (depth[:,:-1] + depth[:,1:]) / 2.
+	avVelMag = (velMag[:,:-1] + velMag[:,1:]) / 2.
+	avVelX = average(velX)
+	avVelY = average(velY)
+
+	# carry flow direction forward from the previous segment if velocity has no direction
+	hasDirection = np.isfinite(avVelX) & np.isfinite(avVelY) & ((avVelX != 0.) | (avVelY != 0.))
+	ind = np.where(hasDirection, np.arange(avVelX.shape[1]), -1)
+	ind = np.maximum.accumulate(ind, axis=1)
+	flowX = np.take_along_axis(avVelX, np.maximum(ind, 0), axis=1)
+	flowY = np.take_along_axis(avVelY, np.maximum(ind, 0), axis=1)
+
+	# positive flow is to the left of the line direction, zero if parallel
+	seg = np.diff(xy, axis=0)
+	sign = np.where(ind < 0, 0., np.sign(seg[:,0] * flowY - seg[:,1] * flowX))
+	width = np.diff(chainages)
+
+	return np.nansum(sign * avDepth * width * avVelMag, axis=1)
+
+
+class TuFluxLine(TuMeshSampler):
+	"""
+	Samples mesh results along a flow line and calculates the flow across it.
+	"""
+
+	def __init__(self, tuPlot2D, layer, geometry, points, chainages, faces, onVertices, avgmethod=None, dataType=None):
+		"""
+		:param tuPlot2D: TuPlot2D
+		:param layer: QgsMeshLayer
+		:param geometry: TuMeshGeometry
+		:param points: list -> QgsPointXY
+		:param chainages: list -> float
+		:param faces: list -> int face index for each point (face centred results)
+		:param onVertices: bool
+		"""
+
+		n = len(points) if onVertices else len(faces)
+		self.xy = np.array([[p.x(), p.y()] for p in points[:n]], dtype=np.float64).reshape((-1, 2))
+		self.chainages = np.array(chainages[:n], dtype=np.float64)
+		TuMeshSampler.__init__(self, layer, geometry, points[:n], None if onVertices else faces, onVertices,
+		                       tuPlot2D, avgmethod, dataType)
+
+	def flow(self, depth, velocity):
+		"""
+		Flow across the line for each timestep.
+
+		:param depth: np.ndarray -> (ntimes, npoints)
+		:param velocity: np.ndarray -> (ntimes, 3, npoints) magnitude, x, y
+		:return: np.ndarray -> (ntimes,)
+		"""
+
+		return flow_across_line(self.xy, self.chainages, depth, velocity[:,0], velocity[:,1], velocity[:,2])
@@ -44,6 +44,9 @@ from ..tuflow_results_gpkg import ResData_GPKG
 from ..fvbc_tide_dlg import ImportFVBCTideDlg
 
 
+BATCH_EXPORT_CHUNK_SIZE = 250  # number of point features extracted together during batch plot export
+
+
 class TuMenuFunctions():
 	"""
 	Generic class for handling menu functions.
@@ -2025,16 +2028,20 @@ class TuMenuFunctions():
 			pComplete = 0
 			complete = 0
 		# loop through features and output
+		points = []  # point features are exported in chunks so each result timestep is read once for many points
 		for f in featIterator:
 			if vLayer.geometryType() == QgsWkbTypes.PointGeometry:
 				if nameIndex is not None:
 					name = '{1}_{0}'.format(f.attributes()[nameIndex], mLayers[0].name())
 				else:
 					name = '{1}_{0}_TS'.format(f.id(), mLayers[0].name())
-				self.tuView.tuPlot.tuPlot2D.plotTimeSeriesFromMap(
-					vLayer, f, bypass=True, mesh=mLayers, types=resultTypes, export=format,
-					export_location=outputFolder, name=name, export_format=imageFormat,
-					mesh_rendered=False, **kwargs)
+				points.append((f, name))
+				if len(points) < BATCH_EXPORT_CHUNK_SIZE:
+					continue
+				self.batchTimeSeriesExport(vLayer, points, mLayers, resultTypes, format, outputFolder, imageFormat,
+				                           **kwargs)
+				complete += len(points)
+				points.clear()
 			elif vLayer.geometryType() == QgsWkbTypes.LineGeometry:
 				if nameIndex is not None:
 					name = '{1}_{0}'.format(f.attributes()[nameIndex], mLayers[0].name())
@@ -2044,12 +2051,52 @@ class TuMenuFunctions():
 					vLayer, f, bypass=True, mesh=mLayers, types=resultTypes, export=format,
 					export_location=outputFolder, name=name, time=timestepKey, time_formatted=timestep, export_format=imageFormat,
 					mesh_rendered=False, **kwargs)
+				complete += 1
 			else:
 				return False
-			complete += 1
 			pComplete = int(complete / featureCount * 100)
 			if self.iface is not None:
 				progress.setValue(pComplete)
+		if points:
+			self.batchTimeSeriesExport(vLayer, points, mLayers, resultTypes, format, outputFolder, imageFormat, **kwargs)
+			if self.iface is not None:
+				progress.setValue(100)
+
+		return True
+
+	def batchTimeSeriesExport(self, vLayer, points, mLayers, resultTypes, format, outputFolder, imageFormat, **kwargs):
+		"""
+		Export time series for a chunk of point features. Results are extracted for all points at once and then
+		written out for each feature.
+
+		:param vLayer: QgsVectorLayer
+		:param points: list -> tuple (QgsFeature, str output name)
+		:param mLayers: list -> QgsMeshLayer
+		:param resultTypes: list -> str result type e.g. 'depth'
+		:param format: str 'csv' or 'image'
+		:param outputFolder: str output folder
+		:param imageFormat: str extension e.g. '.png'
+		:return: bool -> True for successful, False for unsuccessful
+		"""
+
+		from .tuflowqgis_tuplot import TuPlot
+
+		tuPlot2D = self.tuView.tuPlot.tuPlot2D
+		dataType = kwargs['data_type'] if 'data_type' in kwargs else TuPlot.DataTimeSeries2D
+		allData = tuPlot2D.timeSeriesFromMapBatch(mLayers, [f.geometry().asPoint() for f, _ in points], resultTypes,
+		                                          vLayer.crs(), dataType)
+		if allData is None:  # results can't be extracted together (e.g. 3D results) - do each point separately
+			for f, name in points:
+				tuPlot2D.plotTimeSeriesFromMap(
+					vLayer, f, bypass=True, mesh=mLayers, types=resultTypes, export=format,
+					export_location=outputFolder, name=name, export_format=imageFormat,
+					mesh_rendered=False, **kwargs)
+			return True
+
+		for (f, name), (data, labels, types) in zip(points, allData):
+			if data:
+				tuPlot2D.exportTimeSeries(data, labels, types, dataType, format, outputFolder, name, imageFormat,
+				                          **kwargs)
 
 		return True
 	
@@ -0,0 +1,339 @@
+import re
+from pathlib import Path
+
+import numpy as np
+from qgis.core import QgsMesh
+
+from ..tuflow_plugin_cache import load_cached_arrays, save_cached_arrays
+
+
+MESH_GEOMETRY_TAG = 'MeshGeometry'  # array cache tag (see tuflow_plugin_cache.save_cached_arrays)
+MAX_GRID_CELLS_PER_FACE = 4.  # limits the grid size if the faces only cover a small part of the mesh extent
+CELL_SIZE_PERCENTILE = 50.  # grid cell size is this percentile of the face sizes
+MAX_CELLS_PER_FACE = 32  # faces that overlap more grid cells than this are bounding box tested instead
+WEIGHT_TOL = -1e-9  # barycentric weights above this count as inside (points on an edge or vertex)
+CHUNK_SIZE = 100000  # max number of point / face pairs tested at once
+
+
+class TuMeshGeometry:
+	"""
+	Array representation of a mesh used to answer point in face and line intersection queries for many
+	points at once.
+
+	Faces are stored as a padded (nfaces, max vertices per face) array (padding is -1) and are
+	indexed with a uniform grid - each grid cell stores the faces whose bounding box overlaps it.
+	The cell size is taken from the typical (median) face size rather than the average. Faces that
+	would overlap too many cells (e.g. large faces in a mesh with a wide range of face sizes) are kept
+	out of the grid and are tested against their bounding box instead.
+	Faces are treated as fans of triangles from their first vertex (same split as QGIS uses for quads).
+
+	The arrays can be saved in the plugin array cache against the mesh file so the index is only built
+	once per mesh rather than every session.
+	"""
+
+	def __init__(self, vertices, faces, gridOrigin, gridCellSize, gridShape, cellStart, cellFaces, largeFaces):
+		"""
+		:param vertices: np.ndarray -> (nvertices, 2) float x, y
+		:param faces: np.ndarray -> (nfaces, max vertices per face) int vertex indexes, padded with -1
+		:param gridOrigin: np.ndarray -> (2,) float x, y of the bottom left of the grid
+		:param gridCellSize: float
+		:param gridShape: np.ndarray -> (2,) int number of columns, rows
+		:param cellStart: np.ndarray -> (ncells + 1,) int start of each cell in cellFaces
+		:param cellFaces: np.ndarray -> int face indexes sorted by grid cell
+		:param largeFaces: np.ndarray -> int indexes of the faces not in the grid
+		"""
+
+		self.vertices = vertices
+		self.faces = faces
+		self.faceVertexCount = (faces >= 0).sum(axis=1)
+		self.gridOrigin = gridOrigin
+		self.gridCellSize = float(gridCellSize)
+		self.gridShape = gridShape
+		self.cellStart = cellStart
+		self.cellFaces = cellFaces
+		self.largeFaces = largeFaces
+		self.largeMin, self.largeMax = self.bounds(faces[largeFaces], vertices)
+
+	@staticmethod
+	def fromArrays(vertices, faces):
+		"""
+		Create from vertex coordinates and face vertex lists and build the grid index.
+
+		:param vertices: array like -> (nvertices, 2+)
+		:param faces: list -> list -> int vertex indexes, or padded np.ndarray (padding -1)
+		:return: TuMeshGeometry
+		"""
+
+		vertices = np.asarray(vertices, dtype=np.float64)[:,:2]
+		if not isinstance(faces, np.ndarray):
+			maxv = max((len(x) for x in faces), default=3)
+			a = np.full((len(faces), maxv), -1, dtype=np.int64)
+			for i, f in enumerate(faces):
+				a[i,:len(f)] = f
+			faces = a
+		faces = faces.astype(np.int64)
+
+		fmin, fmax = TuMeshGeometry.bounds(faces, vertices)
+
+		# grid cell size from the typical face size (the average is skewed by the large faces in meshes
+		# with a wide range of face sizes)
+		if faces.shape[0]:
+			origin = fmin.min(axis=0)
+			extent = np.maximum(fmax.max(axis=0) - origin, 1e-9)
+			faceSize = np.percentile((fmax - fmin).max(axis=1), CELL_SIZE_PERCENTILE)
+		else:
+			origin, extent, faceSize = np.zeros(2), np.ones(2), 0.
+		ncells = max(faces.shape[0] * MAX_GRID_CELLS_PER_FACE, 1.)
+		cellSize = max(faceSize, np.sqrt(extent[0] * extent[1] / ncells), extent.max() / 4096., 1e-9)
+		shape = (np.floor(extent / cellSize).astype(np.int64) + 1)
+
+		# register each face in every cell its bounding box overlaps - except faces that overlap too many
+		c0 = np.clip(np.floor((fmin - origin) / cellSize).astype(np.int64), 0, shape - 1)
+		c1 = np.clip(np.floor((fmax - origin) / cellSize).astype(np.int64), 0, shape - 1)
+		nx = c1[:,0] - c0[:,0] + 1
+		count = nx * (c1[:,1] - c0[:,1] + 1)
+		large = count > MAX_CELLS_PER_FACE
+		count[large] = 0
+		fid = np.repeat(np.arange(faces.shape[0]), count)
+		k = np.arange(fid.size) - np.repeat(np.cumsum(count) - count, count)
+		cell = (c0[fid,1] + k // nx[fid]) * shape[0] + c0[fid,0] + k % nx[fid]
+		order = np.argsort(cell, kind='stable')
+		cellStart = np.searchsorted(cell[order], np.arange(shape[0] * shape[1] + 1))
+
+		return TuMeshGeometry(vertices, faces, origin, cellSize, shape, cellStart, fid[order], np.flatnonzero(large))
+
+	@staticmethod
+	def bounds(faces, vertices):
+		"""Bounding box (min x, y and max x, y) of each face."""
+
+		xy = vertices[np.maximum(faces, 0)]
+		pad = (faces < 0)[:,:,None]
+		return np.where(pad, np.inf, xy).min(axis=1), np.where(pad, -np.inf, xy).max(axis=1)
+
+	@staticmethod
+	def fromMesh(mesh):
+		"""
+		Create from a QgsMesh.
+
+		:param mesh: QgsMesh
+		:return: TuMeshGeometry
+		"""
+
+		vertices = [(v.x(), v.y()) for v in (mesh.vertex(i) for i in range(mesh.vertexCount()))]
+		faces = [mesh.face(i) for i in range(mesh.faceCount())]
+		return TuMeshGeometry.fromArrays(np.array(vertices, dtype=np.float64).reshape((-1, 2)), faces)
+
+	@staticmethod
+	def fromLayer(layer, cache=True):
+		"""
+		Create for a mesh layer. If cache is True, loaded from the plugin array cache if the mesh file has been
+		indexed before (and hasn't changed), otherwise built from the data provider and saved to the cache
+		(which is kept within its size limit - see tuflow_plugin_cache.save_cached_arrays).
+
+		:param layer: QgsMeshLayer
+		:param cache: bool
+		:return: TuMeshGeometry
+		"""
+
+		path = TuMeshGeometry.meshFile(layer) if cache else None
+		if path is not None:
+			arrays = load_cached_arrays(path, MESH_GEOMETRY_TAG)
+			if arrays is not None:
+				try:
+					return TuMeshGeometry(arrays['vertices'], arrays['faces'], arrays['gridOrigin'],
+					                      float(arrays['gridCellSize']), arrays['gridShape'], arrays['cellStart'],
+					                      arrays['cellFaces'], arrays['largeFaces'])
+				except KeyError:
+					pass
+
+		mesh = QgsMesh()
+		layer.dataProvider().populateMesh(mesh)
+		geom = TuMeshGeometry.fromMesh(mesh)
+		if path is not None:
+			save_cached_arrays(path, MESH_GEOMETRY_TAG, geom.arrays())
+		return geom
+
+	@staticmethod
+	def meshFile(layer):
+		"""Returns the mesh file of the layer (or None if the layer isn't from a file)."""
+
+		source = layer.source()
+		for candidate in [source] + re.findall(r'"([^"]+)"', source):
+			try:
+				if Path(candidate).is_file():
+					return Path(candidate)
+			except (OSError, ValueError):
+				continue
+		return None
+
+	def arrays(self):
+		"""Arrays used to save and reload the geometry."""
+
+		return {
+			'vertices': self.vertices, 'faces': self.faces, 'gridOrigin': self.gridOrigin,
+			'gridCellSize': np.array(self.gridCellSize), 'gridShape': self.gridShape,
+			'cellStart': self.cellStart, 'cellFaces': self.cellFaces, 'largeFaces': self.largeFaces,
+		}
+
+	def cells(self, xy):
+		"""Grid cell of each point (-1 if outside the grid)."""
+
+		c = np.floor((xy - self.gridOrigin) / self.gridCellSize).astype(np.int64)
+		inside = ((c >= 0) & (c < self.gridShape)).all(axis=1)
+		return np.where(inside, c[:,1] * self.gridShape[0] + c[:,0], -1)
+
+	def candidates(self, cells):
+		"""
+		Faces registered in each cell.
+
+		:param cells: np.ndarray -> int cell index (-1 for none)
+		:return: np.ndarray, np.ndarray -> position in cells, face index for every candidate pair
+		"""
+
+		cells = np.asarray(cells)
+		valid = cells >= 0
+		start = np.where(valid, self.cellStart[np.maximum(cells, 0)], 0)
+		count = np.where(valid, self.cellStart[np.maximum(cells, 0) + 1] - start, 0)
+		pos = np.repeat(np.arange(cells.size), count)
+		k = np.arange(pos.size) - np.repeat(np.cumsum(count) - count, count)
+		return pos, self.cellFaces[start[pos] + k]
+
+	def largeCandidates(self, lo, hi):
+		"""
+		Faces not in the grid whose bounding box overlaps each box.
+
+		:param lo: np.ndarray -> (n, 2) min x, y of each box
+		:param hi: np.ndarray -> (n, 2) max x, y of each box
+		:return: np.ndarray, np.ndarray -> position in the boxes, face index for every candidate pair
+		"""
+
+		pos, fid = [np.array([], dtype=np.int64)], [np.array([], dtype=np.int64)]
+		if self.largeFaces.size:
+			step = max(CHUNK_SIZE // self.largeFaces.size, 1)
+			for i in range(0, lo.shape[0], step):
+				overlap = ((lo[i:i+step,None] <= self.largeMax) & (hi[i:i+step,None] >= self.largeMin)).all(axis=2)
+				p, f = np.nonzero(overlap)
+				pos.append(p + i)
+				fid.append(self.largeFaces[f])
+		return np.concatenate(pos), np.concatenate(fid)
+
+	def locate(self, points):
+		"""
+		Face, triangle vertices and barycentric weights for each point. Points outside the mesh have a face
+		of -1 (and zero weights).
+
+		:param points: array like -> (npoints, 2)
+		:return: np.ndarray (npoints,) faces, np.ndarray (npoints, 3) vertices, np.ndarray (npoints, 3) weights
+		"""
+
+		xy = np.asarray(points, dtype=np.float64).reshape((-1, 2))
+		n = xy.shape[0]
+		faces = np.full(n, -1, dtype=np.int64)
+		vertices = np.zeros((n, 3), dtype=np.int64)
+		weights = np.zeros((n, 3), dtype=np.float64)
+
+		pos, fid = self.candidates(self.cells(xy))
+		pos_, fid_ = self.largeCandidates(xy, xy)
+		pos, fid = np.concatenate((pos, pos_)), np.concatenate((fid, fid_))
+		for i in range(0, pos.size, CHUNK_SIZE):
+			p, f = pos[i:i+CHUNK_SIZE], fid[i:i+CHUNK_SIZE]
+			for t in range(1, self.faces.shape[1] - 1):  # fan triangles (0, t, t + 1)
+				ok = (self.faceVertexCount[f] > t + 1) & (faces[p] < 0)
+				if not ok.any():
+					continue
+				p_, f_ = p[ok], f[ok]
+				tri = self.faces[f_][:,[0, t, t + 1]]
+				w = self.barycentric(xy[p_], self.vertices[tri])
+				inside = (w >= WEIGHT_TOL).all(axis=1) & (faces[p_] < 0)
+				# first match wins if a point is on a shared edge
+				p_, j = np.unique(p_[inside], return_index=True)
+				faces[p_] = f_[inside][j]
+				vertices[p_] = tri[inside][j]
+				weights[p_] = np.clip(w[inside][j], 0., 1.)
+
+		return faces, vertices, weights
+
+	@staticmethod
+	def barycentric(xy, tri):
+		"""
+		Barycentric weights of points in triangles.
+
+		:param xy: np.ndarray -> (n, 2)
+		:param tri: np.ndarray -> (n, 3, 2) triangle vertex coordinates
+		:return: np.ndarray -> (n, 3) weights (nan for degenerate triangles)
+		"""
+
+		(x1, y1), (x2, y2), (x3, y3) = tri[:,0].T, tri[:,1].T, tri[:,2].T
+		denom = (y2 - y3) * (x1 - x3) + (x3 - x2) * (y1 - y3)
+		with np.errstate(divide='ignore', invalid='ignore'):
+			w1 = ((y2 - y3) * (xy[:,0] - x3) + (x3 - x2) * (xy[:,1] - y3)) / denom
+			w2 = ((y3 - y1) * (xy[:,0] - x3) + (x1 - x3) * (xy[:,1] - y3)) / denom
+		return np.column_stack((w1, w2, 1. - w1 - w2))
+
+	def edges(self, faces):
+		"""Unique edges (sorted vertex pairs) of the faces."""
+
+		f = self.faces[faces]
+		nxt = np.roll(f, -1, axis=1)
+		last = np.arange(f.shape[1]) == (self.faceVertexCount[faces] - 1)[:,None]
+		nxt = np.where(last, f[:,:1], nxt)  # close each face (padding is at the end)
+		e = np.stack((f, nxt), axis=2).reshape((-1, 2))
+		e = e[(e >= 0).all(axis=1)]
+		return np.unique(np.sort(e, axis=1), axis=0)
+
+	def lineIntersects(self, polyline, tol=1e-9):
+		"""
+		Points where a line crosses mesh edges (including the line's own vertices) ordered along the line,
+		and the face that each part of the line between consecutive points is in (-1 if outside the mesh).
+
+		:param polyline: array like -> (nvertices, 2)
+		:param tol: float -> crossings closer than this (as a fraction of the segment length) are merged
+		:return: np.ndarray (npoints, 2), np.ndarray (npoints - 1,) faces
+		"""
+
+		line = np.asarray(polyline, dtype=np.float64).reshape((-1, 2))
+		points = [line[:1]]
+		for p1, p2 in zip(line[:-1], line[1:]):
+			d = p2 - p1
+			length = np.hypot(*d)
+			if length == 0:
+				continue
+
+			# cells under the segment - split into pieces shorter than a cell and take the cells under each piece
+			nsplit = int(np.ceil(length / self.gridCellSize)) + 1
+			s = p1 + np.linspace(0., 1., nsplit + 1)[:,None] * d
+			lo = np.floor((np.minimum(s[:-1], s[1:]) - self.gridOrigin) / self.gridCellSize).astype(np.int64)
+			hi = np.floor((np.maximum(s[:-1], s[1:]) - self.gridOrigin) / self.gridCellSize).astype(np.int64)
+			cells = set()
+			for (x0, y0), (x1, y1) in zip(lo, hi):
+				for cy in range(max(y0, 0), min(y1, self.gridShape[1] - 1) + 1):
+					for cx in range(max(x0, 0), min(x1, self.gridShape[0] - 1) + 1):
+						cells.add(cy * self.gridShape[0] + cx)
+
+			t = np.array([])
+			_, faces = self.candidates(np.array(sorted(cells), dtype=np.int64))
+			_, large = self.largeCandidates(np.minimum(p1, p2)[None], np.maximum(p1, p2)[None])
+			faces = np.unique(np.concatenate((faces, large)))
+			if faces.size:
+				e = self.edges(faces)
+				q1, q2 = self.vertices[e[:,0]], self.vertices[e[:,1]]
+				ed = q2 - q1
+				denom = d[0] * ed[:,1] - d[1] * ed[:,0]
+				r = q1 - p1
+				with np.errstate(divide='ignore', invalid='ignore'):
+					t = (r[:,0] * ed[:,1] - r[:,1] * ed[:,0]) / denom
+					u = (r[:,0] * d[1] - r[:,1] * d[0]) / denom
+				hit = (denom != 0) & (t >= 0) & (t <= 1) & (u >= -tol) & (u <= 1 + tol)
+				t = np.sort(t[hit])
+
+			# merge crossings at the same location (line passing through a vertex) and drop the segment ends
+			t = np.concatenate(([0.], t, [1.]))
+			t = t[np.concatenate(([True], np.diff(t) > tol))]
+			if t.size == 1:
+				t = np.append(t, 1.)
+			t[-1] = 1.
+			points.append(p1 + t[1:,None] * d)
+
+		points = np.concatenate(points)
+		faces = self.locate((points[:-1] + points[1:]) / 2.)[0] if points.shape[0] > 1 else np.array([], dtype=np.int64)
+		return points, faces
@@ -0,0 +1,157 @@
+import numpy as np
+from qgis.core import QgsMeshDatasetGroupMetadata
+
+
+RUN_GAP = 64  # max gap between indexes that are still read in the same datasetValues call
+
+
+def index_runs(indexes):
+	"""
+	Split sorted unique indexes into runs that can be read with a single call.
+
+	:param indexes: np.ndarray -> int sorted unique indexes
+	:return: list -> tuple (start, count)
+	"""
+
+	if not indexes.size:
+		return []
+	breaks = np.flatnonzero(np.diff(indexes) > RUN_GAP) + 1
+	starts = np.concatenate(([0], breaks))
+	ends = np.concatenate((breaks, [indexes.size])) - 1
+	return [(int(indexes[i]), int(indexes[j] - indexes[i] + 1)) for i, j in zip(starts, ends)]
+
+
+class TuMeshSampler:
+	"""
+	Samples mesh results at a set of points. Where each point samples from (mesh face, or
+	triangle vertices and barycentric weights for vertex results) is found once using TuMeshGeometry
+	so that values for each timestep can be read in bulk.
+	"""
+
+	def __init__(self, layer, geometry, points, faces=None, onVertices=True, tuPlot2D=None, avgmethod=None,
+	             dataType=None):
+		"""
+		:param layer: QgsMeshLayer
+		:param geometry: TuMeshGeometry
+		:param points: list -> QgsPointXY in the layer crs
+		:param faces: list -> int face index for each point (face centred results). Located from points if None.
+		:param onVertices: bool -> results are on vertices so values are interpolated
+		:param tuPlot2D: TuPlot2D -> only required for depth averaging 3D results
+		"""
+
+		self.layer = layer
+		self.dp = layer.dataProvider()
+		self.onVertices = onVertices
+		self.tuPlot2D = tuPlot2D
+		self.avgmethod = avgmethod
+		self.dataType = dataType
+
+		xy = np.array([[p.x(), p.y()] for p in points], dtype=np.float64).reshape((-1, 2))
+		if onVertices:
+			self.faces, self.vertices, self.weights = geometry.locate(xy)
+		else:
+			if faces is None:
+				faces = geometry.locate(xy)[0]
+			self.faces = np.array([-1 if f is None else f for f in faces], dtype=np.int64)
+			self.vertices, self.weights = None, None
+		self.valid = self.faces >= 0
+
+	def values(self, mdi, vector=False, checkActive=True):
+		"""
+		Values at each point for a dataset. Points that are outside the mesh or in inactive faces are nan.
+
+		:param mdi: QgsMeshDatasetIndex
+		:param vector: bool -> returns (magnitude, x, y) if True
+		:param checkActive: bool -> set to False for datasets that don't use active flags e.g. bed elevation
+		:return: np.ndarray -> (npoints,) or (3, npoints) if vector
+		"""
+
+		gmd = self.dp.datasetGroupMetadata(mdi.group())
+		if gmd.dataType() == QgsMeshDatasetGroupMetadata.DataOnVolumes:
+			return self.averagedValues(mdi, vector)
+
+		n = self.faces.size
+		out = np.full((3, n) if vector else n, np.nan)
+		if not self.valid.any():
+			return out
+
+		if self.onVertices:
+			vals = self.readValues(mdi, self.vertices[self.valid].ravel(), vector)
+			if vector:
+				vals = vals.reshape((3, -1, 3))
+				out[:,self.valid] = (vals * self.weights[self.valid]).sum(axis=2)
+			else:
+				vals = vals.reshape((-1, 3))
+				out[self.valid] = (vals * self.weights[self.valid]).sum(axis=1)
+		else:
+			out[...,self.valid] = self.readValues(mdi, self.faces[self.valid], vector)
+
+		if checkActive:
+			out[...,~self.activeFaces(mdi)] = np.nan
+
+		return out
+
+	def timeSeries(self, res, vector=False, checkActive=True):
+		"""
+		Values at each point for every timestep of a result.
+
+		:param res: dict -> { str time: [ float time, QgsMeshDatasetIndex ] }
+		:param vector: bool -> returns (magnitude, x, y) if True
+		:return: np.ndarray -> (ntimes, npoints) or (ntimes, 3, npoints) if vector
+		"""
+
+		shape = (3, self.faces.size) if vector else (self.faces.size,)
+		out = np.zeros((len(res),) + shape)
+		for i, item in enumerate(res.values()):
+			out[i] = self.values(item[-1], vector, checkActive)
+		return out
+
+	def readValues(self, mdi, indexes, vector):
+		"""Read values at indexes (vertices or faces depending on the dataset) using as few calls as possible."""
+
+		unique, inverse = np.unique(indexes, return_inverse=True)
+		vals = np.full((unique.size, 2 if vector else 1), np.nan)
+		pos = 0
+		for start, count in index_runs(unique):
+			block = self.dp.datasetValues(mdi, start, count)
+			if not block.isValid():
+				pos += np.count_nonzero((unique >= start) & (unique < start + count))
+				continue
+			a = np.array(block.values(), dtype=np.float64).reshape((count, -1))
+			j = unique[(unique >= start) & (unique < start + count)] - start
+			vals[pos:pos+j.size,:a.shape[1]] = a[j]
+			pos += j.size
+
+		if vector:
+			x, y = vals[inverse,0], vals[inverse,1]
+			return np.array([np.hypot(x, y), x, y])
+		return vals[inverse,0]
+
+	def activeFaces(self, mdi):
+		"""Active flag for the face at each point."""
+
+		active = np.zeros(self.faces.size, dtype=bool)
+		unique, inverse = np.unique(self.faces[self.valid], return_inverse=True)
+		flags = np.zeros(unique.size, dtype=bool)
+		pos = 0
+		for start, count in index_runs(unique):
+			block = self.dp.areFacesActive(mdi, start, count)
+			j = unique[(unique >= start) & (unique < start + count)] - start
+			flags[pos:pos+j.size] = [block.active(int(k)) for k in j]
+			pos += j.size
+		active[self.valid] = flags[inverse]
+		return active
+
+	def averagedValues(self, mdi, vector):
+		"""Depth averaged values for 3D datasets (face centred only) - read per face using the active averaging method."""
+
+		restypes = ['scalar', 'x', 'y'] if vector else ['scalar']
+		out = np.full((len(restypes), self.faces.size), np.nan)
+		for i, f in enumerate(self.faces.tolist()):
+			if f < 0:
+				continue
+			for j, restype in enumerate(restypes):
+				val = self.tuPlot2D.datasetValueAvgDep(self.layer, mdi, None, self.avgmethod, self.dataType, restype, f, self.dp)
+				out[j,i] = np.nan if val is None else val
+
+		return out if vector else out[0]
@@ -22,6 +22,7 @@ class TuOptions():
 		self.timeUnits = 'h'
 		self.writeMeshIntersects = False
 		self.particlesWriteDebugInfo = False
+		self.particlesStyledVariablesOnly = False
 		self.verticalProfileInterpolated = False
 		self.timeSpec = QT_TIMESPEC_UTC
 		self.secondary_axis_types = {0: 'y-axis', 1: 'y-axis', 2: 'y-axis', 3: 'x-axis'}
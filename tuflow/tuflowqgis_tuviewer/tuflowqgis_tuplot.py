@@ -3706,9 +3706,11 @@ class TuPlot():
 					lengthChanges.append(i)
 					length = len(x)
 					maxLength = max(maxLength, len(x))
-		# next format data into string
-		datastring = ''
+		# next format data into string - rows are collected in a list and joined once (repeatedly
+		# concatenating the string gets very slow with long time series)
+		rows = []
 		for i in range(maxLength):  # iterate through longest series
+			row = []
 			for j in range(len(data)):  # iterate through the different data sets
 				if plotNo == TuPlot.TimeSeries and len(data[j][0]) < i + 1:
 					x = None
@@ -3732,11 +3734,11 @@ class TuPlot():
 				if qIsNaN(y):
 					y = ''
 				if j in lengthChanges:  # where there are data length changes, include X axis values again
-					datastring = '{0}{1},'.format(datastring, x)
-				datastring = '{0}{1},'.format(datastring, y)  # add y value
-				if j + 1 == len(data):  # include return character and remove last comma
-					datastring = '{0}\n'.format(datastring[:-1])
-					
+					row.append('{0}'.format(x))
+				row.append('{0}'.format(y))  # add y value
+			rows.append(','.join(row))
+		datastring = ''.join('{0}\n'.format(x) for x in rows)
+
 		# column names
 		header = ''
 		for i, l in enumerate(newLabels):
@@ -267,6 +267,59 @@ class TuPlot1D():
 
 		return xAll, yAll, labels, typs
 
+	@staticmethod
+	def timeSeriesTypeName(rtype, dom, source):
+		"""
+		Result type name used to get time series data for an element from a 2015+ result.
+
+		:param rtype: str -> selected result type
+		:param dom: str -> element domain i.e. 1D, 2D, RL
+		:param source: str -> element source i.e. HU
+		:return: str
+		"""
+
+		source = source.upper()
+		if dom == '2D':
+			if rtype.upper().find('STRUCTURE FLOWS') >= 0 and 'QS' in source:
+				return 'QS'
+			elif rtype.upper().find('STRUCTURE LEVELS') >= 0 and 'HU' in source:
+				return 'HU'
+			elif rtype.upper().find('STRUCTURE LEVELS') >= 0 and 'HD' in source:
+				return 'HD'
+			return rtype
+		if re.findall("flow regime", rtype, re.IGNORECASE):
+			return "Flow Regime"
+		return rtype
+
+	def timeSeriesMany(self, res, rtype, tuResults1D):
+		"""
+		Gets the time series for all selected elements of a result type with one getTSDataMany call per
+		domain / result type rather than one getTSData call per element. Elements not found are left out
+		so the caller can fall back to getTSData.
+
+		:param res: ResData
+		:param rtype: str -> selected result type
+		:param tuResults1D: TuResults1D
+		:return: dict -> { ( str id, str dom, str typename ): ( xdata, ydata ) }
+		"""
+
+		groups = {}
+		for id, dom, source in zip(tuResults1D.ids, tuResults1D.domains, tuResults1D.sources):
+			groups.setdefault((dom, self.timeSeriesTypeName(rtype, dom, source)), []).append(id)
+
+		data = {}
+		for (dom, typename), ids in groups.items():
+			found, values, message = res.getTSDataMany(ids, dom, typename)
+			if not found:
+				continue
+			xdata = res.times
+			for j, id in enumerate(ids):
+				column = values[:,j]
+				if not np.ma.getmaskarray(column).all():
+					data[(id, dom, typename)] = (xdata, np.ma.filled(column, np.nan))
+
+		return data
+
 	def plot1dTimeSeries(self, **kwargs):
 		"""
 		Plots 1D time series based on selected features, results, and result types.
@@ -329,6 +382,10 @@ class TuPlot1D():
 						rtypes = tuResults1D.typesTS[:]
 					#for rtype in tuResults1D.typesTS:
 					for rtype in rtypes:
+						# read the result type for all selected elements together where the result supports it
+						manyData = {}
+						if res.formatVersion == 2 and hasattr(res, 'getTSDataMany'):
+							manyData = self.timeSeriesMany(res, rtype, tuResults1D)
 						# get result for each selected element
 						for i, id in enumerate(tuResults1D.ids):
 							#types.append('{0}_1d'.format(rtype))
@@ -368,23 +425,12 @@ class TuPlot1D():
 								xdata = res.times
 							elif res.formatVersion == 2:  # 2015
 								dom = tuResults1D.domains[i]
-								source = tuResults1D.sources[i].upper()
-								if dom == '2D':
-									if rtype.upper().find('STRUCTURE FLOWS') >= 0 and 'QS' in source:
-										typename = 'QS'
-									elif rtype.upper().find('STRUCTURE LEVELS') >= 0 and 'HU' in source:
-										typename = 'HU'
-									elif rtype.upper().find('STRUCTURE LEVELS') >= 0 and 'HD' in source:
-										typename = 'HD'
-									else:
-										typename = rtype
+								typename = self.timeSeriesTypeName(rtype, dom, tuResults1D.sources[i])
+								if (id, dom, typename) in manyData:
+									xdata, ydata = manyData[(id, dom, typename)]
 								else:
-									if re.findall("flow regime", rtype, re.IGNORECASE):
-										typename = "Flow Regime"
-									else:
-										typename = rtype
-								found, ydata, message = res.getTSData(id, dom, typename, 'Geom')
-								xdata = res.times if found else []
+									found, ydata, message = res.getTSData(id, dom, typename, 'Geom')
+									xdata = res.times if found else []
 							elif res.formatVersion == 0:  # _TS
 								xdata, ydata = res.getTSData(self.tuView.currentLayer, id)
 								rtype = ''
@@ -1,4 +1,5 @@
 import os
+from collections import OrderedDict
 import numpy as np
 from qgis.PyQt.QtCore import *
 from qgis.PyQt.QtGui import *
@@ -6,10 +7,14 @@ from qgis.PyQt import QtGui
 from qgis.core import *
 from qgis.PyQt.QtWidgets  import *
 from .tuflowqgis_turesultsindex import TuResultsIndex
+from .tuflowqgis_tuflux import TuFluxLine
+from .tuflowqgis_tumeshsampler import TuMeshSampler
+from .tuflowqgis_tumeshgeometry import TuMeshGeometry
+from .tuflowqgis_tusection import TuSectionLine, SECTION_CACHE_SIZE
 from ..tuflowqgis_library import (lineToPoints, getDirection, doLinesIntersect,
                                        intersectionPoint, calculateLength, getFaceIndexes3,
-                                       findMeshIntersects, writeTempPoints, writeTempPolys,
-                                       meshToPolygon, calcMidPoint, calcMidPoint2, getFaceIndex)
+                                       writeTempPoints, writeTempPolys,
+                                       meshToPolygon, calcMidPoint, calcMidPoint2)
 import inspect
 from datetime import datetime, timedelta
 from ..nc_grid_data_provider import NetCDFGridGeometry
@@ -47,6 +52,8 @@ class TuPlot2D():
 			self.crossSectionGeom = []
 			self.si = {}
 			self.mesh = {}
+			self.meshGeometries = {}
+			self.sectionLines = OrderedDict()  # key (layer id, crs, onVertices, line wkb): value TuSectionLine
 
 	def plotTimeSeriesFromMap(self, vLayer, point, **kwargs):
 		"""
@@ -88,7 +95,6 @@ class TuPlot2D():
 		featName = kwargs['featName'] if 'featName' in kwargs else None
 		markerNo = kwargs['markerNo'] if 'markerNo' in kwargs else 0
 		dataType = kwargs['data_type'] if 'data_type' in kwargs else TuPlot.DataTimeSeries2D
-		overwrite = kwargs['overwrite'] if 'overwrite' in kwargs else False
 
 		do_profiling = self.tuView.tuOptions.profile_plotting_tasks
 		
@@ -124,23 +130,12 @@ class TuPlot2D():
 		for layer in resultMesh:  # get plotting for all selected result meshes
 			if isinstance(layer, QgsMeshLayer) and not meshRendered:
 				dp = layer.dataProvider()
-				if layer.id() in self.si:
-					mesh = self.mesh[layer.id()]
-					si = self.si[layer.id()]
-				else:
-					if do_profiling:
-						start = datetime.now()
-					mesh = QgsMesh()
-					dp.populateMesh(mesh)
-					si = QgsMeshSpatialIndex(mesh)
-					self.mesh[layer.id()] = mesh
-					self.si[layer.id()] = si
-					if do_profiling:
-						Logging.info('Time to generate mesh spatial index: {0} sec'.format((datetime.now() - start).total_seconds()), silent=True)
+				mesh, si = self.meshSpatialIndex(layer)
 			else:
 				dp = None
 				mesh = None
 				si = None
+			samplers = {}  # key onVertices: value TuMeshSampler
 			
 			# get plotting for all checked result types
 			if not resultTypes:  # specified result types can be passed through kwargs (used for batch export not normal plotting)
@@ -197,7 +192,20 @@ class TuPlot2D():
 						x.append(item[0] / 3600)
 					else:
 						x.append(item[0])
-					y.append(self.datasetValue(layer, dp, si, mesh, item[-1], meshRendered, point, i, dataType, am))
+				if isinstance(layer, QgsMeshLayer) and am is None and \
+						gmd.dataType() != QgsMeshDatasetGroupMetadata.DataOnVolumes:
+					# face and interpolation weights are found once then all timesteps are read in bulk
+					onVertices = gmd.dataType() == QgsMeshDatasetGroupMetadata.DataOnVertices
+					if onVertices not in samplers:
+						samplers[onVertices] = self.pointSampler(layer, [point], onVertices)
+					if gmd.isVector():
+						y = samplers[onVertices].timeSeries(r, vector=True)[:,1:,0]
+						y = np.hypot(y[:,0], y[:,1]).tolist()  # magnitude of interpolated x, y components
+					else:
+						y = samplers[onVertices].timeSeries(r)[:,0].tolist()
+				else:
+					y = [self.datasetValue(layer, dp, si, mesh, item[-1], meshRendered, point, i, dataType, am)
+					     for item in r.values()]
 				if do_profiling:
 					Logging.info('Time to extract time series data: {0} sec'.format((datetime.now() - start).total_seconds()), silent=True)
 
@@ -230,24 +238,222 @@ class TuPlot2D():
 		if data:
 			if export is None:  # normal plot i.e. in tuview
 				self.tuPlot.drawPlot(TuPlot.TimeSeries, data, labels, types, dataTypes, draw=draw, time=time, show_current_time=showCurrentTime)
-			elif export == 'image':  # plot through drawPlot however instead of drawing, save figure
-				# unique output file name
-				outFile = '{0}{1}'.format(os.path.join(exportOut, name), exportFormat)
-				iterator = 1
-				if not overwrite:
-					while os.path.exists(outFile):
-						outFile = '{0}_{2}{1}'.format(os.path.join(exportOut, name), exportFormat, iterator)
-						iterator += 1
-				self.tuPlot.drawPlot(TuPlot.TimeSeries, data, labels, types, dataTypes, export=outFile)
-			elif export == 'csv':  # export to csv, don't plot
-				if 'types' in kwargs:
-					del kwargs['types']
-				self.tuPlot.exportCSV(TuPlot.TimeSeries, data, labels, types, exportOut, name, **kwargs)
+			elif export in ('image', 'csv'):
+				self.exportTimeSeries(data, labels, types, dataType, export, exportOut, name, exportFormat, **kwargs)
 			else:  # catch all other cases and just do normal, although should never be triggered
 				self.tuPlot.drawPlot(TuPlot.TimeSeries, data, labels, types, dataTypes, draw=draw, time=time, show_current_time=showCurrentTime)
 			
 		return True
 	
+	def meshSpatialIndex(self, layer):
+		"""
+		Returns the native mesh and spatial index for a mesh layer. These are generated the first time and
+		stored for subsequent calls.
+
+		:param layer: QgsMeshLayer
+		:return: QgsMesh, QgsMeshSpatialIndex
+		"""
+
+		if layer.id() not in self.si:
+			if self.tuView.tuOptions.profile_plotting_tasks:
+				start = datetime.now()
+			mesh = QgsMesh()
+			layer.dataProvider().populateMesh(mesh)
+			self.mesh[layer.id()] = mesh
+			self.si[layer.id()] = QgsMeshSpatialIndex(mesh)
+			if self.tuView.tuOptions.profile_plotting_tasks:
+				Logging.info('Time to generate mesh spatial index: {0} sec'.format((datetime.now() - start).total_seconds()), silent=True)
+
+		return self.mesh[layer.id()], self.si[layer.id()]
+
+	def meshGeometry(self, layer):
+		"""
+		Returns the TuMeshGeometry (vectorised face locator) for a mesh layer. Loaded from the plugin cache
+		(if TUFLOW/tuview_cache_mesh_geometry is on) or generated the first time and stored for subsequent calls.
+
+		:param layer: QgsMeshLayer
+		:return: TuMeshGeometry
+		"""
+
+		if layer.id() not in self.meshGeometries:
+			if self.tuView.tuOptions.profile_plotting_tasks:
+				start = datetime.now()
+			cache = QSettings().value('TUFLOW/tuview_cache_mesh_geometry', True, type=bool)
+			self.meshGeometries[layer.id()] = TuMeshGeometry.fromLayer(layer, cache)
+			if self.tuView.tuOptions.profile_plotting_tasks:
+				Logging.info('Time to generate mesh geometry: {0} sec'.format((datetime.now() - start).total_seconds()), silent=True)
+
+		return self.meshGeometries[layer.id()]
+
+	def meshIntersects(self, layer, feat, crs):
+		"""
+		Points where a line feature crosses the mesh edges, the chainage of each point and the
+		face between each point and the next (-1 if outside the mesh).
+
+		:param layer: QgsMeshLayer
+		:param feat: QgsFeature -> line
+		:param crs: QgsCoordinateReferenceSystem
+		:return: list -> QgsPointXY, list -> float chainage, list -> int face
+		"""
+
+		if feat.geometry().wkbType() == QgsWkbTypes.LineString:
+			geom = feat.geometry().asPolyline()
+		elif feat.geometry().wkbType() == QgsWkbTypes.MultiLineString:
+			geom = [p for g in feat.geometry().asMultiPolyline() for p in g]
+		else:
+			return [], [], []
+
+		points, faces = self.meshGeometry(layer).lineIntersects([(p.x(), p.y()) for p in geom])
+
+		da = QgsDistanceArea()
+		da.setSourceCrs(crs, QgsCoordinateTransformContext())
+		units = self.iface.mapCanvas().mapUnits() if self.iface is not None else QgsUnitTypes.DistanceMeters
+		lengths = np.hypot(*np.diff(points, axis=0).T) * da.convertLengthMeasurement(1., units)
+		chainages = np.concatenate(([0.], np.cumsum(lengths)))
+
+		return [QgsPointXY(x, y) for x, y in points.tolist()], chainages.tolist(), faces.tolist()
+
+	def sectionLineKey(self, layer, feat, crs, onVertices):
+		"""Key for a line feature on a mesh layer in the stored section lines."""
+
+		return layer.id(), crs.authid(), onVertices, bytes(feat.geometry().asWkb())
+
+	def sectionLine(self, layer, feat, crs, onVertices):
+		"""
+		Returns the TuSectionLine for a line feature on a mesh layer. Stored for the most recently used
+		lines so that redrawing a section (e.g. when the time changes) only re-reads values.
+
+		:param layer: QgsMeshLayer
+		:param feat: QgsFeature -> line
+		:param crs: QgsCoordinateReferenceSystem
+		:param onVertices: bool
+		:return: TuSectionLine
+		"""
+
+		key = self.sectionLineKey(layer, feat, crs, onVertices)
+		if key in self.sectionLines:
+			self.sectionLines.move_to_end(key)
+			return self.sectionLines[key]
+
+		if self.tuView.tuOptions.profile_plotting_tasks:
+			start = datetime.now()
+		inters, ch, fcs = self.meshIntersects(layer, feat, crs)
+		self.sectionLines[key] = TuSectionLine(layer, self.meshGeometry(layer), inters, ch, fcs, onVertices)
+		while len(self.sectionLines) > SECTION_CACHE_SIZE:
+			self.sectionLines.popitem(last=False)
+		if self.tuView.tuOptions.profile_plotting_tasks:
+			Logging.info('Time to find cross section intersects: {0} sec'.format((datetime.now() - start).total_seconds()), silent=True)
+
+		return self.sectionLines[key]
+
+	def pointSampler(self, layer, points, onVertices, crs=None):
+		"""
+		Returns a TuMeshSampler for points on a mesh layer.
+
+		:param layer: QgsMeshLayer
+		:param points: list -> QgsPointXY
+		:param onVertices: bool
+		:param crs: QgsCoordinateReferenceSystem -> crs of the points, project crs if None
+		:return: TuMeshSampler
+		"""
+
+		crs = self.tuView.project.crs() if crs is None else crs
+		points = [QgsPointXY(x) for x in points]
+		if layer.crs().isValid() and crs.isValid() and layer.crs() != crs:
+			transform = QgsCoordinateTransform(crs, layer.crs(), self.tuView.project)
+			points = [transform.transform(x) for x in points]
+		return TuMeshSampler(layer, self.meshGeometry(layer), points, onVertices=onVertices)
+
+	def timeSeriesFromMapBatch(self, layers, points, resultTypes, crs=None, dataType=None):
+		"""
+		Time series data for many points at once (batch export). Faces and interpolation weights for all points
+		are found in one pass and each result timestep is read once for all points.
+
+		:param layers: list -> QgsMeshLayer
+		:param points: list -> QgsPointXY
+		:param resultTypes: list -> str result type e.g. 'depth'
+		:param crs: QgsCoordinateReferenceSystem -> crs of the points, project crs if None
+		:param dataType: TuPlot data type
+		:return: list -> [ data, labels, types ] for each point in the same format as plotTimeSeriesFromMap,
+		                 or None if the results can't be read this way (e.g. 3D results that are depth averaged)
+		"""
+
+		from .tuflowqgis_tuplot import TuPlot
+
+		if not resultTypes:
+			return None
+
+		dataType = TuPlot.DataTimeSeries2D if dataType is None else dataType
+		out = [[[], [], []] for _ in points]
+		for layer in layers:
+			if not isinstance(layer, QgsMeshLayer):
+				return None
+			samplers = {}  # key onVertices: value TuMeshSampler
+			for rtype in resultTypes:
+				tuResultsIndex = TuResultsIndex(layer.name(), rtype, None, False, False, self.tuView.tuResults, self.tuView.tuOptions.timeUnits)
+				r = self.tuView.tuResults.getResult(tuResultsIndex)  # r = dict - { str time: [ float time, QgsMeshDatasetIndex ] }
+				if not r or r == -1:
+					continue
+				gmd = layer.dataProvider().datasetGroupMetadata(next(iter(r.values()))[-1].group())
+				if gmd.dataType() == QgsMeshDatasetGroupMetadata.DataOnVolumes:
+					return None
+
+				if self.tuView.tuOptions.timeUnits == 's':
+					x = [item[0] / 3600 for item in r.values()]
+				else:
+					x = [item[0] for item in r.values()]
+				onVertices = gmd.dataType() == QgsMeshDatasetGroupMetadata.DataOnVertices
+				if onVertices not in samplers:
+					samplers[onVertices] = self.pointSampler(layer, points, onVertices, crs)
+				if gmd.isVector():
+					y = samplers[onVertices].timeSeries(r, vector=True)[:,1:]
+					y = np.hypot(y[:,0], y[:,1])  # magnitude of interpolated x, y components
+				else:
+					y = samplers[onVertices].timeSeries(r)
+				if self.tuView.tuOptions.xAxisDates and y.size:
+					y[0,np.isnan(y).all(axis=0)] = 0  # insert one dummy value
+
+				label = self.generateLabel(layer, layers, rtype, 0, None, layers, None, 'csv', True, 0, dataType)
+				for i, (data, labels, types) in enumerate(out):
+					data.append((x, y[:,i].tolist()))
+					labels.append(label)
+					types.append(rtype)
+
+		return out
+
+	def exportTimeSeries(self, data, labels, types, dataType, export, exportOut, name, exportFormat, **kwargs):
+		"""
+		Export time series data to an image or csv.
+
+		:param data: list -> [ x, y ] for each dataset
+		:param labels: list -> str
+		:param types: list -> str result type
+		:param export: str 'image' or 'csv'
+		:return: bool -> True for successful, False for unsuccessful
+		"""
+
+		from .tuflowqgis_tuplot import TuPlot
+
+		overwrite = kwargs['overwrite'] if 'overwrite' in kwargs else False
+		dataTypes = [dataType] * len(data)
+		if export == 'image':  # plot through drawPlot however instead of drawing, save figure
+			# unique output file name
+			outFile = '{0}{1}'.format(os.path.join(exportOut, name), exportFormat)
+			iterator = 1
+			if not overwrite:
+				while os.path.exists(outFile):
+					outFile = '{0}_{2}{1}'.format(os.path.join(exportOut, name), exportFormat, iterator)
+					iterator += 1
+			self.tuPlot.drawPlot(TuPlot.TimeSeries, data, labels, types, dataTypes, export=outFile)
+		elif export == 'csv':  # export to csv, don't plot
+			if 'types' in kwargs:
+				del kwargs['types']
+			self.tuPlot.exportCSV(TuPlot.TimeSeries, data, labels, types, exportOut, name, **kwargs)
+		else:
+			return False
+
+		return True
+
 	def plotCrossSectionFromMap(self, vLayer, feat, **kwargs):
 		"""
 		Initiate plotting using XY coordinates
@@ -326,27 +532,11 @@ class TuPlot2D():
 			resultMesh = activeMeshLayers
 		for layer in resultMesh:
 			try:
-				if isinstance(layer, QgsMeshLayer):
-					dp = layer.dataProvider()
-					if layer.id() in self.si:
-						mesh = self.mesh[layer.id()]
-						si = self.si[layer.id()]
-					else:
-						if do_profiling:
-							start = datetime.now()
-						mesh = QgsMesh()
-						dp.populateMesh(mesh)
-						si = QgsMeshSpatialIndex(mesh)
-						self.mesh[layer.id()] = mesh
-						self.si[layer.id()] = si
-						if do_profiling:
-							Logging.info('Time to generate mesh spatial index: {0} sec'.format((datetime.now() - start).total_seconds()), silent=True)
-				else:
-					dp = None
-					mesh = None
-					si = None
-					if isinstance(layer, NetCDFGrid):
-						layer.open()
+				dp = layer.dataProvider() if isinstance(layer, QgsMeshLayer) else None
+				mesh = None  # native mesh and spatial index are only generated if values can't be read in bulk
+				si = None
+				if isinstance(layer, NetCDFGrid):
+					layer.open()
 
 				# get plotting for all checked result types
 				if not resultTypes:  # specified result types can be passed through kwargs (used for batch export not normal plotting)
@@ -430,34 +620,33 @@ class TuPlot2D():
 							except:    # versions earlier than ~ 3.8
 								onVertices = True
 
-						update = feat in self.crossSectionGeom
-
-						if update:
-							crossSectionGeom = self.crossSectionGeom[self.crossSectionGeom.index(feat)]
+						if isinstance(layer, QgsMeshLayer):
+							# edge crossings are stored per mesh and line so changing time only re-reads values
+							update = self.sectionLineKey(layer, feat, crs, onVertices) in self.sectionLines
+							crossSectionGeom = self.sectionLine(layer, feat, crs, onVertices)
 						else:
-							if isinstance(layer, QgsMeshLayer):
-								inters, ch, fcs = findMeshIntersects(si, dp, mesh, feat, crs, self.tuView.project, self.iface)
-								if len(fcs) + 3 == len(ch):  # start and end point of line is outside mesh
-									fcs.insert(0, None)
-									fcs.append(None)
-								elif len(fcs) + 2 == len(ch):  # one of start or end point of line is outside mesh
-									if getFaceIndex(inters[0], si, mesh):
-										fcs.append(None)
-									else:
-										fcs.insert(None)
-							elif isinstance(layer, NetCDFGrid):
-								nc_grid_geom = NetCDFGridGeometry(layer)
-								linestring = feat.geometry().asMultiPolyline() if feat.geometry().isMultipart() else feat.geometry().asPolyline()
-								fcs = nc_grid_geom.select_cells_from_linestring(linestring)
-								inters, ch = nc_grid_geom.intersects_along_linestring(linestring, fcs)
+							update = feat in self.crossSectionGeom
+
+							if update:
+								crossSectionGeom = self.crossSectionGeom[self.crossSectionGeom.index(feat)]
 							else:
-								continue
+								if isinstance(layer, NetCDFGrid):
+									nc_grid_geom = NetCDFGridGeometry(layer)
+									linestring = feat.geometry().asMultiPolyline() if feat.geometry().isMultipart() else feat.geometry().asPolyline()
+									fcs = nc_grid_geom.select_cells_from_linestring(linestring)
+									inters, ch = nc_grid_geom.intersects_along_linestring(linestring, fcs)
+								else:
+									continue
 
-							crossSectionGeom = CrossSectionIntersects(feat, inters, ch, fcs, crs, self.iface)
-							self.crossSectionGeom.append(crossSectionGeom)
+								crossSectionGeom = CrossSectionIntersects(feat, inters, ch, fcs, crs, self.iface)
+								self.crossSectionGeom.append(crossSectionGeom)
 
 						inters = crossSectionGeom.inters
-						if onVertices:
+						if isinstance(layer, QgsMeshLayer):
+							points = crossSectionGeom.points
+							chainage = crossSectionGeom.chainages
+							faces = crossSectionGeom.sectionFaces
+						elif onVertices:
 							points = crossSectionGeom.mid_points
 							chainage = crossSectionGeom.chainages_mid_points
 							faces = [None] * len(points)
@@ -469,6 +658,7 @@ class TuPlot2D():
 						if j == 0 and not update and debug:
 							polys = None
 							if isinstance(layer, QgsMeshLayer):
+								mesh, si = self.meshSpatialIndex(layer)
 								polys = [meshToPolygon(mesh, mesh.face(x)) for x in faces if x is not None]
 							elif isinstance(layer, NetCDFGrid):
 								nc_grid_geom = NetCDFGridGeometry(layer)
@@ -483,22 +673,28 @@ class TuPlot2D():
 					y = []
 					if do_profiling:
 						start = datetime.now()
-					for i in range(len(faces)):
-						x.append(chainage[i])
-						if not onVerticesCurr and faces[i] is None:
-							y.append(np.nan)
-						else:
-
-							v = self.datasetValue(layer, dp, si, mesh, meshDatasetIndex, meshRendered,
-												  points[i], 0, dataType, am, faces[i])
-							y.append(v)
-
-						if faces[i] is not None or not onVerticesCurr:
-							x.append(chainage[i+1])
-							if faces[i] is None and not onVerticesCurr:
+					if isinstance(layer, QgsMeshLayer) and am is None and \
+							gmd.dataType() != QgsMeshDatasetGroupMetadata.DataOnVolumes:
+						x, y = crossSectionGeom.profile(meshDatasetIndex)
+					else:
+						if isinstance(layer, QgsMeshLayer) and mesh is None and not meshRendered:
+							mesh, si = self.meshSpatialIndex(layer)
+						for i in range(len(faces)):
+							x.append(chainage[i])
+							if not onVerticesCurr and faces[i] is None:
 								y.append(np.nan)
 							else:
+
+								v = self.datasetValue(layer, dp, si, mesh, meshDatasetIndex, meshRendered,
+													  points[i], 0, dataType, am, faces[i])
 								y.append(v)
+
+							if faces[i] is not None or not onVerticesCurr:
+								x.append(chainage[i+1])
+								if faces[i] is None and not onVerticesCurr:
+									y.append(np.nan)
+								else:
+									y.append(v)
 					if do_profiling:
 						Logging.info('Time to extract cross section data: {0} sec'.format((datetime.now() - start).total_seconds()), silent=True)
 
@@ -600,19 +796,6 @@ class TuPlot2D():
 		# iterate through all selected results
 		for layer in activeMeshLayers:
 			dp = layer.dataProvider()
-			if layer.id() in self.si:
-				mesh = self.mesh[layer.id()]
-				si = self.si[layer.id()]
-			else:
-				if do_profiling:
-					start = datetime.now()
-				mesh = QgsMesh()
-				dp.populateMesh(mesh)
-				si = QgsMeshSpatialIndex(mesh)
-				self.mesh[layer.id()] = mesh
-				self.si[layer.id()] = si
-				if do_profiling:
-					Logging.info('Time to generate mesh spatial index: {0} sec'.format((datetime.now() - start).total_seconds()), silent=True)
 
 			# get velocity and either depth or water level
 			depth = None
@@ -668,8 +851,7 @@ class TuPlot2D():
 			for key, item in velRes.items():
 				gmd = layer.dataProvider().datasetGroupMetadata(item[-1].group())
 				break
-			inters, ch, fcs = findMeshIntersects(si, dp, mesh, feat, crs,
-			                                             self.tuView.project, self.iface)
+			inters, ch, fcs = self.meshIntersects(layer, feat, crs)
 
 			try:
 				onVertices = gmd.dataType() == QgsMeshDatasetGroupMetadata.DataOnVertices
@@ -695,197 +877,60 @@ class TuPlot2D():
 				chainages = ch[:]
 				faces = fcs[:]
 				if debug:
-					polys = [meshToPolygon(mesh, mesh.face(x)) for x in faces]
+					mesh, si = self.meshSpatialIndex(layer)
+					polys = [meshToPolygon(mesh, mesh.face(x)) for x in faces if x >= 0]
 					writeTempPolys(polys, self.tuView.project, crs)
 					writeTempPoints(inters, self.tuView.project, crs, chainages, 'Chainage',
 					                QT_DOUBLE)
 
-			# get directions
-			directions = [None]
-			for j, point in enumerate(points[1:]):
-				directions.append(getDirection(points[j], point))
+			# where each point samples the mesh is worked out once and reused for every timestep
+			fluxLine = TuFluxLine(self, layer, self.meshGeometry(layer), points, chainages, faces, onVertices,
+			                      self.activeAvgMethod(layer.rendererSettings()), TuPlot.DataFlow2D)
 
 			# initialise progress bar
-			noFeatures = 1
-			noPoints = len(points)
 			noTimesteps = []
 			for resultType in results[layer.name()]:
 				if TuResults.isMapOutputType(resultType) and not TuResults.isMaximumResultType(resultType) \
 						and not TuResults.isMinimumResultType(resultType) \
 						and 'bed elevation' not in resultType.lower() and 'time' not in resultType and \
 						'dur' not in resultType:
-				# if '_ts' not in resultType and '_lp' not in resultType and 'Maximum' not in resultType and \
-				# 		'bed elevation' not in resultType.lower() and 'time' not in resultType and \
-				# 		'dur' not in resultType:
 					tuResultsIndex = TuResultsIndex(layer.name(), resultType, None, False, False, self.tuView.tuResults, self.tuView.tuOptions.timeUnits)
 					res = self.tuView.tuResults.getResult(tuResultsIndex)
 					if len(res) > 1:
 						noTimesteps.append(len(res))
 						break
-			maxProgress = 0
-			for ts in noTimesteps:
-				maxProgress += noFeatures * noPoints * ts
-			if maxProgress:
+			if noTimesteps:
 				self.tuView.progressBar.setVisible(True)
 				self.tuView.progressBar.setRange(0, 100)
 				self.tuView.progressBar.setValue(0)
-				pComplete = 0
-				complete = 0
 			else:
 				return False
 
-			# iterate through result timesteps to get time series
+			# read depth and velocity along the line for all timesteps, then calculate flow for all timesteps at once
 			x = []
-			y = []
 			if do_profiling:
 				start = datetime.now()
-			for key, velItem in velRes.items():
+			nt = len(velRes)
+			depthValues = np.zeros((nt, fluxLine.faces.size))
+			velValues = np.zeros((nt, 3, fluxLine.faces.size))
+			for i, (key, velItem) in enumerate(velRes.items()):
 				if self.tuView.tuOptions.timeUnits == 's':
 					x.append(velItem[0] / 3600)
 				else:
 					x.append(velItem[0])
-				
-				# iterate across line to get flow
-				sumFlow = 0
-				#for i, point in enumerate(points):
-				for i in range(len(faces)):
-					#if not meshRendered:
-					#	# pre-render means that we need to
-					#	# manually go get mesh face indexes
-					#	# then interpolate value from mesh vertices
-					#	if i == 0:
-					#		# first round - go get mesh faces that
-					#		# points fall in. If graphing for more than
-					#		# one result - don't need to do this step again
-					#		success = self.getFaceIndexes2(si, dp, points, mesh)
-					#		if not success:
-					#			return False
-					#		if len(self.faceIndexes) != len(points):
-					#			return False
-
-					chainage = chainages[i]
-					direction = directions[i]
-					# qpoint = QgsPointXY(point)
-
-					# get depth - either directly or through water level and bed elevation
-					if depth is not None:
-						depthMag = self.datasetValue(layer, dp, si, mesh, results[layer.name()][depth]['times'][key][-1],
-						                           meshRendered, points[i], 0, TuPlot.DataFlow2D, None, faces[i])
-					else:
-						wlMag = self.datasetValue(layer, dp, si, mesh, results[layer.name()][waterLevel]['times'][key][-1],
-						                          meshRendered, points[i], 0, TuPlot.DataFlow2D, None, faces[i])
-						bedMag = self.datasetValue(layer, dp, si, mesh, results[layer.name()][bedElevation]['times'][key][-1],
-						                           meshRendered, points[i], 0, TuPlot.DataFlow2D, None, faces[i])
-						depthMag = wlMag - bedMag
-					if qIsNaN(depthMag):
-						depthMag = 0
-						
-					if depthMag > 0:
-						velDataValue = self.datasetValue(layer, dp, si, mesh, velItem[-1], meshRendered, points[i], 0,
-						                                 TuPlot.DataFlow2D, None, faces[i], value='vector')
-						if isinstance(velDataValue, float) and np.isnan(velDataValue):
-							velMag = 0
-							velX = 0
-							velY = 0
-						else:
-							velMag = velDataValue[0]
-							velX = velDataValue[1]
-							velY = velDataValue[2]
 
-						if qIsNaN(velMag):
-							velMag = 0
-					else:
-						velMag = 0
-						velX = 0
-						velY = 0
-
-					# calculate flux across line segment
-					if i == 0:  # can't get flux at first point since there's no flow area
-						prevChainage = chainage
-						prevVelMag = velMag
-						prevVelX = velX
-						prevVelY = velY
-						prevDepthMag = depthMag
-						prevFlowDirection = None
-						complete += 1
-						pComplete = complete / maxProgress * 100
-						self.progress.setValue(int(pComplete))
-					
-					elif i > 0:
-						directionOpposite = direction + 180.0
-						if directionOpposite > 360.0:
-							directionOpposite -= 360.0
-
-						# get average values from current and previous values
-						avVelMag = (velMag + prevVelMag) / 2
-						if qIsNaN(prevVelX):
-							avVelX = velX
-						elif qIsNaN(velX):
-							avVelX = prevVelX
-						else:
-							avVelX = (velX + prevVelX) / 2
-						if qIsNaN(prevVelY):
-							avVelY = velY
-						elif qIsNaN(velY):
-							avVelY = prevVelY
-						else:
-							avVelY = (velY + prevVelY) / 2
-						avDepthMag = (depthMag + prevDepthMag) / 2
-
-						flowDirection = getDirection(None, None, x=avVelX, y=avVelY)
-						if flowDirection is None:
-							flowDirection = prevFlowDirection
-							if flowDirection is None:
-								prevChainage = chainage
-								prevVelMag = velMag
-								prevVelX = velX
-								prevVelY = velY
-								prevDepthMag = depthMag
-								prevFlowDirection = flowDirection
-								complete += 1
-								pComplete = complete / maxProgress * 100
-								self.progress.setValue(int(pComplete))
-								continue
-
-						if flowDirection == direction or flowDirection == directionOpposite:
-							flow = 0  # zero flow if flow is running parallel to line
-						else:
-							width = chainage - prevChainage
-							flow = avDepthMag * width * avVelMag
-							# determine direction
-							# need to consider what happens when line direction is > 180deg i.e. there is a
-							# spot where angle resets to zero when tracking round to the opposite direction
-							if direction > 180 and flowDirection < 180:
-								flowDirectionAdd = flowDirection + 360.0
-								if flowDirectionAdd > direction and flowDirection < directionOpposite:  # positive
-									sumFlow += flow
-								else:  # negative
-									sumFlow -= flow
-							elif direction > 180 and flowDirection > 180:
-								directionOppositeAdd = directionOpposite + 360.0
-								if flowDirection > direction and flowDirection < directionOppositeAdd:  # positive
-									sumFlow += flow
-								else:  # negativve
-									sumFlow -= flow
-							else:  # don't need to consider what happens when one of the direction exceed 360
-								if flowDirection > direction and flowDirection < directionOpposite:  # positive
-									sumFlow += flow
-								else:  # negative
-									sumFlow -= flow
-
-						prevChainage = chainage
-						prevVelMag = velMag
-						prevVelX = velX
-						prevVelY = velY
-						prevDepthMag = depthMag
-						prevFlowDirection = flowDirection
-						complete += 1
-						pComplete = complete / maxProgress * 100
-						self.tuView.progressBar.setValue(int(pComplete))
-						QgsApplication.processEvents()
-
-				# summed all flow, can append to timestep
-				y.append(sumFlow)
+				# get depth - either directly or through water level and bed elevation
+				if depth is not None:
+					depthValues[i] = fluxLine.values(results[layer.name()][depth]['times'][key][-1])
+				else:
+					depthValues[i] = fluxLine.values(results[layer.name()][waterLevel]['times'][key][-1]) - \
+					                 fluxLine.values(results[layer.name()][bedElevation]['times'][key][-1], checkActive=False)
+				velValues[i] = fluxLine.values(velItem[-1], vector=True)
+
+				self.tuView.progressBar.setValue(int((i + 1) / nt * 100))
+				QgsApplication.processEvents()
+
+			y = fluxLine.flow(depthValues, velValues).tolist()
 			if do_profiling:
 				Logging.info('Time to extract flow data: {0} sec'.format((datetime.now() - start).total_seconds()), silent=True)
 
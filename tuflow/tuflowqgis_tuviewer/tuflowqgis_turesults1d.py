@@ -147,6 +147,8 @@ class TuResults1D():
 			# post 2013 results
 			elif ext.upper() == '.TPC':
 				res = ResData()
+				res.lazy_load = QSettings().value('TUFLOW/tuview_lazy_load_1d', True, type=bool)
+				res.cache_results = QSettings().value('TUFLOW/tuview_cache_1d_results', True, type=bool)
 				error, message = res.Load(filePath)
 				if error:
 					self.tuView.resultSelectionChangeSignal = self.tuView.OpenResults.itemSelectionChanged.connect(
@@ -968,6 +970,7 @@ class TuResults1D():
 				for res_ in self.results1d[res][:]:
 					if isinstance(res_, ResData_GPKG):
 						self.remove_gpkg_gis(res_)
+						res_.close()
 				del self.results1d[res]
 			
 			for i in range(self.tuView.OpenResults.count()):
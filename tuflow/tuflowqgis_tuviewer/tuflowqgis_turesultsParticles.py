@@ -2,8 +2,9 @@ import os
 import glob
 import re
 from datetime import timedelta, datetime
+import numpy as np
 from qgis.core import *
-from qgis.PyQt.QtCore import Qt, QVariant
+from qgis.PyQt.QtCore import Qt, QVariant, QTimer
 from qgis.core import QgsVectorLayer, QgsFeature, QgsPointXY, QgsGeometry, QgsField, Qgis
 from ..tuflowqgis_library import isSame_float, roundSeconds, datetime2timespec
 
@@ -312,7 +313,7 @@ class TuResultsParticles():
 						pass
 
 				try:
-					self.resultsParticles[res][0].nc.close()
+					self.resultsParticles[res][0].close()
 				except:
 					pass
 				del self.resultsParticles[res]
@@ -453,7 +454,9 @@ class TuResultsParticles():
 		if time_index == None:
 			return points
 
-		data = particles_data_provider.read_data_at_time(time_index)
+		previous_index = particles_data_provider.last_time_index
+		variables = self._usedVariables(vlayer)
+		data = particles_data_provider.read_data_at_time(time_index, variables)
 		if data is None:
 			return points
 
@@ -471,25 +474,65 @@ class TuResultsParticles():
 			z = data.pop('z')
 		stats = data.get('stat')
 
-		for i, stat in enumerate(stats):
-			# ignore inactive particles
-			if int(stat) > 0:
-				feat = QgsFeature()
-				point = QgsPoint(x[i], y[i], z[i])
-				feat.setGeometry(QgsGeometry(point))
-				feat.setFields(vlayer.fields())
-				for attr in data.keys():
-					feat['id'] = i
-					feat[attr] = float(
-						data.get(attr)[i])  # must be converted to primitive type, otherwise feature data wont be stored
-				if self.debug:  # ES
-					feat['_absTime'] = absTime
-					feat['_relTime'] = relTime
-					feat['_dateTime'] = self.tuView.tuResults._dateFormat.format(dt)
-				points.append(feat)
+		# convert to python lists once - attribute values must be primitive types, otherwise feature data wont be stored
+		fields = vlayer.fields()
+		attrs = [(fields.lookupField(attr), values.astype(np.float64).tolist()) for attr, values in data.items()
+		         if fields.lookupField(attr) >= 0]
+		iid = fields.lookupField('id')
+		x, y, z = x.tolist(), y.tolist(), z.tolist()
+
+		# ignore inactive particles
+		for i in np.flatnonzero(stats.astype(np.int64) > 0).tolist():
+			feat = QgsFeature(fields)
+			point = QgsPoint(x[i], y[i], z[i])
+			feat.setGeometry(QgsGeometry(point))
+			feat.setAttribute(iid, i)
+			for j, values in attrs:
+				feat.setAttribute(j, values[i])
+			if self.debug:  # ES
+				feat['_absTime'] = absTime
+				feat['_relTime'] = relTime
+				feat['_dateTime'] = self.tuView.tuResults._dateFormat.format(dt)
+			points.append(feat)
+
+		# read the next timesteps while the application is idle
+		direction = -1 if previous_index is not None and time_index < previous_index else 1
+		particles_data_provider.prefetch(time_index, variables, direction)
+		QTimer.singleShot(0, lambda: self._prefetchNext(particles_data_provider, time_index))
 
 		return points
 
+	def _prefetchNext(self, particles_data_provider, time_index):
+		"""
+		Reads one prefetched variable then gives control back to the event loop before reading the next, so
+		the reads stop as soon as the user moves to another timestep or closes the result.
+		"""
+
+		if particles_data_provider.prefetch_next(time_index):
+			QTimer.singleShot(0, lambda: self._prefetchNext(particles_data_provider, time_index))
+
+	def _usedVariables(self, vlayer):
+		"""
+		Returns the attributes used by the layer style and labels, or None if all variables should be read
+		(option is turned off, debug info is on, or the style uses all attributes).
+		"""
+
+		if not self.tuView.tuOptions.particlesStyledVariablesOnly or self.debug:
+			return None
+
+		context = QgsRenderContext()
+		used = set()
+		if vlayer.renderer() is not None:
+			used.update(vlayer.renderer().usedAttributes(context))
+		if vlayer.labelsEnabled() and vlayer.labeling() is not None:
+			labeling = vlayer.labeling()
+			for provider in labeling.subProviders():
+				used.update(labeling.settings(provider).referencedFields(context))
+		if QgsFeatureRequest.ALL_ATTRIBUTES in used:
+			return None
+
+		return used
+
 	def _timeFields(self):
 		"""Time fields"""
 
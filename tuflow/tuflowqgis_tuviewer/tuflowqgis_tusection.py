@@ -0,0 +1,77 @@
+import numpy as np
+from qgis.core import QgsPointXY
+
+from .tuflowqgis_tumeshsampler import TuMeshSampler
+
+
+SECTION_CACHE_SIZE = 32  # number of (mesh, line) section geometries kept by TuPlot2D
+
+
+def section_profile(chainages, values, onVertices):
+	"""
+	Cross section plot data from values along a line. Vertex values are plotted at each point, face values are
+	plotted as steps across each part of the line (nan outside the mesh).
+
+	:param chainages: np.ndarray -> (npoints,) chainage of each point
+	:param values: np.ndarray -> (npoints,) if onVertices else (npoints - 1,) value for each part of the line
+	:param onVertices: bool
+	:return: list -> float x, list -> float y
+	"""
+
+	if onVertices:
+		return chainages.tolist(), values.tolist()
+
+	x = np.column_stack((chainages[:-1], chainages[1:])).ravel()
+	y = np.repeat(values, 2)
+	return x.tolist(), y.tolist()
+
+
+class TuSectionLine(TuMeshSampler):
+	"""
+	Cross section line on a mesh layer. The mesh edge crossings and where each plotted point samples the mesh
+	are found once so that plotting the section for another timestep only reads values.
+	"""
+
+	def __init__(self, layer, geometry, inters, chainages, faces, onVertices):
+		"""
+		:param layer: QgsMeshLayer
+		:param geometry: TuMeshGeometry
+		:param inters: list -> QgsPointXY line vertices and mesh edge crossings in order along the line
+		:param chainages: list -> float chainage of each point in inters
+		:param faces: list -> int face between each point and the next (-1 if outside the mesh)
+		:param onVertices: bool
+		"""
+
+		self.inters = inters[:]
+		if onVertices:
+			# line ends and the middle of each part of the line between crossings
+			xy = np.array([[p.x(), p.y()] for p in inters], dtype=np.float64).reshape((-1, 2))
+			ch = np.array(chainages, dtype=np.float64)
+			xy = np.concatenate((xy[:1], (xy[:-1] + xy[1:]) / 2., xy[-1:]))
+			ch = np.concatenate((ch[:1], (ch[:-1] + ch[1:]) / 2., ch[-1:]))
+			self.points = [QgsPointXY(x, y) for x, y in xy.tolist()]
+			self.chainages = ch.tolist()
+			self.sectionFaces = [None] * len(self.points)
+		else:
+			self.points = inters[:]
+			self.chainages = chainages[:]
+			self.sectionFaces = [None if f < 0 else f for f in faces]
+
+		n = len(self.points) if onVertices else len(self.sectionFaces)
+		TuMeshSampler.__init__(self, layer, geometry, self.points[:n], None if onVertices else self.sectionFaces,
+		                       onVertices)
+
+	def profile(self, mdi):
+		"""
+		Cross section plot data for a dataset. Vector datasets are plotted as the magnitude.
+
+		:param mdi: QgsMeshDatasetIndex
+		:return: list -> float x, list -> float y
+		"""
+
+		if self.dp.datasetGroupMetadata(mdi.group()).isVector():
+			values = self.values(mdi, vector=True)
+			values = np.hypot(values[1], values[2])
+		else:
+			values = self.values(mdi)
+		return section_profile(np.array(self.chainages, dtype=np.float64), values, self.onVertices)
@@ -1,19 +1,28 @@
 # https://stackoverflow.com/questions/29967487/get-progress-back-from-shutil-file-copy-thread
+import errno
 import os
 import shutil
+import sys
 import typing
-from time import sleep
+from time import perf_counter
 
-from qgis.PyQt.QtCore import QObject, QThread, pyqtSignal
+from qgis.PyQt.QtCore import QObject, QThread, pyqtSignal, pyqtSlot, Qt
 from qgis.PyQt.QtWidgets import QWidget, QVBoxLayout, QProgressBar, QDialog
 
 # differs from shutil.COPY_BUFSIZE on platforms != Windows
 READINTO_BUFSIZE = 1024 * 1024
+MAX_BUFSIZE = 64 * 1024 * 1024  # chunk size is grown up to this while the copy is fast
+PROGRESS_INTERVAL = 0.25  # target seconds between progress updates - used to size the chunks
 
+# errors from copy_file_range / sendfile that mean the file system doesn't support it - fall back to read / write
+KERNEL_COPY_UNSUPPORTED = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.ENOTSUP, errno.EOPNOTSUPP, errno.EBADF,
+                           errno.ETXTBSY, errno.EPERM}
 
 
 from ..compatibility_routines import QT_DIALOG_REJECTED
 
+_background_copies = set()  # keeps background copy threads alive until they finish
+
 
 def copy_file_with_progbar(src, dst, parent, on_finished: typing.Callable = None):
     """
@@ -32,6 +41,51 @@ def copy_file_with_progbar(src, dst, parent, on_finished: typing.Callable = None
         on_finished(dst)
 
 
+def copy_file_in_background(src, dst, on_finished: typing.Callable = None, on_error: typing.Callable = None):
+    """
+    Copies file in a background thread without blocking the GUI. on_finished(dst) is called in the GUI thread
+    once the copy is complete, on_error(exception) is called if the copy fails.
+    Must be called from the GUI thread.
+    """
+    copy = CopyFile(str(src), str(dst))
+    thread = QThread()
+    receiver = BackgroundCopyReceiver(thread, str(dst), on_finished, on_error)  # lives in the calling (GUI) thread
+    # connect before moving the copy to the worker thread - queued so the callbacks run in the receiver's thread
+    copy.finished.connect(receiver.copy_finished, Qt.QueuedConnection)
+    copy.error.connect(receiver.copy_error, Qt.QueuedConnection)
+    copy.moveToThread(thread)
+    thread.started.connect(copy.copy)
+    item = (copy, thread, receiver)
+    _background_copies.add(item)
+    # quit() is asynchronous - only drop the reference once the thread has actually stopped
+    thread.finished.connect(lambda: _background_copies.discard(item))
+    thread.start()
+
+
+class BackgroundCopyReceiver(QObject):
+    """Receives the signals from a background CopyFile in the GUI thread and calls the callbacks from there."""
+
+    def __init__(self, thread: QThread, dst: str, on_finished: typing.Callable = None,
+                 on_error: typing.Callable = None):
+        super().__init__()
+        self.thread = thread
+        self.dst = dst
+        self.on_finished = on_finished
+        self.on_error = on_error
+
+    @pyqtSlot()
+    def copy_finished(self):
+        self.thread.quit()
+        if self.on_finished:
+            self.on_finished(self.dst)
+
+    @pyqtSlot(Exception)
+    def copy_error(self, e: Exception):
+        self.thread.quit()
+        if self.on_error:
+            self.on_error(e)
+
+
 class CopyFileProgressBar(QDialog):
 
     def __init__(self, src: str, dst: str, min_: int, max_: int, parent=None):
@@ -90,15 +144,73 @@ class CopyFile(QObject):
     def copy(self):
         def callback(copied):
             self.updated.emit(copied)
-        with open(self.src, 'rb') as fsrc:
-            with open(self.dst, 'wb') as fdst:
-                try:
-                    self.copyfileobj(fsrc, fdst, callback, READINTO_BUFSIZE)
-                except Exception as e:
-                    self.error.emit(e)
-                    return
+        try:
+            with open(self.src, 'rb') as fsrc:
+                with open(self.dst, 'wb') as fdst:
+                    copied = self._copy_kernel(fsrc, fdst, callback)
+                    if copied is None:  # kernel copy not available, use python buffers from where it got to
+                        self.copyfileobj(fsrc, fdst, callback)
+                    fdst.flush()
+                    src_size, dst_size = os.fstat(fsrc.fileno()).st_size, os.fstat(fdst.fileno()).st_size
+            if dst_size != src_size:
+                raise OSError('Copy is incomplete ({0} of {1} bytes): {2}'.format(dst_size, src_size, self.dst))
+        except Exception as e:
+            self.error.emit(e)
+            return
         self.finished.emit()
 
+    @staticmethod
+    def _next_length(length: int, elapsed: float) -> int:
+        """Adjust the chunk size so progress is reported about every PROGRESS_INTERVAL seconds."""
+        if elapsed < PROGRESS_INTERVAL / 2:
+            return min(length * 2, MAX_BUFSIZE)
+        if elapsed > PROGRESS_INTERVAL * 2:
+            return max(length // 2, READINTO_BUFSIZE)
+        return length
+
+    def _copy_kernel(self, fsrc, fdst, callback) -> int | None:
+        """
+        Copy using os.copy_file_range or os.sendfile so data doesn't pass through python buffers
+        (and with copy_file_range, may not be copied at all on file systems that support reflinks).
+
+        Returns the number of bytes copied, or None if neither is supported (or the kernel copy stopped short,
+        which happens on some network and FUSE file systems) in which case the file positions are left at the
+        point the copy reached so the copy can be continued with copyfileobj.
+        """
+        if hasattr(os, 'copy_file_range'):
+            kernel_copy = lambda infd, outfd, n, offset: os.copy_file_range(infd, outfd, n, offset)
+        elif hasattr(os, 'sendfile') and sys.platform.startswith('linux'):  # other platforms require a socket
+            kernel_copy = lambda infd, outfd, n, offset: os.sendfile(outfd, infd, offset, n)
+        else:
+            return None
+
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        size = os.fstat(infd).st_size
+        length = READINTO_BUFSIZE
+        offset = 0
+        while offset < size:
+            t = perf_counter()
+            try:
+                n = kernel_copy(infd, outfd, min(length, size - offset), offset)
+            except OSError as e:
+                if e.errno not in KERNEL_COPY_UNSUPPORTED:
+                    raise
+                fsrc.seek(offset)
+                fdst.seek(offset)
+                fdst.truncate()
+                return None
+            if n == 0:  # short copy - let copyfileobj finish it (or find the file is now shorter)
+                fsrc.seek(offset)
+                fdst.seek(offset)
+                fdst.truncate()
+                return None
+            offset += n
+            os.lseek(outfd, offset, os.SEEK_SET)
+            callback(offset // 1024)
+            length = self._next_length(length, perf_counter() - t)
+
+        return offset
+
     def copyfileobj(self, fsrc, fdst, callback, length=0):
         try:
             # check for optimisation opportunity
@@ -114,42 +226,46 @@ class CopyFile(QObject):
         fsrc_read = fsrc.read
         fdst_write = fdst.write
 
-        copied = 0
+        copied = fsrc.tell() if hasattr(fsrc, 'tell') else 0
         while True:
             buf = fsrc_read(length)
             if not buf:
                 break
             fdst_write(buf)
-            copied += len(buf) // 1024
-            callback(copied)
-
+            copied += len(buf)
+            callback(copied // 1024)
 
     def _copyfileobj_readinto(self, fsrc, fdst, callback, length=0):
         """readinto()/memoryview() based variant of copyfileobj().
         *fsrc* must support readinto() method and both files must be
         open in binary mode.
+
+        If length is not given, the buffer starts at READINTO_BUFSIZE and grows (up to MAX_BUFSIZE)
+        while reads are fast, which cuts the number of round trips when copying from network drives.
         """
         fsrc_readinto = fsrc.readinto
         fdst_write = fdst.write
 
+        adaptive = not length
         if not length:
-            try:
-                file_size = os.stat(fsrc.fileno()).st_size
-            except OSError:
-                file_size = READINTO_BUFSIZE
-            length = min(file_size, READINTO_BUFSIZE)
-
-        copied = 0
-        with memoryview(bytearray(length)) as mv:
-            while True:
+            length = READINTO_BUFSIZE
+
+        copied = fsrc.tell()
+        buf = bytearray(length)
+        while True:
+            t = perf_counter()
+            with memoryview(buf) as full, full[:length] as mv:
                 n = fsrc_readinto(mv)
                 if not n:
-                    print('break')
                     break
                 elif n < length:
                     with mv[:n] as smv:
-                        fdst.write(smv)
+                        fdst_write(smv)
                 else:
                     fdst_write(mv)
-                copied += n // 1024
-                callback(copied)
+            copied += n
+            callback(copied // 1024)
+            if adaptive:
+                length = self._next_length(length, perf_counter() - t)
+                if length > len(buf):
+                    buf = bytearray(length)
@@ -18,6 +18,8 @@ pLABEL_LEN = 396
 pDATE = 400
 pFIRST_LABEL = 640
 
+VARIABLES = ('q', 'h', 'f', 'v', 's', 'm')  # order of the result variables for each node in the .zzn
+
 
 def byte2str(b):
     return re.sub(rf'[{chr(0)}-{chr(31)}]', '', b''.join(b).decode('utf-8', errors='ignore')).strip()
@@ -27,7 +29,7 @@ class ZZL:
 
     def __init__(self, zzl_path):
         self.labels = []
-        self.nvars = 6
+        self.nvars = len(VARIABLES)
         with zzl_path.open('rb') as f:
             self._model_title = byte2str(struct.unpack('c'*128, f.read(128)))
             self.model_title = self._model_title.split('FILE=')[0].strip()
@@ -60,6 +62,10 @@ class ZZL:
 
 
 class ZZN:
+    """
+    Flood Modeller .zzn results. The file is memory mapped (timestep x node x variable) so only the data that is
+    requested is read from disk. Data is returned as strided views into the file rather than copies.
+    """
 
     def __init__(self, file_path):
         self._zzn_path = Path(file_path)
@@ -67,12 +73,27 @@ class ZZN:
         if not self._zzl_path.exists() or not self._zzn_path.exists():
             raise FileNotFoundError
         self._zzl = ZZL(self._zzl_path)
-        self._a = np.fromfile(str(self._zzn_path), dtype=np.float32, count=self.timestep_count()*self.node_count()*self.result_type_count())
-        self._a = np.reshape(self._a, (self.timestep_count(), self.node_count()*self.result_type_count()))
-        self._h = np.array(sum([['q', 'h', 'f', 'v', 's', 'm'] for _ in range(self.node_count())], []))
+        self._var_offset = {x: i for i, x in enumerate(VARIABLES)}
+
+        # only map complete timesteps - the file could still be being written to
+        row_size = self.node_count() * self.result_type_count() * np.dtype(np.float32).itemsize
+        nrows = min(self.timestep_count(), self._zzn_path.stat().st_size // row_size) if row_size else 0
+        shape = (nrows, self.node_count(), self.result_type_count())
+        if nrows:
+            self._a = np.memmap(str(self._zzn_path), dtype=np.float32, mode='r', shape=shape)
+        else:
+            self._a = np.zeros(shape, dtype=np.float32)
+
+    def variable_offset(self, type_):
+        """Returns the position of the result variable within the node record (e.g. 'h' -> 1) or None."""
+        return self._var_offset.get(type_.lower())
 
     def get_time_series_data(self, type_):
-        return self._a[:,self._h == type_.lower()]
+        """Returns a (timestep x node) view of a single result variable e.g. 'h'."""
+        i = self.variable_offset(type_)
+        if i is None:
+            return np.zeros((self._a.shape[0], 0), dtype=np.float32)
+        return self._a[:,:,i]
 
     def labels(self):
         return self._zzl.labels[:]